@@ -69,7 +69,33 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.get_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    return to_dauphin_runs(graphene_info, runs)
+
+
+def to_dauphin_runs(graphene_info, runs):
+    '''Wrap a page of runs for GraphQL, sharing one RunStatsLoader between them.'''
+    stats_loader = RunStatsLoader(graphene_info.context.instance, [run.run_id for run in runs])
+    return [
+        graphene_info.schema.type_named('PipelineRun')(run, stats_loader=stats_loader)
+        for run in runs
+    ]
+
+
+class RunStatsLoader(object):
+    '''Loads the stats of a page of runs with a single call to the instance, the first time the
+    stats of any of them are resolved, rather than once per run.'''
+
+    def __init__(self, instance, run_ids):
+        self._instance = instance
+        self._run_ids = check.list_param(run_ids, 'run_ids', of_type=str)
+        self._stats = None
+
+    def get(self, run_id):
+        if self._stats is None:
+            self._stats = self._instance.get_runs_stats(self._run_ids)
+        if run_id not in self._stats:
+            return self._instance.get_run_stats(run_id)
+        return self._stats[run_id]
 
 
 @capture_dauphin_error
@@ -100,6 +126,10 @@ def get_execution_plan(graphene_info, selector, environment_dict, mode):
 
 
 @capture_dauphin_error
-def get_stats(graphene_info, run_id):
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+def get_stats(graphene_info, run_id, stats_loader=None):
+    check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
+    if stats_loader:
+        stats = stats_loader.get(run_id)
+    else:
+        stats = graphene_info.context.instance.get_run_stats(run_id)
     return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
@@ -1,18 +1,24 @@
+# Maximum number of events sent in each message of a subscription's initial backlog, so that long
+# runs are neither loaded into memory nor sent to the client all at once
+BACKLOG_CHUNK_SIZE = 1000
+
+
 class PipelineRunObservableSubscribe(object):
-    def __init__(self, instance, run_id, after_cursor=None):
+    def __init__(self, instance, run_id, after_cursor=None, chunk_size=BACKLOG_CHUNK_SIZE):
         self.instance = instance
         self.run_id = run_id
         self.observer = None
         self.after_cursor = after_cursor if after_cursor is not None else -1
+        self.chunk_size = chunk_size
 
     def __call__(self, observer):
         self.observer = observer
 
-        events = self.instance.logs_after(self.run_id, self.after_cursor)
-        if events:
+        cursor = int(self.after_cursor)
+        for events in self.instance.stream_logs(self.run_id, cursor, chunk_size=self.chunk_size):
             self.observer.on_next(events)
+            cursor += len(events)
 
-        cursor = len(events) + int(self.after_cursor)
         self.instance.watch_event_logs(self.run_id, cursor, self.handle_new_event)
 
     def handle_new_event(self, new_event):
@@ -81,12 +81,14 @@ class DauphinPipeline(dauphin.ObjectType):
         )
 
     def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs(
+        from dagster_graphql.implementation.fetch_runs import to_dauphin_runs
+
+        return to_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(
                 filters=PipelineRunsFilter(pipeline_name=self._pipeline.name)
-            )
-        ]
+            ),
+        )
 
     def resolve_modes(self, _):
         return [
@@ -83,7 +83,15 @@ class DauphinPipelineRun(dauphin.ObjectType):
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('PipelineReference')
     stats = dauphin.NonNull('PipelineRunStatsOrError')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        after=dauphin.Argument('Cursor'),
+        limit=dauphin.Argument(dauphin.Int),
+        description='''
+        The run's event log, starting after the given cursor. Pass pageInfo.lastCursor back as
+        after to fetch the next page.
+        ''',
+    )
     computeLogs = dauphin.Field(
         dauphin.NonNull('ComputeLogs'),
         stepKey=dauphin.Argument(dauphin.NonNull(dauphin.String)),
@@ -99,20 +107,23 @@ class DauphinPipelineRun(dauphin.ObjectType):
     canCancel = dauphin.NonNull(dauphin.Boolean)
     executionSelection = dauphin.NonNull('ExecutionSelection')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, stats_loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._stats_loader = stats_loader
 
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
-    def resolve_logs(self, graphene_info):
-        return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+    def resolve_logs(self, graphene_info, after=None, limit=None):
+        return graphene_info.schema.type_named('LogMessageConnection')(
+            self._pipeline_run, after=after, limit=limit
+        )
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, self._stats_loader)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
         return graphene_info.schema.type_named('ComputeLogs')(runId=self.run_id, stepKey=stepKey)
@@ -262,8 +273,25 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, after=None, limit=None):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._after = -1 if check.opt_int_param(after, 'after') is None else after
+        self._limit = check.opt_int_param(limit, 'limit')
+        check.invariant(self._limit is None or self._limit > 0, 'limit must be positive')
+        self._logs = None
+        self._has_next_page = None
+
+    def _get_logs(self, graphene_info):
+        if self._logs is None:
+            # Fetch one more log than requested to tell whether there is a next page
+            logs = graphene_info.context.instance.logs_after(
+                self._pipeline_run.run_id,
+                self._after,
+                limit=self._limit + 1 if self._limit is not None else None,
+            )
+            self._has_next_page = self._limit is not None and len(logs) > self._limit
+            self._logs = logs[: self._limit] if self._limit is not None else logs
+        return self._logs
 
     def resolve_nodes(self, graphene_info):
 
@@ -281,20 +309,21 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
 
         return [
             from_event_record(graphene_info, log, pipeline, execution_plan)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+            for log in self._get_logs(graphene_info)
         ]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
-        lastCursor = None
-        if count > 0:
-            lastCursor = str(count - 1)
+        count = len(self._get_logs(graphene_info))
+        # The cursor of the last log in this page, or of the last log before it if it is empty
+        last_cursor = self._after + count
         return graphene_info.schema.type_named('PageInfo')(
-            lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
+            lastCursor=str(last_cursor) if last_cursor >= 0 else None,
+            hasNextPage=self._has_next_page,
+            hasPreviousPage=self._after >= 0,
             count=count,
-            totalCount=count,
+            # The number of logs up to the end of this page, which is the run's total once
+            # hasNextPage is false
+            totalCount=last_cursor + 1,
         )
 
 
@@ -0,0 +1,113 @@
+'''Benchmark the per-step overhead of executing steps on a remote worker.
+
+Compares the GraphQL round trip the Celery and Dask workers used to make
+(execute_execute_plan_mutation, which resolves an executePlan mutation through the schema and
+parses the resulting GraphQL dicts back into DagsterEvents) with the direct
+execute_step_remotely entry point, which executes the plan and serializes the DagsterEvents it
+yields. Both are timed end to end as a worker sees them, including the final JSON serialization
+of the events.
+
+The steps do no work of their own, so the timings are dominated by framework overhead.
+
+Usage:
+
+    python -m dagster_graphql_tests.benchmarks.bench_execute_step --steps 50
+'''
+
+import argparse
+import time
+
+from dagster_graphql.client.mutations import execute_execute_plan_mutation
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    lambda_solid,
+)
+from dagster.core.execution.api import execute_step_remotely
+from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import serialize_dagster_namedtuple
+from dagster.core.utils import make_new_run_id
+
+ENVIRONMENT_DICT = {'storage': {'filesystem': {}}}
+
+
+def define_benchmark_pipeline():
+    @lambda_solid(output_def=OutputDefinition(Int))
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)], output_def=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='bench_execute_step',
+        solid_defs=[return_one, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('return_one')}},
+    )
+
+
+def execute_with_graphql(handle, run_id, step_keys, instance_ref):
+    variables = {
+        'executionParams': {
+            'selector': {'name': 'bench_execute_step'},
+            'environmentConfigData': ENVIRONMENT_DICT,
+            'mode': 'default',
+            'executionMetadata': {'runId': run_id},
+            'stepKeys': step_keys,
+        }
+    }
+    events = execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref)
+    return [serialize_dagster_namedtuple(event) for event in events]
+
+
+def execute_direct(handle, run_id, step_keys, instance_ref):
+    return execute_step_remotely(
+        handle, run_id, step_keys, ENVIRONMENT_DICT, 'default', instance_ref=instance_ref
+    )
+
+
+def time_steps(fn, handle, instance, num_steps):
+    timings = []
+    for _ in range(num_steps):
+        run_id = make_new_run_id()
+        instance.create_empty_run(run_id, 'bench_execute_step')
+        for step_key in ['return_one.compute', 'add_one.compute']:
+            start = time.time()
+            fn(handle, run_id, [step_key], instance.get_ref())
+            timings.append(time.time() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--steps', type=int, default=50, help='Number of runs of two steps each')
+    args = parser.parse_args()
+
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_benchmark_pipeline)
+    instance = DagsterInstance.local_temp()
+
+    # warm up imports and the handle cache so neither path pays for them
+    time_steps(execute_with_graphql, handle, instance, 1)
+    time_steps(execute_direct, handle, instance, 1)
+
+    print('{:>10} {:>12} {:>12} {:>12}'.format('path', 'mean ms', 'median ms', 'max ms'))
+    for name, fn in [('graphql', execute_with_graphql), ('direct', execute_direct)]:
+        timings = sorted(time_steps(fn, handle, instance, args.steps))
+        print(
+            '{:>10} {:>12.2f} {:>12.2f} {:>12.2f}'.format(
+                name,
+                1000.0 * sum(timings) / len(timings),
+                1000.0 * timings[len(timings) // 2],
+                1000.0 * timings[-1],
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -67,6 +67,11 @@ snapshots['test_successful_pipeline_reexecution 1'] = {
                                     'description': None,
                                     'label': 'key',
                                     'path': 'DUMMY_PATH'
+                                },
+                                {
+                                    'description': None,
+                                    'label': 'digest',
+                                    'text': 'DUMMY_DIGEST'
                                 }
                             ],
                             'op': 'SET_OBJECT'
@@ -146,6 +151,11 @@ snapshots['test_successful_pipeline_reexecution 1'] = {
                                     'description': None,
                                     'label': 'key',
                                     'path': 'DUMMY_PATH'
+                                },
+                                {
+                                    'description': None,
+                                    'label': 'digest',
+                                    'text': 'DUMMY_DIGEST'
                                 }
                             ],
                             'op': 'SET_OBJECT'
@@ -203,6 +213,11 @@ snapshots['test_successful_pipeline_reexecution 2'] = {
                                     'description': None,
                                     'label': 'key',
                                     'path': 'DUMMY_PATH'
+                                },
+                                {
+                                    'description': None,
+                                    'label': 'digest',
+                                    'text': 'DUMMY_DIGEST'
                                 }
                             ],
                             'op': 'CP_OBJECT'
@@ -275,6 +290,11 @@ snapshots['test_successful_pipeline_reexecution 2'] = {
                                     'description': None,
                                     'label': 'key',
                                     'path': 'DUMMY_PATH'
+                                },
+                                {
+                                    'description': None,
+                                    'label': 'digest',
+                                    'text': 'DUMMY_DIGEST'
                                 }
                             ],
                             'op': 'SET_OBJECT'
@@ -79,6 +79,26 @@ ALL_RUNS_QUERY = '''
 }
 '''
 
+RUN_LOGS_PAGE_QUERY = '''
+query RunLogsPageQuery($runId: ID!, $after: Cursor, $limit: Int) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs(after: $after, limit: $limit) {
+        nodes {
+          __typename
+        }
+        pageInfo {
+          lastCursor
+          hasNextPage
+          hasPreviousPage
+          count
+        }
+      }
+    }
+  }
+}
+'''
+
 
 def _get_runs_data(result, run_id):
     for run_data in result.data['pipeline']['runs']:
@@ -165,6 +185,48 @@ def test_get_runs_over_graphql():
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
 
 
+def test_get_run_logs_paginated():
+    from .utils import (
+        define_test_context,
+        sync_execute_get_run_log_data,
+    )
+
+    payload = sync_execute_get_run_log_data(
+        {
+            'executionParams': {
+                'selector': {'name': 'multi_mode_with_resources'},
+                'mode': 'add_mode',
+                'environmentConfigData': {'resources': {'op': {'config': 2}}},
+            }
+        }
+    )
+    run_id = payload['run']['runId']
+    expected_typenames = [msg['__typename'] for msg in payload['messages']]
+    assert len(expected_typenames) > 2
+
+    read_context = define_test_context(instance=DagsterInstance.local_temp())
+
+    typenames = []
+    after = None
+    while True:
+        result = execute_dagster_graphql(
+            read_context,
+            RUN_LOGS_PAGE_QUERY,
+            variables={'runId': run_id, 'after': after, 'limit': 2},
+        )
+        logs = result.data['pipelineRunOrError']['logs']
+        assert logs['pageInfo']['count'] == len(logs['nodes']) <= 2
+        assert logs['pageInfo']['hasPreviousPage'] == (after is not None)
+
+        typenames.extend(node['__typename'] for node in logs['nodes'])
+        after = logs['pageInfo']['lastCursor']
+        if not logs['pageInfo']['hasNextPage']:
+            break
+
+    assert typenames == expected_typenames
+    assert after == len(expected_typenames) - 1
+
+
 def get_repo_at_time_1():
     @lambda_solid
     def solid_A():
@@ -113,7 +113,13 @@ from dagster.core.types.decorator import (
     make_python_type_usable_as_dagster_type,
     usable_as_dagster_type,
 )
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.types.marshal import (
+    ArrowTableSerializationStrategy,
+    CompressedPickleSerializationStrategy,
+    NumpyArraySerializationStrategy,
+    SerializationStrategy,
+    is_memory_mapped,
+)
 from dagster.core.types.python_dict import Dict
 from dagster.core.types.python_set import Set
 from dagster.core.types.python_tuple import Tuple
@@ -242,6 +248,10 @@ __all__ = [
     'Optional',
     'Path',
     'SerializationStrategy',
+    'CompressedPickleSerializationStrategy',
+    'NumpyArraySerializationStrategy',
+    'ArrowTableSerializationStrategy',
+    'is_memory_mapped',
     'Set',
     'String',
     'Tuple',
@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 
 from future.utils import raise_with_traceback
@@ -737,3 +738,110 @@ def class_param(obj, param_name):
             )
         )
     return obj
+
+
+# Hot paths
+#
+# The *_param checks on hot paths (e.g. the constructors of events and log records, which run for
+# every event and log line) are called through check.hot_path, e.g.
+# check.hot_path.str_param(message, 'message'). In the optimized mode, set with the
+# DAGSTER_OPTIMIZED_CHECKS environment variable or the checks.optimized setting of an instance,
+# these skip the type checks and only return what the full checks would return for valid
+# arguments, e.g. an empty dict for None. Invariants are always checked.
+
+OPTIMIZED_CHECKS_ENV_VAR = 'DAGSTER_OPTIMIZED_CHECKS'
+
+
+# pylint: disable=unused-argument
+
+
+def _unchecked_param(obj, _param_name):
+    return obj
+
+
+def _unchecked_inst_param(obj, _param_name, _ttype, additional_message=None):
+    return obj
+
+
+def _unchecked_opt_inst_param(obj, _param_name, _ttype, default=None):
+    return default if obj is None else obj
+
+
+def _unchecked_opt_str_param(obj, _param_name, default=None):
+    return default if obj is None else obj
+
+
+def _unchecked_list_param(obj_list, _param_name, of_type=None):
+    return obj_list
+
+
+def _unchecked_opt_list_param(obj_list, _param_name, of_type=None):
+    return obj_list if obj_list else []
+
+
+def _unchecked_dict_param(obj, _param_name, key_type=None, value_type=None):
+    return obj
+
+
+def _unchecked_opt_dict_param(obj, _param_name, key_type=None, value_type=None, value_class=None):
+    return obj if obj else {}
+
+
+# pylint: enable=unused-argument
+
+_HOT_PATH_PARAM_CHECKS = {
+    'inst_param': (inst_param, _unchecked_inst_param),
+    'opt_inst_param': (opt_inst_param, _unchecked_opt_inst_param),
+    'callable_param': (callable_param, _unchecked_param),
+    'int_param': (int_param, _unchecked_param),
+    'float_param': (float_param, _unchecked_param),
+    'str_param': (str_param, _unchecked_param),
+    'opt_str_param': (opt_str_param, _unchecked_opt_str_param),
+    'list_param': (list_param, _unchecked_list_param),
+    'opt_list_param': (opt_list_param, _unchecked_opt_list_param),
+    'dict_param': (dict_param, _unchecked_dict_param),
+    'opt_dict_param': (opt_dict_param, _unchecked_opt_dict_param),
+}
+
+
+class _HotPathChecks(object):
+    '''The *_param checks of _HOT_PATH_PARAM_CHECKS, as set by set_optimized_checks.'''
+
+    optimized = False
+
+    inst_param = staticmethod(inst_param)
+    opt_inst_param = staticmethod(opt_inst_param)
+    callable_param = staticmethod(callable_param)
+    int_param = staticmethod(int_param)
+    float_param = staticmethod(float_param)
+    str_param = staticmethod(str_param)
+    opt_str_param = staticmethod(opt_str_param)
+    list_param = staticmethod(list_param)
+    opt_list_param = staticmethod(opt_list_param)
+    dict_param = staticmethod(dict_param)
+    opt_dict_param = staticmethod(opt_dict_param)
+
+
+hot_path = _HotPathChecks()
+
+
+def set_optimized_checks(optimized):
+    '''Switch the *_param checks called through check.hot_path between the full checks and the
+    unchecked versions of the optimized mode. Affects the whole process.'''
+    bool_param(optimized, 'optimized')
+    for name, (full_check, unchecked) in _HOT_PATH_PARAM_CHECKS.items():
+        setattr(hot_path, name, unchecked if optimized else full_check)
+    hot_path.optimized = optimized
+
+
+def optimized_checks_enabled():
+    return hot_path.optimized
+
+
+def optimized_checks_from_env():
+    '''Whether the DAGSTER_OPTIMIZED_CHECKS environment variable turns the optimized mode on, with
+    one of 1, true, yes or on (in any case). Any other value, or none, leaves the checks on.'''
+    return os.getenv(OPTIMIZED_CHECKS_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+set_optimized_checks(optimized_checks_from_env())
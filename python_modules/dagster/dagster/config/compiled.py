@@ -0,0 +1,309 @@
+'''Config types compiled into closures that validate and process config values.
+
+Validation in :py:mod:`dagster.config.validate` and :py:mod:`dagster.config.post_process` walks
+the config type tree building a ValidationContext and EvaluationStack at every node, so that it can
+report where any error occurs. Most config is valid, and for valid config that bookkeeping is
+wasted.
+
+Each config type is compiled once (and cached for as long as the type is alive, e.g. an
+environment type for the lifetime of its pipeline) into a validator and a processor closure that
+mirror those walks without the bookkeeping. They raise on the first problem they find, at which
+point callers fall back to the detailed walks to report the errors.
+'''
+
+import threading
+import weakref
+from enum import Enum as PythonEnum
+
+import six
+
+from dagster import check
+from dagster.utils import ensure_single_item, frozendict, frozenlist
+
+from .config_type import ConfigType, ConfigTypeKind
+
+
+class ConfigFastPathError(Exception):
+    '''Raised by compiled validators for config values that are not valid.'''
+
+
+_compiled_validators = weakref.WeakKeyDictionary()
+_compiled_processors = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _get_compiled(cache, compile_fn, config_type):
+    compiled = cache.get(config_type)
+    if compiled is None:
+        compiled = compile_fn(config_type)
+        with _lock:
+            cache[config_type] = compiled
+    return compiled
+
+
+def get_compiled_validator(config_type):
+    '''A function that returns the validated value of a config value as
+    :py:func:`~dagster.config.validate.validate_config` would, and raises if it is not valid.'''
+    check.inst_param(config_type, 'config_type', ConfigType)
+    return _get_compiled(_compiled_validators, _compile_validator, config_type)
+
+
+def get_compiled_processor(config_type):
+    '''A function that resolves the defaults of and post processes a validated config value as
+    :py:func:`~dagster.config.post_process.post_process_config` would, and raises if it cannot.'''
+    check.inst_param(config_type, 'config_type', ConfigType)
+    return _get_compiled(_compiled_processors, _compile_processor, config_type)
+
+
+def _invalid():
+    raise ConfigFastPathError()
+
+
+def _compile_validator(config_type):
+    kind = config_type.kind
+
+    if kind == ConfigTypeKind.NONEABLE:
+        inner = get_compiled_validator(config_type.inner_type)
+        return lambda value: None if value is None else inner(value)
+
+    if kind == ConfigTypeKind.ANY:
+        return lambda value: value
+
+    if kind == ConfigTypeKind.SCALAR:
+        return _compile_scalar_validator(config_type)
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_validator(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_validator(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_validator(config_type)
+    elif kind == ConfigTypeKind.ENUM:
+        return _compile_enum_validator(config_type)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(config_type, get_compiled_validator, none_allowed=False)
+    else:
+        check.failed('Unsupported ConfigTypeKind {}'.format(kind))
+
+
+def _compile_scalar_validator(config_type):
+    is_valid = config_type.is_config_scalar_valid
+
+    def _validate(value):
+        if value is None or not is_valid(value):
+            _invalid()
+        return value
+
+    return _validate
+
+
+def _compile_selector_validator(config_type):
+    fields = config_type.fields
+    validators = {name: get_compiled_validator(field.config_type) for name, field in fields.items()}
+    has_fields = {
+        name: ConfigTypeKind.has_fields(field.config_type.kind) for name, field in fields.items()
+    }
+    # an empty selector is valid if it has a single optional field
+    empty_is_valid = len(fields) == 1 and not next(iter(fields.values())).is_required
+
+    def _validate(value):
+        if value is None:
+            _invalid()
+
+        if value == {}:
+            if not empty_is_valid:
+                _invalid()
+            return {}
+
+        if not isinstance(value, dict) or len(value) != 1:
+            _invalid()
+
+        name, field_value = next(iter(value.items()))
+        if name not in validators:
+            _invalid()
+
+        if field_value is None and has_fields[name]:
+            field_value = {}
+
+        return frozendict({name: validators[name](field_value)})
+
+    return _validate
+
+
+def _compile_shape_validator(config_type):
+    fields = config_type.fields
+    validators = [
+        (name, get_compiled_validator(field.config_type)) for name, field in fields.items()
+    ]
+    required = [name for name, field in fields.items() if field.is_required]
+    strict = config_type.kind == ConfigTypeKind.STRICT_SHAPE
+
+    def _validate(value):
+        if not isinstance(value, dict):
+            _invalid()
+
+        if strict:
+            for name in value:
+                if name not in fields:
+                    _invalid()
+
+        for name in required:
+            if name not in value:
+                _invalid()
+
+        for name, validate in validators:
+            if name in value:
+                validate(value[name])
+
+        # the validated value of a shape is the incoming value, not the validated field values
+        return frozendict(value)
+
+    return _validate
+
+
+def _compile_array_validator(config_type):
+    inner = get_compiled_validator(config_type.inner_type)
+
+    def _validate(value):
+        if not isinstance(value, list):
+            _invalid()
+        return [inner(item) for item in value]
+
+    return _validate
+
+
+def _compile_enum_validator(config_type):
+    is_valid = config_type.is_valid_config_enum_value
+
+    def _validate(value):
+        if isinstance(value, PythonEnum):
+            value = value.name
+
+        if not isinstance(value, six.string_types) or not is_valid(value):
+            _invalid()
+
+        return value
+
+    return _validate
+
+
+def _compile_scalar_union(config_type, get_compiled, none_allowed):
+    scalar = get_compiled(config_type.scalar_type)
+    non_scalar = get_compiled(config_type.non_scalar_type)
+
+    def _compiled(value):
+        if value is None and not none_allowed:
+            _invalid()
+
+        if isinstance(value, (dict, list)):
+            return non_scalar(value)
+        return scalar(value)
+
+    return _compiled
+
+
+def _compile_processor(config_type):
+    resolve_defaults = _compile_defaults_resolver(config_type)
+
+    if six.get_unbound_function(type(config_type).post_process) is six.get_unbound_function(
+        ConfigType.post_process
+    ):
+        # the default post_process returns the value as is
+        return resolve_defaults
+
+    post_process = config_type.post_process
+    return lambda value: post_process(resolve_defaults(value))
+
+
+def _compile_defaults_resolver(config_type):
+    kind = config_type.kind
+
+    if kind in (ConfigTypeKind.SCALAR, ConfigTypeKind.ENUM, ConfigTypeKind.ANY):
+        return lambda value: value
+    elif kind == ConfigTypeKind.SELECTOR:
+        return _compile_selector_resolver(config_type)
+    elif ConfigTypeKind.is_shape(kind):
+        return _compile_shape_resolver(config_type)
+    elif kind == ConfigTypeKind.ARRAY:
+        return _compile_array_resolver(config_type)
+    elif kind == ConfigTypeKind.NONEABLE:
+        inner = get_compiled_processor(config_type.inner_type)
+        return lambda value: None if value is None else inner(value)
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _compile_scalar_union(config_type, get_compiled_processor, none_allowed=True)
+    else:
+        check.failed('Unsupported type {key}'.format(key=config_type.key))
+
+
+def _compile_selector_resolver(config_type):
+    fields = config_type.fields
+    processors = {name: get_compiled_processor(field.config_type) for name, field in fields.items()}
+    has_fields = {
+        name: ConfigTypeKind.has_fields(field.config_type.kind) for name, field in fields.items()
+    }
+
+    def _resolve(value):
+        if value:
+            check.invariant(len(value) == 1)
+            name, field_value = ensure_single_item(value)
+        else:
+            name, field = ensure_single_item(fields)
+            # default values are callables for some fields, so resolve them on every call
+            field_value = field.default_value if field.default_provided else None
+
+        if field_value is None and has_fields[name]:
+            field_value = {}
+
+        return frozendict({name: processors[name](field_value)})
+
+    return _resolve
+
+
+def _compile_shape_resolver(config_type):
+    fields = config_type.fields
+    processors = [
+        (name, field, get_compiled_processor(field.config_type)) for name, field in fields.items()
+    ]
+    permissive = config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE
+
+    def _resolve(value):
+        if value is None:
+            value = {}
+        elif permissive:
+            # unknown fields are not validated
+            check.dict_param(value, 'config_value', key_type=str)
+        elif not isinstance(value, dict):
+            _invalid()
+
+        processed = {}
+        for name, field, process in processors:
+            if name in value:
+                processed[name] = process(value[name])
+            elif field.default_provided:
+                processed[name] = process(field.default_value)
+            elif field.is_required:
+                _invalid()
+
+        if permissive:
+            for name, field_value in value.items():
+                if name not in fields:
+                    processed[name] = field_value
+
+        return frozendict(processed)
+
+    return _resolve
+
+
+def _compile_array_resolver(config_type):
+    inner = get_compiled_processor(config_type.inner_type)
+    inner_is_noneable = config_type.inner_type.kind == ConfigTypeKind.NONEABLE
+
+    def _resolve(value):
+        if not value:
+            return []
+
+        if not inner_is_noneable and any(item is None for item in value):
+            _invalid()
+
+        return frozenlist([inner(item) for item in value])
+
+    return _resolve
@@ -5,6 +5,7 @@ import six
 from dagster import check
 from dagster.utils import ensure_single_item, frozendict
 
+from .compiled import get_compiled_processor, get_compiled_validator
 from .config_type import Bool, ConfigScalar, ConfigType, ConfigTypeKind, Float, Int, Path, String
 from .errors import (
     create_array_error,
@@ -47,9 +48,20 @@ def is_config_scalar_valid(config_type, config_value):
 
 
 def validate_config(config_type, config_value):
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    try:
+        return EvaluateValueResult.for_value(get_compiled_validator(config_type)(config_value))
+    except Exception:  # pylint: disable=broad-except
+        # fall through to the detailed validation, which reports the errors
+        pass
+
+    return _validate_config_detailed(config_type, config_value)
+
+
+def _validate_config_detailed(config_type, config_value):
     context = ValidationContext(
-        config_type=check.inst_param(config_type, 'config_type', ConfigType),
-        stack=EvaluationStack(config_type=config_type, entries=[]),
+        config_type=config_type, stack=EvaluationStack(config_type=config_type, entries=[]),
     )
 
     return _validate_config(context, config_value)
@@ -304,7 +316,20 @@ def validate_enum_config(context, config_value):
 
 
 def process_config(config_type, config_dict):
-    validate_evr = validate_config(config_type, config_dict)
+    check.inst_param(config_type, 'config_type', ConfigType)
+
+    try:
+        validated = get_compiled_validator(config_type)(config_dict)
+        return EvaluateValueResult.for_value(get_compiled_processor(config_type)(validated))
+    except Exception:  # pylint: disable=broad-except
+        # fall through to the detailed evaluation, which reports the errors
+        pass
+
+    return _process_config_detailed(config_type, config_dict)
+
+
+def _process_config_detailed(config_type, config_dict):
+    validate_evr = _validate_config_detailed(config_type, config_dict)
     if not validate_evr.success:
         return validate_evr
 
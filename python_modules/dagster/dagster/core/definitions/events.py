@@ -374,7 +374,7 @@ class ObjectStoreOperationType(Enum):
 class ObjectStoreOperation(
     namedtuple(
         '_ObjectStoreOperation',
-        'op key dest_key obj serialization_strategy_name object_store_name value_name',
+        'op key dest_key obj serialization_strategy_name object_store_name value_name digest',
     )
 ):
     '''This event is used internally by Dagster machinery when values are written to and read from
@@ -391,6 +391,8 @@ class ObjectStoreOperation(
             employed by the operation
         object_store_name (Optional[str]): The name of the object store that performed the
             operation.
+        digest (Optional[str]): A digest of the bytes stored by a set or copy operation, for object
+            stores that report one.
     '''
 
     def __new__(
@@ -402,6 +404,7 @@ class ObjectStoreOperation(
         serialization_strategy_name=None,
         object_store_name=None,
         value_name=None,
+        digest=None,
     ):
         return super(ObjectStoreOperation, cls).__new__(
             cls,
@@ -414,6 +417,7 @@ class ObjectStoreOperation(
             ),
             object_store_name=check.opt_str_param(object_store_name, 'object_store_name'),
             value_name=check.opt_str_param(value_name, 'value_name'),
+            digest=check.opt_str_param(digest, 'digest'),
         )
 
     @classmethod
@@ -428,6 +432,7 @@ class ObjectStoreOperation(
                     'serialization_strategy_name': inst.serialization_strategy_name,
                     'object_store_name': inst.object_store_name,
                     'value_name': inst.value_name,
+                    'digest': inst.digest,
                 },
                 **kwargs
             )
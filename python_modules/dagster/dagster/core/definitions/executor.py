@@ -1,7 +1,7 @@
 from functools import update_wrapper
 
 from dagster import check
-from dagster.builtins import Int
+from dagster.builtins import Bool, Int
 from dagster.config.field import Field
 from dagster.config.field_utils import check_user_facing_opt_config_param
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
@@ -144,7 +144,11 @@ class _ExecutorDecoratorCallable(object):
 
 @executor(
     name='in_process',
-    config={'retries': get_retries_config(), 'marker_to_close': Field(str, is_required=False),},
+    config={
+        'retries': get_retries_config(),
+        'marker_to_close': Field(str, is_required=False),
+        'release_intermediates': Field(Bool, is_required=False, default_value=False),
+    },
 )
 def in_process_executor(init_context):
     '''The default in-process executor.
@@ -161,6 +165,11 @@ def in_process_executor(init_context):
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Setting ``release_intermediates`` to ``true`` releases each intermediate as soon as every
+    step that consumes it has succeeded, rather than keeping all of them until the run ends.
+    Outputs that no step consumes are kept, as are the inputs of failed or skipped steps so that
+    the run can be re-executed from the point of failure.
     '''
     from dagster.core.engine.init import InitExecutorContext
 
@@ -170,6 +179,7 @@ def in_process_executor(init_context):
         # shouldn't need to .get() here - issue with defaults in config setup
         retries=Retries.from_config(init_context.executor_config.get('retries', {'enabled': {}})),
         marker_to_close=init_context.executor_config.get('marker_to_close'),
+        release_intermediates=init_context.executor_config.get('release_intermediates', False),
     )
 
 
@@ -178,6 +188,12 @@ def in_process_executor(init_context):
     config={
         'max_concurrent': Field(Int, is_required=False, default_value=0),
         'retries': get_retries_config(),
+        'worker_pool': Field(
+            {'max_tasks_per_worker': Field(Int, is_required=False, default_value=0)},
+            is_required=False,
+        ),
+        'release_intermediates': Field(Bool, is_required=False, default_value=False),
+        'prioritize_critical_path': Field(Bool, is_required=False, default_value=False),
     },
 )
 def multiprocess_executor(init_context):
@@ -197,9 +213,32 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default every step is executed in a freshly started process. Setting ``worker_pool``
+    instead starts up to ``max_concurrent`` long-lived worker processes for the run, each of which
+    loads the pipeline, builds the execution plan and connects to the instance once and then
+    executes steps as they are handed to it:
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            max_concurrent: 4
+            worker_pool:
+              max_tasks_per_worker: 100
+
+    The optional ``max_tasks_per_worker`` recycles each worker process after it has executed that
+    many steps. By default, or if you set it to 0, workers live for the whole run.
+
+    Setting ``release_intermediates`` to ``true`` removes each intermediate from storage as soon
+    as every step that consumes it has succeeded, as described for the in-process executor.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
+
+    Setting ``prioritize_critical_path`` to ``true`` starts the steps of the same priority with
+    the longest chain of downstream steps first, weighting each step by its mean duration in
+    recent runs of the pipeline. This shortens runs that are limited by ``max_concurrent``.
     '''
     from dagster.core.definitions.handle import ExecutionTargetHandle
     from dagster.core.engine.init import InitExecutorContext
@@ -209,10 +248,17 @@ def multiprocess_executor(init_context):
     check_cross_process_constraints(init_context)
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
+    worker_pool_config = init_context.executor_config.get('worker_pool')
     return MultiprocessExecutorConfig(
         handle=handle,
         max_concurrent=init_context.executor_config['max_concurrent'],
         retries=Retries.from_config(init_context.executor_config['retries']),
+        worker_pool=worker_pool_config is not None,
+        max_tasks_per_worker=worker_pool_config.get('max_tasks_per_worker')
+        if worker_pool_config is not None
+        else None,
+        release_intermediates=init_context.executor_config['release_intermediates'],
+        prioritize_critical_path=init_context.executor_config['prioritize_critical_path'],
     )
 
 
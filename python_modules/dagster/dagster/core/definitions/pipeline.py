@@ -211,6 +211,7 @@ class PipelineDefinition(IContainSolids, object):
         )
         self._cached_enviroment_schemas = {}
         self._cached_pipeline_snapshot = None
+        self._execution_plan_cache = None
 
     def get_environment_schema(self, mode=None):
         check.str_param(mode, 'mode')
@@ -468,6 +469,14 @@ class PipelineDefinition(IContainSolids, object):
     def get_config_schema_snapshot(self):
         return self.get_pipeline_snapshot().config_schema_snapshot
 
+    def get_execution_plan_cache(self):
+        if self._execution_plan_cache is None:
+            from dagster.core.execution.plan.cache import ExecutionPlanCache
+
+            self._execution_plan_cache = ExecutionPlanCache(self)
+
+        return self._execution_plan_cache
+
 
 def _dep_key_of(solid):
     return SolidInvocation(solid.definition.name, solid.name)
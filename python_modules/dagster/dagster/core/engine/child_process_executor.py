@@ -1,6 +1,7 @@
 '''Facilities for running arbitrary commands in child processes.'''
 
 import multiprocessing
+import multiprocessing.connection
 import os
 import sys
 from abc import ABCMeta, abstractmethod
@@ -77,9 +78,35 @@ PROCESS_DEAD_AND_QUEUE_EMPTY = 'PROCESS_DEAD_AND_QUEUE_EMPTY'
 '''Sentinel value.'''
 
 
-def _poll_for_event(process, queue):
+class ChildProcess(namedtuple('_ChildProcess', 'process queue')):
+    '''A handle on a running child process and the queue it communicates over.'''
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    @property
+    def waitables(self):
+        '''The objects that become ready when this child has something for the parent to do:
+        the read end of its event queue and its process sentinel.
+
+        Suitable for passing to multiprocessing.connection.wait. Empty if the platform does not
+        expose them (Python 2), in which case callers must fall back to polling.
+        '''
+        # pylint: disable=protected-access
+        reader = getattr(self.queue, '_reader', None)
+        sentinel = getattr(self.process, 'sentinel', None)
+        if reader is None or sentinel is None:
+            return []
+        return [reader, sentinel]
+
+
+def _poll_for_event(process, queue, timeout=TICK):
     try:
-        return queue.get(block=True, timeout=TICK)
+        if timeout:
+            return queue.get(block=True, timeout=timeout)
+        else:
+            return queue.get(block=False)
     except KeyboardInterrupt as e:
         return e
     except multiprocessing.queues.Empty:
@@ -97,6 +124,67 @@ def _poll_for_event(process, queue):
     return None
 
 
+def start_child_process_command(command):
+    '''Start a new process whose execution target is a ChildProcessCommand wrapped by
+    _execute_command_in_child_process.
+
+    Args:
+        command (ChildProcessCommand): The command to execute in the child process.
+
+    Returns:
+        ChildProcess: A handle on the started process, to be passed to poll_child_process.
+    '''
+    check.inst_param(command, 'command', ChildProcessCommand)
+
+    multiprocessing_context = get_multiprocessing_context()
+    queue = multiprocessing_context.Queue()
+
+    process = multiprocessing_context.Process(
+        target=_execute_command_in_child_process, args=(queue, command)
+    )
+
+    process.start()
+
+    return ChildProcess(process, queue)
+
+
+def poll_child_process(child_process, timeout=TICK):
+    '''Poll the queue of a started child process for events until the process dies and the
+    queue is empty.
+
+    Yields the same set of objects as execute_child_process_command.
+
+    Args:
+        child_process (ChildProcess): The handle returned by start_child_process_command.
+        timeout (float): How long to block waiting for each event before yielding None. Callers
+            that multiplex many children with multiprocessing.connection.wait on
+            ChildProcess.waitables should pass 0, so that polling never blocks.
+    '''
+    check.inst_param(child_process, 'child_process', ChildProcess)
+    check.numeric_param(timeout, 'timeout')
+
+    process, queue = child_process
+
+    completed_properly = False
+
+    while not completed_properly:
+        event = _poll_for_event(process, queue, timeout)
+
+        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+            break
+
+        yield event
+
+        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+            completed_properly = True
+
+    if not completed_properly:
+        # TODO Gather up stderr and the process exit code
+        raise ChildProcessCrashException()
+
+    process.join()
+
+
 def execute_child_process_command(command):
     '''Execute a ChildProcessCommand in a new process.
 
@@ -126,30 +214,47 @@ def execute_child_process_command(command):
 
     check.inst_param(command, 'command', ChildProcessCommand)
 
-    multiprocessing_context = get_multiprocessing_context()
-    queue = multiprocessing_context.Queue()
-
-    process = multiprocessing_context.Process(
-        target=_execute_command_in_child_process, args=(queue, command)
-    )
-
-    process.start()
+    for event in poll_child_process(start_child_process_command(command)):
+        yield event
 
-    completed_properly = False
 
-    while not completed_properly:
-        event = _poll_for_event(process, queue)
+def wait_for_ready(waitables_by_key, timeout=TICK):
+    '''Block until at least one of a set of child processes has an event to deliver or has died.
 
-        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-            break
-
-        yield event
+    Args:
+        waitables_by_key (Dict[str, List]): ChildProcess.waitables for each in-flight child,
+            keyed by an arbitrary identifier. An empty list marks an entry that has no child to
+            wait on yet, which is always considered ready.
+        timeout (float): The maximum time to block.
+
+    Returns:
+        Set[str]: The keys that are ready to be polled without blocking. When the platform
+            cannot multiplex (see can_wait_on_children) every key is returned, and callers should
+            poll with a blocking timeout instead.
+    '''
+    check.dict_param(waitables_by_key, 'waitables_by_key', key_type=str, value_type=list)
+    check.numeric_param(timeout, 'timeout')
+
+    if not can_wait_on_children():
+        return set(waitables_by_key.keys())
+
+    ready_keys = set()
+    key_by_waitable = {}
+    for key, waitables in waitables_by_key.items():
+        if not waitables:
+            ready_keys.add(key)
+        for waitable in waitables:
+            key_by_waitable[waitable] = key
+
+    if key_by_waitable:
+        ready = multiprocessing.connection.wait(
+            list(key_by_waitable.keys()), timeout=0 if ready_keys else timeout
+        )
+        ready_keys.update(key_by_waitable[waitable] for waitable in ready)
 
-        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-            completed_properly = True
+    return ready_keys
 
-    if not completed_properly:
-        # TODO Gather up stderr and the process exit code
-        raise ChildProcessCrashException()
 
-    process.join()
+def can_wait_on_children():
+    '''Whether this platform supports multiplexing child processes with wait_for_ready.'''
+    return hasattr(multiprocessing.connection, 'wait')
@@ -3,6 +3,7 @@ import sys
 
 from dagster import check
 from dagster.core.definitions import (
+    EventMetadataEntry,
     ExpectationResult,
     Failure,
     Materialization,
@@ -29,7 +30,12 @@ from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
 )
-from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.memoization import (
+    copy_required_intermediates_for_execution,
+    find_memoized_step,
+    record_memoized_step,
+    step_cache_key,
+)
 from dagster.core.execution.plan.objects import (
     StepFailureData,
     StepInputData,
@@ -83,11 +89,9 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
             ):
                 yield event
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
             active_execution = execution_plan.start(
-                retries=pipeline_context.executor_config.retries
+                retries=pipeline_context.executor_config.retries,
+                release_intermediates=pipeline_context.executor_config.release_intermediates,
             )
             while not active_execution.is_complete:
                 step = active_execution.get_next_step()
@@ -133,6 +137,11 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
                 for event in active_execution.skipped_step_events_iterator(pipeline_context):
                     yield event
 
+                for event in active_execution.released_intermediate_events_iterator(
+                    pipeline_context
+                ):
+                    yield event
+
         yield DagsterEvent.engine_event(
             pipeline_context,
             'Finished steps in process (pid: {pid}) in {duration_ms}'.format(
@@ -559,6 +568,15 @@ def _core_dagster_event_sequence_for_step(step_context):
     else:
         yield DagsterEvent.step_start_event(step_context)
 
+    # the cache key does not depend on input values, so memoized steps never load their inputs
+    cache_key = step_cache_key(step_context)
+    if cache_key:
+        memoized_step = find_memoized_step(step_context, cache_key)
+        if memoized_step:
+            for evt in _memoized_step_event_sequence(step_context, memoized_step):
+                yield evt
+            return
+
     inputs = {}
     for input_name, input_value in _input_values_from_intermediates_manager(step_context).items():
         if isinstance(input_value, ObjectStoreOperation):
@@ -581,6 +599,7 @@ def _core_dagster_event_sequence_for_step(step_context):
         ):
             yield evt
 
+    output_names = []
     with time_execution_scope() as timer_result:
         user_event_sequence = check.generator(
             _user_event_sequence_for_step_compute_fn(step_context, inputs)
@@ -593,6 +612,7 @@ def _core_dagster_event_sequence_for_step(step_context):
         ):
 
             if isinstance(user_event, Output):
+                output_names.append(user_event.output_name)
                 for evt in _create_step_events_for_output(step_context, user_event):
                     yield evt
             elif isinstance(user_event, Materialization):
@@ -606,6 +626,82 @@ def _core_dagster_event_sequence_for_step(step_context):
                     )
                 )
 
+    if cache_key:
+        record_memoized_step(step_context, cache_key, output_names)
+
+    yield DagsterEvent.step_success_event(
+        step_context, StepSuccessData(duration_ms=timer_result.millis)
+    )
+
+
+def _memoized_step_event_sequence(step_context, memoized_step):
+    '''Copy the outputs of a previous step that executed with the same cache key instead of
+    executing this one.
+    '''
+    step = step_context.step
+    intermediates_manager = step_context.intermediates_manager
+
+    with time_execution_scope() as timer_result:
+        yield DagsterEvent.engine_event(
+            step_context,
+            'Skipping execution of step {step_key}: step {memoized_step_key} of run {run_id} '
+            'executed with the same inputs and config, reusing its outputs.'.format(
+                step_key=step.key,
+                memoized_step_key=memoized_step.step_key,
+                run_id=memoized_step.run_id,
+            ),
+            EngineEventData(
+                metadata_entries=[
+                    EventMetadataEntry.text(memoized_step.cache_key, 'cache_key'),
+                    EventMetadataEntry.text(memoized_step.run_id, 'run_id'),
+                    EventMetadataEntry.text(memoized_step.step_key, 'step_key'),
+                ]
+            ),
+            step_key=step.key,
+        )
+
+        for output_name in memoized_step.output_names:
+            step_output = step.step_output_named(output_name)
+            step_output_handle = StepOutputHandle.from_step(step=step, output_name=output_name)
+
+            yield DagsterEvent.step_output_event(
+                step_context=step_context,
+                step_output_data=StepOutputData(
+                    step_output_handle=step_output_handle,
+                    type_check_data=TypeCheckData(
+                        success=True,
+                        label=output_name,
+                        description='Type checked when stored by step {step_key} of run '
+                        '{run_id}.'.format(
+                            step_key=memoized_step.step_key, run_id=memoized_step.run_id
+                        ),
+                    ),
+                ),
+            )
+
+            if not intermediates_manager.has_intermediate(step_context, step_output_handle):
+                operation = intermediates_manager.copy_intermediate_from_run(
+                    step_context,
+                    memoized_step.run_id,
+                    StepOutputHandle(memoized_step.step_key, output_name),
+                    step_output_handle,
+                )
+                yield DagsterEvent.object_store_operation(
+                    step_context,
+                    ObjectStoreOperation.serializable(operation, value_name=output_name),
+                )
+
+            if _output_specs(step_context, output_name):
+                value = intermediates_manager.get_intermediate(
+                    context=step_context,
+                    dagster_type=step_output.dagster_type,
+                    step_output_handle=step_output_handle,
+                )
+                if isinstance(value, ObjectStoreOperation):
+                    value = value.obj
+                for evt in _create_output_materializations(step_context, output_name, value):
+                    yield evt
+
     yield DagsterEvent.step_success_event(
         step_context, StepSuccessData(duration_ms=timer_result.millis)
     )
@@ -643,11 +739,13 @@ def _set_intermediates(step_context, step_output, step_output_handle, output):
         )
 
 
-def _create_output_materializations(step_context, output_name, value):
-    step = step_context.step
-    current_handle = step.solid_handle
+def _output_specs(step_context, output_name):
+    '''The materialization config for an output, checking for output mappings at every point up
+    the composition heirarchy.
+    '''
+    output_specs = []
+    current_handle = step_context.step.solid_handle
 
-    # check for output mappings at every point up the composition heirarchy
     while current_handle:
         solid_config = step_context.environment_config.solids.get(current_handle.to_string())
         current_handle = current_handle.parent
@@ -659,40 +757,49 @@ def _create_output_materializations(step_context, output_name, value):
             check.invariant(len(output_spec) == 1)
             config_output_name, output_spec = list(output_spec.items())[0]
             if config_output_name == output_name:
-                step_output = step.step_output_named(output_name)
-                with user_code_error_boundary(
-                    DagsterOutputMaterializationError,
-                    msg_fn=lambda: '''Error occured during output materialization:
-                    output name: "{output_name}"
-                    step key: "{key}"
-                    solid invocation: "{solid}"
-                    solid definition: "{solid_def}"
-                    '''.format(
-                        output_name=output_name,
-                        key=step_context.step.key,
-                        solid_def=step_context.solid_def.name,
-                        solid=step_context.solid.name,
-                    ),
-                ):
-                    materializations = step_output.dagster_type.output_materialization_config.materialize_runtime_values(
-                        step_context, output_spec, value
-                    )
+                output_specs.append(output_spec)
 
-                for materialization in materializations:
-                    if not isinstance(materialization, Materialization):
-                        raise DagsterInvariantViolationError(
-                            (
-                                'materialize_runtime_values on type {type_name} has returned '
-                                'value {value} of type {python_type}. You must return a '
-                                'Materialization.'
-                            ).format(
-                                type_name=step_output.dagster_type.name,
-                                value=repr(materialization),
-                                python_type=type(materialization).__name__,
-                            )
-                        )
+    return output_specs
+
+
+def _create_output_materializations(step_context, output_name, value):
+    step = step_context.step
+
+    for output_spec in _output_specs(step_context, output_name):
+        step_output = step.step_output_named(output_name)
+        with user_code_error_boundary(
+            DagsterOutputMaterializationError,
+            msg_fn=lambda: '''Error occured during output materialization:
+            output name: "{output_name}"
+            step key: "{key}"
+            solid invocation: "{solid}"
+            solid definition: "{solid_def}"
+            '''.format(
+                output_name=output_name,
+                key=step_context.step.key,
+                solid_def=step_context.solid_def.name,
+                solid=step_context.solid.name,
+            ),
+        ):
+            materializations = step_output.dagster_type.output_materialization_config.materialize_runtime_values(
+                step_context, output_spec, value
+            )
+
+        for materialization in materializations:
+            if not isinstance(materialization, Materialization):
+                raise DagsterInvariantViolationError(
+                    (
+                        'materialize_runtime_values on type {type_name} has returned '
+                        'value {value} of type {python_type}. You must return a '
+                        'Materialization.'
+                    ).format(
+                        type_name=step_output.dagster_type.name,
+                        value=repr(materialization),
+                        python_type=type(materialization).__name__,
+                    )
+                )
 
-                    yield DagsterEvent.step_materialization(step_context, materialization)
+            yield DagsterEvent.step_materialization(step_context, materialization)
 
 
 def _user_event_sequence_for_step_compute_fn(step_context, evaluated_inputs):
@@ -1,4 +1,5 @@
 import os
+from collections import namedtuple
 
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
@@ -7,16 +8,22 @@ from dagster.core.execution.api import create_execution_plan, execute_plan_itera
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.plan.critical_path import critical_path_sort_key_fn_for_context
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import Retries, RetryMode
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    TICK,
     ChildProcessCommand,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
-    execute_child_process_command,
+    can_wait_on_children,
+    poll_child_process,
+    start_child_process_command,
+    wait_for_ready,
 )
 from .engine_base import Engine, override_env_for_inner_executor
 
@@ -55,7 +62,7 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
             yield step_event
 
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
+def execute_step_out_of_process(step_context, step, errors, term_events, waitables):
     command = InProcessExecutorChildProcessCommand(
         step_context.environment_dict,
         step_context.pipeline_run,
@@ -72,7 +79,14 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
         step_key=step.key,
     )
 
-    for ret in execute_child_process_command(command):
+    child_process = start_child_process_command(command)
+    waitables[step.key] = child_process.waitables
+
+    # When the coordinator can multiplex children we never block here -- it only advances this
+    # iterator once wait_for_ready reports that the child has something for us.
+    poll_timeout = 0.0 if can_wait_on_children() else TICK
+
+    for ret in poll_child_process(child_process, timeout=poll_timeout):
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -90,6 +104,29 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
             check.failed('Unexpected return value from child process {}'.format(type(ret)))
 
 
+def _sort_key_fn(pipeline_context, execution_plan):
+    if not pipeline_context.executor_config.prioritize_critical_path:
+        return None
+
+    return critical_path_sort_key_fn_for_context(pipeline_context, execution_plan)
+
+
+def _raise_subprocess_errors(errors):
+    errs = {pid: err for pid, err in errors.items() if err}
+    if errs:
+        raise DagsterSubprocessError(
+            'During multiprocess execution errors occurred in child processes:\n{error_list}'.format(
+                error_list='\n'.join(
+                    [
+                        'In process {pid}: {err}'.format(pid=pid, err=err.to_string())
+                        for pid, err in errs.items()
+                    ]
+                )
+            ),
+            subprocess_error_infos=list(errs.values()),
+        )
+
+
 class MultiprocessEngine(Engine):  # pylint: disable=no-init
     @staticmethod
     def execute(pipeline_context, execution_plan):
@@ -110,9 +147,6 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
 
             for event in copy_required_intermediates_for_execution(
@@ -121,11 +155,14 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                 yield event
 
             active_execution = execution_plan.start(
-                retries=pipeline_context.executor_config.retries
+                retries=pipeline_context.executor_config.retries,
+                sort_key_fn=_sort_key_fn(pipeline_context, execution_plan),
+                release_intermediates=pipeline_context.executor_config.release_intermediates,
             )
             active_iters = {}
             errors = {}
             term_events = {}
+            waitables = {}
             stopping = False
 
             while (not stopping and not active_execution.is_complete) or active_iters:
@@ -142,20 +179,28 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                         for step in steps:
                             step_context = pipeline_context.for_step(step)
                             term_events[step.key] = get_multiprocessing_context().Event()
+                            waitables[step.key] = []
                             active_iters[step.key] = execute_step_out_of_process(
-                                step_context, step, errors, term_events
+                                step_context, step, errors, term_events, waitables
                             )
 
-                    # process active iterators
+                    # block until any child has an event for us or has died, then process only
+                    # the iterators that are ready
+                    ready_keys = wait_for_ready(waitables)
+
                     empty_iters = []
                     for key, step_iter in active_iters.items():
+                        if key not in ready_keys:
+                            continue
                         try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
-                                yield event_or_none
-                                active_execution.handle_event(event_or_none)
+                            # drain everything this child has delivered so far
+                            while True:
+                                event_or_none = next(step_iter)
+                                if event_or_none is None:
+                                    break
+                                else:
+                                    yield event_or_none
+                                    active_execution.handle_event(event_or_none)
 
                         except StopIteration:
                             empty_iters.append(key)
@@ -166,12 +211,18 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                         if term_events[key].is_set():
                             stopping = True
                         del term_events[key]
+                        del waitables[key]
                         active_execution.verify_complete(pipeline_context, key)
 
                     # process skips from failures or uncovered inputs
                     for event in active_execution.skipped_step_events_iterator(pipeline_context):
                         yield event
 
+                    for event in active_execution.released_intermediate_events_iterator(
+                        pipeline_context
+                    ):
+                        yield event
+
                 # In the very small chance that we get interrupted in this coordination section and not
                 # polling the subprocesses for events - try to clean up gracefully
                 except KeyboardInterrupt:
@@ -184,19 +235,275 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
                     for event in term_events.values():
                         event.set()
 
-            errs = {pid: err for pid, err in errors.items() if err}
-            if errs:
-                raise DagsterSubprocessError(
-                    'During multiprocess execution errors occurred in child processes:\n{error_list}'.format(
-                        error_list='\n'.join(
-                            [
-                                'In process {pid}: {err}'.format(pid=pid, err=err.to_string())
-                                for pid, err in errs.items()
-                            ]
+            _raise_subprocess_errors(errors)
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Multiprocess engine: parent process exiting after {duration} (pid: {pid})'.format(
+                duration=format_duration(timer_result.millis), pid=os.getpid()
+            ),
+            event_specific_data=EngineEventData.multiprocess(os.getpid()),
+        )
+
+
+class WorkerStepCompleteEvent(
+    namedtuple('WorkerStepCompleteEvent', 'pid step_key'), ChildProcessEvent
+):
+    pass
+
+
+class WorkerPoolChildProcessCommand(ChildProcessCommand):
+    '''Executes steps in a long-lived worker process.
+
+    The pipeline definition, the full execution plan and the instance are built once when the
+    worker starts. The worker then takes (step_key, previous_attempt_count) pairs off its work
+    queue until it receives None or has executed max_tasks steps.
+    '''
+
+    def __init__(
+        self,
+        environment_dict,
+        pipeline_run,
+        executor_config,
+        instance_ref,
+        work_queue,
+        term_event,
+        max_tasks,
+    ):
+        self.environment_dict = environment_dict
+        self.executor_config = executor_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.work_queue = work_queue
+        self.term_event = term_event
+        self.max_tasks = max_tasks
+
+    def execute(self):
+        check.inst(self.executor_config, MultiprocessExecutorConfig)
+        pipeline_def = self.executor_config.load_pipeline(self.pipeline_run)
+
+        start_termination_thread(self.term_event)
+
+        execution_plan = create_execution_plan(
+            pipeline_def, self.environment_dict, self.pipeline_run
+        )
+        instance = DagsterInstance.from_ref(self.instance_ref)
+
+        tasks = 0
+        while not self.max_tasks or tasks < self.max_tasks:
+            work = self.work_queue.get()
+            if work is None:
+                break
+
+            step_key, previous_attempts = work
+            for step_event in execute_plan_iterator(
+                execution_plan.build_subset_plan([step_key]),
+                self.pipeline_run,
+                environment_dict=override_env_for_inner_executor(
+                    self.environment_dict,
+                    Retries(RetryMode.DEFERRED, {step_key: previous_attempts}),
+                    step_key,
+                    DELEGATE_MARKER,
+                ),
+                instance=instance,
+            ):
+                yield step_event
+
+            tasks += 1
+            yield WorkerStepCompleteEvent(pid=os.getpid(), step_key=step_key)
+
+
+class _PoolWorker(object):
+    def __init__(self, pipeline_context, max_tasks):
+        self.max_tasks = max_tasks
+        self.tasks = 0
+        self.step_key = None
+        self.exited = False
+
+        self.term_event = get_multiprocessing_context().Event()
+        self.work_queue = get_multiprocessing_context().Queue()
+        self.child_process = start_child_process_command(
+            WorkerPoolChildProcessCommand(
+                pipeline_context.environment_dict,
+                pipeline_context.pipeline_run,
+                pipeline_context.executor_config,
+                pipeline_context.instance.get_ref(),
+                self.work_queue,
+                self.term_event,
+                max_tasks,
+            )
+        )
+        self.events = poll_child_process(
+            self.child_process, timeout=0.0 if can_wait_on_children() else TICK
+        )
+
+    @property
+    def pid(self):
+        return self.child_process.pid
+
+    @property
+    def available(self):
+        return self.step_key is None and not (self.max_tasks and self.tasks >= self.max_tasks)
+
+    def submit(self, step_key, previous_attempts):
+        check.invariant(self.available, 'Can not submit a step to a busy worker')
+        self.step_key = step_key
+        self.work_queue.put((step_key, previous_attempts))
+
+    def complete(self, step_key):
+        check.invariant(
+            step_key == self.step_key,
+            'Worker {pid} completed step {completed} but was executing {current}'.format(
+                pid=self.pid, completed=step_key, current=self.step_key
+            ),
+        )
+        self.step_key = None
+        self.tasks += 1
+
+    def shutdown(self):
+        self.work_queue.put(None)
+
+
+class MultiprocessWorkerPoolEngine(Engine):  # pylint: disable=no-init
+    '''Executes each step in one of a pool of long-lived worker processes.
+
+    Unlike MultiprocessEngine, which pays for process startup, pipeline loading, plan building
+    and instance construction on every step, workers do that once and then execute steps as they
+    are dispatched to them. Workers are recycled after max_tasks_per_worker steps if configured.
+    '''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        executor_config = pipeline_context.executor_config
+        limit = executor_config.max_concurrent
+
+        yield DagsterEvent.engine_event(
+            pipeline_context,
+            'Executing steps using multiprocess engine with a pool of up to {limit} workers: '
+            'parent process (pid: {pid})'.format(limit=limit, pid=os.getpid()),
+            event_specific_data=EngineEventData.multiprocess(
+                os.getpid(), step_keys_to_execute=execution_plan.step_keys_to_execute
+            ),
+        )
+
+        with time_execution_scope() as timer_result:
+
+            for event in copy_required_intermediates_for_execution(
+                pipeline_context, execution_plan
+            ):
+                yield event
+
+            active_execution = execution_plan.start(
+                retries=executor_config.retries,
+                sort_key_fn=_sort_key_fn(pipeline_context, execution_plan),
+                release_intermediates=executor_config.release_intermediates,
+            )
+            workers = {}
+            errors = {}
+            stopping = False
+            closed = False
+            next_worker_id = 0
+
+            try:
+                while (not stopping and not active_execution.is_complete) or any(
+                    worker.step_key for worker in workers.values()
+                ):
+                    try:
+                        if not stopping:
+                            available = [w for w in workers.values() if w.available]
+                            capacity = len(available) + limit - len(workers)
+                            steps = (
+                                active_execution.get_steps_to_execute(limit=capacity)
+                                if capacity > 0
+                                else []
+                            )
+
+                            for step in steps:
+                                if available:
+                                    worker = available.pop()
+                                else:
+                                    worker = _PoolWorker(
+                                        pipeline_context, executor_config.max_tasks_per_worker
+                                    )
+                                    workers[str(next_worker_id)] = worker
+                                    next_worker_id += 1
+
+                                yield DagsterEvent.engine_event(
+                                    pipeline_context.for_step(step),
+                                    'Dispatching {key} to worker process (pid: {pid})'.format(
+                                        key=step.key, pid=worker.pid
+                                    ),
+                                    EngineEventData(marker_start=DELEGATE_MARKER),
+                                    step_key=step.key,
+                                )
+                                worker.submit(
+                                    step.key, executor_config.retries.get_attempt_count(step.key)
+                                )
+
+                        finished = []
+                        for key in wait_for_ready(
+                            {key: worker.child_process.waitables for key, worker in workers.items()}
+                        ):
+                            worker = workers[key]
+                            for event in _drain_worker(
+                                pipeline_context, active_execution, worker, errors
+                            ):
+                                yield event
+                            if worker.exited:
+                                finished.append(key)
+
+                        for key in finished:
+                            worker = workers.pop(key)
+                            if worker.term_event.is_set():
+                                stopping = True
+                            if worker.step_key:
+                                active_execution.verify_complete(pipeline_context, worker.step_key)
+
+                        # process skips from failures or uncovered inputs
+                        for event in active_execution.skipped_step_events_iterator(
+                            pipeline_context
+                        ):
+                            yield event
+
+                        for event in active_execution.released_intermediate_events_iterator(
+                            pipeline_context
+                        ):
+                            yield event
+
+                    except KeyboardInterrupt:
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            'Multiprocess engine: received KeyboardInterrupt - forwarding to '
+                            'worker processes',
+                            EngineEventData.interrupted(
+                                [worker.step_key for worker in workers.values() if worker.step_key]
+                            ),
                         )
-                    ),
-                    subprocess_error_infos=list(errs.values()),
-                )
+                        stopping = True
+                        for worker in workers.values():
+                            worker.term_event.set()
+
+            except GeneratorExit:
+                closed = True
+                raise
+
+            finally:
+                for event in _shutdown_workers(workers, errors):
+                    # a generator that is being closed can no longer yield
+                    if closed:
+                        pipeline_context.log.debug(
+                            'Multiprocess engine: discarding {event_type} event of step '
+                            '{step_key} delivered after execution was stopped'.format(
+                                event_type=event.event_type_value, step_key=event.step_key
+                            )
+                        )
+                    else:
+                        yield event
+
+            _raise_subprocess_errors(errors)
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -205,3 +512,66 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ),
             event_specific_data=EngineEventData.multiprocess(os.getpid()),
         )
+
+
+def _shutdown_workers(workers, errors):
+    '''Ask every worker to exit once it has finished its current step, and wait until they have.
+
+    Yields the DagsterEvents the workers deliver meanwhile, e.g. those of the steps that were still
+    running when execution failed.
+    '''
+    # idle and retiring workers exit once they have drained their work queues
+    for worker in workers.values():
+        worker.shutdown()
+
+    remaining = dict(workers)
+    while remaining:
+        for key in wait_for_ready(
+            {key: worker.child_process.waitables for key, worker in remaining.items()}
+        ):
+            worker = remaining[key]
+            while True:
+                try:
+                    ret = next(worker.events)
+                except StopIteration:
+                    del remaining[key]
+                    break
+
+                if ret is None:
+                    break
+                elif isinstance(ret, DagsterEvent):
+                    yield ret
+                elif isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+
+
+def _drain_worker(pipeline_context, active_execution, worker, errors):
+    '''Yield the DagsterEvents a worker has delivered so far, updating the execution and worker
+    state as steps complete.'''
+    while True:
+        try:
+            ret = next(worker.events)
+        except StopIteration:
+            worker.exited = True
+            return
+
+        if ret is None:
+            return
+        elif isinstance(ret, DagsterEvent):
+            yield ret
+            active_execution.handle_event(ret)
+        elif isinstance(ret, WorkerStepCompleteEvent):
+            worker.complete(ret.step_key)
+            active_execution.verify_complete(pipeline_context, ret.step_key)
+        elif isinstance(ret, ChildProcessEvent):
+            if isinstance(ret, ChildProcessSystemErrorEvent):
+                errors[ret.pid] = ret.error_info
+        elif isinstance(ret, KeyboardInterrupt):
+            yield DagsterEvent.engine_event(
+                pipeline_context,
+                'Multiprocess engine: received KeyboardInterrupt - forwarding to worker processes',
+                EngineEventData.interrupted([worker.step_key] if worker.step_key else []),
+            )
+            worker.term_event.set()
+        else:
+            check.failed('Unexpected return value from child process {}'.format(type(ret)))
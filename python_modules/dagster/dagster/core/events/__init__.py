@@ -108,8 +108,8 @@ def _validate_event_specific_data(event_type, event_specific_data):
 
 
 def log_step_event(step_context, event):
-    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
-    check.inst_param(event, 'event', DagsterEvent)
+    check.hot_path.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.hot_path.inst_param(event, 'event', DagsterEvent)
 
     event_type = DagsterEventType(event.event_type_value)
     log_fn = step_context.log.error if event_type in FAILURE_EVENTS else step_context.log.debug
@@ -166,17 +166,17 @@ class DagsterEvent(
     @staticmethod
     def from_step(event_type, step_context, event_specific_data=None, message=None):
 
-        check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+        check.hot_path.inst_param(step_context, 'step_context', SystemStepExecutionContext)
 
         event = DagsterEvent(
-            check.inst_param(event_type, 'event_type', DagsterEventType).value,
+            check.hot_path.inst_param(event_type, 'event_type', DagsterEventType).value,
             step_context.pipeline_def.name,
             step_context.step.key,
             step_context.step.solid_handle,
             step_context.step.kind.value,
             step_context.logging_tags,
             _validate_event_specific_data(event_type, event_specific_data),
-            check.opt_str_param(message, 'message'),
+            check.hot_path.opt_str_param(message, 'message'),
         )
 
         log_step_event(step_context, event)
@@ -238,14 +238,14 @@ class DagsterEvent(
 
         return super(DagsterEvent, cls).__new__(
             cls,
-            check.str_param(event_type_value, 'event_type_value'),
-            check.str_param(pipeline_name, 'pipeline_name'),
-            check.opt_str_param(step_key, 'step_key'),
-            check.opt_inst_param(solid_handle, 'solid_handle', SolidHandle),
-            check.opt_str_param(step_kind_value, 'step_kind_value'),
-            check.opt_dict_param(logging_tags, 'logging_tags'),
+            check.hot_path.str_param(event_type_value, 'event_type_value'),
+            check.hot_path.str_param(pipeline_name, 'pipeline_name'),
+            check.hot_path.opt_str_param(step_key, 'step_key'),
+            check.hot_path.opt_inst_param(solid_handle, 'solid_handle', SolidHandle),
+            check.hot_path.opt_str_param(step_kind_value, 'step_kind_value'),
+            check.hot_path.opt_dict_param(logging_tags, 'logging_tags'),
             _validate_event_specific_data(DagsterEventType(event_type_value), event_specific_data),
-            check.opt_str_param(message, 'message'),
+            check.hot_path.opt_str_param(message, 'message'),
         )
 
     @property
@@ -690,15 +690,19 @@ class DagsterEvent(
         else:
             message = ''
 
+        metadata_entries = [EventMetadataEntry.path(object_store_operation_result.key, label='key')]
+        if object_store_operation_result.digest:
+            metadata_entries.append(
+                EventMetadataEntry.text(object_store_operation_result.digest, label='digest')
+            )
+
         return DagsterEvent.from_step(
             DagsterEventType.OBJECT_STORE_OPERATION,
             step_context,
             event_specific_data=ObjectStoreOperationResultData(
                 op=object_store_operation_result.op,
                 value_name=value_name,
-                metadata_entries=[
-                    EventMetadataEntry.path(object_store_operation_result.key, label='key')
-                ],
+                metadata_entries=metadata_entries,
             ),
             message=message,
         )
@@ -38,15 +38,15 @@ class EventRecord(
     ):
         return super(EventRecord, cls).__new__(
             cls,
-            check.opt_inst_param(error_info, 'error_info', SerializableErrorInfo),
-            check.str_param(message, 'message'),
+            check.hot_path.opt_inst_param(error_info, 'error_info', SerializableErrorInfo),
+            check.hot_path.str_param(message, 'message'),
             coerce_valid_log_level(level),
-            check.str_param(user_message, 'user_message'),
-            check.str_param(run_id, 'run_id'),
-            check.float_param(timestamp, 'timestamp'),
-            check.opt_str_param(step_key, 'step_key'),
-            check.opt_str_param(pipeline_name, 'pipeline_name'),
-            check.opt_inst_param(dagster_event, 'dagster_event', DagsterEvent),
+            check.hot_path.str_param(user_message, 'user_message'),
+            check.hot_path.str_param(run_id, 'run_id'),
+            check.hot_path.float_param(timestamp, 'timestamp'),
+            check.hot_path.opt_str_param(step_key, 'step_key'),
+            check.hot_path.opt_str_param(pipeline_name, 'pipeline_name'),
+            check.hot_path.opt_inst_param(dagster_event, 'dagster_event', DagsterEvent),
         )
 
     @property
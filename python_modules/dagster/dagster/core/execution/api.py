@@ -2,15 +2,16 @@ import time
 
 from dagster import check
 from dagster.core.definitions import PartitionSetDefinition, PipelineDefinition, SystemStorageData
+from dagster.core.definitions.handle import ExecutionTargetHandle
 from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.memoization import validate_retry_memoization
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.instance import DagsterInstance
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.serdes import serialize_dagster_namedtuple
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
-from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.core.telemetry import telemetry_wrapper
 from dagster.core.utils import make_new_backfill_id, make_new_run_id
 from dagster.utils import merge_dicts
@@ -63,9 +64,7 @@ def create_execution_plan(pipeline, environment_dict=None, run_config=None):
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
     run_config = check.opt_inst_param(run_config, 'run_config', IRunConfig, RunConfig())
 
-    environment_config = EnvironmentConfig.build(pipeline, environment_dict, run_config)
-
-    return ExecutionPlan.build(pipeline, environment_config, run_config)
+    return pipeline.get_execution_plan_cache().get_execution_plan(environment_dict, run_config)
 
 
 def _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run):
@@ -379,6 +378,82 @@ def execute_plan(execution_plan, instance, pipeline_run, environment_dict=None):
     )
 
 
+def execute_step_remotely_iterator(
+    handle, run_id, step_keys=None, environment_dict=None, mode=None, instance_ref=None
+):
+    '''Execute a subset of a run's steps on a remote worker, e.g. in a Celery task or on a Dask
+    worker, yielding the resulting events as they happen.
+
+    The pipeline is rebuilt from the handle and the steps are executed in process against the
+    instance the ref points to, so that their events land in the run's event log as usual.
+
+    Parameters:
+        handle (ExecutionTargetHandle): A handle resolved to the pipeline being executed.
+        run_id (str): The id of the run the steps belong to.
+        step_keys (Optional[List[str]]): The keys of the steps to execute. If ``None``, every step
+            in the plan is executed.
+        environment_dict (Optional[dict]): The environment configuration for the run.
+        mode (Optional[str]): The mode to execute in, if the run is not found on the instance.
+        instance_ref (Optional[InstanceRef]): The instance to execute against. If this is ``None``,
+            an ephemeral instance will be used.
+
+    Returns:
+        Iterator[DagsterEvent]: The step and engine events produced by the execution.
+    '''
+    check.inst_param(handle, 'handle', ExecutionTargetHandle)
+    check.str_param(run_id, 'run_id')
+    check.opt_list_param(step_keys, 'step_keys', of_type=str)
+    environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
+    check.opt_str_param(mode, 'mode')
+    check.opt_inst_param(instance_ref, 'instance_ref', InstanceRef)
+
+    pipeline_def = handle.build_pipeline_definition()
+    instance = (
+        DagsterInstance.from_ref(instance_ref) if instance_ref else DagsterInstance.ephemeral()
+    )
+    try:
+        pipeline_run = instance.get_run_by_id(run_id)
+        if not pipeline_run:
+            pipeline_run = PipelineRun(
+                pipeline_name=pipeline_def.name,
+                run_id=run_id,
+                environment_dict=environment_dict,
+                mode=mode or pipeline_def.get_default_mode_name(),
+            )
+
+        execution_plan = create_execution_plan(
+            pipeline_def, environment_dict=environment_dict, run_config=pipeline_run
+        )
+        if step_keys:
+            execution_plan = execution_plan.build_subset_plan(step_keys)
+
+        for event in execute_plan_iterator(
+            execution_plan, pipeline_run, environment_dict=environment_dict, instance=instance,
+        ):
+            if event.is_step_event or event.is_engine_event:
+                yield event
+    finally:
+        instance.dispose()
+
+
+def execute_step_remotely(
+    handle, run_id, step_keys=None, environment_dict=None, mode=None, instance_ref=None
+):
+    '''Execute a subset of a run's steps on a remote worker and return the resulting events in
+    serialized form. See :py:func:`execute_step_remotely_iterator`.
+
+    Returns:
+        List[str]: The step and engine events produced by the execution, each serialized with
+        :py:func:`serialize_dagster_namedtuple`.
+    '''
+    return [
+        serialize_dagster_namedtuple(event)
+        for event in execute_step_remotely_iterator(
+            handle, run_id, step_keys, environment_dict, mode, instance_ref
+        )
+    ]
+
+
 def step_output_event_filter(pipe_iterator):
     for step_event in pipe_iterator:
         if step_event.is_successful_output:
@@ -4,13 +4,14 @@ import io
 import os
 import subprocess
 import sys
+import threading
 import time
 from contextlib import contextmanager
 
 from dagster import check
 from dagster.core.execution import watch_orphans
 from dagster.core.execution.context.system import SystemStepExecutionContext
-from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogCaptureMode
 from dagster.seven import IS_WINDOWS
 from dagster.utils import ensure_file
 
@@ -32,8 +33,12 @@ def mirror_step_io(step_context):
         step_context.run_id, step_context.step.key, ComputeIOType.STDERR
     )
 
+    capture_io = (
+        tee_io if manager.capture_mode(step_context) == ComputeLogCaptureMode.THREAD else mirror_io
+    )
+
     manager.on_compute_start(step_context)
-    with mirror_io(outpath, errpath):
+    with capture_io(outpath, errpath):
         # compute function executed here
         yield
     manager.on_compute_finish(step_context)
@@ -97,6 +102,83 @@ def redirect_stream(to_stream=os.devnull, from_stream=sys.stdout):
             os.dup2(copied.fileno(), from_fd)
 
 
+# Bytes read from the pipe, and written to the log file and original stream, at a time
+TEE_CHUNK_SIZE = 65536
+
+# Seconds to wait at the end of a step for output written to the pipe to be mirrored. Processes
+# started by the step that outlive it keep the pipe open, and are mirrored by the thread until they
+# exit without holding up the step.
+TEE_JOIN_TIMEOUT = 1
+
+
+@contextmanager
+def tee_io(outpath, errpath):
+    with tee_stream(outpath, ComputeIOType.STDOUT):
+        with tee_stream(errpath, ComputeIOType.STDERR):
+            yield
+
+
+@contextmanager
+def tee_stream(path, io_type):
+    '''Redirect the file descriptor of stdout or stderr to a pipe, and append what is written to it
+    to a file while echoing it to the original stream, from a thread in the current process.
+
+    Like mirror_stream, this captures output written by the process at the file descriptor level,
+    including from C extensions and subprocesses, but starts no processes of its own. The pipe
+    holds a bounded amount of output: a writer blocks while the thread catches up.
+    '''
+    ensure_file(path)
+    from_stream = sys.stderr if io_type == ComputeIOType.STDERR else sys.stdout
+    from_fd = _fileno(from_stream)
+
+    if not from_fd or should_disable_io_stream_redirect():
+        yield
+        return
+
+    from_stream.flush()
+    read_fd, write_fd = os.pipe()
+    echo_fd = os.dup(from_fd)
+    log_fd = os.open(path, os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+
+    tee_thread = threading.Thread(
+        target=_tee_pipe, args=(read_fd, log_fd, echo_fd), name='dagster-compute-log-tee'
+    )
+    tee_thread.daemon = True
+    tee_thread.start()
+
+    os.dup2(write_fd, from_fd)
+    os.close(write_fd)
+    try:
+        yield
+    finally:
+        from_stream.flush()
+        # closes the last write end of the pipe held by this process, so the thread reads to the
+        # end of the step's output and exits
+        os.dup2(echo_fd, from_fd)
+        tee_thread.join(TEE_JOIN_TIMEOUT)
+
+
+def _tee_pipe(read_fd, log_fd, echo_fd):
+    try:
+        for chunk in iter(lambda: os.read(read_fd, TEE_CHUNK_SIZE), b''):
+            # keep draining the pipe if either write fails, e.g. because the original stream's
+            # reader has exited, so that the step never blocks on a full pipe
+            for fd in (log_fd, echo_fd):
+                try:
+                    _write_all(fd, chunk)
+                except OSError:
+                    pass
+    finally:
+        os.close(read_fd)
+        os.close(log_fd)
+        os.close(echo_fd)
+
+
+def _write_all(fd, data):
+    while data:
+        data = data[os.write(fd, data) :]
+
+
 POLLING_INTERVAL = 0.1
 
 
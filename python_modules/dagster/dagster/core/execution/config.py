@@ -116,9 +116,12 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
-    def __init__(self, retries, marker_to_close):
+    def __init__(self, retries, marker_to_close, release_intermediates=False):
         self.retries = check.inst_param(retries, 'retries', Retries)
         self.marker_to_close = check.opt_str_param(marker_to_close, 'marker_to_close')
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
 
     def get_engine(self):
         from dagster.core.engine.engine_inprocess import InProcessEngine
@@ -127,13 +130,33 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, retries, max_concurrent=None):
+    def __init__(
+        self,
+        handle,
+        retries,
+        max_concurrent=None,
+        worker_pool=False,
+        max_tasks_per_worker=None,
+        release_intermediates=False,
+        prioritize_critical_path=False,
+    ):
         from dagster import ExecutionTargetHandle
 
         self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle,)
         self.retries = check.inst_param(retries, 'retries', Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.worker_pool = check.bool_param(worker_pool, 'worker_pool')
+        # None or 0 means workers are never recycled
+        self.max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, 'max_tasks_per_worker'
+        )
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
+        self.prioritize_critical_path = check.bool_param(
+            prioritize_critical_path, 'prioritize_critical_path'
+        )
 
     def load_pipeline(self, pipeline_run):
         from dagster.core.storage.pipeline_run import PipelineRun
@@ -145,6 +168,9 @@ class MultiprocessExecutorConfig(ExecutorConfig):
         )
 
     def get_engine(self):
-        from dagster.core.engine.engine_multiprocess import MultiprocessEngine
+        from dagster.core.engine.engine_multiprocess import (
+            MultiprocessEngine,
+            MultiprocessWorkerPoolEngine,
+        )
 
-        return MultiprocessEngine
+        return MultiprocessWorkerPoolEngine if self.worker_pool else MultiprocessEngine
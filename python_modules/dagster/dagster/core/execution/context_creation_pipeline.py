@@ -21,7 +21,6 @@ from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.init import InitSystemStorageContext
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.type_storage import construct_type_storage_plugin_registry
-from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.loggers import default_loggers, default_system_loggers
 from dagster.utils import EventGenerationManager, merge_dicts
 from dagster.utils.error import serializable_error_info_from_exc_info
@@ -78,7 +77,9 @@ ContextCreationData = namedtuple(
 def create_context_creation_data(
     pipeline_def, environment_dict, pipeline_run, instance, execution_plan
 ):
-    environment_config = EnvironmentConfig.build(pipeline_def, environment_dict, pipeline_run)
+    environment_config = pipeline_def.get_execution_plan_cache().get_environment_config(
+        environment_dict, pipeline_run
+    )
 
     mode_def = pipeline_def.get_mode_definition(pipeline_run.mode)
     system_storage_def = system_storage_def_from_config(mode_def, environment_config)
@@ -212,6 +213,10 @@ def pipeline_initialization_event_generator(
 
         if raise_on_error:
             raise dagster_error
+    finally:
+        # resource teardown can log after the last lifecycle event of the run, and this may be a
+        # child process that exits without running atexit handlers
+        instance.flush_events()
 
 
 def create_system_storage_data(
@@ -1,14 +1,30 @@
+import hashlib
+import json
 from collections import defaultdict
 
 from dagster import check
 from dagster.core.errors import DagsterInvariantViolationError, DagsterRunNotFoundError
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.events.log import EventRecord
-from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.config import RunConfig
+from dagster.core.execution.context.system import (
+    SystemPipelineExecutionContext,
+    SystemStepExecutionContext,
+)
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.object_store import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.runs import MemoizedStep
+
+# Solids tagged with a version opt in to memoization: a step of the solid is skipped when a
+# previous step of the same solid version ran with the same config and the same stored inputs, and
+# the outputs of that step are copied instead. Change the version whenever the solid's logic
+# changes.
+MEMOIZE_VERSION_TAG = 'dagster/memoize_version'
+
+# Number of previous steps with a matching cache key checked for outputs that are still stored
+MEMOIZED_STEP_CANDIDATES = 5
 
 
 def validate_retry_memoization(pipeline_context, execution_plan):
@@ -72,6 +88,196 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
             )
 
 
+def step_cache_key(step_context):
+    '''The key identifying the outputs of a memoized step, or None if the step is not memoized.
+
+    The key is a hash of the pipeline name, the mode, the solid definition's name and memoization
+    version, the solid's config and config-supplied inputs, the config of the resources the solid
+    requires, and the identity of each input. Input values are not loaded: an input is identified by
+    the digest of its stored bytes that the object store reported when the intermediate was set or
+    copied in this run. An input whose object store reports no digest falls back to its lineage: if
+    it is from a step that executes in this run, that step's own cache key, and otherwise the
+    previous run it was stored in. A step with such an input from an unversioned step executing in
+    this run is not memoized, since that input may differ from run to run.
+
+    Args:
+        step_context (SystemStepExecutionContext): The context of the step to be executed.
+
+    Returns:
+        Optional[str]
+    '''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+
+    if step_context.step.tags.get(MEMOIZE_VERSION_TAG) is None:
+        return None
+
+    if not step_context.intermediates_manager.is_persistent:
+        step_context.log.debug(
+            'Not memoizing step {step_key}: intermediates are not persisted across runs.'.format(
+                step_key=step_context.step.key
+            )
+        )
+        return None
+
+    execution_plan = step_context.pipeline_def.get_execution_plan_cache().get_execution_plan(
+        step_context.environment_dict, RunConfig(mode=step_context.mode_def.name)
+    )
+
+    digests = _stored_output_digests(step_context)
+
+    try:
+        cache_key = _cache_key_for_step(
+            step_context, execution_plan, step_context.step, digests, {}
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        step_context.log.warning(
+            'Not memoizing step {step_key}: could not hash its config: {exc}'.format(
+                step_key=step_context.step.key, exc=exc
+            )
+        )
+        return None
+
+    if cache_key is None:
+        step_context.log.debug(
+            'Not memoizing step {step_key}: it has inputs from steps that are not memoized.'.format(
+                step_key=step_context.step.key
+            )
+        )
+
+    return cache_key
+
+
+def _stored_output_digests(step_context):
+    '''The digest of each intermediate set or copied in this run, by its StepOutputHandle.'''
+    digests = {}
+    for record in step_context.instance.all_logs(step_context.run_id):
+        if not is_intermediate_store_write_event(record):
+            continue
+
+        dagster_event = record.dagster_event
+        handle = StepOutputHandle(
+            dagster_event.step_key, dagster_event.event_specific_data.value_name
+        )
+        # a later write replaces the intermediate, and its digest if it has one
+        digests[handle] = next(
+            (
+                entry.entry_data.text
+                for entry in dagster_event.event_specific_data.metadata_entries
+                if entry.label == 'digest'
+            ),
+            None,
+        )
+    return digests
+
+
+def _cache_key_for_step(step_context, execution_plan, step, digests, cache_keys):
+    if step.key in cache_keys:
+        return cache_keys[step.key]
+
+    cache_keys[step.key] = None
+
+    version = step.tags.get(MEMOIZE_VERSION_TAG)
+    if version is None:
+        return None
+
+    inputs = {}
+    for step_input in step.step_inputs:
+        identities = []
+        for handle in step_input.source_handles:
+            identity = _output_identity(step_context, execution_plan, handle, digests, cache_keys)
+            if identity is None:
+                return None
+            identities.append(identity)
+        inputs[step_input.name] = {'sources': identities, 'config': step_input.config_data}
+
+    environment_config = step_context.environment_config
+    solid_config = environment_config.solids.get(str(step.solid_handle))
+    solid_def = step_context.pipeline_def.get_solid(step.solid_handle).definition
+    resources_config = environment_config.resources or {}
+
+    key_data = json.dumps(
+        {
+            'pipeline': step_context.pipeline_def.name,
+            'mode': step_context.mode_def.name,
+            'solid_definition': solid_def.name,
+            'version': version,
+            'config': solid_config.config if solid_config else None,
+            'resources': {
+                key: resources_config.get(key) for key in solid_def.required_resource_keys
+            },
+            'inputs': inputs,
+        },
+        sort_keys=True,
+    )
+
+    cache_keys[step.key] = hashlib.sha1(key_data.encode('utf-8')).hexdigest()
+    return cache_keys[step.key]
+
+
+def _output_identity(step_context, execution_plan, handle, digests, cache_keys):
+    if digests.get(handle):
+        return 'digest:{}'.format(digests[handle])
+
+    step_keys_to_execute = step_context.pipeline_run.step_keys_to_execute
+    if step_keys_to_execute is None or handle.step_key in step_keys_to_execute:
+        upstream_key = _cache_key_for_step(
+            step_context,
+            execution_plan,
+            execution_plan.get_step_by_key(handle.step_key),
+            digests,
+            cache_keys,
+        )
+        if upstream_key is None:
+            return None
+        return 'step:{}:{}'.format(upstream_key, handle.output_name)
+
+    # the output was copied from the previous run
+    previous_run_id = step_context.pipeline_run.previous_run_id
+    if previous_run_id is None:
+        return None
+    return 'run:{}:{}:{}'.format(previous_run_id, handle.step_key, handle.output_name)
+
+
+def find_memoized_step(step_context, cache_key):
+    '''The most recent step recorded for a cache key whose outputs are all still stored.
+
+    Returns:
+        Optional[MemoizedStep]
+    '''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.str_param(cache_key, 'cache_key')
+
+    step_output_dict = step_context.step.step_output_dict
+    intermediates_manager = step_context.intermediates_manager
+
+    for memoized_step in step_context.instance.get_memoized_steps(
+        cache_key, limit=MEMOIZED_STEP_CANDIDATES
+    ):
+        if all(
+            output_name in step_output_dict
+            and intermediates_manager.has_intermediate_in_run(
+                step_context,
+                memoized_step.run_id,
+                StepOutputHandle(memoized_step.step_key, output_name),
+            )
+            for output_name in memoized_step.output_names
+        ):
+            return memoized_step
+
+    return None
+
+
+def record_memoized_step(step_context, cache_key, output_names):
+    '''Record that a step that executed with a cache key stored the given outputs.'''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.str_param(cache_key, 'cache_key')
+    check.list_param(output_names, 'output_names', of_type=str)
+
+    step_context.instance.add_memoized_step(
+        MemoizedStep(cache_key, step_context.run_id, step_context.step.key, sorted(output_names))
+    )
+
+
 def is_step_failure_event(record):
     check.inst_param(record, 'record', EventRecord)
     if not record.is_dagster_event:
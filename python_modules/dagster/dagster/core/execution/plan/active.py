@@ -1,7 +1,10 @@
+import heapq
+import itertools
 import time
 
 from dagster import check
-from dagster.core.events import DagsterEvent
+from dagster.core.definitions.events import EventMetadataEntry
+from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.retries import Retries
 
 from .plan import ExecutionPlan
@@ -15,16 +18,40 @@ class ActiveExecution(object):
     '''State machine used to track progress through execution of an ExecutionPlan
     '''
 
-    def __init__(self, execution_plan, retries, sort_key_fn=None):
+    def __init__(self, execution_plan, retries, sort_key_fn=None, release_intermediates=False):
         self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
         self._retries = check.inst_param(retries, 'retries', Retries)
         self._sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
+        self._release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
 
-        # All steps to be executed start out here in _pending
-        self._pending = self._plan.execution_deps()
-
-        # steps move in to these buckets as a result of _update calls
+        # For each output produced by this plan, the steps in the plan that consume it and have not
+        # yet succeeded. Once that set is empty the intermediate is moved to _releasable.
+        # https://github.com/dagster-io/dagster/issues/811
+        self._unfinished_consumers = (
+            self._build_unfinished_consumers() if self._release_intermediates else {}
+        )
+        self._releasable = []
+
+        # For each step to be executed, the steps it depends on, and the inverse: for each step, the
+        # steps in the plan that depend on it
+        self._deps = self._plan.execution_deps()
+        self._dependents = {}
+        for step_key, requirements in self._deps.items():
+            for requirement in requirements:
+                self._dependents.setdefault(requirement, []).append(step_key)
+
+        # All steps to be executed start out here in _pending, along with the number of their
+        # dependencies that have not yet completed. _upstream_failed tracks the pending steps with
+        # at least one dependency that completed without succeeding.
+        self._pending = {}
+        self._upstream_failed = set()
+
+        # steps move in to these buckets as their dependencies complete. _executable is a heap of
+        # (sort key, insertion order, step key) so that ties keep the order steps became ready in.
         self._executable = []
+        self._executable_counter = itertools.count()
         self._pending_skip = []
         self._pending_retry = []
         self._waiting_to_retry = {}
@@ -38,30 +65,75 @@ class ActiveExecution(object):
         self._failed = set()
         self._skipped = set()
 
-        # Start the show by loading _executable with the set of _pending steps that have no deps
-        self._update()
+        # Start the show by loading _executable with the set of steps that have no deps
+        for step_key, requirements in self._deps.items():
+            if requirements:
+                self._pending[step_key] = len(requirements)
+            else:
+                self._push_executable(step_key)
+
+    def _build_unfinished_consumers(self):
+        step_keys = set(self._plan.step_keys_to_execute)
+        consumers = {}
+        for step_key in self._plan.step_keys_to_execute:
+            for step_input in self._plan.get_step_by_key(step_key).step_inputs:
+                for handle in step_input.source_handles:
+                    if handle.step_key in step_keys:
+                        consumers.setdefault(handle, set()).add(step_key)
+        return consumers
+
+    def _release_inputs_of(self, step_key):
+        if not self._release_intermediates:
+            return
+
+        for step_input in self._plan.get_step_by_key(step_key).step_inputs:
+            for handle in step_input.source_handles:
+                consumers = self._unfinished_consumers.get(handle)
+                if consumers is None:
+                    continue
+                consumers.discard(step_key)
+                if not consumers:
+                    del self._unfinished_consumers[handle]
+                    self._releasable.append(handle)
+
+    def _push_executable(self, step_key):
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self._plan.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
 
-    def _update(self):
-        '''Moves steps from _pending to _executable / _pending_skip / _pending_retry
-           as a function of what has been _completed
+    def _resolve_dependents_of(self, step_key):
+        '''Moves the dependents of a newly completed step from _pending to _executable /
+           _pending_skip once all of their dependencies have completed
         '''
-        new_steps_to_execute = []
-        new_steps_to_skip = []
-        for step_key, requirements in self._pending.items():
-
-            if requirements.issubset(self._completed):
-                if requirements.issubset(self._success):
-                    new_steps_to_execute.append(step_key)
-                else:
-                    new_steps_to_skip.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        succeeded = step_key in self._success
+        for dependent_key in self._dependents.get(step_key, []):
+            if dependent_key not in self._pending:
+                continue
+
+            if not succeeded:
+                self._upstream_failed.add(dependent_key)
+
+            self._pending[dependent_key] -= 1
+            if self._pending[dependent_key] > 0:
+                continue
+
+            del self._pending[dependent_key]
+            if dependent_key in self._upstream_failed:
+                self._upstream_failed.discard(dependent_key)
+                self._pending_skip.append(dependent_key)
+            else:
+                self._push_executable(dependent_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+    def _update(self):
+        '''Moves steps waiting to retry to _executable once their retry time has passed
+        '''
+        if not self._waiting_to_retry:
+            return
 
         ready_to_retry = []
         tick_time = time.time()
@@ -70,7 +142,7 @@ class ActiveExecution(object):
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_til_ready(self):
@@ -98,28 +170,24 @@ class ActiveExecution(object):
         check.opt_int_param(limit, 'limit')
         self._update()
 
-        steps = sorted(
-            [self._plan.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
-
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        while self._executable and (not limit or len(steps) < limit):
+            _, _, step_key = heapq.heappop(self._executable)
+            self._in_flight.add(step_key)
+            steps.append(self._plan.get_step_by_key(step_key))
 
         return steps
 
     def get_steps_to_skip(self):
         self._update()
 
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
+
         steps = []
-        steps_to_skip = list(self._pending_skip)
         for key in steps_to_skip:
             steps.append(self._plan.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -150,6 +218,41 @@ class ActiveExecution(object):
 
             steps_to_skip = self.get_steps_to_skip()
 
+    def released_intermediate_events_iterator(self, pipeline_context):
+        '''Release the intermediates that no remaining step in the plan will read, yielding an
+        engine event for each one that was released.
+
+        Outputs with no consumers in the plan are never released, so the results of the plan
+        remain available once it completes.
+        '''
+        intermediates_manager = pipeline_context.intermediates_manager
+
+        releasable = self._releasable
+        self._releasable = []
+
+        for step_output_handle in releasable:
+            size = intermediates_manager.release_intermediate(pipeline_context, step_output_handle)
+            if size is None:
+                continue
+
+            yield DagsterEvent.engine_event(
+                pipeline_context,
+                'Released intermediate for output {output_name} of step {step_key}, which no '
+                'remaining steps require ({size} bytes freed).'.format(
+                    output_name=step_output_handle.output_name,
+                    step_key=step_output_handle.step_key,
+                    size=size,
+                ),
+                EngineEventData(
+                    metadata_entries=[
+                        EventMetadataEntry.text(step_output_handle.step_key, 'step_key'),
+                        EventMetadataEntry.text(step_output_handle.output_name, 'output_name'),
+                        EventMetadataEntry.text(str(size), 'bytes_released'),
+                    ]
+                ),
+                step_key=step_output_handle.step_key,
+            )
+
     def mark_failed(self, step_key):
         self._failed.add(step_key)
         self._mark_complete(step_key)
@@ -157,6 +260,9 @@ class ActiveExecution(object):
     def mark_success(self, step_key):
         self._success.add(step_key)
         self._mark_complete(step_key)
+        # Only success releases inputs: failed and skipped steps keep theirs so that the run can
+        # be re-executed from the point of failure.
+        self._release_inputs_of(step_key)
 
     def mark_skipped(self, step_key):
         self._skipped.add(step_key)
@@ -169,15 +275,17 @@ class ActiveExecution(object):
         )
         check.opt_float_param(at_time, 'at_time')
 
-        # if retries are enabled - queue this back up
+        # if retries are enabled - queue this back up. Its dependencies have already succeeded, so
+        # it is executable again as soon as any retry delay has passed.
         if self._retries.enabled:
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.execution_deps()[step_key]
+                self._push_executable(step_key)
 
         elif self._retries.deferred:
             self._completed.add(step_key)
+            self._resolve_dependents_of(step_key)
 
         self._retries.mark_attempt(step_key)
         self._in_flight.remove(step_key)
@@ -195,6 +303,7 @@ class ActiveExecution(object):
         )
         self._in_flight.remove(step_key)
         self._completed.add(step_key)
+        self._resolve_dependents_of(step_key)
 
     def handle_event(self, dagster_event):
         check.inst_param(dagster_event, 'dagster_event', DagsterEvent)
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from dagster import check
+from dagster.core.definitions import PipelineDefinition
+from dagster.core.execution.config import IRunConfig, RunConfig
+from dagster.core.system_config.objects import EnvironmentConfig
+
+from .plan import ExecutionPlan
+
+# Maximum number of (environment_dict, mode) combinations cached for each pipeline
+EXECUTION_PLAN_CACHE_SIZE = 16
+
+
+def environment_dict_hash(environment_dict):
+    '''A content hash of an environment dict, or None if it is not JSON serializable.'''
+    check.dict_param(environment_dict, 'environment_dict')
+    try:
+        serialized = json.dumps(environment_dict, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+class ExecutionPlanCache(object):
+    '''Caches the validated EnvironmentConfig and full ExecutionPlan built for a pipeline.
+
+    Every step executed in a worker or child process builds the environment config, which
+    validates the whole environment dict, and the plan for the whole pipeline before selecting
+    the step it executes. With the cache, both are built once per process for a given environment
+    and mode, and the plans for individual steps are derived from the cached full plan.
+
+    Each PipelineDefinition holds its own cache (see
+    :py:meth:`PipelineDefinition.get_execution_plan_cache`), since plans hold on to the
+    definition's compute functions; entries are keyed by a content hash of the environment dict,
+    the mode and the previous run id. Environment dicts that cannot be hashed are never cached.
+    '''
+
+    def __init__(self, pipeline_def, max_size=EXECUTION_PLAN_CACHE_SIZE):
+        self._pipeline_def = check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._environment_configs = OrderedDict()
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, entries, key, build):
+        if key is None:
+            return build()
+
+        with self._lock:
+            if key in entries:
+                entries[key] = entries.pop(key)
+                return entries[key]
+
+        value = build()
+
+        with self._lock:
+            entries[key] = value
+            while len(entries) > self._max_size:
+                entries.popitem(last=False)
+
+        return value
+
+    def _mode(self, run_config):
+        return run_config.mode or self._pipeline_def.get_default_mode_name()
+
+    def get_environment_config(self, environment_dict, run_config):
+        environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
+        check.inst_param(run_config, 'run_config', IRunConfig)
+
+        env_hash = environment_dict_hash(environment_dict)
+        return self._get(
+            self._environment_configs,
+            (env_hash, self._mode(run_config)) if env_hash else None,
+            lambda: EnvironmentConfig.build(self._pipeline_def, environment_dict, run_config),
+        )
+
+    def get_execution_plan(self, environment_dict, run_config):
+        environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
+        check.inst_param(run_config, 'run_config', IRunConfig)
+
+        mode = self._mode(run_config)
+        env_hash = environment_dict_hash(environment_dict)
+
+        def _build_full_plan():
+            full_run_config = RunConfig(mode=mode, previous_run_id=run_config.previous_run_id)
+            return ExecutionPlan.build(
+                self._pipeline_def,
+                self.get_environment_config(environment_dict, full_run_config),
+                full_run_config,
+            )
+
+        full_plan = self._get(
+            self._plans,
+            (env_hash, mode, run_config.previous_run_id) if env_hash else None,
+            _build_full_plan,
+        )
+
+        if run_config.step_keys_to_execute:
+            return full_plan.build_subset_plan(run_config.step_keys_to_execute)
+
+        return full_plan
@@ -0,0 +1,137 @@
+from dagster import check
+from dagster.core.definitions.pipeline import PipelineRunsFilter
+from dagster.core.events import DagsterEventType
+from dagster.core.utils import toposort_flatten
+
+from .active import _default_sort_key
+from .plan import ExecutionPlan
+
+# Number of previous runs of a pipeline whose step durations are averaged
+CRITICAL_PATH_HISTORY_RUNS = 10
+
+
+def historical_step_durations(instance, pipeline_name, exclude_run_id=None, max_runs=None):
+    '''The mean duration, in seconds, of each step that succeeded in recent runs of a pipeline.
+
+    Durations are measured from the STEP_START to the STEP_SUCCESS event of each step in the event
+    log, so a step that was retried is measured from the start of its last attempt. Only those
+    events are read from the event log of each run.
+
+    Args:
+        instance (DagsterInstance): The instance whose runs and event logs are read.
+        pipeline_name (str): The pipeline whose runs are read.
+        exclude_run_id (Optional[str]): A run to ignore, typically the one being scheduled.
+        max_runs (Optional[int]): The number of most recent runs to read. Defaults to
+            CRITICAL_PATH_HISTORY_RUNS.
+
+    Returns:
+        Dict[str, float]: Mean durations by step key.
+    '''
+    from dagster.core.instance import DagsterInstance
+
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.opt_str_param(exclude_run_id, 'exclude_run_id')
+    check.opt_int_param(max_runs, 'max_runs')
+    if max_runs is None:
+        max_runs = CRITICAL_PATH_HISTORY_RUNS
+
+    runs = [
+        run
+        for run in instance.get_runs(
+            filters=PipelineRunsFilter(pipeline_name=pipeline_name), limit=max_runs + 1
+        )
+        if run.run_id != exclude_run_id
+    ][:max_runs]
+
+    durations = {}
+    for run in runs:
+        start_times = {}
+        for record in instance.logs_of_types(
+            run.run_id, [DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS]
+        ):
+            if not record.step_key:
+                continue
+
+            event_type = record.dagster_event.event_type
+            if event_type == DagsterEventType.STEP_START:
+                start_times[record.step_key] = record.timestamp
+            elif event_type == DagsterEventType.STEP_SUCCESS and record.step_key in start_times:
+                durations.setdefault(record.step_key, []).append(
+                    record.timestamp - start_times[record.step_key]
+                )
+
+    return {step_key: sum(values) / len(values) for step_key, values in durations.items()}
+
+
+def critical_path_lengths(execution_plan, step_durations=None):
+    '''The length of the longest path from each step to the end of an execution plan.
+
+    The length of a path is the sum of the weights of the steps on it, including the step itself.
+    Steps are weighted by their duration in step_durations; steps without one are weighted by the
+    mean of the known durations, or all steps are given unit weight when no durations are known.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan whose steps to execute are ranked.
+        step_durations (Optional[Dict[str, float]]): Durations by step key, as returned by
+            historical_step_durations.
+
+    Returns:
+        Dict[str, float]: Critical path lengths by step key.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    step_durations = check.opt_dict_param(step_durations, 'step_durations', key_type=str)
+
+    deps = execution_plan.execution_deps()
+
+    known_durations = [step_durations[key] for key in deps if key in step_durations]
+    default_weight = sum(known_durations) / len(known_durations) if known_durations else 1.0
+
+    dependents = {}
+    for step_key, requirements in deps.items():
+        for requirement in requirements:
+            dependents.setdefault(requirement, []).append(step_key)
+
+    lengths = {}
+    for step_key in reversed(toposort_flatten(deps)):
+        lengths[step_key] = step_durations.get(step_key, default_weight) + max(
+            [lengths[dependent] for dependent in dependents.get(step_key, [])] or [0.0]
+        )
+
+    return lengths
+
+
+def critical_path_sort_key_fn(execution_plan, step_durations=None, sort_key_fn=None):
+    '''A sort key function for ActiveExecution that starts the steps with the longest path to the
+    end of the plan first.
+
+    Steps are still ordered by sort_key_fn first, so explicit priorities are respected, and the
+    critical path only breaks ties between steps of the same priority.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to be executed.
+        step_durations (Optional[Dict[str, float]]): Durations by step key used to weight steps,
+            as returned by historical_step_durations.
+        sort_key_fn (Optional[Callable[[ExecutionStep], Any]]): The sort key function used for
+            explicit priorities. Defaults to ordering by the ``dagster/priority`` tag.
+    '''
+    lengths = critical_path_lengths(execution_plan, step_durations)
+    sort_key_fn = check.opt_callable_param(sort_key_fn, 'sort_key_fn', _default_sort_key)
+
+    return lambda step: (sort_key_fn(step), -1 * lengths.get(step.key, 0.0))
+
+
+def critical_path_sort_key_fn_for_context(pipeline_context, execution_plan, sort_key_fn=None):
+    '''critical_path_sort_key_fn weighted by the durations of steps in previous runs of the
+    pipeline being executed.
+    '''
+    from dagster.core.execution.context.system import SystemPipelineExecutionContext
+
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+
+    step_durations = historical_step_durations(
+        pipeline_context.instance,
+        pipeline_context.pipeline_def.name,
+        exclude_run_id=pipeline_context.run_id,
+    )
+    return critical_path_sort_key_fn(execution_plan, step_durations, sort_key_fn)
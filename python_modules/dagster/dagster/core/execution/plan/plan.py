@@ -332,12 +332,11 @@ class ExecutionPlan(
         for key in self.step_keys_to_execute:
             deps[key] = set()
 
+        step_keys_to_execute = set(self.step_keys_to_execute)
         for key in self.step_keys_to_execute:
             step = self.step_dict[key]
             for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
+                deps[step.key].update(step_input.dependency_keys.intersection(step_keys_to_execute))
         return deps
 
     def build_subset_plan(self, step_keys_to_execute):
@@ -352,11 +351,11 @@ class ExecutionPlan(
         )
 
     def start(
-        self, retries, sort_key_fn=None,
+        self, retries, sort_key_fn=None, release_intermediates=False,
     ):
         from .active import ActiveExecution
 
-        return ActiveExecution(self, retries, sort_key_fn)
+        return ActiveExecution(self, retries, sort_key_fn, release_intermediates)
 
     def step_key_for_single_step_plans(self):
         # Temporary hack to isolate single-step plans, which are often the representation of
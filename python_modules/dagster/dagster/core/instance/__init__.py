@@ -116,6 +116,10 @@ class DagsterInstance:
         telemetry_settings (Optional[Dict]): Specifies certain telemetry-specific, per-instance
             settings, such as whether it is enabled. These are set in the ``dagster.yaml`` under
             the key ``telemetry``
+        checks_settings (Optional[Dict]): Specifies whether the parameter checks on hot paths
+            (e.g. the constructors of events) are optimized away, for every process using this
+            instance. These are set in the ``dagster.yaml`` under the key ``checks``. They can also
+            be optimized away by setting the ``DAGSTER_OPTIMIZED_CHECKS`` environment variable.
         ref (Optional[InstanceRef]): Used by internal machinery to pass instances across process
             boundaries.
     '''
@@ -134,6 +138,7 @@ class DagsterInstance:
         run_launcher=None,
         dagit_settings=None,
         telemetry_settings=None,
+        checks_settings=None,
         ref=None,
     ):
         from dagster.core.storage.compute_log_manager import ComputeLogManager
@@ -143,6 +148,7 @@ class DagsterInstance:
         from dagster.core.storage.schedules import ScheduleStorage
         from dagster.core.scheduler import Scheduler
         from dagster.core.launcher import RunLauncher
+        from .event_buffer import EventWriteBuffer
 
         self._instance_type = check.inst_param(instance_type, 'instance_type', InstanceType)
         self._local_artifact_storage = check.inst_param(
@@ -160,11 +166,23 @@ class DagsterInstance:
         self._run_launcher = check.opt_inst_param(run_launcher, 'run_launcher', RunLauncher)
         self._dagit_settings = check.opt_dict_param(dagit_settings, 'dagit_settings')
         self._telemetry_settings = check.opt_dict_param(telemetry_settings, 'telemetry_settings')
+        self._checks_settings = check.opt_dict_param(checks_settings, 'checks_settings')
+
+        # Only ever switches the optimized checks on, e.g. in the subprocesses of a run, which
+        # rehydrate this instance from its ref
+        if self.optimized_checks:
+            check.set_optimized_checks(True)
 
         self._ref = check.opt_inst_param(ref, 'ref', InstanceRef)
 
         self._subscribers = defaultdict(list)
 
+        # Writes to persistent event storage go through a write-behind buffer, flushed before any
+        # read from this instance; in-memory storage is written through directly
+        self._event_buffer = (
+            EventWriteBuffer(self._event_storage) if self._event_storage.is_persistent else None
+        )
+
     # ctors
 
     @staticmethod
@@ -227,6 +245,7 @@ class DagsterInstance:
             run_launcher=instance_ref.run_launcher,
             dagit_settings=instance_ref.dagit_settings,
             telemetry_settings=instance_ref.telemetry_settings,
+            checks_settings=instance_ref.checks_settings,
             ref=instance_ref,
         )
 
@@ -271,6 +290,7 @@ class DagsterInstance:
 
         dagit_settings = self._dagit_settings if self._dagit_settings else None
         telemetry_settings = self._telemetry_settings if self._telemetry_settings else None
+        checks_settings = self._checks_settings if self._checks_settings else None
 
         return (
             'DagsterInstance components:\n\n'
@@ -283,6 +303,7 @@ class DagsterInstance:
             '  Run Launcher:\n{run_launcher}\n'
             '  Dagit:\n{dagit}\n'
             '  Telemetry:\n{telemetry}\n'
+            '  Checks:\n{checks}\n'
             ''.format(
                 artifact=_info(self._local_artifact_storage),
                 run=_info(self._run_storage),
@@ -293,6 +314,7 @@ class DagsterInstance:
                 run_launcher=_info(self._run_launcher),
                 dagit=_info(dagit_settings),
                 telemetry=_info(telemetry_settings),
+                checks=_info(checks_settings),
             )
         )
 
@@ -341,6 +363,10 @@ class DagsterInstance:
         else:
             return dagster_telemetry_enabled_default
 
+    @property
+    def optimized_checks(self):
+        return bool(self._checks_settings.get('optimized'))
+
     def upgrade(self, print_fn=lambda _: None):
         print_fn('Updating run storage...')
         self._run_storage.upgrade()
@@ -349,8 +375,11 @@ class DagsterInstance:
         self._event_storage.upgrade()
 
     def dispose(self):
+        self.flush_events()
         self._run_storage.dispose()
         self._event_storage.dispose()
+        if self._schedule_storage:
+            self._schedule_storage.dispose()
 
     # run storage
 
@@ -358,8 +387,13 @@ class DagsterInstance:
         return self._run_storage.get_run_by_id(run_id)
 
     def get_run_stats(self, run_id):
+        self.flush_events()
         return self._event_storage.get_stats_for_run(run_id)
 
+    def get_runs_stats(self, run_ids):
+        self.flush_events()
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -420,24 +454,46 @@ class DagsterInstance:
         return self._run_storage.get_runs_count(filters)
 
     def wipe(self):
+        self.flush_events()
         self._run_storage.wipe()
         self._event_storage.wipe()
 
     def delete_run(self, run_id):
+        self.flush_events()
         self._run_storage.delete_run(run_id)
         self._event_storage.delete_events(run_id)
 
+    def add_memoized_step(self, memoized_step):
+        self._run_storage.add_memoized_step(memoized_step)
+
+    def get_memoized_steps(self, cache_key, limit=None):
+        return self._run_storage.get_memoized_steps(cache_key, limit)
+
     # event storage
 
-    def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+    def logs_after(self, run_id, cursor, limit=None):
+        self.flush_events()
+        return self._event_storage.get_logs_for_run(run_id, cursor=cursor, limit=limit)
+
+    def stream_logs(self, run_id, cursor=-1, chunk_size=None):
+        self.flush_events()
+        return self._event_storage.stream_logs_for_run(run_id, cursor=cursor, chunk_size=chunk_size)
 
     def all_logs(self, run_id):
+        self.flush_events()
         return self._event_storage.get_logs_for_run(run_id)
 
+    def logs_of_types(self, run_id, dagster_event_types):
+        self.flush_events()
+        return self._event_storage.get_logs_for_run_by_type(run_id, dagster_event_types)
+
     def watch_event_logs(self, run_id, cursor, cb):
+        self.flush_events()
         return self._event_storage.watch(run_id, cursor, cb)
 
+    def end_watch_event_logs(self, run_id, cb):
+        return self._event_storage.end_watch(run_id, cb)
+
     # event subscriptions
 
     def get_logger(self):
@@ -449,7 +505,11 @@ class DagsterInstance:
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_buffer:
+            # lifecycle events, including the pipeline events below, are flushed immediately
+            self._event_buffer.add(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -457,6 +517,11 @@ class DagsterInstance:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def flush_events(self):
+        '''Write any buffered events through to event log storage.'''
+        if self._event_buffer:
+            self._event_buffer.flush()
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
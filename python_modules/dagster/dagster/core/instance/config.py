@@ -53,4 +53,7 @@ def define_dagster_config_cls():
             is_required=False,
         ),
         'telemetry': Field({'enabled': Field(Bool, default_value=False, is_required=False)}),
+        'checks': Field(
+            {'optimized': Field(Bool, default_value=False, is_required=False)}, is_required=False
+        ),
     }
@@ -0,0 +1,142 @@
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from dagster.core.events.log import EventRecord
+from dagster.core.storage.event_log import EventLogStorage
+
+# Maximum number of events held before the buffer is written through to storage
+EVENT_BUFFER_MAX_SIZE = 100
+
+# Maximum number of seconds an event is held before the buffer is written through to storage
+EVENT_BUFFER_FLUSH_INTERVAL = 0.25
+
+# Events that mark progress through a run -- these are written through immediately, along with
+# everything buffered before them, so that run status and step state in storage are never stale
+LIFECYCLE_EVENTS = {
+    DagsterEventType.PIPELINE_INIT_FAILURE,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
+
+def is_lifecycle_event(event):
+    check.inst_param(event, 'event', EventRecord)
+    return event.is_dagster_event and event.dagster_event.event_type in LIFECYCLE_EVENTS
+
+
+def _flush_at_exit(buffer_ref):
+    event_buffer = buffer_ref()
+    if event_buffer is not None:
+        event_buffer.flush()
+
+
+class EventWriteBuffer(object):
+    '''Write-behind buffer in front of an EventLogStorage.
+
+    Events are written through to storage in batches, with ``store_events``, once ``max_size``
+    events are pending, within ``flush_interval`` seconds of an event being added, or when a
+    lifecycle event is added. A daemon thread handles the time-based flushes; it is only running
+    while events are pending.
+
+    The buffer is fork-aware: a child process discards any events pending in its parent at fork
+    time, which remain the parent's to write.
+    '''
+
+    def __init__(
+        self,
+        event_storage,
+        max_size=EVENT_BUFFER_MAX_SIZE,
+        flush_interval=EVENT_BUFFER_FLUSH_INTERVAL,
+    ):
+        self._event_storage = check.inst_param(event_storage, 'event_storage', EventLogStorage)
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._flush_interval = check.numeric_param(flush_interval, 'flush_interval')
+        self._pid = os.getpid()
+        self._events = []
+        # guards self._events and self._flusher
+        self._lock = threading.Lock()
+        # serializes writes, so batches reach storage in the order their events were added
+        self._write_lock = threading.Lock()
+        self._flusher = None
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # the parent's locks may have been held by one of its other threads at fork time
+            self._pid = os.getpid()
+            self._events = []
+            self._lock = threading.Lock()
+            self._write_lock = threading.Lock()
+            self._flusher = None
+
+    def _start_flusher(self):
+        # must be called with self._lock held
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop)
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def add(self, event):
+        '''Buffer an event, writing the buffer through to storage if it is full or the event is a
+        lifecycle event.'''
+        check.inst_param(event, 'event', EventRecord)
+        self._check_pid()
+
+        with self._lock:
+            self._events.append(event)
+            should_flush = len(self._events) >= self._max_size or is_lifecycle_event(event)
+            if not should_flush:
+                self._start_flusher()
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        '''Write all pending events through to storage.
+
+        If the write fails, the events are put back at the front of the buffer, to be retried by
+        the flushing thread, and the error is raised.
+        '''
+        self._check_pid()
+
+        with self._write_lock:
+            with self._lock:
+                events, self._events = self._events, []
+
+            if not events:
+                return
+
+            try:
+                self._event_storage.store_events(events)
+            except Exception:
+                with self._lock:
+                    self._events[:0] = events
+                    self._start_flusher()
+                raise
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self._flush_interval)
+
+            with self._lock:
+                if not self._events:
+                    self._flusher = None
+                    return
+
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception('Error writing buffered events to event log storage')
@@ -40,7 +40,8 @@ class InstanceRef(
     namedtuple(
         '_InstanceRef',
         'local_artifact_storage_data run_storage_data event_storage_data compute_logs_data '
-        'schedule_storage_data scheduler_data run_launcher_data dagit_settings telemetry_settings',
+        'schedule_storage_data scheduler_data run_launcher_data dagit_settings telemetry_settings '
+        'checks_settings',
     )
 ):
     '''Serializable representation of a :py:class:`DagsterInstance`.
@@ -59,6 +60,7 @@ class InstanceRef(
         run_launcher_data,
         dagit_settings,
         telemetry_settings,
+        checks_settings=None,
     ):
         return super(self, InstanceRef).__new__(
             self,
@@ -85,6 +87,7 @@ class InstanceRef(
             ),
             dagit_settings=check.opt_dict_param(dagit_settings, 'dagit_settings'),
             telemetry_settings=check.opt_dict_param(telemetry_settings, 'telemetry_settings'),
+            checks_settings=check.opt_dict_param(checks_settings, 'checks_settings'),
         )
 
     @staticmethod
@@ -157,6 +160,7 @@ class InstanceRef(
             run_launcher_data=run_launcher_data,
             dagit_settings=config_value.get('dagit'),
             telemetry_settings=config_value.get('telemetry'),
+            checks_settings=config_value.get('checks'),
         )
 
     @staticmethod
@@ -164,7 +168,7 @@ class InstanceRef(
         def value_for_ref_item(k, v):
             if v is None:
                 return None
-            if k in ['dagit_settings', 'telemetry_settings']:
+            if k in ['dagit_settings', 'telemetry_settings', 'checks_settings']:
                 return v
             return ConfigurableClassData(*v)
 
@@ -145,8 +145,8 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
         )
 
     def _prepare_message(self, orig_message, message_props):
-        check.str_param(orig_message, 'orig_message')
-        check.dict_param(message_props, 'message_props')
+        check.hot_path.str_param(orig_message, 'orig_message')
+        check.hot_path.dict_param(message_props, 'message_props')
 
         # These are todos to further align with the Python logging API
         check.invariant(
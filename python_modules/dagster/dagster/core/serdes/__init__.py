@@ -26,10 +26,74 @@ from dagster import check, seven
 _WHITELISTED_TUPLE_MAP = {}
 _WHITELISTED_ENUM_MAP = {}
 
+# Functions that pack and unpack the values of each serializable namedtuple class, keyed by class.
+# They are built once per class, so that its fields and constructor signature, which is expensive
+# to inspect, are not looked up again for every value.
+_TUPLE_PACKERS = {}
+_TUPLE_UNPACKERS = {}
+
+# Values of these exact types pack and unpack to themselves. Checking the exact type rather than
+# using isinstance keeps, e.g., IntEnum members on the enum path.
+_SCALAR_TYPES = frozenset(list(six.string_types) + [six.text_type, int, float, bool, type(None)])
+
 
 def register_serdes_tuple_fallbacks(fallback_map):
     for class_name, klass in fallback_map.items():
         _WHITELISTED_TUPLE_MAP[class_name] = klass
+        if klass is not None:
+            _get_tuple_unpacker(klass)
+
+
+def _compile_tuple_packer(klass):
+    klass_name = klass.__name__
+    fields = klass._fields
+
+    def pack(val, enum_map, tuple_map):
+        packed = {
+            field: value
+            if type(value) in _SCALAR_TYPES
+            else _pack_value(value, enum_map, tuple_map)
+            for field, value in zip(fields, val)
+        }
+        packed['__class__'] = klass_name
+        return packed
+
+    return pack
+
+
+def _compile_tuple_unpacker(klass):
+    args_for_class = frozenset(seven.get_args(klass))
+
+    def unpack(val, enum_map, tuple_map):
+        # Naively implements backwards compatibility by filtering arguments that aren't present in
+        # the constructor. If a property is present in the serialized object, but doesn't exist in
+        # the version of the class loaded into memory, that property will be completely ignored.
+        # This also drops the '__class__' key.
+        return klass(
+            **{
+                key: value
+                if type(value) in _SCALAR_TYPES
+                else _unpack_value(value, enum_map, tuple_map)
+                for key, value in val.items()
+                if key in args_for_class
+            }
+        )
+
+    return unpack
+
+
+def _get_tuple_packer(klass):
+    packer = _TUPLE_PACKERS.get(klass)
+    if packer is None:
+        packer = _TUPLE_PACKERS[klass] = _compile_tuple_packer(klass)
+    return packer
+
+
+def _get_tuple_unpacker(klass):
+    unpacker = _TUPLE_UNPACKERS.get(klass)
+    if unpacker is None:
+        unpacker = _TUPLE_UNPACKERS[klass] = _compile_tuple_unpacker(klass)
+    return unpacker
 
 
 def _whitelist_for_serdes(enum_map, tuple_map):
@@ -38,6 +102,7 @@ def _whitelist_for_serdes(enum_map, tuple_map):
             enum_map[klass.__name__] = klass
         elif issubclass(klass, tuple):
             tuple_map[klass.__name__] = klass
+            _get_tuple_unpacker(klass)
         else:
             check.failed('Can not whitelist class {klass} for serdes'.format(klass=klass))
         return klass
@@ -56,28 +121,27 @@ def pack_value(val):
 
 
 def _pack_value(val, enum_map, tuple_map):
+    if type(val) in _SCALAR_TYPES:
+        return val
     if isinstance(val, list):
-        return [_pack_value(i, enum_map, tuple_map) for i in val]
+        return [i if type(i) in _SCALAR_TYPES else _pack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, tuple):
         klass_name = val.__class__.__name__
-        check.invariant(
-            klass_name in tuple_map,
-            'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
-        )
-        base_dict = {
-            key: _pack_value(value, enum_map, tuple_map) for key, value in val._asdict().items()
-        }
-        base_dict['__class__'] = klass_name
-        return base_dict
+        if klass_name not in tuple_map:
+            check.failed(
+                'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name)
+            )
+        return _get_tuple_packer(val.__class__)(val, enum_map, tuple_map)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
-        check.invariant(
-            klass_name in enum_map,
-            'Can only serialize whitelisted Enums, recieved {}'.format(klass_name),
-        )
+        if klass_name not in enum_map:
+            check.failed('Can only serialize whitelisted Enums, recieved {}'.format(klass_name))
         return {'__enum__': str(val)}
     if isinstance(val, dict):
-        return {key: _pack_value(value, enum_map, tuple_map) for key, value in val.items()}
+        return {
+            key: value if type(value) in _SCALAR_TYPES else _pack_value(value, enum_map, tuple_map)
+            for key, value in val.items()
+        }
 
     return val
 
@@ -97,10 +161,14 @@ def unpack_value(val):
 
 
 def _unpack_value(val, enum_map, tuple_map):
+    if type(val) in _SCALAR_TYPES:
+        return val
     if isinstance(val, list):
-        return [_unpack_value(i, enum_map, tuple_map) for i in val]
+        return [
+            i if type(i) in _SCALAR_TYPES else _unpack_value(i, enum_map, tuple_map) for i in val
+        ]
     if isinstance(val, dict) and val.get('__class__'):
-        klass_name = val.pop('__class__')
+        klass_name = val['__class__']
         if klass_name not in tuple_map:
             check.failed(
                 'Attempted to deserialize class "{}" which is not in the serdes whitelist.'.format(
@@ -112,23 +180,17 @@ def _unpack_value(val, enum_map, tuple_map):
         if klass is None:
             return None
 
-        unpacked_val = {
-            key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()
-        }
-
-        # Naively implements backwards compatibility by filtering arguments that aren't present in
-        # the constructor. If a property is present in the serialized object, but doesn't exist in
-        # the version of the class loaded into memory, that property will be completely ignored.
-        # The call to seven.get_args turns out to be pretty expensive -- we should probably turn
-        # to, e.g., manually managing the deprecated keys on the serdes constructor.
-        args_for_class = seven.get_args(klass)
-        filtered_val = {k: v for k, v in unpacked_val.items() if k in args_for_class}
-        return klass(**filtered_val)
+        return _get_tuple_unpacker(klass)(val, enum_map, tuple_map)
     if isinstance(val, dict) and val.get('__enum__'):
         name, member = val['__enum__'].split('.')
         return getattr(enum_map[name], member)
     if isinstance(val, dict):
-        return {key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()}
+        return {
+            key: value
+            if type(value) in _SCALAR_TYPES
+            else _unpack_value(value, enum_map, tuple_map)
+            for key, value in val.items()
+        }
 
     return val
 
@@ -145,6 +207,49 @@ def _deserialize_json_to_dagster_namedtuple(json_str, enum_map, tuple_map):
     return _unpack_value(seven.json.loads(json_str), enum_map=enum_map, tuple_map=tuple_map)
 
 
+def _import_msgpack():
+    try:
+        import msgpack  # pylint: disable=import-error
+
+        return msgpack
+    except ImportError:
+        check.failed(
+            'The binary serdes encoding requires the msgpack package. Install it with '
+            '"pip install msgpack".'
+        )
+
+
+def serialize_dagster_namedtuple_to_bytes(nt):
+    '''Serialize a whitelisted namedtuple to a compact binary encoding.
+
+    This is an opt-in alternative to :py:func:`serialize_dagster_namedtuple` for callers that store
+    or transmit large numbers of values and do not need the result to be human readable. JSON
+    remains the default encoding. Requires the optional ``msgpack`` package.
+    '''
+    return _serialize_dagster_namedtuple_to_bytes(
+        nt, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP
+    )
+
+
+def _serialize_dagster_namedtuple_to_bytes(nt, enum_map, tuple_map):
+    return _import_msgpack().packb(_pack_value(nt, enum_map, tuple_map), use_bin_type=True)
+
+
+def deserialize_bytes_to_dagster_namedtuple(data):
+    '''Deserialize a value encoded by :py:func:`serialize_dagster_namedtuple_to_bytes`.'''
+    return _deserialize_bytes_to_dagster_namedtuple(
+        check.inst_param(data, 'data', bytes),
+        enum_map=_WHITELISTED_ENUM_MAP,
+        tuple_map=_WHITELISTED_TUPLE_MAP,
+    )
+
+
+def _deserialize_bytes_to_dagster_namedtuple(data, enum_map, tuple_map):
+    return _unpack_value(
+        _import_msgpack().unpackb(data, raw=False), enum_map=enum_map, tuple_map=tuple_map
+    )
+
+
 @whitelist_for_serdes
 class ConfigurableClassData(
     namedtuple('_ConfigurableClassData', 'module_name class_name config_yaml')
@@ -17,6 +17,19 @@ class ComputeIOType(Enum):
     STDERR = 'stderr'
 
 
+class ComputeLogCaptureMode(Enum):
+    '''How stdout and stderr are mirrored while they are redirected to the compute log files.
+
+    TAIL: a ``tail`` process (and a watcher process that cleans it up if the step process dies) per
+        stream echoes each log file to the original stream.
+    THREAD: each stream is redirected to a pipe, and a thread in the step process writes what it
+        reads from the pipe to both the log file and the original stream.
+    '''
+
+    TAIL = 'tail'
+    THREAD = 'thread'
+
+
 class ComputeLogFileData(namedtuple('ComputeLogFileData', 'path data cursor size download_url')):
     '''Representation of a chunk of compute execution log data'''
 
@@ -120,6 +133,17 @@ class ComputeLogManager(six.with_metaclass(ABCMeta)):
         '''
         return True
 
+    def capture_mode(self, _step_context):
+        '''Hook for choosing how stdout and stderr are mirrored while they are captured.
+
+        Args:
+            _step_context (SystemStepExecutionContext): The execution context for the compute step
+
+        Returns:
+            ComputeLogCaptureMode
+        '''
+        return ComputeLogCaptureMode.TAIL
+
     @abstractmethod
     def on_subscribe(self, subscription):
         '''Hook for managing streaming subscriptions for log data from `dagit`
@@ -196,6 +220,16 @@ class ComputeLogSubscription(object):
                 self.cursor = update.cursor
             should_fetch = update.data and len(update.data.encode('utf-8')) >= MAX_BYTES_CHUNK_READ
 
+    def on_update(self, update):
+        '''Send log data read by the compute log manager from the subscription's cursor on, e.g.
+        when the same data is sent to several subscriptions.'''
+        check.inst_param(update, 'update', ComputeLogFileData)
+        if not self.observer:
+            return
+
+        self.observer.on_next(update)
+        self.cursor = update.cursor
+
     def complete(self):
         if not self.observer:
             return
@@ -1,5 +1,5 @@
 from .base import EventLogStorage
 from .in_memory import InMemoryEventLogStorage
-from .schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from .schema import SqlEventLogRunStatsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
 from .sqlite import SqliteEventLogStorage
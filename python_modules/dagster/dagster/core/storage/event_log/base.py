@@ -3,9 +3,14 @@ from abc import ABCMeta, abstractmethod, abstractproperty
 import pyrsistent
 import six
 
+from dagster import check
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import build_stats_from_events
 
+# Number of events fetched per query when streaming a run's event log
+DEFAULT_LOG_CHUNK_SIZE = 1000
+
 
 class EventLogSequence(pyrsistent.CheckedPVector):
     __type__ = EventRecord
@@ -24,20 +29,91 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     '''
 
     @abstractmethod
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If not set, all logs
+                after the cursor will be returned. (default: None)
+        '''
+
+    def stream_logs_for_run(self, run_id, cursor=-1, chunk_size=None):
+        '''Iterate over the logs corresponding to a run, fetching at most chunk_size at a time.
+
+        Unlike get_logs_for_run, this never holds more than one chunk of the run's logs in memory.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be yielded starting from cursor + 1.
+                (default: -1)
+            chunk_size (Optional[int]): The maximum number of logs in each chunk.
+                (default: DEFAULT_LOG_CHUNK_SIZE)
+
+        Yields:
+            List[EventRecord]: Consecutive, non-empty chunks of the run's logs.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.int_param(cursor, 'cursor')
+        check.opt_int_param(chunk_size, 'chunk_size')
+        if chunk_size is None:
+            chunk_size = DEFAULT_LOG_CHUNK_SIZE
+        check.invariant(chunk_size > 0, 'chunk_size must be positive')
+
+        while True:
+            chunk = self.get_logs_for_run(run_id, cursor=cursor, limit=chunk_size)
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < chunk_size:
+                return
+            cursor += len(chunk)
+
+    def get_logs_for_run_by_type(self, run_id, dagster_event_types):
+        '''Get the logs of a run whose dagster events are of the given types, in order.
+
+        Storages that can select a run's logs by event type without reading all of them should
+        override this.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            dagster_event_types (List[DagsterEventType]): The types of the events to fetch.
+
+        Returns:
+            List[EventRecord]
         '''
+        check.str_param(run_id, 'run_id')
+        dagster_event_types = set(
+            check.list_param(dagster_event_types, 'dagster_event_types', of_type=DagsterEventType)
+        )
+        return [
+            record
+            for record in self.get_logs_for_run(run_id)
+            if record.is_dagster_event and record.dagster_event.event_type in dagster_event_types
+        ]
 
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
 
         return build_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids):
+        '''Get summaries of the events that have occurred in each of several runs.
+
+        Storages that can look up many runs' stats more cheaply than one at a time should override
+        this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs for which to fetch stats.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats for each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
@@ -47,6 +123,17 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def store_events(self, events):
+        '''Store a batch of events, in order, possibly from several pipeline runs.
+
+        Storages that can write many events more cheaply than one at a time should override this.
+
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
@@ -14,17 +14,19 @@ class InMemoryEventLogStorage(EventLogStorage):
         self._lock = defaultdict(gevent.lock.Semaphore)
         self._handlers = defaultdict(set)
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         check.str_param(run_id, 'run_id')
         check.int_param(cursor, 'cursor')
         check.invariant(
             cursor >= -1,
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
+        check.opt_int_param(limit, 'limit')
 
         cursor = cursor + 1
+        end = cursor + limit if limit is not None else None
         with self._lock[run_id]:
-            return self._logs[run_id][cursor:]
+            return self._logs[run_id][cursor:end]
 
     def store_event(self, event):
         check.inst_param(event, 'event', EventRecord)
@@ -11,3 +11,28 @@ SqlEventLogStorageTable = db.Table(
     db.Column('dagster_event_type', db.Text),
     db.Column('timestamp', db.types.TIMESTAMP),
 )
+
+# Indexes backing the per-run reads in SqlEventLogStorage: log fetches are by run id ordered by
+# id (with the cursor as a lower bound), and run stats group each run's events by type and read
+# their timestamps, which the second index covers without touching the event bodies.
+db.Index('idx_event_logs_run_id', SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+db.Index(
+    'idx_event_logs_run_id_event_type',
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.dagster_event_type,
+    SqlEventLogStorageTable.c.timestamp,
+)
+
+# Summary of each run's events, maintained as events are stored so that reading a run's stats does
+# not have to aggregate its event log.
+SqlEventLogRunStatsTable = db.Table(
+    'run_stats',
+    SqlEventLogStorageMetadata,
+    db.Column('run_id', db.String(255), primary_key=True),
+    db.Column('steps_succeeded', db.Integer, nullable=False),
+    db.Column('steps_failed', db.Integer, nullable=False),
+    db.Column('materializations', db.Integer, nullable=False),
+    db.Column('expectations', db.Integer, nullable=False),
+    db.Column('start_time', db.types.TIMESTAMP),
+    db.Column('end_time', db.types.TIMESTAMP),
+)
@@ -1,5 +1,6 @@
 import datetime
 from abc import abstractmethod
+from collections import OrderedDict
 
 import six
 import sqlalchemy as db
@@ -12,8 +13,42 @@ from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serializ
 from dagster.utils import datetime_as_float
 
 from ..pipeline_run import PipelineRunStatsSnapshot
-from .base import EventLogStorage
-from .schema import SqlEventLogStorageTable
+from .base import DEFAULT_LOG_CHUNK_SIZE, EventLogStorage
+from .schema import SqlEventLogRunStatsTable, SqlEventLogStorageTable
+
+# Columns of the run_stats table that count events, keyed by the type of event they count
+RUN_STATS_COUNT_COLUMNS = {
+    DagsterEventType.STEP_SUCCESS.value: 'steps_succeeded',
+    DagsterEventType.STEP_FAILURE.value: 'steps_failed',
+    DagsterEventType.STEP_MATERIALIZATION.value: 'materializations',
+    DagsterEventType.STEP_EXPECTATION_RESULT.value: 'expectations',
+}
+
+RUN_END_EVENT_TYPES = set(
+    [DagsterEventType.PIPELINE_SUCCESS.value, DagsterEventType.PIPELINE_FAILURE.value]
+)
+
+
+def _run_stats_increments(rows):
+    '''Summarize a run's newly stored event rows as increments to the run's row in run_stats.
+
+    Returns None if the rows do not change the run's stats.
+    '''
+    counts = {column: 0 for column in RUN_STATS_COUNT_COLUMNS.values()}
+    times = {}
+    for row in rows:
+        event_type = row['dagster_event_type']
+        if event_type in RUN_STATS_COUNT_COLUMNS:
+            counts[RUN_STATS_COUNT_COLUMNS[event_type]] += 1
+        elif event_type == DagsterEventType.PIPELINE_START.value:
+            times['start_time'] = row['timestamp']
+        elif event_type in RUN_END_EVENT_TYPES:
+            times['end_time'] = row['timestamp']
+
+    if not times and not any(counts.values()):
+        return None
+
+    return counts, times
 
 
 class SqlEventLogStorage(EventLogStorage):
@@ -35,38 +70,91 @@ class SqlEventLogStorage(EventLogStorage):
         out-of-date instance of the storage up to date.
         '''
 
-    def store_event(self, event):
-        '''Store an event corresponding to a pipeline run.
-
-        Args:
-            event (EventRecord): The event to store.
-        '''
+    def _event_to_row(self, event):
         check.inst_param(event, 'event', EventRecord)
 
         dagster_event_type = None
         if event.is_dagster_event:
             dagster_event_type = event.dagster_event.event_type_value
 
-        run_id = event.run_id
-
-        # https://stackoverflow.com/a/54386260/324449
-        event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
+        return dict(
+            run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
             timestamp=datetime.datetime.fromtimestamp(event.timestamp),
         )
 
-        with self.connect(run_id) as conn:
-            conn.execute(event_insert)
+    def store_event(self, event):
+        '''Store an event corresponding to a pipeline run.
+
+        Args:
+            event (EventRecord): The event to store.
+        '''
+        check.inst_param(event, 'event', EventRecord)
+        self.store_events([event])
+
+    def store_events(self, events):
+        '''Store a batch of events, using a single connection and INSERT per run. Each run's
+        stats are updated in the same transaction as its events are inserted.
+
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        rows_by_run_id = OrderedDict()
+        for event in events:
+            rows_by_run_id.setdefault(event.run_id, []).append(self._event_to_row(event))
+
+        for run_id, rows in rows_by_run_id.items():
+            with self.connect(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        rows,
+                    )
+                    self._update_run_stats(conn, run_id, rows)
+
+    def _update_run_stats(self, conn, run_id, rows):
+        '''Apply a batch of a run's newly stored event rows to its row in run_stats.'''
+        increments = _run_stats_increments(rows)
+        if increments is not None:
+            counts, times = increments
+            self._upsert_run_stats(conn, run_id, counts, times)
+
+    def _upsert_run_stats(self, conn, run_id, counts, times):
+        '''Add counts to a run's row in run_stats and overwrite its times, creating the row if it
+        does not exist yet.
+
+        This updates and then inserts if no row was updated, which is safe as long as writers to
+        the same run are serialized by the database, as they are in SQLite. Storages whose
+        databases allow concurrent writers should override this with an atomic upsert.
+        '''
+        values = dict(times)
+        for column, count in counts.items():
+            values[column] = SqlEventLogRunStatsTable.c[column] + count
+
+        updated = conn.execute(
+            SqlEventLogRunStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(SqlEventLogRunStatsTable.c.run_id == run_id)
+            .values(**values)
+        )
+        if updated.rowcount == 0:
+            conn.execute(
+                SqlEventLogRunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id, **dict(counts, **times)
+                )
+            )
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If not set, all logs
+                after the cursor will be returned. (default: None)
         '''
         check.str_param(run_id, 'run_id')
         check.int_param(cursor, 'cursor')
@@ -74,23 +162,40 @@ class SqlEventLogStorage(EventLogStorage):
             cursor >= -1,
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
+        check.opt_int_param(limit, 'limit')
+
+        with self.connect(run_id) as conn:
+            return self._query_logs_for_run(conn, run_id, cursor, limit)
 
-        # cursor starts at 0 & auto-increment column starts at 1 so adjust
-        cursor = cursor + 1
+    def _query_logs_for_run(self, conn, run_id, cursor=-1, limit=None):
+        '''Fetch logs as get_logs_for_run does, over an open connection to the run's logs.'''
+        query = self._logs_query(run_id, cursor)
+        if limit is not None:
+            query = query.limit(limit)
 
+        return self._events_from_rows(run_id, conn.execute(query).fetchall())
+
+    def _logs_query(self, run_id, cursor):
+        '''Select the ids and serialized events of a run's logs after the cursor, in order.
+
+        The cursor counts the run's logs rather than identifying one of them, since event ids are
+        shared by every run whose logs are kept in the same table, so the logs up to it are
+        skipped with an offset. Storages that can find the cursor's log by its id should override
+        this.
+        '''
         query = (
-            db.select([SqlEventLogStorageTable.c.event])
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id > cursor)
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
+        if cursor >= 0:
+            query = query.offset(cursor + 1)
+        return query
 
-        with self.connect(run_id) as conn:
-            results = conn.execute(query).fetchall()
-
+    def _events_from_rows(self, run_id, rows):
         events = []
         try:
-            for (json_str,) in results:
+            for (_id, json_str) in rows:
                 events.append(
                     check.inst_param(
                         deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
@@ -101,9 +206,126 @@ class SqlEventLogStorage(EventLogStorage):
 
         return events
 
+    def stream_logs_for_run(self, run_id, cursor=-1, chunk_size=None):
+        '''Iterate over the logs corresponding to a run, fetching at most chunk_size at a time.
+
+        Each chunk after the first is selected by the ids of the logs after the last one in the
+        chunk before it, rather than by skipping over every log before it.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.int_param(cursor, 'cursor')
+        check.opt_int_param(chunk_size, 'chunk_size')
+        if chunk_size is None:
+            chunk_size = DEFAULT_LOG_CHUNK_SIZE
+        check.invariant(chunk_size > 0, 'chunk_size must be positive')
+
+        query = self._logs_query(run_id, cursor)
+        while True:
+            with self.connect(run_id) as conn:
+                rows = conn.execute(query.limit(chunk_size)).fetchall()
+            if not rows:
+                return
+            yield self._events_from_rows(run_id, rows)
+            if len(rows) < chunk_size:
+                return
+
+            last_id = rows[-1][0]
+            query = self._logs_query(run_id, -1).where(SqlEventLogStorageTable.c.id > last_id)
+
+    def get_logs_for_run_by_type(self, run_id, dagster_event_types):
+        '''Get the logs of a run whose dagster events are of the given types, selecting them by
+        the dagster_event_type column so the run's other events are not read.'''
+        check.str_param(run_id, 'run_id')
+        check.list_param(dagster_event_types, 'dagster_event_types', of_type=DagsterEventType)
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return [
+                check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                )
+                for (json_str,) in results
+            ]
+        except (seven.JSONDecodeError, check.CheckError) as err:
+            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, 'run_id')
 
+        with self.connect(run_id) as conn:
+            stats = self._query_run_stats(conn, [run_id]).get(run_id)
+            if stats is None:
+                stats = self._aggregate_stats_for_run(conn, run_id)
+        return stats
+
+    def get_stats_for_runs(self, run_ids):
+        '''Get the stats for several runs, reading their rows in run_stats with one query.'''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        if not run_ids:
+            return {}
+
+        with self.connect() as conn:
+            stats_by_run_id = self._query_run_stats(conn, run_ids)
+
+        for run_id in run_ids:
+            if run_id not in stats_by_run_id:
+                stats_by_run_id[run_id] = self.get_stats_for_run(run_id)
+
+        return stats_by_run_id
+
+    def _query_run_stats(self, conn, run_ids):
+        query = db.select(
+            [
+                SqlEventLogRunStatsTable.c.run_id,
+                SqlEventLogRunStatsTable.c.steps_succeeded,
+                SqlEventLogRunStatsTable.c.steps_failed,
+                SqlEventLogRunStatsTable.c.materializations,
+                SqlEventLogRunStatsTable.c.expectations,
+                SqlEventLogRunStatsTable.c.start_time,
+                SqlEventLogRunStatsTable.c.end_time,
+            ]
+        ).where(SqlEventLogRunStatsTable.c.run_id.in_(run_ids))
+
+        stats_by_run_id = {}
+        for row in conn.execute(query).fetchall():
+            (
+                run_id,
+                steps_succeeded,
+                steps_failed,
+                materializations,
+                expectations,
+                start_time,
+                end_time,
+            ) = row
+            stats_by_run_id[run_id] = PipelineRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=steps_succeeded,
+                steps_failed=steps_failed,
+                materializations=materializations,
+                expectations=expectations,
+                start_time=datetime_as_float(start_time) if start_time else None,
+                end_time=datetime_as_float(end_time) if end_time else None,
+            )
+        return stats_by_run_id
+
+    def _aggregate_stats_for_run(self, conn, run_id):
+        '''Compute a run's stats from its event log, for runs stored before the run_stats table
+        was introduced and not yet backfilled by a migration.
+        '''
         query = (
             db.select(
                 [
@@ -116,8 +338,7 @@ class SqlEventLogStorage(EventLogStorage):
             .group_by('dagster_event_type')
         )
 
-        with self.connect(run_id) as conn:
-            results = conn.execute(query).fetchall()
+        results = conn.execute(query).fetchall()
 
         try:
             counts = {}
@@ -153,6 +374,9 @@ class SqlEventLogStorage(EventLogStorage):
         # https://stackoverflow.com/a/54386260/324449
         with self.connect() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(
+                SqlEventLogRunStatsTable.delete()  # pylint: disable=no-value-for-parameter
+            )
 
     def delete_events(self, run_id):
         check.str_param(run_id, 'run_id')
@@ -160,9 +384,14 @@ class SqlEventLogStorage(EventLogStorage):
         statement = SqlEventLogStorageTable.delete().where(  # pylint: disable=no-value-for-parameter
             SqlEventLogStorageTable.c.run_id == run_id
         )
+        stats_statement = SqlEventLogRunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+            SqlEventLogRunStatsTable.c.run_id == run_id
+        )
 
         with self.connect(run_id) as conn:
-            conn.execute(statement)
+            with conn.begin():
+                conn.execute(statement)
+                conn.execute(stats_statement)
 
     @property
     def is_persistent(self):
@@ -0,0 +1,87 @@
+"""add run stats
+
+Revision ID: 90eb2172de04
+Revises: 95d2647c223f
+Create Date: 2020-03-05 10:12:41.384214
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = '90eb2172de04'
+down_revision = '95d2647c223f'
+branch_labels = None
+depends_on = None
+
+# Before 0.7.0, event timestamps were stored as seconds since the epoch, which SQLAlchemy cannot
+# read back from a TIMESTAMP column, so they are converted to the local datetime strings that the
+# storage now writes.
+EVENT_TIMESTAMP = '''
+CASE WHEN timestamp NOT LIKE '%-%' THEN printf(
+    '%s.%06d',
+    datetime(CAST(timestamp AS REAL), 'unixepoch', 'localtime'),
+    CAST(CAST(timestamp AS REAL) * 1000000 AS INTEGER) % 1000000
+) ELSE timestamp END
+'''
+
+# Recomputes every run's stats from its events. Rows are rebuilt rather than only added for runs
+# that lack one, since a storage that created the table before migrating may already hold partial
+# stats for runs that were in progress.
+BACKFILL_RUN_STATS = '''
+INSERT INTO run_stats (
+    run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+)
+SELECT
+    run_id,
+    SUM(CASE WHEN dagster_event_type = 'STEP_SUCCESS' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_FAILURE' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_MATERIALIZATION' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_EXPECTATION_RESULT' THEN 1 ELSE 0 END),
+    MAX(CASE WHEN dagster_event_type = 'PIPELINE_START' THEN {timestamp} END),
+    MAX(
+        CASE WHEN dagster_event_type IN ('PIPELINE_SUCCESS', 'PIPELINE_FAILURE') THEN {timestamp} END
+    )
+FROM event_logs
+WHERE run_id IS NOT NULL
+GROUP BY run_id
+'''.format(
+    timestamp=EVENT_TIMESTAMP
+)
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'event_logs' not in has_tables:
+        return
+
+    if 'run_stats' not in has_tables:
+        op.create_table(
+            'run_stats',
+            sa.Column('run_id', sa.String(255), primary_key=True),
+            sa.Column('steps_succeeded', sa.Integer, nullable=False),
+            sa.Column('steps_failed', sa.Integer, nullable=False),
+            sa.Column('materializations', sa.Integer, nullable=False),
+            sa.Column('expectations', sa.Integer, nullable=False),
+            sa.Column('start_time', sa.types.TIMESTAMP),
+            sa.Column('end_time', sa.types.TIMESTAMP),
+        )
+
+    op.execute('DELETE FROM run_stats')
+    op.execute(BACKFILL_RUN_STATS)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_stats' in has_tables:
+        op.drop_table('run_stats')
@@ -0,0 +1,55 @@
+"""add event log indexes
+
+Revision ID: 95d2647c223f
+Revises: 567bc23fd1ac
+Create Date: 2020-03-02 14:21:07.132817
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = '95d2647c223f'
+down_revision = '567bc23fd1ac'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'event_logs': [
+        ('idx_event_logs_run_id', ['run_id', 'id']),
+        ('idx_event_logs_run_id_event_type', ['run_id', 'dagster_event_type', 'timestamp']),
+    ],
+}
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    for table_name, indexes in INDEXES.items():
+        if table_name not in has_tables:
+            continue
+
+        has_indexes = set(index['name'] for index in inspector.get_indexes(table_name))
+        for index_name, columns in indexes:
+            if index_name not in has_indexes:
+                op.create_index(index_name, table_name, columns)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    for table_name, indexes in INDEXES.items():
+        if table_name not in has_tables:
+            continue
+
+        has_indexes = set(index['name'] for index in inspector.get_indexes(table_name))
+        for index_name, _ in indexes:
+            if index_name in has_indexes:
+                op.drop_index(index_name, table_name)
@@ -2,12 +2,13 @@ import glob
 import logging
 import os
 import sqlite3
-from collections import defaultdict
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from dagster import check
@@ -16,15 +17,26 @@ from dagster.utils import mkdir_p
 
 from ...pipeline_run import PipelineRunStatus
 from ...sql import (
+    ConnectionAcquireStats,
+    PooledEngine,
     create_engine,
     get_alembic_config,
     handle_schema_errors,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
-from ..schema import SqlEventLogStorageMetadata
+from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import SqlEventLogStorage
 
+# Each run is stored in its own database, so engines are cached per run; this bounds how many are
+# held at once, e.g. by a long-lived dagit process that has served many runs
+ENGINE_CACHE_SIZE = 64
+
+# How long after the last change to a watched run's database it is read once more. SQLite publishes
+# a commit to readers by updating the WAL index in the -shm file, which is memory mapped, so that
+# update raises no filesystem event and a read woken by the commit's last write may not yet see it.
+RECHECK_SECONDS = 0.1
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     '''SQLite-backed event log storage.
@@ -57,8 +69,14 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         self._base_dir = os.path.abspath(check.str_param(base_dir, 'base_dir'))
         mkdir_p(self._base_dir)
 
-        self._watchers = defaultdict(dict)
+        # run_id -> PooledEngine, least recently used first
+        self._engines = OrderedDict()
+        self._engines_lock = threading.Lock()
+        self._acquire_stats = ConnectionAcquireStats()
+
+        self._watchdog = SqliteEventLogStorageWatchdog(self)
         self._obs = Observer()
+        self._obs.schedule(self._watchdog, self._base_dir, False)
         self._obs.start()
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
@@ -124,29 +142,68 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
                     'swallowing {str_exc}'.format(str_exc=err_msg)
                 )
 
+    def _engine_for_run_id(self, run_id):
+        with self._engines_lock:
+            # pop and reinsert rather than move_to_end, which is not available on python 2
+            engine = self._engines.pop(run_id, None)
+            if engine is None:
+                engine = PooledEngine(
+                    self.conn_string_for_run_id(run_id),
+                    acquire_stats=self._acquire_stats,
+                    poolclass=NullPool,
+                )
+            self._engines[run_id] = engine
+
+            evicted = []
+            while len(self._engines) > ENGINE_CACHE_SIZE:
+                evicted.append(self._engines.popitem(last=False)[1])
+
+        for evicted_engine in evicted:
+            evicted_engine.dispose()
+        return engine
+
+    def _dispose_engines(self):
+        with self._engines_lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+
+        for engine in engines:
+            engine.dispose()
+
     @contextmanager
     def connect(self, run_id=None):
         check.str_param(run_id, 'run_id')
 
-        conn_string = self.conn_string_for_run_id(run_id)
-        engine = create_engine(conn_string, poolclass=NullPool)
+        engine = self._engine_for_run_id(run_id)
 
         if not os.path.exists(self.path_for_run_id(run_id)):
-            self._initdb(engine, run_id)
+            self._initdb(engine.engine, run_id)
 
-        conn = engine.connect()
-        try:
+        with engine.connect() as conn:
             with handle_schema_errors(
                 conn,
                 get_alembic_config(__file__),
                 msg='SqliteEventLogStorage for run {run_id}'.format(run_id=run_id),
             ):
                 yield conn
-        finally:
-            conn.close()
-        engine.dispose()
+
+    @property
+    def connection_acquire_stats(self):
+        return self._acquire_stats
+
+    def _logs_query(self, run_id, cursor):
+        # each run is stored in its own database, whose event ids number the run's logs from 1, so
+        # the logs after the cursor are found by id instead of by skipping over the logs before it
+        query = super(SqliteEventLogStorage, self)._logs_query(run_id, -1)
+        return query.where(SqlEventLogStorageTable.c.id > cursor + 1)
+
+    def get_stats_for_runs(self, run_ids):
+        # each run is stored in its own database, so there is no single table to query
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
 
     def wipe(self):
+        self._dispose_engines()
         for filename in (
             glob.glob(os.path.join(self._base_dir, '*.db'))
             + glob.glob(os.path.join(self._base_dir, '*.db-wal'))
@@ -155,39 +212,200 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             os.unlink(filename)
 
     def watch(self, run_id, start_cursor, callback):
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        self._watchdog.watch(run_id, start_cursor, callback)
 
     def end_watch(self, run_id, handler):
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)
-            del self._watchers[run_id][handler]
+        self._watchdog.end_watch(run_id, handler)
 
+    def dispose(self):
+        self._obs.stop()
+        self._watchdog.close()
+        self._dispose_engines()
 
-class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+
+class SqliteEventLogStorageWatchdog(FileSystemEventHandler):
+    '''Dispatches new events to the subscribers of every watched run in a SqliteEventLogStorage.
+
+    A single instance watches the storage's base_dir on behalf of all subscribers. Filesystem
+    events only mark the run whose database changed as dirty; a dispatcher thread then reads each
+    dirty run once, from the lowest cursor among its subscribers, so a burst of writes to a run
+    costs one incremental query, and once more after the run has been quiet for RECHECK_SECONDS.
+    The dispatcher holds a connection to each watched run's database for as long as the run has
+    subscribers.
+    '''
+
+    def __init__(self, event_log_storage):
         self._event_log_storage = check.inst_param(
             event_log_storage, 'event_log_storage', SqliteEventLogStorage
         )
-        self._run_id = check.str_param(run_id, 'run_id')
-        self._cb = check.callable_param(callback, 'callback')
-        self._log_path = event_log_storage.path_for_run_id(run_id)
-        self._cursor = start_cursor if start_cursor is not None else -1
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = self._cb(event)
-
-            if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
-                self._event_log_storage.end_watch(self._run_id, self._cb)
-
-    def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        # run_id -> [[callback, cursor]], a list rather than a dict keyed by callback since bound
+        # methods of unhashable objects, e.g. list.append, are unhashable on older pythons
+        self._subscribers = {}
+        # runs whose databases have changed since they were last read
+        self._dirty = set()
+        # runs whose databases have been created or deleted, invalidating any open connection
+        self._stale = set()
+
+        # run_id -> connection, only touched by the dispatcher thread since SQLite connections
+        # may not be shared between threads
+        self._conns = {}
+
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name='sqlite-event-log-watchdog'
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        super(SqliteEventLogStorageWatchdog, self).__init__()
+
+    def watch(self, run_id, start_cursor, callback):
+        check.str_param(run_id, 'run_id')
+        check.opt_int_param(start_cursor, 'start_cursor')
+        check.callable_param(callback, 'callback')
+
+        with self._lock:
+            self._subscribers.setdefault(run_id, []).append(
+                [callback, start_cursor if start_cursor is not None else -1]
+            )
+            # catch up on anything written between the subscriber's last read and now
+            self._dirty.add(run_id)
+        self._wakeup.set()
+
+    def end_watch(self, run_id, callback):
+        with self._lock:
+            subscribers = [
+                subscriber
+                for subscriber in self._subscribers.get(run_id, [])
+                if subscriber[0] != callback
+            ]
+            if subscribers:
+                self._subscribers[run_id] = subscribers
+            else:
+                self._subscribers.pop(run_id, None)
+        # let the dispatcher close the run's connection if it has no subscribers left
+        self._wakeup.set()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    def _run_id_for_path(self, path):
+        filename = os.path.basename(path)
+        # in WAL mode, writes land in the -wal file until they are checkpointed into the database
+        for suffix in ('.db', '.db-wal'):
+            if filename.endswith(suffix):
+                return filename[: -len(suffix)]
+        return None
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+
+        run_id = self._run_id_for_path(event.src_path)
+        if run_id is None:
+            return
+
+        with self._lock:
+            if run_id not in self._subscribers:
+                return
+            # the -wal file comes and goes with the database's connections, which does not
+            # invalidate ours
+            created_or_deleted = event.event_type in (EVENT_TYPE_CREATED, EVENT_TYPE_DELETED)
+            if created_or_deleted and event.src_path.endswith('.db'):
+                self._stale.add(run_id)
+            self._dirty.add(run_id)
+        self._wakeup.set()
+
+    def _dispatch_loop(self):
+        # runs that have changed since the dispatcher last waited RECHECK_SECONDS without waking
+        recheck = set()
+        while True:
+            woken = self._wakeup.wait(RECHECK_SECONDS if recheck else None)
+            self._wakeup.clear()
+
+            with self._lock:
+                if self._closed:
+                    break
+                dirty, self._dirty = self._dirty, set()
+                stale, self._stale = self._stale, set()
+                watched = set(self._subscribers)
+
+            if woken:
+                recheck |= dirty
+            else:
+                # runs changed just as the wait timed out are read now and again after a wait
+                dirty, recheck = dirty | recheck, dirty
+
+            for run_id in list(self._conns):
+                if run_id not in watched or run_id in stale:
+                    self._close_conn(run_id)
+
+            for run_id in dirty & watched:
+                self._dispatch_run(run_id)
+
+        for run_id in list(self._conns):
+            self._close_conn(run_id)
+
+    def _get_conn(self, run_id):
+        conn = self._conns.get(run_id)
+        if conn is None:
+            # the run's database is created by its first write, which will wake us again
+            if not os.path.exists(self._event_log_storage.path_for_run_id(run_id)):
+                return None
+            engine = create_engine(
+                self._event_log_storage.conn_string_for_run_id(run_id), poolclass=NullPool
+            )
+            conn = engine.connect()
+            self._conns[run_id] = conn
+        return conn
+
+    def _close_conn(self, run_id):
+        conn = self._conns.pop(run_id)
+        conn.close()
+
+    def _dispatch_run(self, run_id):
+        with self._lock:
+            cursors = [
+                (subscriber, subscriber[1]) for subscriber in self._subscribers.get(run_id, [])
+            ]
+        if not cursors:
+            return
+
+        conn = self._get_conn(run_id)
+        if conn is None:
+            return
+
+        start_cursor = min(cursor for _, cursor in cursors)
+        try:
+            # pylint: disable=protected-access
+            events = self._event_log_storage._query_logs_for_run(conn, run_id, start_cursor)
+        except (db.exc.DatabaseError, sqlite3.DatabaseError) as exc:
+            # e.g. the database file exists but its schema has not been created yet; the write
+            # that creates it will wake us again
+            logging.debug(
+                'SqliteEventLogStorageWatchdog: could not read events for run {run_id}: '
+                '{exc}'.format(run_id=run_id, exc=exc)
+            )
+            self._close_conn(run_id)
+            return
+
+        end_cursor = start_cursor + len(events)
+        for subscriber, cursor in cursors:
+            with self._lock:
+                # skip subscribers that have ended their watch since the cursors were read
+                if not any(s is subscriber for s in self._subscribers.get(run_id, [])):
+                    continue
+                subscriber[1] = max(subscriber[1], end_cursor)
+
+            callback = subscriber[0]
+            for event in events[cursor - start_cursor :]:
+                status = callback(event)
+
+                if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
+                    self.end_watch(run_id, callback)
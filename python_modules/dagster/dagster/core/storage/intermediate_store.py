@@ -33,9 +33,9 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         return self.object_store.key_for_paths([self.root] + paths)
 
     def set_object(self, obj, context, dagster_type, paths):
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.inst_param(dagster_type, 'dagster_type', DagsterType)
-        check.list_param(paths, 'paths', of_type=str)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.inst_param(dagster_type, 'dagster_type', DagsterType)
+        check.hot_path.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.set_object(
@@ -43,29 +43,36 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         )
 
     def get_object(self, context, dagster_type, paths):
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.list_param(paths, 'paths', of_type=str)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
-        check.inst_param(dagster_type, 'dagster_type', DagsterType)
+        check.hot_path.inst_param(dagster_type, 'dagster_type', DagsterType)
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.get_object(
             key, serialization_strategy=dagster_type.serialization_strategy
         )
 
     def has_object(self, context, paths):
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.list_param(paths, 'paths', of_type=str)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.has_object(key)
 
     def rm_object(self, context, paths):
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.list_param(paths, 'paths', of_type=str)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
         self.object_store.rm_object(key)
 
+    def object_size(self, context, paths):
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+        key = self.object_store.key_for_paths([self.root] + paths)
+        return self.object_store.get_size(key)
+
     def copy_object_from_prev_run(self, _context, previous_run_id, paths):
         check.str_param(previous_run_id, 'previous_run_id')
         check.list_param(paths, 'paths', of_type=str)
@@ -74,7 +81,26 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         src = self.object_store.key_for_paths([self.root_for_run_id(previous_run_id)] + paths)
         dst = self.object_store.key_for_paths([self.root] + paths)
 
-        return self.object_store.cp_object(src, dst)
+        return self.object_store.link_object(src, dst)
+
+    def has_object_in_run(self, _context, run_id, paths):
+        check.str_param(run_id, 'run_id')
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+        key = self.object_store.key_for_paths([self.root_for_run_id(run_id)] + paths)
+        return self.object_store.has_object(key)
+
+    def copy_object_from_run(self, _context, run_id, src_paths, dst_paths):
+        check.str_param(run_id, 'run_id')
+        check.list_param(src_paths, 'src_paths', of_type=str)
+        check.param_invariant(len(src_paths) > 0, 'src_paths')
+        check.list_param(dst_paths, 'dst_paths', of_type=str)
+        check.param_invariant(len(dst_paths) > 0, 'dst_paths')
+
+        src = self.object_store.key_for_paths([self.root_for_run_id(run_id)] + src_paths)
+        dst = self.object_store.key_for_paths([self.root] + dst_paths)
+
+        return self.object_store.link_object(src, dst)
 
     def set_value(self, obj, context, dagster_type, paths):
         if self.type_storage_plugin_registry.is_registered(dagster_type):
@@ -1,3 +1,4 @@
+import sys
 from abc import ABCMeta, abstractmethod, abstractproperty
 
 import six
@@ -36,6 +37,38 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def is_persistent(self):
         pass
 
+    def release_intermediate(self, context, step_output_handle):
+        '''Release the storage held by an intermediate that no remaining step will read.
+
+        Called by engines configured with ``release_intermediates``. Managers that do not support
+        releasing intermediates keep them and return None.
+
+        Returns:
+            Optional[int]: None if nothing was released, otherwise the approximate number of bytes
+                freed (0 if that cannot be determined).
+        '''
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        return None
+
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        '''Whether an intermediate is stored for another run.
+
+        Managers that cannot read the intermediates of other runs return False.
+        '''
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(run_id, 'run_id')
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        return False
+
+    def copy_intermediate_from_run(  # pylint: disable=unused-argument
+        self, context, run_id, source_handle, step_output_handle
+    ):
+        '''Copy the intermediate stored for source_handle in another run to step_output_handle in
+        this run.
+        '''
+        check.failed('{} cannot copy intermediates from other runs'.format(self.__class__.__name__))
+
     def all_inputs_covered(self, context, step):
         return len(self.uncovered_inputs(context, step)) == 0
 
@@ -69,9 +102,9 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         canonicalize_dagster_type = canonicalize_backcompat_args(
             dagster_type, 'dagster_type', runtime_type, 'runtime_type',
         )  # TODO to deprecate in 0.8.0
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.opt_inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
-        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.opt_inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
+        check.hot_path.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return self.values[step_output_handle]
 
     def set_intermediate(
@@ -80,19 +113,30 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         canonicalize_dagster_type = canonicalize_backcompat_args(
             dagster_type, 'dagster_type', runtime_type, 'runtime_type',
         )  # TODO to deprecate in 0.8.0
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.opt_inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
-        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.opt_inst_param(canonicalize_dagster_type, 'dagster_type', DagsterType)
+        check.hot_path.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         self.values[step_output_handle] = value
 
     def has_intermediate(self, context, step_output_handle):
-        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
-        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return step_output_handle in self.values
 
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def release_intermediate(self, context, step_output_handle):
+        check.hot_path.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.hot_path.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        if step_output_handle not in self.values:
+            return None
+
+        value = self.values.pop(step_output_handle)
+        # nbytes covers numpy arrays and the like, for which getsizeof is only the header
+        size = getattr(value, 'nbytes', None)
+        return size if isinstance(size, int) else sys.getsizeof(value)
+
     @property
     def is_persistent(self):
         return False
@@ -158,6 +202,37 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
             context, previous_run_id, self._get_paths(step_output_handle)
         )
 
+    def has_intermediate_in_run(self, context, run_id, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(run_id, 'run_id')
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.has_object_in_run(
+            context, run_id, self._get_paths(step_output_handle)
+        )
+
+    def copy_intermediate_from_run(self, context, run_id, source_handle, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(run_id, 'run_id')
+        check.inst_param(source_handle, 'source_handle', StepOutputHandle)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.copy_object_from_run(
+            context, run_id, self._get_paths(source_handle), self._get_paths(step_output_handle)
+        )
+
+    def release_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        paths = self._get_paths(step_output_handle)
+        if not self._intermediate_store.has_object(context, paths):
+            return None
+
+        size = self._intermediate_store.object_size(context, paths)
+        self._intermediate_store.rm_object(context, paths)
+        return size
+
     @property
     def is_persistent(self):
         return True
@@ -1,17 +1,23 @@
 import hashlib
+import logging
 import os
+import sys
+import threading
 from collections import defaultdict
 
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers.polling import PollingObserver
 
 from dagster import check
+from dagster.config import Field
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
 
 from .compute_log_manager import (
+    MAX_BYTES_CHUNK_READ,
     MAX_BYTES_FILE_READ,
     ComputeIOType,
+    ComputeLogCaptureMode,
     ComputeLogFileData,
     ComputeLogManager,
     ComputeLogSubscription,
@@ -26,10 +32,19 @@ MAX_FILENAME_LENGTH = 255
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     '''Stores copies of stdout & stderr for each compute step locally on disk.
+
+    Args:
+        base_dir (str): The directory in which to store the logs.
+        capture_mode (Optional[str]): ``'tail'`` (the default) mirrors the captured streams with
+            ``tail`` processes, ``'thread'`` with a thread in the step process. See
+            :py:class:`~dagster.core.storage.compute_log_manager.ComputeLogCaptureMode`.
     '''
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, capture_mode=None, inst_data=None):
         self._base_dir = base_dir
+        self._capture_mode = ComputeLogCaptureMode(
+            check.opt_str_param(capture_mode, 'capture_mode', ComputeLogCaptureMode.TAIL.value)
+        )
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
@@ -39,7 +54,10 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return {'base_dir': str}
+        return {'base_dir': str, 'capture_mode': Field(str, is_required=False)}
+
+    def capture_mode(self, _step_context):
+        return self._capture_mode
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -102,26 +120,61 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
         self._subscription_manager.add_subscription(subscription)
 
 
+def _create_native_observer():
+    '''An inotify observer on Linux, which notifies as soon as a log file changes rather than on
+    the next poll, or None where inotify is unavailable.'''
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        from watchdog.observers.inotify import InotifyObserver
+
+        observer = InotifyObserver()
+        observer.start()
+        return observer
+    except (ImportError, OSError) as exc:
+        logging.warning(
+            'Falling back to polling for compute log changes: inotify is unavailable: %s', exc
+        )
+        return None
+
+
 class LocalComputeLogSubscriptionManager(object):
     def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
         self._watchers = {}
-        self._observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
-        self._observer.start()
+        self._readers = {}
+        self._lock = threading.RLock()
+        self._native_observer = _create_native_observer()
+        self._polling_observer = None
 
     def _key(self, run_id, step_key):
         return '{}:{}'.format(run_id, step_key)
 
+    def _get_polling_observer(self):
+        if not self._polling_observer:
+            self._polling_observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
+            self._polling_observer.start()
+        return self._polling_observer
+
     def add_subscription(self, subscription):
         check.inst_param(subscription, 'subscription', ComputeLogSubscription)
         key = self._key(subscription.run_id, subscription.step_key)
-        self._subscriptions[key].append(subscription)
+        with self._lock:
+            self._subscriptions[key].append(subscription)
         self.watch(subscription.run_id, subscription.step_key)
 
     def remove_all_subscriptions(self, run_id, step_key):
         key = self._key(run_id, step_key)
-        for subscription in self._subscriptions.pop(key, []):
+        with self._lock:
+            subscriptions = self._subscriptions.pop(key, [])
+            for io_type in ComputeIOType:
+                reader = self._readers.pop((key, io_type), None)
+                if reader:
+                    reader.close()
+
+        for subscription in subscriptions:
             subscription.complete()
 
     def watch(self, run_id, step_key):
@@ -139,23 +192,121 @@ class LocalComputeLogSubscriptionManager(object):
         )
 
         ensure_dir(directory)
-        self._watchers[key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(
-                self, run_id, step_key, update_paths, complete_paths
-            ),
-            str(directory),
+
+        # readers start at the current end of the logs, where subscriptions that are about to read
+        # the logs so far will be
+        with self._lock:
+            for io_type in ComputeIOType:
+                if (key, io_type) not in self._readers:
+                    self._readers[(key, io_type)] = LocalComputeLogTailReader(
+                        self._manager, run_id, step_key, io_type
+                    )
+
+        handler = LocalComputeLogFilesystemEventHandler(
+            self, run_id, step_key, update_paths, complete_paths
         )
 
+        observer = self._native_observer
+        watch = None
+        if observer:
+            try:
+                watch = observer.schedule(handler, str(directory))
+            except OSError as exc:
+                # e.g. the user's inotify watch limit has been reached
+                logging.warning(
+                    'Falling back to polling for changes to compute logs in %s: %s', directory, exc
+                )
+
+        if watch is None:
+            observer = self._get_polling_observer()
+            watch = observer.schedule(handler, str(directory))
+
+        self._watchers[key] = (observer, watch)
+
     def notify_subscriptions(self, run_id, step_key):
         key = self._key(run_id, step_key)
-        for subscription in self._subscriptions[key]:
-            subscription.fetch()
+        with self._lock:
+            subscriptions = list(self._subscriptions[key])
+            for io_type in ComputeIOType:
+                io_type_subscriptions = [sub for sub in subscriptions if sub.io_type == io_type]
+                if io_type_subscriptions:
+                    self._fan_out(key, run_id, step_key, io_type, io_type_subscriptions)
+
+    def _fan_out(self, key, run_id, step_key, io_type, subscriptions):
+        # one reader per log file reads each new byte once for every subscription that has caught
+        # up to it; subscriptions at other cursors catch up by reading from their own cursor
+        reader = self._readers.get((key, io_type))
+        if not reader:
+            reader = self._readers[(key, io_type)] = LocalComputeLogTailReader(
+                self._manager, run_id, step_key, io_type
+            )
+
+        start_cursor = reader.cursor
+        updates = reader.read_new()
+
+        for subscription in subscriptions:
+            if subscription.cursor == start_cursor:
+                for update in updates:
+                    subscription.on_update(update)
+            else:
+                subscription.fetch()
 
     def unwatch(self, run_id, step_key, handler):
         key = self._key(run_id, step_key)
         if key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[key])
-        del self._watchers[key]
+            observer, watch = self._watchers.pop(key)
+            observer.remove_handler_for_watch(handler, watch)
+
+
+class LocalComputeLogTailReader(object):
+    '''Reads the bytes appended to a compute log file since the last read, through a file handle
+    that stays open while the log is watched.'''
+
+    def __init__(self, manager, run_id, step_key, io_type):
+        self._manager = manager
+        self._run_id = run_id
+        self._step_key = step_key
+        self._io_type = io_type
+        self._path = manager.get_local_path(run_id, step_key, io_type)
+        self._file = None
+        self.cursor = os.path.getsize(self._path) if os.path.isfile(self._path) else 0
+
+    def read_new(self):
+        '''Returns a list of ComputeLogFileData, empty if nothing was appended since the last
+        read.'''
+        if not self._file:
+            if not os.path.isfile(self._path):
+                return []
+            self._file = open(self._path, 'rb')
+
+        updates = []
+        self._file.seek(self.cursor, os.SEEK_SET)
+        while True:
+            data = self._file.read(MAX_BYTES_CHUNK_READ)
+            if not data:
+                break
+
+            self.cursor = self._file.tell()
+            updates.append(
+                ComputeLogFileData(
+                    path=self._path,
+                    data=data.decode('utf-8'),
+                    cursor=self.cursor,
+                    size=os.fstat(self._file.fileno()).st_size,
+                    download_url=self._manager.download_url(
+                        self._run_id, self._step_key, self._io_type
+                    ),
+                )
+            )
+            if len(data) < MAX_BYTES_CHUNK_READ:
+                break
+
+        return updates
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
 
 
 class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
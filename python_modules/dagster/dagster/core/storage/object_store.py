@@ -1,7 +1,11 @@
+import hashlib
+import io
 import logging
 import os
 import shutil
+import sys
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 
 import six
 
@@ -57,6 +61,15 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.CP_OBJECT
         on success.'''
 
+    def link_object(self, src, dst):
+        '''Override this method to make the object at one key readable at another without copying
+        its bytes, where the object store can do so safely.
+
+        The object at dst must remain readable after the object at src is removed, and vice versa.
+        Defaults to cp_object. Should return an ObjectStoreOperation with
+        op==ObjectStoreOperationType.CP_OBJECT on success.'''
+        return self.cp_object(src, dst)
+
     @abstractmethod
     def uri_for_key(self, key, protocol=None):
         '''Implement this method to get a URI for a key in the object store.
@@ -67,10 +80,80 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         '''Joins path fragments into a key using the object-store specific path separator.'''
         return self.sep.join(path_fragments)
 
+    def get_size(self, key):
+        '''Override this method to report the number of bytes stored under a key.
+
+        Used for reporting only. Defaults to 0 for object stores that cannot cheaply determine
+        the size of an object.'''
+        check.str_param(key, 'key')
+        return 0
+
+    def get_digest(self, key):
+        '''Override this method to report a digest of the bytes stored under a key, which changes
+        whenever they do.
+
+        Reported by set and copy operations, and used to identify the inputs of memoized steps.
+        Defaults to None for object stores that cannot cheaply determine a digest.'''
+        check.str_param(key, 'key')
+        return None
+
 
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
 
+@contextmanager
+def file_obj_for_mode(binary_file_obj, mode, encoding=None):
+    '''Wrap a binary file object to read or write text when mode is a text mode.
+
+    Lets object stores that stage objects in temporary files serialize and deserialize text
+    straight to and from the file, rather than through an in-memory string. The binary file object
+    is left open.
+
+    Args:
+        binary_file_obj: A file object opened in binary mode.
+        mode (str): The read_mode or write_mode of a SerializationStrategy.
+        encoding (Optional[str]): The encoding of a SerializationStrategy.
+    '''
+    check.str_param(mode, 'mode')
+    check.opt_str_param(encoding, 'encoding')
+
+    # Python 2 strategies write str, i.e. bytes, in text mode
+    if 'b' in mode or sys.version_info < (3, 0):
+        yield binary_file_obj
+        return
+
+    text_file_obj = io.TextIOWrapper(binary_file_obj, encoding=encoding)
+    try:
+        yield text_file_obj
+    finally:
+        text_file_obj.flush()
+        text_file_obj.detach()
+
+
+# Size of the chunks files are read in to compute their digests
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_digest(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as file_obj:
+        for chunk in iter(lambda: file_obj.read(DIGEST_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _link_or_copy_file(src, dst):
+    # os.link is missing on Windows under Python 2
+    if hasattr(os, 'link'):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+    shutil.copy(src, dst)
+
+
 class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def __init__(self):
         super(FilesystemObjectStore, self).__init__(name='filesystem', sep=os.sep)
@@ -96,6 +179,7 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             obj=obj,
             serialization_strategy_name=serialization_strategy.name,
             object_store_name=self.name,
+            digest=self.get_digest(key),
         )
 
     def get_object(self, key, serialization_strategy=DEFAULT_SERIALIZATION_STRATEGY):
@@ -139,6 +223,44 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             object_store_name=self.name,
         )
 
+    def get_size(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        if os.path.isfile(key):
+            return os.path.getsize(key)
+
+        size = 0
+        for dirpath, _, filenames in os.walk(key):
+            for filename in filenames:
+                size += os.path.getsize(os.path.join(dirpath, filename))
+        return size
+
+    def get_digest(self, key):
+        '''The SHA-1 of the file at key, or for a directory, the SHA-1 of the relative path and
+        SHA-1 of each file under it.'''
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        if os.path.isfile(key):
+            return 'sha1:' + _file_digest(key)
+
+        if not os.path.isdir(key):
+            return None
+
+        digest = hashlib.sha1()
+        for dirpath, dirnames, filenames in os.walk(key):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                relpath = os.path.relpath(path, key).replace(os.sep, '/')
+                digest.update(
+                    '{relpath}\0{file_digest}\n'.format(
+                        relpath=relpath, file_digest=_file_digest(path)
+                    ).encode('utf-8')
+                )
+        return 'sha1-tree:' + digest.hexdigest()
+
     def cp_object(self, src, dst):
         check.invariant(not os.path.exists(dst), 'Path already exists {}'.format(dst))
 
@@ -159,6 +281,45 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             obj=None,
             serialization_strategy_name=None,
             object_store_name=self.name,
+            digest=self.get_digest(dst),
+        )
+
+    def link_object(self, src, dst):
+        '''Hard link the files under src to dst.
+
+        The filesystem counts the links to each file, so removing either path leaves the other
+        intact, and set_object unlinks an existing path before writing to it, so a write to one
+        path is never seen at the other. Files that cannot be linked, e.g. because src and dst are
+        on different devices, are copied instead.
+        '''
+        check.str_param(src, 'src')
+        check.str_param(dst, 'dst')
+        check.invariant(not os.path.exists(dst), 'Path already exists {}'.format(dst))
+
+        # Ensure output path exists
+        mkdir_p(os.path.dirname(dst))
+
+        if os.path.isfile(src):
+            _link_or_copy_file(src, dst)
+        elif os.path.isdir(src):
+            for dirpath, _, filenames in os.walk(src):
+                dst_dirpath = os.path.join(dst, os.path.relpath(dirpath, src))
+                mkdir_p(dst_dirpath)
+                for filename in filenames:
+                    _link_or_copy_file(
+                        os.path.join(dirpath, filename), os.path.join(dst_dirpath, filename)
+                    )
+        else:
+            check.failed('should not get here')
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.CP_OBJECT,
+            key=src,
+            dest_key=dst,
+            obj=None,
+            serialization_strategy_name=None,
+            object_store_name=self.name,
+            digest=self.get_digest(dst),
         )
 
     def uri_for_key(self, key, protocol=None):
@@ -1,4 +1,4 @@
-from .base import RunStorage
+from .base import MemoizedStep, RunStorage
 from .in_memory import InMemoryRunStorage
 from .schema import RunStorageSqlMetadata
 from .sql_run_storage import SqlRunStorage
@@ -1,7 +1,31 @@
 from abc import ABCMeta, abstractmethod
+from collections import namedtuple
 
 import six
 
+from dagster import check
+
+
+class MemoizedStep(namedtuple('_MemoizedStep', 'cache_key run_id step_key output_names')):
+    '''A step that succeeded in a run and whose outputs can be reused by later steps with the same
+    cache key.
+
+    Args:
+        cache_key (str): The cache key the step executed with.
+        run_id (str): The run the step executed in.
+        step_key (str): The key of the step in that run.
+        output_names (List[str]): The outputs the step stored as intermediates.
+    '''
+
+    def __new__(cls, cache_key, run_id, step_key, output_names):
+        return super(MemoizedStep, cls).__new__(
+            cls,
+            cache_key=check.str_param(cache_key, 'cache_key'),
+            run_id=check.str_param(run_id, 'run_id'),
+            step_key=check.str_param(step_key, 'step_key'),
+            output_names=check.list_param(output_names, 'output_names', of_type=str),
+        )
+
 
 class RunStorage(six.with_metaclass(ABCMeta)):
     '''Abstract base class for storing pipeline run history.
@@ -96,5 +120,30 @@ class RunStorage(six.with_metaclass(ABCMeta)):
     def delete_run(self, run_id):
         '''Remove a run from storage'''
 
+    def add_memoized_step(self, memoized_step):
+        '''Record that a step's outputs can be reused by later steps with the same cache key.
+
+        Storages that do not support memoization ignore the step.
+
+        Args:
+            memoized_step (MemoizedStep)
+        '''
+
+    def get_memoized_steps(self, cache_key, limit=None):
+        '''Get the steps recorded for a cache key, most recent first.
+
+        Storages that do not support memoization never return any steps.
+
+        Args:
+            cache_key (str): The cache key to look up.
+            limit (Optional[int]): Number of steps to get. Defaults to infinite.
+
+        Returns:
+            List[MemoizedStep]
+        '''
+        check.str_param(cache_key, 'cache_key')
+        check.opt_int_param(limit, 'limit')
+        return []
+
     def dispose(self):
         '''Explicit lifecycle management.'''
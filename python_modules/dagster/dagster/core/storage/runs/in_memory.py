@@ -6,13 +6,14 @@ from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.utils import frozendict
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus
-from .base import RunStorage
+from .base import MemoizedStep, RunStorage
 
 
 class InMemoryRunStorage(RunStorage):
     def __init__(self):
         self._runs = OrderedDict()
         self._run_tags = defaultdict(dict)
+        self._memoized_steps = []
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
@@ -110,6 +111,20 @@ class InMemoryRunStorage(RunStorage):
         del self._runs[run_id]
         if run_id in self._run_tags:
             del self._run_tags[run_id]
+        self._memoized_steps = [step for step in self._memoized_steps if step.run_id != run_id]
+
+    def add_memoized_step(self, memoized_step):
+        check.inst_param(memoized_step, 'memoized_step', MemoizedStep)
+        self._memoized_steps.append(memoized_step)
+
+    def get_memoized_steps(self, cache_key, limit=None):
+        check.str_param(cache_key, 'cache_key')
+        check.opt_int_param(limit, 'limit')
+        memoized_steps = [
+            step for step in reversed(self._memoized_steps) if step.cache_key == cache_key
+        ]
+        return memoized_steps[:limit] if limit else memoized_steps
 
     def wipe(self):
         self._runs = OrderedDict()
+        self._memoized_steps = []
@@ -22,3 +22,26 @@ RunTagsTable = db.Table(
     db.Column('key', db.String),
     db.Column('value', db.String),
 )
+
+# Steps whose outputs can be reused by later steps with the same cache key, see
+# dagster.core.execution.memoization
+MemoizedStepsTable = db.Table(
+    'memoized_steps',
+    RunStorageSqlMetadata,
+    db.Column('id', db.Integer, primary_key=True, autoincrement=True),
+    db.Column('cache_key', db.String(255), nullable=False),
+    db.Column('run_id', None, db.ForeignKey('runs.run_id', ondelete="CASCADE")),
+    db.Column('step_key', db.String),
+    db.Column('output_names', db.String),
+    db.Column('create_timestamp', db.DateTime, server_default=db.text('CURRENT_TIMESTAMP')),
+)
+
+# Indexes backing the filters and pagination in SqlRunStorage.get_runs: pipeline and status
+# filters are paired with the id ordering so a page can be read off the index, and tag lookups
+# resolve (key, value) pairs to run ids without scanning the tags table.
+db.Index('idx_runs_pipeline_name', RunsTable.c.pipeline_name, RunsTable.c.id)
+db.Index('idx_runs_status', RunsTable.c.status, RunsTable.c.id)
+db.Index('idx_runs_create_timestamp', RunsTable.c.create_timestamp)
+db.Index('idx_run_tags_key_value', RunTagsTable.c.key, RunTagsTable.c.value)
+db.Index('idx_run_tags_run_id', RunTagsTable.c.run_id)
+db.Index('idx_memoized_steps_cache_key', MemoizedStepsTable.c.cache_key, MemoizedStepsTable.c.id)
@@ -5,15 +5,15 @@ from datetime import datetime
 import six
 import sqlalchemy as db
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.errors import DagsterRunAlreadyExists
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus
-from .base import RunStorage
-from .schema import RunTagsTable, RunsTable
+from .base import MemoizedStep, RunStorage
+from .schema import MemoizedStepsTable, RunTagsTable, RunsTable
 
 
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
@@ -124,17 +124,16 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             query = query.where(RunsTable.c.status == filters.status.value)
 
         if filters.tags:
-            query = query.where(
-                db.or_(
-                    *(
-                        db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
-                        for key, value in filters.tags.items()
+            # Each tag is resolved to its matching run ids through the run_tags index, rather than
+            # joining the tags table and grouping on the (potentially large) serialized run body
+            for key, value in filters.tags.items():
+                query = query.where(
+                    RunsTable.c.run_id.in_(
+                        db.select([RunTagsTable.c.run_id]).where(
+                            db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
+                        )
                     )
                 )
-            ).group_by(RunsTable.c.run_body, RunsTable.c.id)
-
-            if len(filters.tags) > 0:
-                query = query.having(db.func.count(RunsTable.c.run_id) == len(filters.tags))
 
         return query
 
@@ -145,14 +144,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         check.opt_str_param(cursor, 'cursor')
         check.opt_int_param(limit, 'limit')
 
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            base_query = db.select([RunsTable.c.run_body]).select_from(
-                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-            )
-        else:
-            base_query = db.select([RunsTable.c.run_body]).select_from(RunsTable)
-
+        base_query = db.select([RunsTable.c.run_body]).select_from(RunsTable)
         query = self._add_filters_to_query(base_query, filters)
         query = self._add_cursor_limit_to_query(query, cursor, limit)
         rows = self.execute(query)
@@ -163,14 +155,7 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
             filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
         )
 
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            subquery = db.select([1]).select_from(
-                RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-            )
-        else:
-            subquery = db.select([1]).select_from(RunsTable)
-
+        subquery = db.select([1]).select_from(RunsTable)
         subquery = self._add_filters_to_query(subquery, filters)
 
         # We use an alias here because Postgres requires subqueries to be
@@ -215,9 +200,45 @@ class SqlRunStorage(RunStorage):  # pylint: disable=no-init
         with self.connect() as conn:
             conn.execute(query)
 
+    def add_memoized_step(self, memoized_step):
+        check.inst_param(memoized_step, 'memoized_step', MemoizedStep)
+        with self.connect() as conn:
+            conn.execute(
+                MemoizedStepsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    cache_key=memoized_step.cache_key,
+                    run_id=memoized_step.run_id,
+                    step_key=memoized_step.step_key,
+                    output_names=seven.json.dumps(memoized_step.output_names),
+                )
+            )
+
+    def get_memoized_steps(self, cache_key, limit=None):
+        check.str_param(cache_key, 'cache_key')
+        check.opt_int_param(limit, 'limit')
+
+        query = (
+            db.select(
+                [
+                    MemoizedStepsTable.c.run_id,
+                    MemoizedStepsTable.c.step_key,
+                    MemoizedStepsTable.c.output_names,
+                ]
+            )
+            .where(MemoizedStepsTable.c.cache_key == cache_key)
+            .order_by(MemoizedStepsTable.c.id.desc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        return [
+            MemoizedStep(cache_key, run_id, step_key, seven.json.loads(output_names))
+            for run_id, step_key, output_names in self.execute(query)
+        ]
+
     def wipe(self):
         '''Clears the run storage.'''
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(RunTagsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(MemoizedStepsTable.delete())  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,52 @@
+"""add memoized steps
+
+Revision ID: 3b1e175a2be3
+Revises: 4590b78dcb37
+Create Date: 2020-03-09 11:02:17.512034
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = '3b1e175a2be3'
+down_revision = '4590b78dcb37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'runs' not in has_tables:
+        return
+
+    if 'memoized_steps' not in has_tables:
+        op.create_table(
+            'memoized_steps',
+            sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column('cache_key', sa.String(255), nullable=False),
+            sa.Column('run_id', sa.String(255), sa.ForeignKey('runs.run_id', ondelete='CASCADE')),
+            sa.Column('step_key', sa.String),
+            sa.Column('output_names', sa.String),
+            sa.Column('create_timestamp', sa.DateTime, server_default=sa.text('CURRENT_TIMESTAMP')),
+        )
+
+    has_indexes = set(index['name'] for index in inspector.get_indexes('memoized_steps'))
+    if 'idx_memoized_steps_cache_key' not in has_indexes:
+        op.create_index('idx_memoized_steps_cache_key', 'memoized_steps', ['cache_key', 'id'])
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'memoized_steps' in has_tables:
+        op.drop_table('memoized_steps')
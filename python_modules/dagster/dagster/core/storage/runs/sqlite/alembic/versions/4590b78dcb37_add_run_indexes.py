@@ -0,0 +1,60 @@
+"""add run indexes
+
+Revision ID: 4590b78dcb37
+Revises: 9fe9e746268c
+Create Date: 2020-03-02 14:21:07.132817
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = '4590b78dcb37'
+down_revision = '9fe9e746268c'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'runs': [
+        ('idx_runs_pipeline_name', ['pipeline_name', 'id']),
+        ('idx_runs_status', ['status', 'id']),
+        ('idx_runs_create_timestamp', ['create_timestamp']),
+    ],
+    'run_tags': [
+        ('idx_run_tags_key_value', ['key', 'value']),
+        ('idx_run_tags_run_id', ['run_id']),
+    ],
+}
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    for table_name, indexes in INDEXES.items():
+        if table_name not in has_tables:
+            continue
+
+        has_indexes = set(index['name'] for index in inspector.get_indexes(table_name))
+        for index_name, columns in indexes:
+            if index_name not in has_indexes:
+                op.create_index(index_name, table_name, columns)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    for table_name, indexes in INDEXES.items():
+        if table_name not in has_tables:
+            continue
+
+        has_indexes = set(index['name'] for index in inspector.get_indexes(table_name))
+        for index_name, _ in indexes:
+            if index_name in has_indexes:
+                op.drop_index(index_name, table_name)
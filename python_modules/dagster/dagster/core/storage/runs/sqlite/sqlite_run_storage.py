@@ -9,8 +9,15 @@ from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.seven import urljoin, urlparse
 from dagster.utils import mkdir_p
 
-from ...sql import check_alembic_revision, create_engine, get_alembic_config, stamp_alembic_rev
-from ..schema import RunStorageSqlMetadata, RunTagsTable, RunsTable
+from ...sql import (
+    PooledEngine,
+    check_alembic_revision,
+    create_engine,
+    get_alembic_config,
+    run_alembic_upgrade,
+    stamp_alembic_rev,
+)
+from ..schema import MemoizedStepsTable, RunStorageSqlMetadata, RunTagsTable, RunsTable
 from ..sql_run_storage import SqlRunStorage
 
 
@@ -40,6 +47,7 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
     def __init__(self, conn_string, inst_data=None):
         check.str_param(conn_string, 'conn_string')
         self._conn_string = conn_string
+        self._engine = PooledEngine(conn_string, poolclass=NullPool)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -65,20 +73,22 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
         RunStorageSqlMetadata.create_all(engine)
         alembic_config = get_alembic_config(__file__)
         connection = engine.connect()
-        db_revision, head_revision = check_alembic_revision(alembic_config, connection)
-        if not (db_revision and head_revision and db_revision == head_revision):
+        db_revision, _ = check_alembic_revision(alembic_config, connection)
+        # Only stamp databases that have never been versioned -- an older revision means there are
+        # migrations (e.g. new indexes) that still need to be applied by `dagster instance migrate`
+        if db_revision is None:
             stamp_alembic_rev(alembic_config, engine)
 
         return SqliteRunStorage(conn_string, inst_data)
 
     @contextmanager
     def connect(self):
-        engine = create_engine(self._conn_string, poolclass=NullPool)
-        conn = engine.connect()
-        try:
+        with self._engine.connect() as conn:
             yield conn
-        finally:
-            conn.close()
+
+    @property
+    def connection_acquire_stats(self):
+        return self._engine.acquire_stats
 
     def upgrade(self):
         old_conn_string = 'sqlite://' + urljoin(urlparse(self._conn_string).path, '../runs.db')
@@ -94,12 +104,20 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
                 self.add_run(run)
             os.unlink(path_to_old_db)
 
+        alembic_config = get_alembic_config(__file__)
+        with self.connect() as conn:
+            run_alembic_upgrade(alembic_config, conn)
+
     def delete_run(self, run_id):
         ''' Override the default sql delete run implementation until we can get full
         support on cascading deletes '''
         check.str_param(run_id, 'run_id')
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
+        remove_memoized_steps = db.delete(MemoizedStepsTable).where(
+            MemoizedStepsTable.c.run_id == run_id
+        )
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(remove_tags)
+            conn.execute(remove_memoized_steps)
             conn.execute(remove_run)
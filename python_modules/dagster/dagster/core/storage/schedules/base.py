@@ -82,3 +82,6 @@ class ScheduleStorage(six.with_metaclass(abc.ABCMeta)):
     def wipe(self):
         '''Delete all schedules from storage
         '''
+
+    def dispose(self):
+        '''Explicit lifecycle management.'''
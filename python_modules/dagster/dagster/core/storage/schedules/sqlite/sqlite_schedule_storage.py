@@ -7,7 +7,13 @@ from dagster import check
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import mkdir_p
 
-from ...sql import check_alembic_revision, create_engine, get_alembic_config, stamp_alembic_rev
+from ...sql import (
+    PooledEngine,
+    check_alembic_revision,
+    create_engine,
+    get_alembic_config,
+    stamp_alembic_rev,
+)
 from ..schema import ScheduleStorageSqlMetadata
 from ..sql_schedule_storage import SqlScheduleStorage
 
@@ -19,6 +25,7 @@ class SqliteScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     def __init__(self, conn_string, inst_data=None):
         check.str_param(conn_string, 'conn_string')
         self._conn_string = conn_string
+        self._engine = PooledEngine(conn_string, poolclass=NullPool)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -52,12 +59,15 @@ class SqliteScheduleStorage(SqlScheduleStorage, ConfigurableClass):
 
     @contextmanager
     def connect(self):
-        engine = create_engine(self._conn_string, poolclass=NullPool)
-        conn = engine.connect()
-        try:
+        with self._engine.connect() as conn:
             yield conn
-        finally:
-            conn.close()
+
+    @property
+    def connection_acquire_stats(self):
+        return self._engine.acquire_stats
+
+    def dispose(self):
+        self._engine.dispose()
 
     def upgrade(self):
         pass
@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 from contextlib import contextmanager
 
 # pylint chokes on the perfectly ok import from alembic.migration
@@ -8,12 +11,98 @@ from alembic.config import Config
 from alembic.migration import MigrationContext  # pylint: disable=import-error
 from alembic.script import ScriptDirectory
 
+from dagster import check
 from dagster.core.errors import DagsterInstanceMigrationRequired
 from dagster.utils import file_relative_path
 from dagster.utils.log import quieten
 
 create_engine = db.create_engine  # exported
 
+# Engines inherited from a parent process across a fork. Their pooled DBAPI connections share
+# sockets with the parent, and closing one, which drivers like psycopg2 also do when it is garbage
+# collected, would end the parent's database session. They are kept referenced here so that they
+# are never collected, for the lifetime of the process.
+_INHERITED_ENGINES = []
+
+
+class ConnectionAcquireStats(object):
+    '''Running statistics on the time a storage spends acquiring database connections.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def mean_seconds(self):
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+class PooledEngine(object):
+    '''A long-lived SQLAlchemy engine that is safe to hold across ``fork()``.
+
+    The engine is created on first use and reused for every subsequent connection, so pooled
+    connections survive between storage operations. A process forked from the one that created
+    the engine gets a fresh engine of its own. The inherited engine is neither disposed nor
+    released, since closing its connections, whether explicitly or when they are garbage
+    collected, would close connections that still belong to the parent.
+
+    Args:
+        conn_string (str): The SQLAlchemy database URL.
+        acquire_stats (Optional[ConnectionAcquireStats]): Where to record connection acquire
+            times. Storages that hold several engines can share one instance between them.
+        **engine_kwargs: Passed through to ``sqlalchemy.create_engine``, e.g. ``poolclass`` or the
+            ``pool_size``, ``max_overflow`` and ``pool_recycle`` settings of a ``QueuePool``.
+    '''
+
+    def __init__(self, conn_string, acquire_stats=None, **engine_kwargs):
+        self._conn_string = check.str_param(conn_string, 'conn_string')
+        self.acquire_stats = check.opt_inst_param(
+            acquire_stats, 'acquire_stats', ConnectionAcquireStats, ConnectionAcquireStats()
+        )
+        self._engine_kwargs = engine_kwargs
+        self._engine = None
+        self._pid = None
+
+    @property
+    def engine(self):
+        pid = os.getpid()
+        if self._engine is None or self._pid != pid:
+            self._abandon_inherited_engine()
+            self._engine = create_engine(self._conn_string, **self._engine_kwargs)
+            self._pid = pid
+        return self._engine
+
+    @contextmanager
+    def connect(self):
+        '''Context manager yielding a sqlalchemy.engine.Connection checked out from the pool.'''
+        engine = self.engine
+        start = time.time()
+        conn = engine.connect()
+        self.acquire_stats.record(time.time() - start)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _abandon_inherited_engine(self):
+        if self._engine is not None and self._pid != os.getpid():
+            _INHERITED_ENGINES.append(self._engine)
+
+    def dispose(self):
+        if self._engine is not None and self._pid == os.getpid():
+            self._engine.dispose()
+        self._abandon_inherited_engine()
+        self._engine = None
+        self._pid = None
+
 
 def get_alembic_config(dunder_file, config_path='alembic/alembic.ini', script_path='alembic/'):
     alembic_config = Config(file_relative_path(dunder_file, config_path))
@@ -1,5 +1,9 @@
+import gzip
+import io
+import mmap
 import pickle
 import sys
+import weakref
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -71,3 +75,255 @@ class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+def _import_optional(module_name, package_name, purpose):
+    try:
+        return __import__(module_name, fromlist=['__name__'])
+    except ImportError:
+        check.failed(
+            '{purpose} requires the {package_name} package. Install it with '
+            '"pip install {package_name}".'.format(purpose=purpose, package_name=package_name)
+        )
+
+
+class CompressedPickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Pickles values through a streaming compressor, so neither the pickled nor the compressed
+    bytes are held in memory in full.
+
+    Args:
+        codec (Optional[str]): One of ``'zstd'`` (requires the zstandard package), ``'lz4'``
+            (requires the lz4 package) or ``'gzip'``. Defaults to ``'zstd'``.
+        level (Optional[int]): The compression level. Defaults to the codec's default level.
+        name (Optional[str]): Defaults to ``'pickle_<codec>'``.
+    '''
+
+    CODECS = ('zstd', 'lz4', 'gzip')
+
+    def __init__(self, codec='zstd', level=None, name=None):
+        self._codec = check.str_param(codec, 'codec')
+        check.param_invariant(
+            codec in self.CODECS, 'codec', 'Must be one of {}'.format(', '.join(self.CODECS))
+        )
+        self._level = check.opt_int_param(level, 'level')
+        super(CompressedPickleSerializationStrategy, self).__init__(
+            check.opt_str_param(name, 'name', default='pickle_{}'.format(codec))
+        )
+
+    @property
+    def codec(self):
+        return self._codec
+
+    def serialize(self, value, write_file_obj):
+        if self._codec == 'zstd':
+            zstandard = _import_optional('zstandard', 'zstandard', 'zstd compression')
+            compressor = (
+                zstandard.ZstdCompressor(level=self._level)
+                if self._level is not None
+                else zstandard.ZstdCompressor()
+            )
+            writer = compressor.stream_writer(write_file_obj)
+            pickle.dump(value, writer, PICKLE_PROTOCOL)
+            # ends the frame without closing write_file_obj
+            writer.flush(zstandard.FLUSH_FRAME)
+        elif self._codec == 'lz4':
+            lz4_frame = _import_optional('lz4.frame', 'lz4', 'lz4 compression')
+            kwargs = {'compression_level': self._level} if self._level is not None else {}
+            with lz4_frame.LZ4FrameFile(write_file_obj, mode='wb', **kwargs) as writer:
+                pickle.dump(value, writer, PICKLE_PROTOCOL)
+        else:
+            with gzip.GzipFile(
+                fileobj=write_file_obj,
+                mode='wb',
+                compresslevel=self._level if self._level is not None else 9,
+            ) as writer:
+                pickle.dump(value, writer, PICKLE_PROTOCOL)
+
+    def deserialize(self, read_file_obj):
+        if self._codec == 'zstd':
+            zstandard = _import_optional('zstandard', 'zstandard', 'zstd compression')
+            # pickles that refer to classes are read with readline, which zstandard's reader does
+            # not support
+            reader = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(read_file_obj))
+            try:
+                return pickle.load(reader)
+            finally:
+                # leaves read_file_obj open, as the other codecs do
+                reader.detach()
+        elif self._codec == 'lz4':
+            lz4_frame = _import_optional('lz4.frame', 'lz4', 'lz4 compression')
+            with lz4_frame.LZ4FrameFile(read_file_obj, mode='rb') as reader:
+                return pickle.load(reader)
+        else:
+            with gzip.GzipFile(fileobj=read_file_obj, mode='rb') as reader:
+                return pickle.load(reader)
+
+
+NPY_MAGIC = b'\x93NUMPY'
+
+
+class NumpyArraySerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Stores numpy arrays in the ``.npy`` format. Requires the numpy package.
+
+    Arrays read from the filesystem are memory mapped, so only the pages that are used are read,
+    and steps on the same host that read the same intermediate share the page cache rather than
+    each holding a private copy. Arrays of Python objects cannot be stored in this format, and are
+    pickled instead.
+
+    Args:
+        mmap_mode (Optional[str]): How arrays read from the filesystem are mapped: ``'c'``
+            (copy-on-write: changes to the array are private to the step and never written back to
+            the stored intermediate), ``'r'`` (read-only: changing the array raises), or None to
+            read arrays into memory. Defaults to ``'c'``.
+    '''
+
+    MMAP_MODES = ('c', 'r')
+
+    def __init__(self, name='npy', mmap_mode='c'):
+        self._mmap_mode = check.opt_str_param(mmap_mode, 'mmap_mode')
+        check.param_invariant(
+            mmap_mode is None or mmap_mode in self.MMAP_MODES,
+            'mmap_mode',
+            'Must be None or one of {}'.format(', '.join(self.MMAP_MODES)),
+        )
+        super(NumpyArraySerializationStrategy, self).__init__(name)
+
+    @property
+    def mmap_mode(self):
+        return self._mmap_mode
+
+    def serialize(self, value, write_file_obj):
+        np = _import_optional('numpy', 'numpy', 'The npy serialization strategy')
+        if isinstance(value, np.ndarray) and value.dtype.hasobject:
+            pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        else:
+            np.save(write_file_obj, value, allow_pickle=False)
+
+    def deserialize(self, read_file_obj):
+        np = _import_optional('numpy', 'numpy', 'The npy serialization strategy')
+        if read_file_obj.read(len(NPY_MAGIC)) != NPY_MAGIC:
+            read_file_obj.seek(0)
+            return pickle.load(read_file_obj)
+
+        read_file_obj.seek(0)
+        return np.load(read_file_obj, allow_pickle=False)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        np = _import_optional('numpy', 'numpy', 'The npy serialization strategy')
+        with open(read_path, self.read_mode) as read_obj:
+            if read_obj.read(len(NPY_MAGIC)) != NPY_MAGIC:
+                read_obj.seek(0)
+                return pickle.load(read_obj)
+
+        return np.load(read_path, mmap_mode=self._mmap_mode, allow_pickle=False)
+
+
+# The memory maps Arrow tables have been read from, by the address range they are mapped at. The
+# buffers of a table read from a map keep the map alive, so a map is only dropped from here once no
+# table uses it.
+_arrow_memory_maps = weakref.WeakValueDictionary()
+
+
+class ArrowTableSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Stores pyarrow Tables in the Arrow IPC file format. Requires the pyarrow package.
+
+    Tables read from the filesystem are memory mapped without copying, so steps on the same host
+    that read the same intermediate share the page cache. Arrow tables are immutable, so a mapped
+    table can be passed around freely, but arrays converted from it without a copy, e.g. by
+    ``to_pandas``, may be mapped read-only; see :py:func:`is_memory_mapped`.
+    '''
+
+    def __init__(self, name='arrow'):
+        super(ArrowTableSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        pyarrow = _import_optional('pyarrow', 'pyarrow', 'The arrow serialization strategy')
+        check.inst_param(value, 'value', pyarrow.Table)
+
+        writer = pyarrow.ipc.new_file(write_file_obj, value.schema)
+        writer.write_table(value)
+        writer.close()
+
+    def deserialize(self, read_file_obj):
+        pyarrow = _import_optional('pyarrow', 'pyarrow', 'The arrow serialization strategy')
+        return pyarrow.ipc.open_file(read_file_obj).read_all()
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        pyarrow = _import_optional('pyarrow', 'pyarrow', 'The arrow serialization strategy')
+        with open(read_path, self.read_mode) as read_obj:
+            mapped = mmap.mmap(read_obj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buf = pyarrow.py_buffer(mapped)
+        try:
+            _arrow_memory_maps[(buf.address, buf.size)] = mapped
+        except TypeError:
+            # memory maps cannot be weakly referenced on python 2
+            pass
+
+        return pyarrow.ipc.open_file(pyarrow.BufferReader(buf)).read_all()
+
+
+def is_memory_mapped(value):
+    '''Whether a value read from an intermediate is backed by a memory mapped file.
+
+    Values read from the filesystem by the npy and arrow strategies are memory mapped, and values
+    derived from them, such as slices, may be too. Changes to a value mapped copy-on-write cost a
+    private copy of each page changed, and changes to a value mapped read-only raise, so steps
+    should copy a mapped value before changing it in place.
+
+    Args:
+        value (Any): The value, typically a solid's input.
+
+    Returns:
+        bool
+    '''
+    if isinstance(value, mmap.mmap):
+        return True
+
+    # a value can only be a numpy array or an arrow object once its package has been imported
+    np = sys.modules.get('numpy')
+    if np is not None:
+        # views of a memory mapped array, such as slices, keep it in their chain of bases, and
+        # arrays converted from arrow without a copy end it with the arrow object
+        while isinstance(value, np.ndarray):
+            if isinstance(value, np.memmap) or isinstance(value.base, mmap.mmap):
+                return True
+            value = value.base
+
+    pyarrow = sys.modules.get('pyarrow')
+    if pyarrow is not None and _arrow_memory_maps:
+        # tables derived from a memory mapped table, such as slices, share its buffers
+        mapped_ranges = list(_arrow_memory_maps.keys())
+        return any(
+            start <= buf.address < start + size
+            for buf in _arrow_buffers(pyarrow, value)
+            for start, size in mapped_ranges
+        )
+
+    return False
+
+
+def _arrow_buffers(pyarrow, value):
+    if isinstance(value, pyarrow.Buffer):
+        return [value]
+
+    if isinstance(value, (pyarrow.Table, pyarrow.RecordBatch)):
+        arrays = value.columns
+    elif isinstance(value, pyarrow.ChunkedArray):
+        arrays = [value]
+    elif isinstance(value, pyarrow.Array):
+        return [buf for buf in value.buffers() if buf is not None]
+    else:
+        return []
+
+    return [
+        buf
+        for array in arrays
+        for chunk in (array.chunks if isinstance(array, pyarrow.ChunkedArray) else [array])
+        for buf in chunk.buffers()
+        if buf is not None
+    ]
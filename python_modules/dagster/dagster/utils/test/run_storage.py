@@ -2,6 +2,7 @@ import pytest
 
 from dagster.core.definitions.pipeline import PipelineRunsFilter
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.runs import MemoizedStep
 from dagster.core.utils import make_new_run_id
 
 
@@ -431,3 +432,35 @@ class TestRunStorage:
         storage.delete_run(run_id)
         assert list(storage.get_runs()) == []
         assert run_id not in [key for key, value in storage.get_run_tags()]
+
+    def test_memoized_steps(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=one, pipeline_name='some_pipeline'))
+        storage.add_run(TestRunStorage.build_run(run_id=two, pipeline_name='some_pipeline'))
+
+        assert storage.get_memoized_steps('some_key') == []
+
+        storage.add_memoized_step(MemoizedStep('some_key', one, 'foo.compute', ['result']))
+        storage.add_memoized_step(MemoizedStep('other_key', one, 'bar.compute', []))
+        storage.add_memoized_step(MemoizedStep('some_key', two, 'foo.compute', ['a', 'b']))
+
+        assert storage.get_memoized_steps('some_key') == [
+            MemoizedStep('some_key', two, 'foo.compute', ['a', 'b']),
+            MemoizedStep('some_key', one, 'foo.compute', ['result']),
+        ]
+        assert storage.get_memoized_steps('some_key', limit=1) == [
+            MemoizedStep('some_key', two, 'foo.compute', ['a', 'b']),
+        ]
+        assert storage.get_memoized_steps('other_key') == [
+            MemoizedStep('other_key', one, 'bar.compute', [])
+        ]
+
+        storage.delete_run(two)
+        assert storage.get_memoized_steps('some_key') == [
+            MemoizedStep('some_key', one, 'foo.compute', ['result']),
+        ]
+
+        storage.wipe()
+        assert storage.get_memoized_steps('some_key') == []
@@ -0,0 +1,186 @@
+'''Benchmark scheduling large execution plans through ActiveExecution.
+
+Builds synthetic execution plans directly from ExecutionSteps, without defining a solid per step,
+and drives them through the ActiveExecution state machine the way the multiprocess engine does:
+keep up to --concurrency steps in flight, complete the oldest one, then ask for more. No step
+does any work, so the timings are the coordinator's scheduling overhead alone.
+
+Shapes:
+
+    chain    each step depends on the one before it
+    fan_out  one root, every other step depends on it, and a final step depends on all of them
+    layered  layers of --width steps, each depending on two steps of the layer before
+
+With --fail-rate, that fraction of steps fail and their downstream steps are skipped.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_active_execution --steps 50000
+'''
+
+import argparse
+import random
+import time
+from collections import OrderedDict, deque
+
+from dagster import PipelineDefinition, lambda_solid
+from dagster.core.definitions.dependency import SolidHandle
+from dagster.core.execution.plan.objects import (
+    ExecutionStep,
+    StepInput,
+    StepInputSourceType,
+    StepKind,
+    StepOutput,
+    StepOutputHandle,
+)
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.types.dagster_type import resolve_dagster_type
+from dagster.utils import frozentags
+
+PIPELINE_NAME = 'bench_active_execution'
+
+
+@lambda_solid
+def noop():
+    pass
+
+
+def _step(index, dependency_keys):
+    dagster_type = resolve_dagster_type(None)
+    step_inputs = []
+    if dependency_keys:
+        step_inputs.append(
+            StepInput(
+                'upstream',
+                dagster_type,
+                StepInputSourceType.SINGLE_OUTPUT
+                if len(dependency_keys) == 1
+                else StepInputSourceType.MULTIPLE_OUTPUTS,
+                [StepOutputHandle(key, 'result') for key in dependency_keys],
+            )
+        )
+    return ExecutionStep(
+        pipeline_name=PIPELINE_NAME,
+        key_suffix='compute',
+        step_inputs=step_inputs,
+        step_outputs=[StepOutput('result', dagster_type, optional=False, should_materialize=False)],
+        compute_fn=lambda *_args: iter([]),
+        kind=StepKind.COMPUTE,
+        solid_handle=SolidHandle('step_{}'.format(index), 'noop', None),
+        tags=frozentags(),
+    )
+
+
+def _chain_deps(num_steps, _width, _rand):
+    return [[] if i == 0 else [i - 1] for i in range(num_steps)]
+
+
+def _fan_out_deps(num_steps, _width, _rand):
+    return [[]] + [[0] for _ in range(1, num_steps - 1)] + [list(range(1, num_steps - 1))]
+
+
+def _layered_deps(num_steps, width, rand):
+    deps = []
+    for i in range(num_steps):
+        layer_start = (i // width) * width
+        if layer_start == 0:
+            deps.append([])
+        else:
+            previous_layer = range(layer_start - width, layer_start)
+            deps.append(sorted(set(rand.sample(previous_layer, min(2, width)))))
+    return deps
+
+
+SHAPES = OrderedDict(
+    [('chain', _chain_deps), ('fan_out', _fan_out_deps), ('layered', _layered_deps)]
+)
+
+
+def build_plan(shape, num_steps, width, seed=0):
+    dep_indices = SHAPES[shape](num_steps, width, random.Random(seed))
+    steps = [
+        _step(i, ['step_{}.compute'.format(dep) for dep in deps])
+        for i, deps in enumerate(dep_indices)
+    ]
+    step_dict = OrderedDict((step.key, step) for step in steps)
+    deps = {
+        step.key: set(
+            handle.step_key
+            for step_input in step.step_inputs
+            for handle in step_input.source_handles
+        )
+        for step in steps
+    }
+    return ExecutionPlan(
+        PipelineDefinition(name=PIPELINE_NAME, solid_defs=[noop]),
+        step_dict,
+        deps,
+        artifacts_persisted=False,
+        previous_run_id=None,
+        step_keys_to_execute=list(step_dict.keys()),
+    )
+
+
+def drive(plan, concurrency, fail_rate, seed=0):
+    rand = random.Random(seed)
+    active_execution = plan.start(retries=Retries(RetryMode.DISABLED))
+    in_flight = deque()
+    executed = 0
+    skipped = 0
+
+    while not active_execution.is_complete:
+        if len(in_flight) < concurrency:
+            for step in active_execution.get_steps_to_execute(concurrency - len(in_flight)):
+                in_flight.append(step.key)
+
+        steps_to_skip = active_execution.get_steps_to_skip()
+        for step in steps_to_skip:
+            active_execution.mark_skipped(step.key)
+        skipped += len(steps_to_skip)
+
+        if in_flight:
+            step_key = in_flight.popleft()
+            if rand.random() < fail_rate:
+                active_execution.mark_failed(step_key)
+            else:
+                active_execution.mark_success(step_key)
+            executed += 1
+
+    return executed, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--steps', type=int, default=50000, help='Number of steps in each plan')
+    parser.add_argument('--width', type=int, default=500, help='Steps per layer of layered plans')
+    parser.add_argument('--concurrency', type=int, default=32, help='Steps kept in flight')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of steps that fail')
+    parser.add_argument('--shapes', nargs='+', choices=list(SHAPES.keys()), default=list(SHAPES))
+    args = parser.parse_args()
+
+    print(
+        '{:>10} {:>10} {:>10} {:>10} {:>12} {:>12}'.format(
+            'shape', 'steps', 'executed', 'skipped', 'build s', 'schedule s'
+        )
+    )
+    for shape in args.shapes:
+        plan = build_plan(shape, args.steps, args.width)
+
+        start = time.time()
+        plan.start(retries=Retries(RetryMode.DISABLED))
+        build_time = time.time() - start
+
+        start = time.time()
+        executed, skipped = drive(plan, args.concurrency, args.fail_rate)
+        schedule_time = time.time() - start
+
+        print(
+            '{:>10} {:>10} {:>10} {:>10} {:>12.3f} {:>12.3f}'.format(
+                shape, args.steps, executed, skipped, build_time, schedule_time
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
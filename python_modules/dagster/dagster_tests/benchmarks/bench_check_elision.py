@@ -0,0 +1,182 @@
+'''Benchmark event throughput with the full and the optimized hot path checks.
+
+Times the work done for every event and log line of a run, with the *_param checks called through
+check.hot_path first run in full and then optimized away (as with DAGSTER_OPTIMIZED_CHECKS=1):
+constructing DagsterEvents and DagsterEventRecords, logging through a DagsterLogManager to an event
+logger, and setting and getting in-memory intermediates. Then executes a pipeline of --solids
+solids in each mode and reports the events it produces per second.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_check_elision --events 50000 --solids 200
+'''
+
+import argparse
+import logging
+import time
+
+from dagster import InputDefinition, check, execute_pipeline, lambda_solid, pipeline
+from dagster.core.definitions.dependency import SolidHandle
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import DagsterEventRecord, construct_event_record
+from dagster.core.execution.plan.objects import StepKind, StepOutputHandle
+from dagster.core.instance import DagsterInstance
+from dagster.core.log_manager import DagsterLogManager
+from dagster.core.storage.intermediates_manager import InMemoryIntermediatesManager
+from dagster.utils.log import StructuredLoggerHandler
+
+RUN_ID = 'benchmark_run'
+PIPELINE_NAME = 'benchmark_pipeline'
+
+EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SKIPPED,
+]
+
+
+def make_event(i):
+    step_key = 'step_{}.compute'.format(i % 100)
+    return DagsterEvent(
+        event_type_value=EVENT_TYPES[i % 4].value,
+        pipeline_name=PIPELINE_NAME,
+        step_key=step_key,
+        solid_handle=SolidHandle('solid_{}'.format(i % 100), 'solid_def', None),
+        step_kind_value=StepKind.COMPUTE.value,
+        logging_tags={'pipeline': PIPELINE_NAME, 'step_key': step_key},
+    )
+
+
+def construct_events(num_events):
+    for i in range(num_events):
+        event = make_event(i)
+        DagsterEventRecord(
+            error_info=None,
+            message='message',
+            level=10,
+            user_message='',
+            run_id=RUN_ID,
+            timestamp=time.time(),
+            step_key=event.step_key,
+            pipeline_name=PIPELINE_NAME,
+            dagster_event=event,
+        )
+
+
+def log_events(num_events):
+    # the logger of construct_event_logger, which the instance uses to record the events of runs
+    records = []
+    event_logger = logging.Logger('event-logger', level=logging.DEBUG)
+    event_logger.addHandler(
+        StructuredLoggerHandler(
+            lambda logger_message: records.append(construct_event_record(logger_message))
+        )
+    )
+
+    log_manager = DagsterLogManager(RUN_ID, {'pipeline': PIPELINE_NAME}, [event_logger])
+    for i in range(num_events):
+        event = make_event(i)
+        log_manager.debug(
+            'message', dagster_event=event, pipeline_name=PIPELINE_NAME, step_key=event.step_key
+        )
+    assert len(records) == num_events
+
+
+def pass_intermediates(num_events):
+    intermediates_manager = InMemoryIntermediatesManager()
+    handles = [StepOutputHandle('step_{}.compute'.format(i % 100)) for i in range(num_events)]
+    for i, handle in enumerate(handles):
+        intermediates_manager.set_intermediate(None, step_output_handle=handle, value=i)
+        intermediates_manager.has_intermediate(None, handle)
+        intermediates_manager.get_intermediate(None, step_output_handle=handle)
+
+
+def build_pipeline(num_solids):
+    @lambda_solid
+    def emit_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    @pipeline
+    def bench_check_elision():
+        num = emit_one()
+        for i in range(num_solids):
+            num = add_one.alias('add_one_{}'.format(i))(num)
+
+    return bench_check_elision
+
+
+def time_fn(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        fn()
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def bench(optimized, num_events, num_solids, repeat):
+    check.set_optimized_checks(optimized)
+
+    timings = [
+        (name, time_fn(lambda fn=fn: fn(num_events), repeat))
+        for name, fn in [
+            ('construct events', construct_events),
+            ('log events', log_events),
+            ('intermediates', pass_intermediates),
+        ]
+    ]
+
+    pipeline_def = build_pipeline(num_solids)
+    num_pipeline_events = [0]
+
+    def _execute():
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={'loggers': {'console': {'config': {'log_level': 'CRITICAL'}}}},
+            instance=DagsterInstance.ephemeral(),
+        )
+        num_pipeline_events[0] = len(result.event_list)
+
+    timings.append(('execute pipeline', time_fn(_execute, repeat)))
+    return timings, num_pipeline_events[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--events', type=int, default=50000, help='Events per case')
+    parser.add_argument('--solids', type=int, default=200, help='Solids in the executed pipeline')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    previous = check.optimized_checks_enabled()
+    try:
+        full, num_pipeline_events = bench(False, args.events, args.solids, args.repeat)
+        optimized, _ = bench(True, args.events, args.solids, args.repeat)
+    finally:
+        check.set_optimized_checks(previous)
+
+    print(
+        '{:>18} {:>10} {:>14} {:>14} {:>9}'.format(
+            'case', 'events', 'full ev/s', 'optimized ev/s', 'speedup'
+        )
+    )
+    for (name, full_secs), (_, optimized_secs) in zip(full, optimized):
+        num_events = num_pipeline_events if name == 'execute pipeline' else args.events
+        print(
+            '{:>18} {:>10} {:>14.0f} {:>14.0f} {:>8.2f}x'.format(
+                name,
+                num_events,
+                num_events / full_secs,
+                num_events / optimized_secs,
+                full_secs / optimized_secs,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+'''Benchmark the per-step overhead of compute log capture.
+
+Executes a pipeline of --steps independent solids that each print a line, in process, on instances
+whose compute log manager captures nothing, captures with the tail capture mode, and captures with
+the thread capture mode, and reports the mean wall time per step of each. The difference between
+the uncaptured and captured timings is the cost of capture.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_compute_logs --steps 200
+'''
+
+import argparse
+import os
+import time
+
+from dagster import execute_pipeline, lambda_solid, pipeline, seven
+from dagster.core.instance import DagsterInstance, InstanceRef, InstanceType
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+
+CAPTURE_MODES = ['off', 'tail', 'thread']
+
+
+def build_pipeline(num_steps):
+    @lambda_solid
+    def say_hello():
+        print('Hello')
+
+    @pipeline(name='bench_compute_logs')
+    def bench_compute_logs():
+        for i in range(num_steps):
+            say_hello.alias('say_hello_{}'.format(i))()
+
+    return bench_compute_logs
+
+
+def build_instance(tempdir, capture_mode):
+    compute_logs_dir = os.path.join(tempdir, 'storage')
+    if capture_mode == 'off':
+        # the same storage as the other instances, without compute log capture
+        instance_ref = InstanceRef.from_dir(tempdir)
+        return DagsterInstance(
+            InstanceType.PERSISTENT,
+            local_artifact_storage=instance_ref.local_artifact_storage,
+            run_storage=instance_ref.run_storage,
+            event_storage=instance_ref.event_storage,
+            compute_log_manager=NoOpComputeLogManager(compute_logs_dir),
+        )
+
+    return DagsterInstance.local_temp(
+        tempdir,
+        overrides={
+            'compute_logs': {
+                'module': 'dagster.core.storage.local_compute_log_manager',
+                'class': 'LocalComputeLogManager',
+                'config': {'base_dir': compute_logs_dir, 'capture_mode': capture_mode},
+            }
+        },
+    )
+
+
+def time_per_step(pipeline_def, capture_mode, num_steps):
+    with seven.TemporaryDirectory() as tempdir:
+        instance = build_instance(tempdir, capture_mode)
+        start = time.time()
+        result = execute_pipeline(pipeline_def, instance=instance)
+        elapsed = time.time() - start
+        assert result.success
+        return elapsed / num_steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--steps', type=int, default=200, help='Number of steps in the pipeline')
+    parser.add_argument('--modes', nargs='+', choices=CAPTURE_MODES, default=CAPTURE_MODES)
+    args = parser.parse_args()
+
+    pipeline_def = build_pipeline(args.steps)
+
+    timings = {mode: time_per_step(pipeline_def, mode, args.steps) for mode in args.modes}
+
+    print('{:>10} {:>14} {:>14}'.format('capture', 'ms per step', 'overhead ms'))
+    for mode in args.modes:
+        print(
+            '{:>10} {:>14.2f} {:>14}'.format(
+                mode,
+                1000 * timings[mode],
+                '{:.2f}'.format(1000 * (timings[mode] - timings['off']))
+                if 'off' in timings
+                else '-',
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
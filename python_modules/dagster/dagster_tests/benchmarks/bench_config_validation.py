@@ -0,0 +1,138 @@
+'''Benchmark processing the environment config of large generated pipelines.
+
+Generates a pipeline of --solids solids, each with a config schema of nested shapes, arrays,
+selectors and defaulted fields, and an environment dict that configures every solid. Reports the
+mean time to process that environment dict against the pipeline's environment type with the
+detailed evaluation (which builds a validation context for every node of the config), with the
+compiled validators the first time (which includes compiling them), with the compiled validators
+once compiled, and for an environment dict with an error in the last solid's config (which falls
+back to the detailed evaluation).
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_config_validation --solids 100 200 500
+'''
+
+import argparse
+import time
+
+from dagster import Field, Selector, pipeline, solid
+from dagster.config.validate import _process_config_detailed, process_config
+from dagster.core.definitions.environment_schema import create_environment_type
+
+SOLID_CONFIG = {
+    'name': str,
+    'retries': Field(int, is_required=False, default_value=3),
+    'tags': Field([str], is_required=False, default_value=[]),
+    'source': Selector(
+        {
+            'table': {'schema': str, 'name': str},
+            'query': {'sql': str, 'timeout': Field(float, is_required=False, default_value=1.0)},
+        }
+    ),
+    'options': Field(
+        {
+            'verbose': Field(bool, is_required=False, default_value=False),
+            'thresholds': Field([{'column': str, 'min': int, 'max': int}], is_required=False),
+        },
+        is_required=False,
+    ),
+}
+
+
+def build_pipeline(num_solids):
+    @solid(config=SOLID_CONFIG)
+    def configured(_):
+        pass
+
+    @pipeline
+    def bench_config_validation():
+        for i in range(num_solids):
+            configured.alias('configured_{}'.format(i))()
+
+    return bench_config_validation
+
+
+def build_environment_dict(num_solids):
+    solids = {}
+    for i in range(num_solids):
+        solids['configured_{}'.format(i)] = {
+            'config': {
+                'name': 'solid_{}'.format(i),
+                'tags': ['a', 'b'],
+                'source': {'table': {'schema': 'public', 'name': 'table_{}'.format(i)}}
+                if i % 2
+                else {'query': {'sql': 'select {}'.format(i)}},
+                'options': {
+                    'thresholds': [
+                        {'column': 'col_{}'.format(j), 'min': 0, 'max': j} for j in range(3)
+                    ]
+                },
+            }
+        }
+    return {'solids': solids}
+
+
+def mean_time(fn, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        fn()
+    return (time.time() - start) / iterations
+
+
+def bench(num_solids, iterations):
+    environment_type = create_environment_type(build_pipeline(num_solids))
+    environment_dict = build_environment_dict(num_solids)
+
+    invalid_environment_dict = build_environment_dict(num_solids)
+    invalid_environment_dict['solids']['configured_{}'.format(num_solids - 1)]['config'][
+        'retries'
+    ] = 'three'
+
+    detailed = mean_time(
+        lambda: _process_config_detailed(environment_type, environment_dict), iterations
+    )
+
+    start = time.time()
+    assert process_config(environment_type, environment_dict).success
+    first = time.time() - start
+
+    compiled = mean_time(lambda: process_config(environment_type, environment_dict), iterations)
+    invalid = mean_time(
+        lambda: process_config(environment_type, invalid_environment_dict), iterations
+    )
+
+    return detailed, first, compiled, invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--solids', type=int, nargs='+', default=[100, 200, 500], help='Numbers of solids'
+    )
+    parser.add_argument(
+        '--iterations', type=int, default=10, help='Times to process each environment dict'
+    )
+    args = parser.parse_args()
+
+    print(
+        '{:>8} {:>14} {:>14} {:>14} {:>9} {:>14}'.format(
+            'solids', 'detailed ms', 'first ms', 'compiled ms', 'speedup', 'invalid ms'
+        )
+    )
+    for num_solids in args.solids:
+        detailed, first, compiled, invalid = bench(num_solids, args.iterations)
+        print(
+            '{:>8} {:>14.2f} {:>14.2f} {:>14.2f} {:>8.1f}x {:>14.2f}'.format(
+                num_solids,
+                1000 * detailed,
+                1000 * first,
+                1000 * compiled,
+                detailed / compiled,
+                1000 * invalid,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
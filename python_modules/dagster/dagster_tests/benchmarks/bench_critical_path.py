@@ -0,0 +1,128 @@
+'''Simulate the makespan of runs scheduled by priority alone and by critical path.
+
+Replays a pipeline's execution plan through ActiveExecution with a fixed number of workers, taking
+each step's duration from the mean of its durations in the pipeline's recorded runs on the current
+instance (DAGSTER_HOME), and reports how long the run would take when ready steps are started in
+the default priority order and when they are started by the length of their critical path. Steps
+that never succeeded in a recorded run take the mean duration of the others.
+
+Without --python-file, a synthetic layered plan with randomly distributed step durations is
+simulated instead.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_critical_path -f pipelines.py -n define_pipeline \\
+        --concurrency 2 4 8
+    python -m dagster_tests.benchmarks.bench_critical_path --steps 2000 --concurrency 4 16 64
+'''
+
+import argparse
+import heapq
+import itertools
+import random
+
+from dagster import ExecutionTargetHandle
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.critical_path import (
+    critical_path_lengths,
+    critical_path_sort_key_fn,
+    historical_step_durations,
+)
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.instance import DagsterInstance
+
+from .bench_active_execution import build_plan
+
+
+def fill_missing_durations(execution_plan, step_durations):
+    known_durations = list(step_durations.values())
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+    return {
+        step_key: step_durations.get(step_key, default_duration)
+        for step_key in execution_plan.step_keys_to_execute
+    }
+
+
+def simulate_makespan(execution_plan, step_durations, concurrency, sort_key_fn=None):
+    active_execution = execution_plan.start(Retries(RetryMode.DISABLED), sort_key_fn)
+    running = []
+    counter = itertools.count()
+    now = 0.0
+
+    while not active_execution.is_complete:
+        if len(running) < concurrency:
+            for step in active_execution.get_steps_to_execute(concurrency - len(running)):
+                heapq.heappush(running, (now + step_durations[step.key], next(counter), step.key))
+
+        now, _, step_key = heapq.heappop(running)
+        active_execution.mark_success(step_key)
+
+    return now
+
+
+def synthetic_durations(execution_plan, seed=0):
+    rand = random.Random(seed)
+    return {
+        step_key: rand.lognormvariate(0, 1.5) for step_key in execution_plan.step_keys_to_execute
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-f', '--python-file', help='File defining the pipeline')
+    parser.add_argument('-n', '--fn-name', help='Function in the file that defines the pipeline')
+    parser.add_argument('--runs', type=int, default=10, help='Number of recorded runs to read')
+    parser.add_argument('--steps', type=int, default=2000, help='Steps in the synthetic plan')
+    parser.add_argument('--width', type=int, default=50, help='Layer width of the synthetic plan')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[2, 4, 8, 16])
+    args = parser.parse_args()
+
+    if args.python_file:
+        pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+            args.python_file, args.fn_name
+        ).build_pipeline_definition()
+        execution_plan = create_execution_plan(pipeline_def)
+        step_durations = historical_step_durations(
+            DagsterInstance.get(), pipeline_def.name, max_runs=args.runs
+        )
+        print(
+            'Read durations of {} of {} steps from recorded runs of {}'.format(
+                len(step_durations), len(execution_plan.step_keys_to_execute), pipeline_def.name
+            )
+        )
+    else:
+        execution_plan = build_plan('layered', args.steps, args.width)
+        step_durations = synthetic_durations(execution_plan)
+
+    # the critical path is ranked by the recorded durations alone, while the simulation needs a
+    # duration for every step
+    sort_key_fn = critical_path_sort_key_fn(execution_plan, step_durations)
+    step_durations = fill_missing_durations(execution_plan, step_durations)
+    critical_path = max(critical_path_lengths(execution_plan, step_durations).values())
+    total = sum(step_durations.values())
+
+    print(
+        '{:>12} {:>12} {:>14} {:>12} {:>12}'.format(
+            'concurrency', 'priority', 'critical path', 'improved', 'lower bound'
+        )
+    )
+    for concurrency in args.concurrency:
+        default_makespan = simulate_makespan(execution_plan, step_durations, concurrency)
+        critical_path_makespan = simulate_makespan(
+            execution_plan, step_durations, concurrency, sort_key_fn
+        )
+        print(
+            '{:>12} {:>12.2f} {:>14.2f} {:>11.1f}% {:>12.2f}'.format(
+                concurrency,
+                default_makespan,
+                critical_path_makespan,
+                100.0 * (default_makespan - critical_path_makespan) / default_makespan
+                if default_makespan
+                else 0.0,
+                max(critical_path, total / concurrency),
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
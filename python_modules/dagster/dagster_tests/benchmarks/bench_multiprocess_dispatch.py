@@ -0,0 +1,137 @@
+'''Benchmark event dispatch latency and throughput in the multiprocess engine's coordinator.
+
+Compares the legacy round-robin coordinator, which blocks for up to TICK polling each child in
+turn, with the multiplexed coordinator, which waits on all children at once with wait_for_ready.
+
+One child emits timestamped events as fast as it can; every other child is idle, which is the
+worst case for round-robin polling.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_multiprocess_dispatch --children 1 4 16 32
+'''
+
+import argparse
+import time
+
+from dagster.core.engine.child_process_executor import (
+    TICK,
+    ChildProcessCommand,
+    can_wait_on_children,
+    poll_child_process,
+    start_child_process_command,
+    wait_for_ready,
+)
+
+
+class EmitTimestampsCommand(ChildProcessCommand):
+    def __init__(self, num_events, interval):
+        self.num_events = num_events
+        self.interval = interval
+
+    def execute(self):
+        for _ in range(self.num_events):
+            if self.interval:
+                time.sleep(self.interval)
+            yield time.time()
+
+
+class IdleCommand(ChildProcessCommand):
+    def __init__(self, duration):
+        self.duration = duration
+
+    def execute(self):
+        time.sleep(self.duration)
+        yield None
+
+
+def _handle(event, latencies):
+    if isinstance(event, float):
+        received = time.time()
+        latencies.append((received - event, received))
+
+
+def _run_round_robin(iters, latencies):
+    while iters:
+        for key, child_iter in list(iters.items()):
+            try:
+                _handle(next(child_iter), latencies)
+            except StopIteration:
+                del iters[key]
+
+
+def _run_multiplexed(iters, waitables, latencies):
+    while iters:
+        for key in wait_for_ready({key: waitables[key] for key in iters}):
+            try:
+                # drain everything this child has delivered so far, as the engine does
+                event = next(iters[key])
+                while event is not None:
+                    _handle(event, latencies)
+                    event = next(iters[key])
+            except StopIteration:
+                del iters[key]
+
+
+def run_benchmark(num_children, num_events, interval, multiplexed):
+    idle_duration = num_events * (interval or 0.001) + 1.0
+    commands = [EmitTimestampsCommand(num_events, interval)] + [
+        IdleCommand(idle_duration) for _ in range(num_children - 1)
+    ]
+    children = {str(i): start_child_process_command(command) for i, command in enumerate(commands)}
+
+    poll_timeout = 0.0 if multiplexed else TICK
+    iters = {key: poll_child_process(child, poll_timeout) for key, child in children.items()}
+    waitables = {key: child.waitables for key, child in children.items()}
+
+    latencies = []
+    if multiplexed:
+        _run_multiplexed(iters, waitables, latencies)
+    else:
+        _run_round_robin(iters, latencies)
+
+    # exclude process startup, and idle children outlive the busy one, so measure throughput
+    # between the first and last delivered events
+    elapsed = latencies[-1][1] - latencies[0][1]
+    latencies = sorted(latency for latency, _ in latencies)
+    return {
+        'p50_ms': 1000.0 * latencies[len(latencies) // 2],
+        'p99_ms': 1000.0 * latencies[int(len(latencies) * 0.99)],
+        'events_per_sec': (len(latencies) - 1) / elapsed if elapsed else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--children', type=int, nargs='+', default=[1, 4, 16, 32])
+    parser.add_argument('--events', type=int, default=500)
+    parser.add_argument(
+        '--interval', type=float, default=0.0, help='Seconds the busy child sleeps between events'
+    )
+    args = parser.parse_args()
+
+    modes = [('round-robin', False)]
+    if can_wait_on_children():
+        modes.append(('multiplexed', True))
+
+    print(
+        '{:>12} {:>9} {:>10} {:>10} {:>12}'.format(
+            'mode', 'children', 'p50 ms', 'p99 ms', 'events/s'
+        )
+    )
+    for num_children in args.children:
+        for mode, multiplexed in modes:
+            result = run_benchmark(num_children, args.events, args.interval, multiplexed)
+            print(
+                '{:>12} {:>9} {:>10.2f} {:>10.2f} {:>12.0f}'.format(
+                    mode,
+                    num_children,
+                    result['p50_ms'],
+                    result['p99_ms'],
+                    result['events_per_sec'],
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+'''Benchmark serializing and deserializing event log records.
+
+Builds a run's worth of DagsterEventRecords with the mix of events a typical step produces (start,
+output with a type check and metadata, success, engine events and the occasional failure with a
+stack trace), then times packing, JSON and, when msgpack is installed, binary round trips over the
+whole log. Loading a run in dagit deserializes every record in its event log, so the unpack
+timings are the ones that matter most.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_serdes --events 50000
+'''
+
+import argparse
+import time
+
+from dagster import EventMetadataEntry
+from dagster.core.definitions.dependency import SolidHandle
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import (
+    StepFailureData,
+    StepKind,
+    StepOutputData,
+    StepOutputHandle,
+    StepSuccessData,
+    TypeCheckData,
+)
+from dagster.core.serdes import (
+    deserialize_bytes_to_dagster_namedtuple,
+    deserialize_json_to_dagster_namedtuple,
+    pack_value,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_to_bytes,
+    unpack_value,
+)
+from dagster.utils.error import SerializableErrorInfo
+
+RUN_ID = 'benchmark_run'
+PIPELINE_NAME = 'benchmark_pipeline'
+
+STACK = [
+    '  File "solids.py", line {}, in compute\n    result = transform(df)\n'.format(i)
+    for i in range(20)
+]
+
+
+def _event_specific_data(event_type, i):
+    if event_type == DagsterEventType.STEP_OUTPUT:
+        return StepOutputData(
+            step_output_handle=StepOutputHandle('step_{}.compute'.format(i % 100)),
+            type_check_data=TypeCheckData(
+                success=True,
+                label='result',
+                metadata_entries=[
+                    EventMetadataEntry.text('{} rows'.format(i), 'row_count'),
+                    EventMetadataEntry.json({'columns': ['a', 'b', 'c'], 'index': i}, 'schema'),
+                ],
+            ),
+        )
+    if event_type == DagsterEventType.STEP_SUCCESS:
+        return StepSuccessData(duration_ms=12.5)
+    if event_type == DagsterEventType.STEP_FAILURE:
+        return StepFailureData(
+            error=SerializableErrorInfo('ValueError: bad row {}'.format(i), STACK, 'ValueError'),
+            user_failure_data=None,
+        )
+    if event_type == DagsterEventType.ENGINE_EVENT:
+        return EngineEventData(
+            [EventMetadataEntry.text(str(1000 + i), 'pid')], marker_start='step_process_start'
+        )
+    return None
+
+
+def make_record(i):
+    event_type = [
+        DagsterEventType.STEP_START,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.ENGINE_EVENT,
+    ][i % 4]
+    if i % 100 == 99:
+        event_type = DagsterEventType.STEP_FAILURE
+
+    step_key = 'step_{}.compute'.format(i % 100)
+    return DagsterEventRecord(
+        error_info=None,
+        message='{} for step {}'.format(event_type.value, step_key),
+        level=10,
+        user_message='',
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        step_key=step_key,
+        pipeline_name=PIPELINE_NAME,
+        dagster_event=DagsterEvent(
+            event_type_value=event_type.value,
+            pipeline_name=PIPELINE_NAME,
+            step_key=step_key,
+            solid_handle=SolidHandle('solid_{}'.format(i % 100), 'solid_def', None),
+            step_kind_value=StepKind.COMPUTE.value,
+            logging_tags={'pipeline': PIPELINE_NAME, 'step_key': step_key},
+            event_specific_data=_event_specific_data(event_type, i),
+        ),
+    )
+
+
+def time_fn(fn, values, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        for value in values:
+            fn(value)
+        timings.append(time.time() - start)
+    return 1000.0 * min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--events', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    records = [make_record(i) for i in range(args.events)]
+    packed = [pack_value(record) for record in records]
+    json_strs = [serialize_dagster_namedtuple(record) for record in records]
+
+    cases = [
+        ('pack_value', pack_value, records),
+        ('unpack_value', unpack_value, packed),
+        ('serialize json', serialize_dagster_namedtuple, records),
+        ('deserialize json', deserialize_json_to_dagster_namedtuple, json_strs),
+    ]
+
+    try:
+        import msgpack  # pylint: disable=unused-import,unused-variable
+    except ImportError:
+        print('msgpack is not installed, skipping the binary encoding')
+    else:
+        binaries = [serialize_dagster_namedtuple_to_bytes(record) for record in records]
+        cases += [
+            ('serialize binary', serialize_dagster_namedtuple_to_bytes, records),
+            ('deserialize binary', deserialize_bytes_to_dagster_namedtuple, binaries),
+        ]
+        print(
+            'Mean encoded size: {:.0f} bytes json, {:.0f} bytes binary'.format(
+                sum(len(s) for s in json_strs) / float(len(json_strs)),
+                sum(len(b) for b in binaries) / float(len(binaries)),
+            )
+        )
+
+    print('{:>20} {:>12} {:>12}'.format('operation', 'total ms', 'us / event'))
+    for name, fn, values in cases:
+        total_ms = time_fn(fn, values, args.repeat)
+        print('{:>20} {:>12.1f} {:>12.2f}'.format(name, total_ms, 1000.0 * total_ms / len(records)))
+
+    assert [unpack_value(value) for value in packed] == records
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+'''Benchmark the run and event log storage queries that back dagit's runs and run views.
+
+Fills a run storage with runs (each tagged, spread over a handful of pipelines and statuses) and
+an event log storage with events for a single run, then times get_runs with each kind of filter,
+get_runs_count, get_logs_for_run and get_stats_for_run. Pass --drop-indexes to time the same
+queries against the unindexed schema.
+
+Rows are bulk inserted directly into the tables, so filling the default sizes takes a minute or
+two on SQLite.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_sql_storage --runs 100000 --events 1000000
+    python -m dagster_tests.benchmarks.bench_sql_storage --postgres-url postgresql://...
+'''
+
+import argparse
+import time
+from datetime import datetime
+
+import sqlalchemy as db
+
+from dagster import seven
+from dagster.core.definitions.pipeline import PipelineRunsFilter
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.serdes import serialize_dagster_namedtuple
+from dagster.core.storage.event_log import SqlEventLogStorageTable, SqliteEventLogStorage
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.runs import SqliteRunStorage
+from dagster.core.storage.runs.schema import RunTagsTable, RunsTable
+
+BATCH_SIZE = 10000
+NUM_PIPELINES = 10
+NUM_TAG_VALUES = 100
+BENCHMARK_RUN_ID = 'benchmark_run'
+
+STATUSES = [
+    PipelineRunStatus.SUCCESS,
+    PipelineRunStatus.SUCCESS,
+    PipelineRunStatus.SUCCESS,
+    PipelineRunStatus.FAILURE,
+    PipelineRunStatus.STARTED,
+]
+
+EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.ENGINE_EVENT,
+]
+
+EVENT_SPECIFIC_DATA = {
+    DagsterEventType.STEP_SUCCESS: StepSuccessData(duration_ms=1.0),
+    DagsterEventType.ENGINE_EVENT: EngineEventData([]),
+}
+
+
+def _batches(num_rows, make_row):
+    for start in range(0, num_rows, BATCH_SIZE):
+        yield [make_row(i) for i in range(start, min(start + BATCH_SIZE, num_rows))]
+
+
+def _run_row(i):
+    pipeline_run = PipelineRun.create_empty_run(
+        pipeline_name='pipeline_{}'.format(i % NUM_PIPELINES), run_id='run_{}'.format(i)
+    )
+    pipeline_run = pipeline_run.run_with_status(STATUSES[i % len(STATUSES)])
+    return dict(
+        run_id=pipeline_run.run_id,
+        pipeline_name=pipeline_run.pipeline_name,
+        status=pipeline_run.status.value,
+        run_body=serialize_dagster_namedtuple(pipeline_run),
+    )
+
+
+def _tag_rows(i):
+    return [
+        dict(run_id='run_{}'.format(i), key='owner', value='owner_{}'.format(i % NUM_TAG_VALUES)),
+        dict(run_id='run_{}'.format(i), key='partition', value=str(i % (NUM_TAG_VALUES * 10))),
+    ]
+
+
+def _event_row(i):
+    event_type = EVENT_TYPES[i % len(EVENT_TYPES)]
+    record = DagsterEventRecord(
+        error_info=None,
+        message='event {}'.format(i),
+        level=20,
+        user_message='',
+        run_id=BENCHMARK_RUN_ID,
+        timestamp=time.time(),
+        step_key='step_{}'.format(i % 100),
+        pipeline_name='pipeline_0',
+        dagster_event=DagsterEvent(
+            event_type_value=event_type.value,
+            pipeline_name='pipeline_0',
+            event_specific_data=EVENT_SPECIFIC_DATA.get(event_type),
+        ),
+    )
+    return dict(
+        run_id=BENCHMARK_RUN_ID,
+        event=serialize_dagster_namedtuple(record),
+        dagster_event_type=event_type.value,
+        timestamp=datetime.now(),
+    )
+
+
+def fill_run_storage(run_storage, num_runs):
+    with run_storage.connect() as conn:
+        for rows in _batches(num_runs, _run_row):
+            conn.execute(RunsTable.insert(), rows)  # pylint: disable=no-value-for-parameter
+        for rows in _batches(num_runs, _tag_rows):
+            conn.execute(
+                RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                [tag for tags in rows for tag in tags],
+            )
+
+
+def fill_event_log_storage(event_log_storage, num_events):
+    with event_log_storage.connect(BENCHMARK_RUN_ID) as conn:
+        for rows in _batches(num_events, _event_row):
+            # pylint: disable=no-value-for-parameter
+            conn.execute(SqlEventLogStorageTable.insert(), rows)
+
+
+def drop_indexes(storage, tables, run_id=None):
+    connect = storage.connect(run_id) if run_id else storage.connect()
+    with connect as conn:
+        for table in tables:
+            for index in table.indexes:
+                index.drop(conn)
+
+
+def time_query(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        fn()
+        timings.append(time.time() - start)
+    timings.sort()
+    return 1000.0 * timings[len(timings) // 2], 1000.0 * timings[-1]
+
+
+def run_queries(run_storage, event_log_storage, num_runs, num_events, repeat):
+    mid_cursor = 'run_{}'.format(num_runs // 2)
+    queries = [
+        ('get_runs(limit=20)', lambda: run_storage.get_runs(limit=20)),
+        ('get_runs(cursor, limit=20)', lambda: run_storage.get_runs(cursor=mid_cursor, limit=20),),
+        (
+            'get_runs(pipeline_name)',
+            lambda: run_storage.get_runs(PipelineRunsFilter(pipeline_name='pipeline_3'), limit=20),
+        ),
+        (
+            'get_runs(status)',
+            lambda: run_storage.get_runs(
+                PipelineRunsFilter(status=PipelineRunStatus.FAILURE), limit=20
+            ),
+        ),
+        (
+            'get_runs(tags)',
+            lambda: run_storage.get_runs(
+                PipelineRunsFilter(tags={'owner': 'owner_7', 'partition': '7'}), limit=20
+            ),
+        ),
+        (
+            'get_runs_count(tags)',
+            lambda: run_storage.get_runs_count(PipelineRunsFilter(tags={'owner': 'owner_7'})),
+        ),
+        (
+            'get_logs_for_run(cursor)',
+            # the last 1000 events, or all of them when there are fewer
+            lambda: event_log_storage.get_logs_for_run(
+                BENCHMARK_RUN_ID, cursor=max(num_events - 1000, -1)
+            ),
+        ),
+        ('get_stats_for_run', lambda: event_log_storage.get_stats_for_run(BENCHMARK_RUN_ID)),
+    ]
+
+    print('{:>28} {:>10} {:>10}'.format('query', 'p50 ms', 'max ms'))
+    for name, fn in queries:
+        print('{:>28} {:>10.2f} {:>10.2f}'.format(name, *time_query(fn, repeat)))
+
+
+def _postgres_storages(postgres_url):
+    from dagster_postgres import PostgresEventLogStorage, PostgresRunStorage
+
+    run_storage = PostgresRunStorage(postgres_url)
+    event_log_storage = PostgresEventLogStorage(postgres_url)
+    run_storage.wipe()
+    event_log_storage.wipe()
+    return run_storage, event_log_storage
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=100000)
+    parser.add_argument('--events', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument(
+        '--postgres-url', help='Benchmark the dagster_postgres storages against this database'
+    )
+    parser.add_argument(
+        '--drop-indexes', action='store_true', help='Time the queries without secondary indexes'
+    )
+    args = parser.parse_args()
+
+    with seven.TemporaryDirectory() as tempdir:
+        if args.postgres_url:
+            run_storage, event_log_storage = _postgres_storages(args.postgres_url)
+        else:
+            run_storage = SqliteRunStorage.from_local(tempdir)
+            event_log_storage = SqliteEventLogStorage(tempdir)
+
+        start = time.time()
+        fill_run_storage(run_storage, args.runs)
+        fill_event_log_storage(event_log_storage, args.events)
+        print(
+            'Filled {} runs and {} events in {:.1f}s'.format(
+                args.runs, args.events, time.time() - start
+            )
+        )
+
+        if args.drop_indexes:
+            drop_indexes(run_storage, [RunsTable, RunTagsTable])
+            drop_indexes(event_log_storage, [SqlEventLogStorageTable], BENCHMARK_RUN_ID)
+
+        for storage, run_id in [(run_storage, None), (event_log_storage, BENCHMARK_RUN_ID)]:
+            with (storage.connect(run_id) if run_id else storage.connect()) as conn:
+                conn.execute(db.text('ANALYZE'))
+
+        run_queries(run_storage, event_log_storage, args.runs, args.events, args.repeat)
+
+        if args.postgres_url:
+            run_storage.wipe()
+            event_log_storage.wipe()
+
+
+if __name__ == '__main__':
+    main()
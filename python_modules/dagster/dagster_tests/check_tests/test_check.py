@@ -1015,3 +1015,81 @@ def test_opt_generator():
 def test_internals():
     with pytest.raises(CheckError):
         check._check_key_value_types(None, str, str)  # pylint: disable=protected-access
+
+
+@contextmanager
+def optimized_checks(optimized=True):
+    previous = check.optimized_checks_enabled()
+    check.set_optimized_checks(optimized)
+    try:
+        yield
+    finally:
+        check.set_optimized_checks(previous)
+
+
+def test_hot_path_checks():
+    with optimized_checks(False):
+        assert check.hot_path.str_param('foo', 'param_name') == 'foo'
+        with pytest.raises(ParameterCheckError):
+            check.hot_path.str_param(1, 'param_name')
+
+        with pytest.raises(ParameterCheckError):
+            check.hot_path.inst_param(1, 'param_name', str)
+
+        with pytest.raises(CheckError):
+            check.hot_path.list_param(['foo', 1], 'param_name', of_type=str)
+
+
+def test_optimized_hot_path_checks():
+    with optimized_checks():
+        assert check.optimized_checks_enabled()
+
+        assert check.hot_path.str_param(1, 'param_name') == 1
+        assert check.hot_path.inst_param(1, 'param_name', str) == 1
+        assert check.hot_path.list_param(['foo', 1], 'param_name', of_type=str) == ['foo', 1]
+        assert check.hot_path.list_param(['foo', 1], 'param_name', str) == ['foo', 1]
+        assert check.hot_path.dict_param({1: 'foo'}, 'param_name', key_type=str) == {1: 'foo'}
+
+        # the values returned for optional params are those of the full checks
+        assert check.hot_path.opt_str_param(None, 'param_name') is None
+        assert check.hot_path.opt_str_param(None, 'param_name', 'default') == 'default'
+        assert check.hot_path.opt_str_param('foo', 'param_name', 'default') == 'foo'
+        assert check.hot_path.opt_inst_param(None, 'param_name', int) is None
+        assert check.hot_path.opt_inst_param(None, 'param_name', int, 3) == 3
+        assert check.hot_path.opt_inst_param(None, 'param_name', int, default=3) == 3
+        assert check.hot_path.opt_list_param(None, 'param_name') == []
+        assert check.hot_path.opt_list_param(frozenlist(), 'param_name', str) == []
+        assert check.hot_path.opt_dict_param(None, 'param_name') == {}
+        assert check.hot_path.opt_dict_param(frozendict(), 'param_name', key_type=str) == {}
+
+        # only the hot path checks are optimized away
+        with pytest.raises(ParameterCheckError):
+            check.str_param(1, 'param_name')
+
+        with pytest.raises(CheckError):
+            check.invariant(False)
+
+
+@pytest.mark.parametrize(
+    'value,optimized',
+    [
+        (None, False),
+        ('', False),
+        ('0', False),
+        ('false', False),
+        ('False', False),
+        ('no', False),
+        ('off', False),
+        ('1', True),
+        ('true', True),
+        ('TRUE', True),
+        ('yes', True),
+        ('on', True),
+    ],
+)
+def test_optimized_checks_from_env(monkeypatch, value, optimized):
+    if value is None:
+        monkeypatch.delenv(check.OPTIMIZED_CHECKS_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(check.OPTIMIZED_CHECKS_ENV_VAR, value)
+    assert check.optimized_checks_from_env() == optimized
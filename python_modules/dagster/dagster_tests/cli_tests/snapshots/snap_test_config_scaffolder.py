@@ -11,6 +11,7 @@ snapshots['test_basic_solids_config 1'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -26,6 +27,8 @@ snapshots['test_basic_solids_config 1'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -35,6 +38,9 @@ snapshots['test_basic_solids_config 1'] = {
                     },
                     'enabled': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -82,6 +88,7 @@ snapshots['test_two_modes 2'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -97,6 +104,8 @@ snapshots['test_two_modes 2'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -106,6 +115,9 @@ snapshots['test_two_modes 2'] = {
                     },
                     'enabled': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -153,6 +165,7 @@ snapshots['test_two_modes 4'] = {
         'in_process': {
             'config': {
                 'marker_to_close': '',
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -168,6 +181,8 @@ snapshots['test_two_modes 4'] = {
         'multiprocess': {
             'config': {
                 'max_concurrent': 0,
+                'prioritize_critical_path': True,
+                'release_intermediates': True,
                 'retries': {
                     'deferred': {
                         'previous_attempts': {
@@ -177,6 +192,9 @@ snapshots['test_two_modes 4'] = {
                     },
                     'enabled': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
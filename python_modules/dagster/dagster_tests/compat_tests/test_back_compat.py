@@ -3,6 +3,7 @@ import os
 import re
 
 import pytest
+import sqlalchemy as db
 
 from dagster import file_relative_path
 from dagster.core.errors import DagsterInstanceMigrationRequired
@@ -22,7 +23,7 @@ def test_0_6_4():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 'c7a6c4d7-6c88-46d0-8baa-d4937c3cefe5). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                '90eb2172de04. Please run `dagster instance migrate`.'
             ),
         ):
             for run in runs:
@@ -49,7 +50,7 @@ def test_0_6_6_sqlite_exc():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 '89296095-892d-4a15-aa0d-9018d1580945). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                '90eb2172de04. Please run `dagster instance migrate`.'
             ),
         ):
             instance._event_storage.get_logs_for_run('89296095-892d-4a15-aa0d-9018d1580945')
@@ -74,3 +75,18 @@ def test_0_6_6_sqlite_migrate():
 
         assert not os.path.exists(file_relative_path(__file__, 'snapshot_0_6_6/sqlite/runs.db'))
         assert os.path.exists(file_relative_path(__file__, 'snapshot_0_6_6/sqlite/history/runs.db'))
+
+        with instance._event_storage.connect('89296095-892d-4a15-aa0d-9018d1580945') as conn:
+            index_names = set(index['name'] for index in db.inspect(conn).get_indexes('event_logs'))
+        assert index_names == set(['idx_event_logs_run_id', 'idx_event_logs_run_id_event_type'])
+
+        # the run's stats were backfilled from its events
+        with instance._event_storage.connect('89296095-892d-4a15-aa0d-9018d1580945') as conn:
+            assert 'run_stats' in db.inspect(conn).get_table_names()
+        stats = instance.get_run_stats('89296095-892d-4a15-aa0d-9018d1580945')
+        assert stats.steps_succeeded == 12
+        assert stats.steps_failed == 0
+        assert stats.materializations == 24
+        assert stats.expectations == 20
+        # the events' timestamps were stored as floats, between 1576109388.33628 and 1576109389.82848
+        assert stats.end_time - stats.start_time == pytest.approx(1.4922, abs=1e-6)
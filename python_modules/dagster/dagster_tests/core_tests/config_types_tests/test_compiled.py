@@ -0,0 +1,157 @@
+import os
+from enum import Enum as PythonEnum
+
+import pytest
+
+from dagster import Enum, EnumValue, Field, Noneable, Permissive, Selector, StringSource
+from dagster.config.compiled import get_compiled_processor, get_compiled_validator
+from dagster.config.field import resolve_to_config_type
+from dagster.config.validate import (
+    _process_config_detailed,
+    _validate_config_detailed,
+    process_config,
+    validate_config,
+)
+from dagster.utils import frozendict, frozenlist
+
+
+class Color(PythonEnum):
+    RED = 1
+    BLUE = 2
+
+
+def _schema():
+    return resolve_to_config_type(
+        {
+            'int_field': int,
+            'optional_str': Field(str, is_required=False),
+            'defaulted': Field(int, is_required=False, default_value=3),
+            'callable_default': Field([int], is_required=False, default_value=lambda: [1, 2]),
+            'nested': Field(
+                {'inner': Field(bool, is_required=False, default_value=True)}, is_required=False
+            ),
+            'noneable': Field(Noneable([Noneable(int)]), is_required=False),
+            'selector': Field(
+                Selector({'a': Field({'x': Field(int, is_required=False, default_value=1)})}),
+                is_required=False,
+            ),
+            'multi_selector': Field(Selector({'b': int, 'c': str}), is_required=False),
+            'permissive': Field(
+                Permissive({'known': Field(int, is_required=False)}), is_required=False
+            ),
+            'enum': Field(
+                Enum('Color', [EnumValue('RED', Color.RED), EnumValue('BLUE', Color.BLUE)]),
+                is_required=False,
+            ),
+            'source': Field(StringSource, is_required=False),
+            'any': Field(None, is_required=False),
+        }
+    )
+
+
+VALID_CONFIGS = [
+    {'int_field': 1},
+    {'int_field': 1, 'optional_str': 'foo', 'defaulted': 4, 'callable_default': [3]},
+    {'int_field': 1, 'nested': {}, 'noneable': None},
+    {'int_field': 1, 'nested': {'inner': False}, 'noneable': [1, None, 3]},
+    {'int_field': 1, 'selector': {}},
+    {'int_field': 1, 'selector': {'a': None}},
+    {'int_field': 1, 'selector': {'a': {'x': 5}}},
+    {'int_field': 1, 'multi_selector': {'c': 'foo'}},
+    {'int_field': 1, 'permissive': {'known': 1, 'unknown': {'any': ['thing']}}},
+    {'int_field': 1, 'enum': 'RED'},
+    {'int_field': 1, 'enum': Color.BLUE},
+    {'int_field': 1, 'source': 'foo'},
+    {'int_field': 1, 'source': {'env': 'DAGSTER_TEST_COMPILED_CONFIG'}},
+    {'int_field': 1, 'any': {'whatever': [1, 'two']}},
+]
+
+INVALID_CONFIGS = [
+    None,
+    {},
+    {'int_field': 'not an int'},
+    {'int_field': True},
+    {'int_field': 1, 'not_a_field': 1},
+    {'int_field': 1, 'nested': 1},
+    {'int_field': 1, 'noneable': ['one']},
+    {'int_field': 1, 'selector': {'a': {}, 'b': {}}},
+    {'int_field': 1, 'selector': {'b': {}}},
+    {'int_field': 1, 'multi_selector': {}},
+    {'int_field': 1, 'enum': 'GREEN'},
+    {'int_field': 1, 'enum': 1},
+    {'int_field': 1, 'source': None},
+    {'int_field': 1, 'source': {'env': 'DAGSTER_TEST_COMPILED_CONFIG_NOT_SET'}},
+]
+
+
+@pytest.fixture(name='env_var')
+def env_var_fixture():
+    os.environ['DAGSTER_TEST_COMPILED_CONFIG'] = 'from_env'
+    yield
+    del os.environ['DAGSTER_TEST_COMPILED_CONFIG']
+
+
+def _assert_same_result(result, expected):
+    assert result.success == expected.success
+    assert result.value == expected.value
+    assert type(result.value) == type(expected.value)  # pylint: disable=unidiomatic-typecheck
+    assert [error.message for error in result.errors] == [
+        error.message for error in expected.errors
+    ]
+
+
+@pytest.mark.parametrize('config_value', VALID_CONFIGS + INVALID_CONFIGS)
+def test_compiled_matches_detailed(config_value, env_var):  # pylint: disable=unused-argument
+    schema = _schema()
+    _assert_same_result(
+        validate_config(schema, config_value), _validate_config_detailed(schema, config_value)
+    )
+    _assert_same_result(
+        process_config(schema, config_value), _process_config_detailed(schema, config_value)
+    )
+
+
+@pytest.mark.parametrize('config_value', VALID_CONFIGS)
+def test_compiled_valid(config_value, env_var):  # pylint: disable=unused-argument
+    schema = _schema()
+    value = get_compiled_processor(schema)(get_compiled_validator(schema)(config_value))
+    assert value['defaulted'] == config_value.get('defaulted', 3)
+    assert isinstance(value['callable_default'], frozenlist)
+    assert isinstance(value, frozendict)
+
+
+@pytest.mark.parametrize('config_value', INVALID_CONFIGS)
+def test_compiled_invalid(config_value):
+    schema = _schema()
+    with pytest.raises(Exception):
+        get_compiled_processor(schema)(get_compiled_validator(schema)(config_value))
+
+    result = process_config(schema, config_value)
+    assert not result.success
+    assert result.errors
+
+
+def test_compiled_processed_values(env_var):  # pylint: disable=unused-argument
+    result = process_config(
+        _schema(),
+        {
+            'int_field': 1,
+            'enum': 'BLUE',
+            'source': {'env': 'DAGSTER_TEST_COMPILED_CONFIG'},
+            'selector': {},
+            'nested': {},
+        },
+    )
+    assert result.success
+    assert result.value['enum'] == Color.BLUE
+    assert result.value['source'] == 'from_env'
+    assert result.value['selector'] == {'a': {'x': 1}}
+    assert result.value['nested'] == {'inner': True}
+    assert result.value['callable_default'] == [1, 2]
+
+
+def test_compiled_once_per_type():
+    schema = _schema()
+    assert get_compiled_validator(schema) is get_compiled_validator(schema)
+    assert get_compiled_processor(schema) is get_compiled_processor(schema)
+    assert get_compiled_validator(schema) is not get_compiled_validator(_schema())
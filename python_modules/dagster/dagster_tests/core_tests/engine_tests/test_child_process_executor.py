@@ -10,7 +10,11 @@ from dagster.core.engine.child_process_executor import (
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    can_wait_on_children,
     execute_child_process_command,
+    poll_child_process,
+    start_child_process_command,
+    wait_for_ready,
 )
 
 
@@ -84,6 +88,48 @@ def test_child_process_crashy_process():
         list(execute_child_process_command(CrashyCommand()))
 
 
+class SleepThenYieldCommand(ChildProcessCommand):
+    def __init__(self, sleep_seconds):
+        self.sleep_seconds = sleep_seconds
+
+    def execute(self):
+        time.sleep(self.sleep_seconds)
+        yield self.sleep_seconds
+
+
+def _drain_ready(child_process):
+    events = []
+    for event in poll_child_process(child_process, timeout=0.0):
+        if event is None:
+            break
+        events.append(event)
+    return events
+
+
+@pytest.mark.skipif(not can_wait_on_children(), reason='Requires multiprocessing.connection.wait')
+def test_wait_for_ready_multiplexes_children():
+    fast = start_child_process_command(SleepThenYieldCommand(0.0))
+    slow = start_child_process_command(SleepThenYieldCommand(5.0))
+    children = {'fast': fast, 'slow': slow}
+    try:
+        start = time.time()
+        collected = {'fast': [], 'slow': []}
+        while 0.0 not in collected['fast']:
+            for key in wait_for_ready({key: child.waitables for key, child in children.items()}):
+                collected[key].extend(_drain_ready(children[key]))
+
+        assert time.time() - start < 5.0
+        assert 5.0 not in collected['slow']
+    finally:
+        slow.process.terminate()
+        fast.process.join()
+        slow.process.join()
+
+
+def test_wait_for_ready_without_waitables():
+    assert wait_for_ready({'not_started': []}, 10.0) == {'not_started'}
+
+
 @pytest.mark.skip('too long')
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
@@ -1,6 +1,8 @@
 import os
 import time
 
+import pytest
+
 from dagster import (
     ExecutionTargetHandle,
     Field,
@@ -10,12 +12,15 @@ from dagster import (
     PresetDefinition,
     String,
     execute_pipeline,
+    execute_pipeline_iterator,
     execute_pipeline_with_preset,
     lambda_solid,
     pipeline,
     seven,
     solid,
 )
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.plan.active import ActiveExecution
 from dagster.core.instance import DagsterInstance
 
 
@@ -237,3 +242,122 @@ def test_seperate_sub_dags():
     assert [
         str(event.solid_handle) for event in result.step_event_list if event.is_step_success
     ] == ['counter_1', 'counter_2', 'counter_3', 'waiter']
+
+
+def _step_pids(result):
+    # the in process engine inside each child reports its pid when it starts executing a step
+    pids = {}
+    for event in result.event_list:
+        if event.is_engine_event and event.step_key:
+            for entry in event.engine_event_data.metadata_entries:
+                if entry.label == 'pid':
+                    pids[event.step_key] = entry.entry_data.text
+    return pids
+
+
+def test_diamond_worker_pool_execution():
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2, 'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    pids = set(_step_pids(result).values())
+    assert str(os.getpid()) not in pids
+    # four steps ran on at most two reused workers
+    assert len(pids) <= 2
+
+
+def test_worker_pool_recycles_workers():
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {
+                'multiprocess': {
+                    'config': {'max_concurrent': 1, 'worker_pool': {'max_tasks_per_worker': 1}}
+                }
+            },
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+    assert len(set(_step_pids(result).values())) == 4
+
+
+def test_error_pipeline_worker_pool():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert result.result_for_solid('should_never_execute').skipped
+
+
+def define_sleepy_pipeline():
+    @lambda_solid
+    def sleepy():
+        time.sleep(2)
+        return 1
+
+    @pipeline
+    def sleepy_pipeline():
+        sleepy()
+
+    return sleepy_pipeline
+
+
+def _cpu_seconds():
+    user, system = os.times()[:2]
+    return user + system
+
+
+def test_worker_pool_waits_for_running_steps_on_error(monkeypatch):
+    handle_event = ActiveExecution.handle_event
+
+    def fail_on_step_start(self, dagster_event):
+        handle_event(self, dagster_event)
+        if dagster_event.event_type == DagsterEventType.STEP_START:
+            raise Exception('Failure while a step is running')
+
+    # the parent fails while the step keeps running in its worker, which is a spawned process
+    monkeypatch.setattr(ActiveExecution, 'handle_event', fail_on_step_start)
+
+    events = []
+    start_wall, start_cpu = time.time(), _cpu_seconds()
+    with pytest.raises(Exception, match='Failure while a step is running'):
+        for event in execute_pipeline_iterator(
+            ExecutionTargetHandle.for_pipeline_fn(
+                define_sleepy_pipeline
+            ).build_pipeline_definition(),
+            environment_dict={
+                'storage': {'filesystem': {}},
+                'execution': {'multiprocess': {'config': {'worker_pool': {}}}},
+            },
+            instance=DagsterInstance.local_temp(),
+        ):
+            events.append(event)
+    wall_seconds, cpu_seconds = time.time() - start_wall, _cpu_seconds() - start_cpu
+
+    # the events of the step that finished while the engine was shutting down are not dropped
+    assert 'STEP_SUCCESS' in [event.event_type_value for event in events]
+    # and the engine blocked while waiting for it rather than spinning
+    assert wall_seconds > 2
+    assert cpu_seconds < wall_seconds / 2
@@ -0,0 +1,186 @@
+import pytest
+from dagster_tests.core_tests.engine_tests.test_multiprocessing import define_diamond_pipeline
+
+from dagster import ExecutionTargetHandle, execute_pipeline, pipeline, seven, solid
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.critical_path import (
+    critical_path_lengths,
+    critical_path_sort_key_fn,
+    historical_step_durations,
+)
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.instance import DagsterInstance
+
+
+def define_chain_and_stragglers_pipeline():
+    @solid
+    def chain_1(_):
+        return 1
+
+    @solid
+    def chain_2(_, num):
+        return num
+
+    @solid
+    def chain_3(_, num):
+        return num
+
+    @solid
+    def straggler_a(_):
+        pass
+
+    @solid
+    def straggler_b(_):
+        pass
+
+    @pipeline
+    def chain_and_stragglers():
+        straggler_a()
+        straggler_b()
+        chain_3(chain_2(chain_1()))
+
+    return chain_and_stragglers
+
+
+def test_critical_path_lengths_unit_weights():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert critical_path_lengths(plan) == {
+        'return_two.compute': 3.0,
+        'add_three.compute': 2.0,
+        'mult_three.compute': 2.0,
+        'adder.compute': 1.0,
+    }
+
+
+def test_critical_path_lengths_weighted():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    lengths = critical_path_lengths(
+        plan,
+        {
+            'return_two.compute': 1.0,
+            'add_three.compute': 5.0,
+            'mult_three.compute': 2.0,
+            'adder.compute': 1.0,
+        },
+    )
+    assert lengths == {
+        'return_two.compute': 7.0,
+        'add_three.compute': 6.0,
+        'mult_three.compute': 3.0,
+        'adder.compute': 1.0,
+    }
+
+    # steps without a duration are weighted by the mean of the known durations
+    lengths = critical_path_lengths(plan, {'add_three.compute': 4.0, 'adder.compute': 2.0})
+    assert lengths['mult_three.compute'] == 5.0
+    assert lengths['return_two.compute'] == 9.0
+
+
+def test_critical_path_sort_key_fn():
+    plan = create_execution_plan(define_chain_and_stragglers_pipeline())
+
+    active_execution = plan.start(Retries(RetryMode.DISABLED), critical_path_sort_key_fn(plan))
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['chain_1.compute']
+
+    # a long enough straggler outranks the chain
+    active_execution = plan.start(
+        Retries(RetryMode.DISABLED),
+        critical_path_sort_key_fn(
+            plan,
+            {
+                'chain_1.compute': 1.0,
+                'chain_2.compute': 1.0,
+                'chain_3.compute': 1.0,
+                'straggler_a.compute': 1.0,
+                'straggler_b.compute': 10.0,
+            },
+        ),
+    )
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['straggler_b.compute']
+
+
+def test_critical_path_respects_priority():
+    @solid
+    def chain_1(_):
+        return 1
+
+    @solid
+    def chain_2(_, num):
+        return num
+
+    @solid(tags={'dagster/priority': 1})
+    def urgent(_):
+        pass
+
+    @pipeline
+    def prioritized():
+        urgent()
+        chain_2(chain_1())
+
+    plan = create_execution_plan(prioritized)
+    active_execution = plan.start(Retries(RetryMode.DISABLED), critical_path_sort_key_fn(plan))
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['urgent.compute', 'chain_1.compute']
+
+
+def test_historical_step_durations():
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.local_temp(tempdir)
+        pipeline_def = define_diamond_pipeline()
+
+        assert historical_step_durations(instance, pipeline_def.name) == {}
+
+        result = execute_pipeline(pipeline_def, instance=instance)
+        assert result.success
+
+        durations = historical_step_durations(instance, pipeline_def.name)
+        assert set(durations.keys()) == {
+            'return_two.compute',
+            'add_three.compute',
+            'mult_three.compute',
+            'adder.compute',
+        }
+        assert all(duration >= 0 for duration in durations.values())
+
+        assert (
+            historical_step_durations(instance, pipeline_def.name, exclude_run_id=result.run_id)
+            == {}
+        )
+        assert historical_step_durations(instance, 'other_pipeline') == {}
+
+
+@pytest.mark.parametrize('worker_pool', [False, True])
+def test_multiprocess_prioritize_critical_path(worker_pool):
+    with seven.TemporaryDirectory() as tempdir:
+        pipe = ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'define_chain_and_stragglers_pipeline'
+        ).build_pipeline_definition()
+        instance = DagsterInstance.local_temp(tempdir)
+
+        multiprocess_config = {'max_concurrent': 1, 'prioritize_critical_path': True}
+        if worker_pool:
+            multiprocess_config['worker_pool'] = {}
+
+        environment_dict = {
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': multiprocess_config}},
+        }
+
+        # with no previous runs every step has unit weight, so the chain is started first
+        result = execute_pipeline(pipe, environment_dict=environment_dict, instance=instance)
+        assert result.success
+        step_keys = [
+            event.step_key
+            for event in result.step_event_list
+            if event.event_type == DagsterEventType.STEP_START
+        ]
+        assert step_keys[0] == 'chain_1.compute'
+
+        # later runs are weighted by the durations of the first
+        result = execute_pipeline(pipe, environment_dict=environment_dict, instance=instance)
+        assert result.success
@@ -286,3 +286,65 @@ def test_priorities():
     assert steps[3].key == 'pri_2.compute'
     assert steps[4].key == 'pri_none.compute'
     assert steps[5].key == 'pri_neg_1.compute'
+
+
+def test_skip_waits_for_all_dependencies():
+    plan = create_execution_plan(define_diamond_pipeline())
+    active_execution = plan.start(retries=Retries(RetryMode.DISABLED))
+
+    [step_1] = active_execution.get_steps_to_execute()
+    active_execution.mark_success(step_1.key)
+
+    step_2, step_3 = active_execution.get_steps_to_execute()
+
+    # the end of the diamond is not skipped until both of its dependencies complete
+    active_execution.mark_failed(step_2.key)
+    assert active_execution.get_steps_to_skip() == []
+    assert active_execution.get_steps_to_execute() == []
+
+    active_execution.mark_success(step_3.key)
+    assert active_execution.get_steps_to_execute() == []
+
+    [step_4] = active_execution.get_steps_to_skip()
+    assert step_4.key == 'adder.compute'
+    active_execution.mark_skipped(step_4.key)
+
+    assert active_execution.is_complete
+
+
+def test_priorities_of_steps_ready_at_different_times():
+    @solid
+    def root(_):
+        return 1
+
+    @solid(tags={'dagster/priority': 1})
+    def pri_1(_, _num):
+        pass
+
+    @solid(tags={'dagster/priority': 5})
+    def pri_5(_, _num):
+        pass
+
+    @solid(tags={'dagster/priority': 3})
+    def pri_3(_):
+        pass
+
+    @pipeline
+    def staggered():
+        num = root()
+        pri_1(num)
+        pri_5(num)
+        pri_3()
+
+    plan = create_execution_plan(staggered)
+    active_execution = plan.start(Retries(RetryMode.DISABLED))
+
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['pri_3.compute']
+
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['root.compute']
+
+    active_execution.mark_success('root.compute')
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['pri_5.compute', 'pri_1.compute']
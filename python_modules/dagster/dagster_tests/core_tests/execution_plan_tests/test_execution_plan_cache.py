@@ -0,0 +1,98 @@
+import pytest
+
+from dagster import (
+    DagsterInvalidConfigError,
+    DependencyDefinition,
+    Field,
+    InputDefinition,
+    Int,
+    PipelineDefinition,
+    RunConfig,
+    lambda_solid,
+    solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.cache import ExecutionPlanCache, environment_dict_hash
+
+
+def define_configurable_pipeline():
+    @solid(config={'num': Field(Int, is_required=False, default_value=1)})
+    def return_num(context):
+        return context.solid_config['num']
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='configurable_pipeline',
+        solid_defs=[return_num, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('return_num')}},
+    )
+
+
+def test_environment_dict_hash():
+    assert environment_dict_hash({'a': 1, 'b': [1, 2]}) == environment_dict_hash(
+        {'b': [1, 2], 'a': 1}
+    )
+    assert environment_dict_hash({'a': 1}) != environment_dict_hash({'a': 2})
+    assert environment_dict_hash({'a': object()}) is None
+
+
+def test_execution_plan_cache_reuses_full_plan():
+    pipeline_def = define_configurable_pipeline()
+    environment_dict = {'solids': {'return_num': {'config': {'num': 2}}}}
+
+    full_plan = create_execution_plan(pipeline_def, environment_dict)
+    assert create_execution_plan(pipeline_def, dict(environment_dict)) is full_plan
+
+    subset_plan = create_execution_plan(
+        pipeline_def, environment_dict, RunConfig(step_keys_to_execute=['add_one.compute']),
+    )
+    assert subset_plan.step_keys_to_execute == ['add_one.compute']
+    assert subset_plan.step_dict is full_plan.step_dict
+
+    other_plan = create_execution_plan(
+        pipeline_def, {'solids': {'return_num': {'config': {'num': 3}}}}
+    )
+    assert other_plan is not full_plan
+
+    reexecution_plan = create_execution_plan(
+        pipeline_def, environment_dict, RunConfig(previous_run_id='previous')
+    )
+    assert reexecution_plan is not full_plan
+    assert reexecution_plan.previous_run_id == 'previous'
+
+
+def test_execution_plan_cache_shares_environment_config():
+    pipeline_def = define_configurable_pipeline()
+    cache = pipeline_def.get_execution_plan_cache()
+
+    environment_config = cache.get_environment_config({}, RunConfig())
+    assert cache.get_environment_config({}, RunConfig(run_id='other')) is environment_config
+    assert environment_config.solids['return_num'].config == {'num': 1}
+
+
+def test_execution_plan_cache_invalid_config():
+    pipeline_def = define_configurable_pipeline()
+    environment_dict = {'solids': {'return_num': {'config': {'num': 'nope'}}}}
+
+    for _ in range(2):
+        with pytest.raises(DagsterInvalidConfigError):
+            create_execution_plan(pipeline_def, environment_dict)
+
+
+def test_execution_plan_cache_eviction():
+    pipeline_def = define_configurable_pipeline()
+    cache = ExecutionPlanCache(pipeline_def, max_size=2)
+
+    def environment_dict(num):
+        return {'solids': {'return_num': {'config': {'num': num}}}}
+
+    plan_one = cache.get_execution_plan(environment_dict(1), RunConfig())
+    plan_two = cache.get_execution_plan(environment_dict(2), RunConfig())
+    assert cache.get_execution_plan(environment_dict(1), RunConfig()) is plan_one
+
+    cache.get_execution_plan(environment_dict(3), RunConfig())
+    assert cache.get_execution_plan(environment_dict(1), RunConfig()) is plan_one
+    assert cache.get_execution_plan(environment_dict(2), RunConfig()) is not plan_two
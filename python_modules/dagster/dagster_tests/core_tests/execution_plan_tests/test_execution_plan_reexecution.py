@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from dagster import (
@@ -100,6 +102,14 @@ def test_execution_plan_reexecution():
     assert not get_step_output_event(step_events, 'add_one.compute')
     assert get_step_output_event(step_events, 'add_two.compute')
 
+    # intermediates from the previous run are linked rather than copied
+    assert os.path.samefile(
+        build_fs_intermediate_store(instance.intermediates_directory, old_run_id).key_for_paths(
+            ['intermediates', 'add_one.compute', 'result']
+        ),
+        store.key_for_paths(['intermediates', 'add_one.compute', 'result']),
+    )
+
 
 def test_execution_plan_wrong_run_id():
     pipeline_def = define_addy_pipeline()
@@ -0,0 +1,197 @@
+from dagster import Field, Int, execute_pipeline, lambda_solid, pipeline, seven, solid
+from dagster.core.execution.memoization import MEMOIZE_VERSION_TAG
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.object_store import FilesystemObjectStore
+
+
+def define_memoized_pipeline(
+    version='1', calls=None, upstream_version='1', name='memoized_pipeline'
+):
+    calls = calls if calls is not None else []
+
+    @solid(
+        config={'num': Field(Int, is_required=False, default_value=1)},
+        tags={MEMOIZE_VERSION_TAG: upstream_version} if upstream_version else None,
+    )
+    def return_num(context):
+        return context.solid_config['num']
+
+    @solid(tags={MEMOIZE_VERSION_TAG: version})
+    def expensive_add_one(_, num):
+        calls.append(num)
+        return num + 1
+
+    @lambda_solid
+    def double(num):
+        return num * 2
+
+    @pipeline(name=name)
+    def memoized_pipeline():
+        double(expensive_add_one(return_num()))
+
+    return memoized_pipeline
+
+
+def _memoized_step_keys(result):
+    return [
+        event.step_key
+        for event in result.event_list
+        if event.is_engine_event
+        and 'cache_key' in [entry.label for entry in event.engine_event_data.metadata_entries]
+    ]
+
+
+def _environment_dict(num=1):
+    return {
+        'storage': {'filesystem': {}},
+        'solids': {'return_num': {'config': {'num': num}}},
+    }
+
+
+def test_memoized_step_is_skipped():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        calls = []
+        pipeline_def = define_memoized_pipeline(calls=calls)
+
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == []
+        assert calls == [1]
+
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == ['return_num.compute', 'expensive_add_one.compute']
+        assert calls == [1]
+        assert result.result_for_solid('expensive_add_one').output_value() == 2
+        assert result.result_for_solid('double').output_value() == 4
+
+        # the copied outputs are memoized in turn
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == ['return_num.compute', 'expensive_add_one.compute']
+        assert calls == [1]
+
+
+def test_memoized_step_recomputes_on_change():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        calls = []
+
+        result = execute_pipeline(
+            define_memoized_pipeline(calls=calls),
+            environment_dict=_environment_dict(),
+            instance=instance,
+        )
+        assert result.success
+
+        # a different upstream value
+        result = execute_pipeline(
+            define_memoized_pipeline(calls=calls),
+            environment_dict=_environment_dict(num=2),
+            instance=instance,
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == []
+        assert result.result_for_solid('double').output_value() == 6
+
+        # a new version of the solid
+        result = execute_pipeline(
+            define_memoized_pipeline(version='2', calls=calls),
+            environment_dict=_environment_dict(),
+            instance=instance,
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == ['return_num.compute']
+
+        # the same solids in another pipeline
+        result = execute_pipeline(
+            define_memoized_pipeline(calls=calls, name='other_memoized_pipeline'),
+            environment_dict=_environment_dict(),
+            instance=instance,
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == []
+
+        assert calls == [1, 2, 1, 1]
+
+
+def test_unversioned_upstream_is_identified_by_content():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        calls = []
+        pipeline_def = define_memoized_pipeline(calls=calls, upstream_version=None)
+
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == []
+
+        # return_num executes again, and stores the same bytes
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == ['expensive_add_one.compute']
+        assert result.result_for_solid('double').output_value() == 4
+
+        result = execute_pipeline(
+            pipeline_def, environment_dict=_environment_dict(num=2), instance=instance
+        )
+        assert result.success
+        assert _memoized_step_keys(result) == []
+        assert result.result_for_solid('double').output_value() == 6
+
+        assert calls == [1, 2]
+
+
+def test_memoization_falls_back_to_lineage_without_digests(monkeypatch):
+    monkeypatch.setattr(FilesystemObjectStore, 'get_digest', lambda _self, _key: None)
+
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        calls = []
+
+        for _ in range(2):
+            result = execute_pipeline(
+                define_memoized_pipeline(calls=calls),
+                environment_dict=_environment_dict(),
+                instance=instance,
+            )
+            assert result.success
+        assert _memoized_step_keys(result) == ['return_num.compute', 'expensive_add_one.compute']
+
+        # the output of an unversioned step may differ from run to run, so without a digest it
+        # cannot identify the input
+        for _ in range(2):
+            result = execute_pipeline(
+                define_memoized_pipeline(calls=calls, upstream_version=None),
+                environment_dict=_environment_dict(),
+                instance=instance,
+            )
+            assert result.success
+            assert _memoized_step_keys(result) == []
+
+        assert calls == [1, 1, 1]
+
+
+def test_memoization_requires_persistent_storage():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        calls = []
+        pipeline_def = define_memoized_pipeline(calls=calls)
+
+        for _ in range(2):
+            result = execute_pipeline(pipeline_def, instance=instance)
+            assert result.success
+            assert _memoized_step_keys(result) == []
+
+        assert calls == [1, 1]
+        assert instance.get_memoized_steps('any') == []
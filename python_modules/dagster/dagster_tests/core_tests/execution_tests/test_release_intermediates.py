@@ -0,0 +1,69 @@
+import os
+
+from dagster import ExecutionTargetHandle, execute_pipeline
+from dagster.core.instance import DagsterInstance
+
+from ..engine_tests.test_multiprocessing import define_diamond_pipeline
+
+
+def _released(result):
+    released = {}
+    for event in result.event_list:
+        if event.is_engine_event and event.message.startswith('Released intermediate'):
+            entries = {
+                entry.label: entry.entry_data.text
+                for entry in event.engine_event_data.metadata_entries
+            }
+            released[entries['step_key']] = int(entries['bytes_released'])
+    return released
+
+
+def test_in_process_release_intermediates():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={'execution': {'in_process': {'config': {'release_intermediates': True}}}},
+    )
+    assert result.success
+
+    assert set(_released(result).keys()) == {
+        'return_two.compute',
+        'add_three.compute',
+        'mult_three.compute',
+    }
+    # outputs with no downstream consumers are kept
+    assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_in_process_keeps_intermediates_by_default():
+    result = execute_pipeline(define_diamond_pipeline())
+    assert result.success
+    assert _released(result) == {}
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def test_multiprocess_release_intermediates():
+    instance = DagsterInstance.local_temp()
+    pipe = ExecutionTargetHandle.for_pipeline_python_file(
+        os.path.join(os.path.dirname(__file__), '..', 'engine_tests', 'test_multiprocessing.py'),
+        'define_diamond_pipeline',
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'release_intermediates': True}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+
+    released = _released(result)
+    assert set(released.keys()) == {'return_two.compute', 'add_three.compute', 'mult_three.compute'}
+    assert all(size > 0 for size in released.values())
+
+    intermediates_dir = os.path.join(
+        instance.intermediates_directory(result.run_id), 'intermediates'
+    )
+    for step_key in released:
+        assert not os.path.exists(os.path.join(intermediates_dir, step_key, 'result'))
+    assert os.path.exists(os.path.join(intermediates_dir, 'adder.compute', 'result'))
@@ -1,4 +1,19 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+import datetime
+import io
+from collections import OrderedDict
+
+import pytest
+
+from dagster.check import CheckError
+from dagster.core.storage.object_store import file_obj_for_mode
+from dagster.core.types.marshal import (
+    ArrowTableSerializationStrategy,
+    CompressedPickleSerializationStrategy,
+    NumpyArraySerializationStrategy,
+    PickleSerializationStrategy,
+    SerializationStrategy,
+    is_memory_mapped,
+)
 from dagster.utils import safe_tempfile_path
 
 
@@ -7,3 +22,167 @@ def test_serialization_strategy():
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+@pytest.mark.parametrize('codec', ['gzip', 'zstd', 'lz4'])
+def test_compressed_pickle_serialization_strategy(codec):
+    if codec == 'zstd':
+        pytest.importorskip('zstandard')
+    elif codec == 'lz4':
+        pytest.importorskip('lz4.frame')
+
+    serialization_strategy = CompressedPickleSerializationStrategy(codec)
+    assert serialization_strategy.name == 'pickle_{}'.format(codec)
+
+    # pickles of class instances refer to their classes by name, which is read back with readline
+    value = {
+        'foo': ['bar'] * 10000,
+        'date': datetime.date(2020, 3, 5),
+        'ordered': OrderedDict([('a', 1), ('b', 2)]),
+    }
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+        assert serialization_strategy.deserialize_from_file(tempfile_path) == value
+
+    file_obj = io.BytesIO()
+    serialization_strategy.serialize(value, file_obj)
+    assert not file_obj.closed
+
+    pickled = io.BytesIO()
+    PickleSerializationStrategy().serialize(value, pickled)
+    assert len(file_obj.getvalue()) < len(pickled.getvalue())
+
+    file_obj.seek(0)
+    assert serialization_strategy.deserialize(file_obj) == value
+
+
+def test_compressed_pickle_unknown_codec():
+    with pytest.raises(CheckError):
+        CompressedPickleSerializationStrategy('snappy')
+
+
+def test_numpy_array_serialization_strategy():
+    np = pytest.importorskip('numpy')
+
+    serialization_strategy = NumpyArraySerializationStrategy()
+    value = np.arange(1000, dtype='float64').reshape(100, 10)
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+
+        array = serialization_strategy.deserialize_from_file(tempfile_path)
+        assert is_memory_mapped(array)
+        assert is_memory_mapped(array[10:20])
+        assert not is_memory_mapped(array + 1)
+        assert (array == value).all()
+
+        # the array is copy-on-write, so the stored intermediate is unchanged
+        array[0, 0] = -1
+        assert serialization_strategy.deserialize_from_file(tempfile_path)[0, 0] == 0
+
+    file_obj = io.BytesIO()
+    serialization_strategy.serialize(value, file_obj)
+    file_obj.seek(0)
+    array = serialization_strategy.deserialize(file_obj)
+    assert not is_memory_mapped(array)
+    assert (array == value).all()
+
+
+def test_numpy_array_serialization_strategy_mmap_mode():
+    np = pytest.importorskip('numpy')
+
+    value = np.arange(10)
+    with safe_tempfile_path() as tempfile_path:
+        NumpyArraySerializationStrategy().serialize_to_file(value, tempfile_path)
+
+        array = NumpyArraySerializationStrategy(mmap_mode='r').deserialize_from_file(tempfile_path)
+        assert is_memory_mapped(array)
+        with pytest.raises(ValueError):
+            array[0] = -1
+
+        array = NumpyArraySerializationStrategy(mmap_mode=None).deserialize_from_file(tempfile_path)
+        assert not is_memory_mapped(array)
+        assert (array == value).all()
+
+    with pytest.raises(CheckError):
+        NumpyArraySerializationStrategy(mmap_mode='w+')
+
+
+def test_numpy_array_serialization_strategy_object_arrays():
+    np = pytest.importorskip('numpy')
+
+    serialization_strategy = NumpyArraySerializationStrategy()
+    value = np.array([{'foo': 1}, 'bar', None], dtype=object)
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+        assert list(serialization_strategy.deserialize_from_file(tempfile_path)) == list(value)
+
+    file_obj = io.BytesIO()
+    serialization_strategy.serialize(value, file_obj)
+    file_obj.seek(0)
+    assert list(serialization_strategy.deserialize(file_obj)) == list(value)
+
+
+def test_arrow_table_serialization_strategy():
+    pyarrow = pytest.importorskip('pyarrow')
+
+    serialization_strategy = ArrowTableSerializationStrategy()
+    table = pyarrow.Table.from_arrays(
+        [pyarrow.array([1, 2, 3]), pyarrow.array(['a', 'b', 'c'])], names=['foo', 'bar']
+    )
+    assert not is_memory_mapped(table)
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(table, tempfile_path)
+        mapped_table = serialization_strategy.deserialize_from_file(tempfile_path)
+        assert mapped_table.equals(table)
+        assert is_memory_mapped(mapped_table)
+        assert is_memory_mapped(mapped_table.slice(1))
+        assert is_memory_mapped(mapped_table.column(0))
+        assert is_memory_mapped(mapped_table.column(0).to_numpy())
+
+    file_obj = io.BytesIO()
+    serialization_strategy.serialize(table, file_obj)
+    file_obj.seek(0)
+    read_table = serialization_strategy.deserialize(file_obj)
+    assert read_table.equals(table)
+    assert not is_memory_mapped(read_table)
+
+
+def test_is_memory_mapped():
+    assert not is_memory_mapped(None)
+    assert not is_memory_mapped('foo')
+    assert not is_memory_mapped(b'foo')
+
+
+class UppercaseSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    def __init__(self):
+        super(UppercaseSerializationStrategy, self).__init__(
+            'uppercase', write_mode='w', read_mode='r'
+        )
+
+    def serialize(self, value, write_file_obj):
+        return write_file_obj.write(value.upper())
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read().lower()
+
+
+def test_file_obj_for_mode():
+    serialization_strategy = UppercaseSerializationStrategy()
+    binary_file_obj = io.BytesIO()
+
+    with file_obj_for_mode(
+        binary_file_obj, serialization_strategy.write_mode, serialization_strategy.encoding
+    ) as write_obj:
+        serialization_strategy.serialize('foo', write_obj)
+
+    assert not binary_file_obj.closed
+    assert binary_file_obj.getvalue() == b'FOO'
+
+    binary_file_obj.seek(0)
+    with file_obj_for_mode(
+        binary_file_obj, serialization_strategy.read_mode, serialization_strategy.encoding
+    ) as read_obj:
+        assert serialization_strategy.deserialize(read_obj) == 'foo'
+
+    with file_obj_for_mode(binary_file_obj, 'rb') as read_obj:
+        assert read_obj is binary_file_obj
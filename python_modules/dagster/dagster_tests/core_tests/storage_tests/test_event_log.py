@@ -15,10 +15,12 @@ from dagster.core.events.log import DagsterEventRecord
 from dagster.core.execution.plan.objects import StepSuccessData
 from dagster.core.storage.event_log import (
     InMemoryEventLogStorage,
+    SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.sqlite import sqlite_event_log
 from dagster.core.storage.sql import create_engine
 
 
@@ -112,6 +114,42 @@ def test_event_log_storage_store_with_multiple_runs(event_storage_factory_cm_fn)
             assert len(storage.get_logs_for_run(run_id)) == 0
 
 
+@event_storage_test
+def test_event_log_storage_store_events_batch(event_storage_factory_cm_fn):
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'nonce',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(
+            [
+                evt('Message_0', 'foo'),
+                evt('Message_1', 'bar'),
+                evt('Message_2', 'foo'),
+                evt('Message_3', 'foo'),
+            ]
+        )
+        storage.store_events([])
+
+        assert [event.message for event in storage.get_logs_for_run('foo')] == [
+            'Message_0',
+            'Message_2',
+            'Message_3',
+        ]
+        assert [event.message for event in storage.get_logs_for_run('bar')] == ['Message_1']
+
+
 @event_storage_test
 def test_event_log_storage_watch(event_storage_factory_cm_fn):
     def evt(name):
@@ -191,6 +229,94 @@ def test_event_log_storage_pagination(event_storage_factory_cm_fn):
         assert len(storage.get_logs_for_run('foo', 1)) == 1
         assert len(storage.get_logs_for_run('foo', 2)) == 0
 
+        assert [log.message for log in storage.get_logs_for_run('foo', limit=2)] == [
+            'Message_0',
+            'Message_1',
+        ]
+        assert [log.message for log in storage.get_logs_for_run('foo', 0, limit=1)] == ['Message_1']
+        assert len(storage.get_logs_for_run('foo', 1, limit=5)) == 1
+
+        chunks = list(storage.stream_logs_for_run('foo', chunk_size=2))
+        assert [[log.message for log in chunk] for chunk in chunks] == [
+            ['Message_0', 'Message_1'],
+            ['Message_2'],
+        ]
+        assert [len(chunk) for chunk in storage.stream_logs_for_run('foo', 0, chunk_size=1)] == [
+            1,
+            1,
+        ]
+        assert list(storage.stream_logs_for_run('foo', 2)) == []
+
+
+class SharedTableSqlEventLogStorage(SqlEventLogStorage):
+    '''Keeps every run's logs in one table, whose ids are shared by all of the runs, as
+    PostgresEventLogStorage does.'''
+
+    def __init__(self, conn_string):
+        self._engine = create_engine(conn_string)
+        SqlEventLogStorageMetadata.create_all(self._engine)
+
+    @contextmanager
+    def connect(self, run_id=None):
+        with self._engine.connect() as conn:
+            yield conn
+
+    def upgrade(self):
+        pass
+
+    def watch(self, run_id, start_cursor, callback):
+        raise NotImplementedError()
+
+    def end_watch(self, run_id, handler):
+        raise NotImplementedError()
+
+
+def test_event_log_storage_pagination_shared_table():
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'nonce',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SharedTableSqlEventLogStorage(
+            'sqlite:///{}'.format(os.path.join(tmpdir_path, 'events.db'))
+        )
+
+        # two events of another run before each of this run's, so that their ids are interleaved
+        events = []
+        for i in range(15):
+            events.append(evt('Other_{i}_a'.format(i=i), 'other'))
+            events.append(evt('Other_{i}_b'.format(i=i), 'other'))
+            events.append(evt('Message_{i}'.format(i=i), 'foo'))
+        for event in events:
+            storage.store_event(event)
+
+        messages = ['Message_{i}'.format(i=i) for i in range(15)]
+
+        assert [log.message for log in storage.get_logs_for_run('foo')] == messages
+        assert [log.message for log in storage.get_logs_for_run('foo', 4)] == messages[5:]
+        assert [log.message for log in storage.get_logs_for_run('foo', 4, limit=3)] == messages[5:8]
+        assert storage.get_logs_for_run('foo', 14) == []
+
+        chunks = list(storage.stream_logs_for_run('foo', chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 4, 3]
+        assert [log.message for chunk in chunks for log in chunk] == messages
+
+        chunks = list(storage.stream_logs_for_run('foo', 6, chunk_size=4))
+        assert [log.message for chunk in chunks for log in chunk] == messages[7:]
+
+        assert len(storage.get_logs_for_run('other')) == 30
+
 
 @event_storage_test
 def test_event_log_delete(event_storage_factory_cm_fn):
@@ -217,6 +343,47 @@ def test_event_log_delete(event_storage_factory_cm_fn):
         assert len(storage.get_logs_for_run('foo')) == 0
 
 
+@event_storage_test
+def test_event_log_get_logs_by_type(event_storage_factory_cm_fn):
+    def evt(event_type, step_key=None, event_specific_data=None):
+        return DagsterEventRecord(
+            None,
+            event_type.value,
+            'debug',
+            '',
+            'foo',
+            time.time(),
+            step_key=step_key,
+            dagster_event=DagsterEvent(
+                event_type.value,
+                'nonce',
+                step_key=step_key,
+                event_specific_data=event_specific_data,
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(
+            [
+                evt(DagsterEventType.ENGINE_EVENT, event_specific_data=EngineEventData()),
+                evt(DagsterEventType.STEP_START, 'a.compute'),
+                evt(DagsterEventType.STEP_START, 'b.compute'),
+                evt(DagsterEventType.ENGINE_EVENT, 'a.compute', EngineEventData()),
+                evt(DagsterEventType.STEP_SUCCESS, 'a.compute', StepSuccessData(duration_ms=1.0)),
+            ]
+        )
+
+        logs = storage.get_logs_for_run_by_type(
+            'foo', [DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS]
+        )
+        assert [(log.dagster_event.event_type, log.step_key) for log in logs] == [
+            (DagsterEventType.STEP_START, 'a.compute'),
+            (DagsterEventType.STEP_START, 'b.compute'),
+            (DagsterEventType.STEP_SUCCESS, 'a.compute'),
+        ]
+        assert storage.get_logs_for_run_by_type('bar', [DagsterEventType.STEP_START]) == []
+
+
 @event_storage_test
 def test_event_log_get_stats_without_start_and_success(event_storage_factory_cm_fn):
     # When an event log doesn't have a PIPELINE_START or PIPELINE_SUCCESS | PIPELINE_FAILURE event,
@@ -227,6 +394,46 @@ def test_event_log_get_stats_without_start_and_success(event_storage_factory_cm_
         assert storage.get_stats_for_run('foo')
 
 
+@event_storage_test
+def test_event_log_storage_stats_for_runs(event_storage_factory_cm_fn):
+    def evt(event_type, run_id, event_specific_data=None):
+        return DagsterEventRecord(
+            None,
+            event_type.value,
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                event_type.value, 'nonce', event_specific_data=event_specific_data,
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(
+            [
+                evt(DagsterEventType.STEP_SUCCESS, 'foo', StepSuccessData(duration_ms=100.0)),
+                evt(DagsterEventType.STEP_SUCCESS, 'bar', StepSuccessData(duration_ms=100.0)),
+                evt(DagsterEventType.ENGINE_EVENT, 'bar', EngineEventData.in_process(999)),
+            ]
+        )
+        storage.store_event(
+            evt(DagsterEventType.STEP_SUCCESS, 'foo', StepSuccessData(duration_ms=100.0))
+        )
+
+        stats = storage.get_stats_for_runs(['foo', 'bar', 'baz'])
+        assert set(stats.keys()) == set(['foo', 'bar', 'baz'])
+        assert stats['foo'] == storage.get_stats_for_run('foo')
+        assert stats['foo'].steps_succeeded == 2
+        assert stats['bar'].steps_succeeded == 1
+        assert stats['bar'].steps_failed == 0
+        assert stats['baz'].steps_succeeded == 0
+
+        storage.delete_events('foo')
+        assert storage.get_stats_for_run('foo').steps_succeeded == 0
+        assert storage.get_stats_for_run('bar').steps_succeeded == 1
+
+
 def test_filesystem_event_log_storage_run_corrupted():
     with seven.TemporaryDirectory() as tmpdir_path:
         storage = SqliteEventLogStorage(tmpdir_path)
@@ -262,6 +469,56 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data():
             storage.get_logs_for_run('bar')
 
 
+def test_sqlite_event_log_watch_shared_across_runs():
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'nonce',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    def wait_for(condition):
+        attempts = 20
+        while not condition() and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+    with create_sqlite_run_event_logstorage() as storage:
+        storage.store_event(evt('foo_0', 'foo'))
+
+        from_start, from_first, bar_watched = [], [], []
+        storage.watch('foo', -1, from_start.append)
+        storage.watch('foo', 0, from_first.append)
+        storage.watch('bar', -1, bar_watched.append)
+
+        storage.store_events([evt('foo_1', 'foo'), evt('foo_2', 'foo'), evt('bar_0', 'bar')])
+
+        wait_for(lambda: len(from_start) == 3 and len(from_first) == 2 and len(bar_watched) == 1)
+        assert [e.message for e in from_start] == ['foo_0', 'foo_1', 'foo_2']
+        assert [e.message for e in from_first] == ['foo_1', 'foo_2']
+        assert [e.message for e in bar_watched] == ['bar_0']
+
+        storage.end_watch('foo', from_first.append)
+        storage.store_event(evt('foo_3', 'foo'))
+
+        wait_for(lambda: len(from_start) == 4)
+        assert [e.message for e in from_start] == ['foo_0', 'foo_1', 'foo_2', 'foo_3']
+        assert len(from_first) == 2
+        assert len(bar_watched) == 1
+
+        storage.end_watch('foo', from_start.append)
+        storage.end_watch('bar', bar_watched.append)
+        storage.dispose()
+
+
 def cmd(exceptions, tmpdir_path):
     storage = SqliteEventLogStorage(tmpdir_path)
     try:
@@ -294,3 +551,30 @@ def test_concurrent_sqlite_event_log_connections():
         while not exceptions.empty():
             excs.append(exceptions.get())
         assert not excs, excs
+
+
+def test_sqlite_event_log_engine_cache(monkeypatch):
+    monkeypatch.setattr(sqlite_event_log, 'ENGINE_CACHE_SIZE', 2)
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        # pylint: disable=protected-access
+        try:
+            for run_id in ['a', 'b', 'a', 'c']:
+                with storage.connect(run_id):
+                    pass
+            engines = dict(storage._engines)
+
+            # the least recently used engine is evicted and disposed
+            assert list(storage._engines) == ['a', 'c']
+
+            with storage.connect('b'):
+                pass
+            assert list(storage._engines) == ['c', 'b']
+            assert engines['a']._engine is None
+
+            storage.wipe()
+            assert not storage._engines
+            assert engines['c']._engine is None
+        finally:
+            storage.dispose()
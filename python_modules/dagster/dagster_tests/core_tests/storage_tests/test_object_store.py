@@ -0,0 +1,90 @@
+import os
+
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.storage.object_store import FilesystemObjectStore
+from dagster.utils.temp_file import get_temp_dir
+
+
+def test_filesystem_link_object_file():
+    object_store = FilesystemObjectStore()
+    with get_temp_dir() as temp_dir:
+        src = os.path.join(temp_dir, 'one', 'intermediates', 'result')
+        dst = os.path.join(temp_dir, 'two', 'intermediates', 'result')
+        object_store.set_object(src, 'foo')
+
+        operation = object_store.link_object(src, dst)
+        assert operation.op == ObjectStoreOperationType.CP_OBJECT
+        assert operation.key == src
+        assert operation.dest_key == dst
+
+        assert os.path.samefile(src, dst)
+        assert object_store.get_object(dst).obj == 'foo'
+
+        # writing to either key does not change the other
+        object_store.set_object(dst, 'bar')
+        assert object_store.get_object(src).obj == 'foo'
+        assert object_store.get_object(dst).obj == 'bar'
+
+
+def test_filesystem_link_object_survives_source_removal():
+    object_store = FilesystemObjectStore()
+    with get_temp_dir() as temp_dir:
+        src = os.path.join(temp_dir, 'one', 'result')
+        dst = os.path.join(temp_dir, 'two', 'result')
+        object_store.set_object(src, 'foo')
+        object_store.link_object(src, dst)
+
+        object_store.rm_object(src)
+        assert not object_store.has_object(src)
+        assert object_store.get_object(dst).obj == 'foo'
+
+
+def test_filesystem_link_object_directory():
+    object_store = FilesystemObjectStore()
+    with get_temp_dir() as temp_dir:
+        src = os.path.join(temp_dir, 'one', 'result')
+        dst = os.path.join(temp_dir, 'two', 'result')
+        object_store.set_object(os.path.join(src, 'part-0'), 0)
+        object_store.set_object(os.path.join(src, 'nested', 'part-1'), 1)
+
+        object_store.link_object(src, dst)
+
+        assert os.path.samefile(os.path.join(src, 'part-0'), os.path.join(dst, 'part-0'))
+        assert object_store.get_object(os.path.join(dst, 'nested', 'part-1')).obj == 1
+        assert object_store.get_size(dst) == object_store.get_size(src)
+
+        object_store.rm_object(src)
+        assert object_store.get_object(os.path.join(dst, 'part-0')).obj == 0
+
+
+def test_filesystem_get_digest():
+    object_store = FilesystemObjectStore()
+    with get_temp_dir() as temp_dir:
+        one = os.path.join(temp_dir, 'one', 'result')
+        two = os.path.join(temp_dir, 'two', 'result')
+
+        operation = object_store.set_object(one, 'foo')
+        assert operation.digest == object_store.get_digest(one)
+        assert object_store.set_object(two, 'foo').digest == operation.digest
+        assert object_store.set_object(two, 'bar').digest != operation.digest
+        assert object_store.cp_object(one, os.path.join(temp_dir, 'three')).digest == (
+            operation.digest
+        )
+
+        assert object_store.get_digest(os.path.join(temp_dir, 'four')) is None
+
+
+def test_filesystem_get_digest_directory():
+    object_store = FilesystemObjectStore()
+    with get_temp_dir() as temp_dir:
+        src = os.path.join(temp_dir, 'one', 'result')
+        dst = os.path.join(temp_dir, 'two', 'result')
+        object_store.set_object(os.path.join(src, 'part-0'), 0)
+        object_store.set_object(os.path.join(src, 'nested', 'part-1'), 1)
+
+        digest = object_store.get_digest(src)
+        assert object_store.link_object(src, dst).digest == digest
+
+        # the digest covers the paths of the files as well as their contents
+        os.rename(os.path.join(dst, 'part-0'), os.path.join(dst, 'part-2'))
+        assert object_store.get_digest(dst) != digest
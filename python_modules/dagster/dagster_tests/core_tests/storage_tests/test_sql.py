@@ -0,0 +1,79 @@
+import multiprocessing
+import os
+import sys
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from dagster import seven
+from dagster.core.storage import sql
+from dagster.core.storage.sql import PooledEngine
+
+
+def test_pooled_engine_reuse():
+    with seven.TemporaryDirectory() as tmpdir:
+        pooled = PooledEngine('sqlite:///' + os.path.join(tmpdir, 'test.db'), poolclass=NullPool)
+        engine = pooled.engine
+
+        for _ in range(3):
+            with pooled.connect() as conn:
+                assert conn.execute('select 1').fetchall() == [(1,)]
+
+        assert pooled.engine is engine
+        assert pooled.acquire_stats.count == 3
+        assert pooled.acquire_stats.mean_seconds <= pooled.acquire_stats.max_seconds
+
+        pooled.dispose()
+        assert pooled.engine is not engine
+
+
+def _check_engine_in_child(pooled, inherited_engine_id, results):
+    with pooled.connect() as conn:
+        conn.execute('select 1')
+    results.put(
+        (
+            id(pooled.engine) != inherited_engine_id,
+            # the inherited engine, whose connections belong to the parent, is never collected
+            [id(engine) for engine in sql._INHERITED_ENGINES],  # pylint: disable=protected-access
+        )
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform == 'win32' or not hasattr(multiprocessing, 'get_context'),
+    reason='Requires the fork start method',
+)
+def test_pooled_engine_recreated_after_fork():
+    with seven.TemporaryDirectory() as tmpdir:
+        pooled = PooledEngine('sqlite:///' + os.path.join(tmpdir, 'test.db'), poolclass=NullPool)
+        with pooled.connect() as conn:
+            conn.execute('select 1')
+
+        ctx = multiprocessing.get_context('fork')
+        results = ctx.Queue()
+        process = ctx.Process(
+            target=_check_engine_in_child, args=(pooled, id(pooled.engine), results)
+        )
+        process.start()
+        process.join()
+
+        assert process.exitcode == 0
+        assert results.get() == (True, [id(pooled.engine)])
+
+
+def test_pooled_engine_keeps_inherited_engine(monkeypatch):
+    monkeypatch.setattr(sql, '_INHERITED_ENGINES', [])
+    with seven.TemporaryDirectory() as tmpdir:
+        pooled = PooledEngine('sqlite:///' + os.path.join(tmpdir, 'test.db'), poolclass=NullPool)
+        engine = pooled.engine
+
+        # as in a forked child, which must not dispose or drop the parent's engine
+        pid = os.getpid()
+        monkeypatch.setattr(os, 'getpid', lambda: pid + 1)
+        pooled.dispose()
+        assert sql._INHERITED_ENGINES == [engine]  # pylint: disable=protected-access
+
+        child_engine = pooled.engine
+        assert child_engine is not engine
+        pooled.dispose()
+        assert sql._INHERITED_ENGINES == [engine]  # pylint: disable=protected-access
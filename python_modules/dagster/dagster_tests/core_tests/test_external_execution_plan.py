@@ -12,8 +12,9 @@ from dagster import (
     PipelineDefinition,
     lambda_solid,
 )
-from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.api import create_execution_plan, execute_plan, execute_step_remotely
 from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.utils import make_new_run_id
@@ -135,6 +136,34 @@ def test_using_file_system_for_subplan_multiprocessing():
     assert store.get_intermediate(None, 'add_one.compute', Int).obj == 2
 
 
+def test_execute_step_remotely():
+    environment_dict = {'storage': {'filesystem': {}}}
+    instance = DagsterInstance.local_temp()
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_inty_pipeline)
+
+    run_id = make_new_run_id()
+    instance.create_empty_run(run_id, 'basic_external_plan_execution')
+
+    for step_key, value in [('return_one.compute', 1), ('add_one.compute', 2)]:
+        serialized_events = execute_step_remotely(
+            handle,
+            run_id,
+            [step_key],
+            environment_dict=environment_dict,
+            mode='default',
+            instance_ref=instance.get_ref(),
+        )
+        step_events = [deserialize_json_to_dagster_namedtuple(e) for e in serialized_events]
+        assert all(e.is_step_event or e.is_engine_event for e in step_events)
+        assert get_step_output(step_events, step_key)
+
+        store = build_fs_intermediate_store(instance.intermediates_directory, run_id)
+        assert store.get_intermediate(None, step_key, Int).obj == value
+
+    with pytest.raises(DagsterExecutionStepNotFoundError):
+        execute_step_remotely(handle, run_id, ['nope'], instance_ref=instance.get_ref())
+
+
 def test_execute_step_wrong_step_key():
     pipeline = define_inty_pipeline()
     instance = DagsterInstance.ephemeral()
@@ -1,7 +1,15 @@
+# pylint: disable=protected-access
+import time
+
 import pytest
 
+from dagster import check, execute_pipeline, pipeline, seven, solid
 from dagster.core.errors import DagsterRunConflict
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
 from dagster.core.instance import DagsterInstance
+from dagster.core.instance.event_buffer import EVENT_BUFFER_FLUSH_INTERVAL, EventWriteBuffer
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.core.storage.pipeline_run import PipelineRun
 
 
@@ -22,3 +30,157 @@ def test_get_or_create_run():
 
     with pytest.raises(DagsterRunConflict, match='Found conflicting existing run with same id.'):
         instance.get_or_create_run(conflicting_pipeline_run)
+
+
+def _event(run_id, event_type=DagsterEventType.ENGINE_EVENT):
+    return DagsterEventRecord(
+        None,
+        'message',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            event_type.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999)
+            if event_type == DagsterEventType.ENGINE_EVENT
+            else None,
+        ),
+    )
+
+
+def test_buffered_events_flush_on_interval():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        for _ in range(3):
+            instance.handle_new_event(_event('foo'))
+
+        attempts = 20
+        while not instance._event_storage.get_logs_for_run('foo') and attempts > 0:
+            time.sleep(EVENT_BUFFER_FLUSH_INTERVAL)
+            attempts -= 1
+
+        assert len(instance._event_storage.get_logs_for_run('foo')) == 3
+
+
+def test_buffered_events_are_written_behind():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        # an interval long enough that the flush thread cannot write the events during the test
+        instance._event_buffer = EventWriteBuffer(instance._event_storage, flush_interval=600)
+        for _ in range(3):
+            instance.handle_new_event(_event('foo'))
+
+        # not yet visible to readers of the underlying storage
+        assert len(instance._event_storage.get_logs_for_run('foo')) == 0
+
+        instance._event_buffer.flush()
+        assert len(instance._event_storage.get_logs_for_run('foo')) == 3
+
+
+def test_buffered_events_are_retried_after_a_failed_write():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        event_storage = instance._event_storage
+        store_events = event_storage.store_events
+        failures = []
+
+        def fail_once(events):
+            if not failures:
+                failures.append(events)
+                raise Exception('Unavailable')
+            store_events(events)
+
+        event_storage.store_events = fail_once
+        instance._event_buffer = EventWriteBuffer(event_storage, flush_interval=0.01)
+        for _ in range(3):
+            instance.handle_new_event(_event('foo'))
+
+        attempts = 20
+        while len(event_storage.get_logs_for_run('foo')) < 3 and attempts > 0:
+            time.sleep(0.05)
+            attempts -= 1
+
+        assert len(failures) == 1
+        assert len(event_storage.get_logs_for_run('foo')) == 3
+
+
+def test_buffered_events_flush_on_lifecycle_event():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        instance.handle_new_event(_event('foo'))
+        instance.handle_new_event(_event('foo'))
+        instance.handle_new_event(_event('foo', DagsterEventType.STEP_START))
+
+        events = instance._event_storage.get_logs_for_run('foo')
+        assert [event.dagster_event.event_type for event in events] == [
+            DagsterEventType.ENGINE_EVENT,
+            DagsterEventType.ENGINE_EVENT,
+            DagsterEventType.STEP_START,
+        ]
+
+
+def test_buffered_events_flush_on_read():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        instance.handle_new_event(_event('foo'))
+        instance.handle_new_event(_event('bar'))
+
+        assert len(instance.all_logs('foo')) == 1
+        assert len(instance._event_storage.get_logs_for_run('bar')) == 1
+
+
+def test_optimized_checks_setting():
+    @solid
+    def emit_one(_):
+        return 1
+
+    @solid
+    def add_one(context, num):
+        context.log.info('adding one')
+        return num + 1
+
+    @pipeline
+    def add_one_pipeline():
+        add_one(emit_one())
+
+    previous = check.optimized_checks_enabled()
+    check.set_optimized_checks(False)
+    try:
+        with seven.TemporaryDirectory() as tempdir:
+            instance = DagsterInstance.local_temp(tempdir)
+            assert not instance.optimized_checks
+            result = execute_pipeline(add_one_pipeline, instance=instance)
+            assert not check.optimized_checks_enabled()
+
+        with seven.TemporaryDirectory() as tempdir:
+            instance = DagsterInstance.local_temp(
+                tempdir, overrides={'checks': {'optimized': True}}
+            )
+            assert instance.optimized_checks
+            assert check.optimized_checks_enabled()
+            # e.g. in the subprocesses of a run
+            ref = deserialize_json_to_dagster_namedtuple(
+                serialize_dagster_namedtuple(instance.get_ref())
+            )
+            assert DagsterInstance.from_ref(ref).optimized_checks
+
+            optimized_result = execute_pipeline(add_one_pipeline, instance=instance)
+            assert optimized_result.success
+            assert optimized_result.result_for_solid('add_one').output_value() == 2
+            assert [event.event_type_value for event in optimized_result.event_list] == [
+                event.event_type_value for event in result.event_list
+            ]
+    finally:
+        check.set_optimized_checks(previous)
+
+
+def test_dispose_disposes_schedule_storage():
+    with seven.TemporaryDirectory() as tmpdir:
+        instance = DagsterInstance.local_temp(tmpdir)
+        schedule_engine = instance.schedule_storage._engine
+        assert schedule_engine.engine is not None
+
+        instance.dispose()
+        assert schedule_engine._engine is None
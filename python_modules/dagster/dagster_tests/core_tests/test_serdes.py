@@ -6,9 +6,12 @@ import pytest
 
 from dagster.check import ParameterCheckError
 from dagster.core.serdes import (
+    _TUPLE_UNPACKERS,
+    _deserialize_bytes_to_dagster_namedtuple,
     _deserialize_json_to_dagster_namedtuple,
     _pack_value,
     _serialize_dagster_namedtuple,
+    _serialize_dagster_namedtuple_to_bytes,
     _unpack_value,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
@@ -127,3 +130,56 @@ def test_backward_compat_serdes():
     assert deserialized.foo == quux.foo
     assert deserialized.bar == quux.bar
     assert not hasattr(deserialized, 'baz')
+
+
+def test_unpacker_built_on_whitelist():
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Grault(namedtuple('_Grault', 'foo bar')):
+        def __new__(cls, foo, bar):
+            return super(Grault, cls).__new__(cls, foo, bar)  # pylint: disable=bad-super-call
+
+    assert Grault in _TUPLE_UNPACKERS
+
+    serialized = _serialize_dagster_namedtuple(
+        Grault('zip', [Grault(1, {'a': None})]), tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    deserialized = _deserialize_json_to_dagster_namedtuple(
+        serialized, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    assert deserialized == Grault('zip', [Grault(1, {'a': None})])
+
+    # packed values are left as they are by unpacking
+    packed = _pack_value(Grault('zip', None), tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    assert _unpack_value(packed, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP) == Grault(
+        'zip', None
+    )
+    assert packed == {'__class__': 'Grault', 'foo': 'zip', 'bar': None}
+
+
+def test_binary_serdes_round_trip():
+    pytest.importorskip('msgpack')
+
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Garply(Enum):
+        FOO = 1
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Waldo(namedtuple('_Waldo', 'name enum_value items')):
+        pass
+
+    waldo = Waldo(u'w\xe4ldo', Garply.FOO, [1.5, True, None, {'key': Waldo('inner', None, [])}])
+    serialized = _serialize_dagster_namedtuple_to_bytes(
+        waldo, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    assert isinstance(serialized, bytes)
+
+    deserialized = _deserialize_bytes_to_dagster_namedtuple(
+        serialized, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    assert deserialized == waldo
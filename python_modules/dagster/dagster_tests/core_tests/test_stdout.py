@@ -1,14 +1,21 @@
 import os
 import random
 import string
+import subprocess
 import sys
+import time
 
 import pytest
 
-from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline
+from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline, seven, solid
 from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogCaptureMode
+from dagster.core.storage.local_compute_log_manager import (
+    LocalComputeLogManager,
+    LocalComputeLogTailReader,
+)
+from dagster.utils import ensure_file, touch_file
 
 
 @lambda_solid
@@ -112,3 +119,130 @@ def test_long_solid_names():
 
     stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
     assert stdout.data == HELLO_WORLD + SEPARATOR
+
+
+def _thread_capture_instance(tempdir):
+    return DagsterInstance.local_temp(
+        tempdir,
+        overrides={
+            'compute_logs': {
+                'module': 'dagster.core.storage.local_compute_log_manager',
+                'class': 'LocalComputeLogManager',
+                'config': {'base_dir': os.path.join(tempdir, 'storage'), 'capture_mode': 'thread'},
+            }
+        },
+    )
+
+
+@solid
+def spew_from_subprocess(_):
+    print(HELLO_WORLD)
+    sys.stdout.flush()
+    # the stream's file descriptor is the one captured, which is not stdout's under pytest
+    subprocess.check_call([sys.executable, '-c', 'print("Hello Subprocess")'], stdout=sys.stdout)
+    sys.stderr.write(HELLO_WORLD + '\n')
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_thread_capture_mode():
+    with seven.TemporaryDirectory() as tempdir:
+        instance = _thread_capture_instance(tempdir)
+        manager = instance.compute_log_manager
+        assert manager.capture_mode(None) == ComputeLogCaptureMode.THREAD
+
+        @pipeline
+        def subprocess_pipeline():
+            spew_from_subprocess()
+
+        result = execute_pipeline(subprocess_pipeline, instance=instance)
+        assert result.success
+
+        step_key = 'spew_from_subprocess.compute'
+        assert manager.is_compute_completed(result.run_id, step_key)
+
+        stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
+        assert stdout.data == HELLO_WORLD + SEPARATOR + 'Hello Subprocess' + SEPARATOR
+
+        stderr = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDERR)
+        assert HELLO_WORLD + SEPARATOR in stderr.data
+        assert 'dagster - DEBUG - subprocess_pipeline - ' in stderr.data.replace(
+            '\x1b[34m', ''
+        ).replace('\x1b[0m', '')
+
+
+def test_capture_mode_config():
+    assert DagsterInstance.local_temp().compute_log_manager.capture_mode(None) == (
+        ComputeLogCaptureMode.TAIL
+    )
+
+    with seven.TemporaryDirectory() as tempdir:
+        with pytest.raises(ValueError):
+            LocalComputeLogManager(tempdir, capture_mode='fork')
+
+
+def _wait_for(condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout
+        time.sleep(0.05)
+
+
+def test_compute_log_subscriptions_share_reads():
+    with seven.TemporaryDirectory() as tempdir:
+        manager = LocalComputeLogManager(tempdir)
+        run_id = 'some_run_id'
+        step_key = 'spew.compute'
+        path = manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT)
+        ensure_file(path)
+        with open(path, 'a') as log_file:
+            log_file.write('foo')
+
+        first, second = [], []
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(first.append)
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(second.append)
+        assert [update.data for update in first] == ['foo']
+        assert [update.data for update in second] == ['foo']
+
+        with open(path, 'a') as log_file:
+            log_file.write('bar')
+
+        _wait_for(lambda: len(first) == 2 and len(second) == 2)
+        assert first[1].data == 'bar'
+        assert first[1].cursor == 6
+        assert second[1] == first[1]
+
+        # subscribing after the log was read by the others starts from the subscription's cursor
+        third = []
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT, cursor='3').subscribe(
+            third.append
+        )
+        assert [update.data for update in third] == ['bar']
+
+        completed = []
+        manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            on_next=lambda _: None, on_completed=lambda: completed.append(True)
+        )
+        touch_file(manager.complete_artifact_path(run_id, step_key))
+        _wait_for(lambda: completed)
+
+
+def test_compute_log_tail_reader():
+    with seven.TemporaryDirectory() as tempdir:
+        manager = LocalComputeLogManager(tempdir)
+        path = manager.get_local_path('some_run_id', 'spew.compute', ComputeIOType.STDERR)
+
+        reader = LocalComputeLogTailReader(
+            manager, 'some_run_id', 'spew.compute', ComputeIOType.STDERR
+        )
+        assert reader.read_new() == []
+
+        ensure_file(path)
+        with open(path, 'a') as log_file:
+            log_file.write('foo')
+
+        updates = reader.read_new()
+        assert [(update.data, update.cursor, update.size) for update in updates] == [('foo', 3, 3)]
+        assert reader.read_new() == []
+        reader.close()
@@ -89,6 +89,13 @@ def _do_setup(name='dagster'):
             'pywin32 != 226; platform_system=="Windows"',
             'pytz',
         ],
+        extras_require={
+            # serialization strategies for intermediates
+            'arrow': ['pyarrow'],
+            'lz4': ['lz4'],
+            'numpy': ['numpy'],
+            'zstd': ['zstandard'],
+        },
         entry_points={'console_scripts': ['dagster = dagster.cli:main']},
     )
 
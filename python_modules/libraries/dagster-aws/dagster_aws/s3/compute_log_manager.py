@@ -1,4 +1,7 @@
 import os
+import threading
+
+from botocore.exceptions import ClientError
 
 from dagster import Field, check, seven
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
@@ -13,6 +16,17 @@ from dagster.utils import ensure_dir, ensure_file
 
 from .utils import create_s3_session
 
+DEFAULT_UPLOAD_INTERVAL = 5  # seconds
+
+DEFAULT_SEGMENT_BYTES = 8388608  # 8 MB
+
+MIN_SEGMENT_BYTES = 5242880  # 5 MB, S3 parts other than the last must be at least this size
+
+# The last, partial segment of a running step's log is re-uploaded once it has doubled in size or
+# grown by 1 / PARTIAL_SEGMENT_GROWTH of a segment since it was last uploaded, which bounds the bytes
+# uploaded for each segment to a small multiple of its size
+PARTIAL_SEGMENT_GROWTH = 8
+
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     '''Logs solid compute function stdout and stderr to S3.
@@ -30,26 +44,62 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             local_dir: "/tmp/cool"
             prefix: "dagster-test-"
 
+    While a step runs, the bytes appended to its logs are uploaded every ``upload_interval`` seconds
+    as segment objects of ``segment_bytes`` bytes each, so the logs can be read from S3 before the
+    step completes. The last, partial segment is only re-uploaded once it has grown enough since
+    its last upload. When the step completes,
+    the segments are composed into a single object with server-side part copies, rather than
+    uploading the whole log at once.
+
     Args:
         bucket (str): The name of the s3 bucket to which to log.
         local_dir (Optional[str]): Path to the local directory in which to stage logs. Default:
             ``dagster.seven.get_system_temp_directory()``.
         prefix (Optional[str]): Prefix for the log file keys.
+        capture_mode (Optional[str]): How captured stdout and stderr are mirrored, ``'tail'`` (the
+            default) or ``'thread'``, as for the local compute log manager.
+        upload_interval (Optional[int]): How often, in seconds, to upload the logs of a running
+            step. Default: 5. Set to 0 to upload the logs only once the step completes.
+        segment_bytes (Optional[int]): The size of the segment objects. Segments are composed as
+            the parts of a multipart upload, so this must be at least 5 MB. Default: 8 MB.
+        s3_session (Optional[botocore.client.S3]): The S3 client to use. Default: a client created
+            with :py:func:`~dagster_aws.s3.utils.create_s3_session`.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     '''
 
-    def __init__(self, bucket, local_dir=None, inst_data=None, prefix='dagster'):
-        self._s3_session = create_s3_session()
+    def __init__(
+        self,
+        bucket,
+        local_dir=None,
+        inst_data=None,
+        prefix='dagster',
+        capture_mode=None,
+        upload_interval=DEFAULT_UPLOAD_INTERVAL,
+        segment_bytes=DEFAULT_SEGMENT_BYTES,
+        s3_session=None,
+    ):
+        self._s3_session = s3_session or create_s3_session()
         self._s3_bucket = check.str_param(bucket, 'bucket')
         self._s3_prefix = check.str_param(prefix, 'prefix')
+        self._upload_interval = check.int_param(upload_interval, 'upload_interval')
+        self._segment_bytes = check.int_param(segment_bytes, 'segment_bytes')
+        check.param_invariant(
+            self._segment_bytes >= MIN_SEGMENT_BYTES,
+            'segment_bytes',
+            'Segments are composed as the parts of a multipart upload, so they must be at least '
+            '{min_bytes} bytes, got {segment_bytes}'.format(
+                min_bytes=MIN_SEGMENT_BYTES, segment_bytes=self._segment_bytes
+            ),
+        )
         self._download_urls = {}
+        self._uploaders = {}
 
         # proxy calls to local compute log manager (for subscriptions, etc)
         if not local_dir:
             local_dir = seven.get_system_temp_directory()
 
-        self.local_manager = LocalComputeLogManager(local_dir)
+        self.local_manager = LocalComputeLogManager(local_dir, capture_mode=capture_mode)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -62,6 +112,9 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             'bucket': str,
             'local_dir': Field(str, is_required=False),
             'prefix': Field(str, is_required=False, default_value='dagster'),
+            'capture_mode': Field(str, is_required=False),
+            'upload_interval': Field(int, is_required=False, default_value=DEFAULT_UPLOAD_INTERVAL),
+            'segment_bytes': Field(int, is_required=False, default_value=DEFAULT_SEGMENT_BYTES),
         }
 
     @staticmethod
@@ -71,13 +124,31 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def get_local_path(self, run_id, step_key, io_type):
         return self.local_manager.get_local_path(run_id, step_key, io_type)
 
+    def capture_mode(self, step_context):
+        return self.local_manager.capture_mode(step_context)
+
     def on_compute_start(self, step_context):
         self.local_manager.on_compute_start(step_context)
+        if self._upload_interval > 0:
+            run_id, step_key = step_context.run_id, step_context.step.key
+            uploader = S3ComputeLogSegmentUploader(
+                self._upload_segments, run_id, step_key, self._upload_interval
+            )
+            self._uploaders[(run_id, step_key)] = uploader
+            uploader.start()
 
     def on_compute_finish(self, step_context):
         self.local_manager.on_compute_finish(step_context)
-        self._upload_from_local(step_context.run_id, step_context.step.key, ComputeIOType.STDOUT)
-        self._upload_from_local(step_context.run_id, step_context.step.key, ComputeIOType.STDERR)
+        run_id, step_key = step_context.run_id, step_context.step.key
+        uploader = self._uploaders.pop((run_id, step_key), None)
+        if not uploader:
+            self._upload_from_local(run_id, step_key, ComputeIOType.STDOUT)
+            self._upload_from_local(run_id, step_key, ComputeIOType.STDERR)
+            return
+
+        uploaded = uploader.stop()
+        for io_type in ComputeIOType:
+            self._compose_segments(run_id, step_key, io_type, uploaded[io_type])
 
     def is_compute_completed(self, run_id, step_key):
         return self.local_manager.is_compute_completed(run_id, step_key)
@@ -97,6 +168,9 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
     def read_logs_file(self, run_id, step_key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         if self._should_download(run_id, step_key, io_type):
             self._download_to_local(run_id, step_key, io_type)
+        elif not os.path.exists(self.get_local_path(run_id, step_key, io_type)):
+            # the step is running elsewhere; read the segments uploaded so far
+            return self._read_segments(run_id, step_key, io_type, cursor, max_bytes)
         data = self.local_manager.read_logs_file(run_id, step_key, io_type, cursor, max_bytes)
         return self._from_local_file_data(run_id, step_key, io_type, data)
 
@@ -107,10 +181,10 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         local_path = self.get_local_path(run_id, step_key, io_type)
         if os.path.exists(local_path):
             return False
-        s3_objects = self._s3_session.list_objects(
+        s3_objects = self._s3_session.list_objects_v2(
             Bucket=self._s3_bucket, Prefix=self._bucket_key(run_id, step_key, io_type)
         )
-        return len(s3_objects) > 0
+        return s3_objects['KeyCount'] > 0
 
     def _from_local_file_data(self, run_id, step_key, io_type, local_file_data):
         is_complete = self.is_compute_completed(run_id, step_key)
@@ -135,6 +209,127 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
         with open(path, 'rb') as data:
             self._s3_session.upload_fileobj(data, self._s3_bucket, key)
 
+    def _upload_segments(self, run_id, step_key, io_type, uploaded, final=False):
+        '''Upload the bytes appended to a local log after the first ``uploaded`` bytes. Returns the
+        number of bytes uploaded in all.
+
+        Segments completed since the last upload are uploaded whole, including one that was only
+        partially uploaded before. Unless this is the final upload, a partial segment that was
+        already uploaded is only re-uploaded once it has doubled in size, or grown by
+        1 / PARTIAL_SEGMENT_GROWTH of a segment.
+        '''
+        path = self.get_local_path(run_id, step_key, io_type)
+        if not os.path.isfile(path):
+            return uploaded
+
+        # only upload up to the current size, the log may grow while we read it
+        size = os.path.getsize(path)
+        if size <= uploaded:
+            return uploaded
+
+        first_index = uploaded // self._segment_bytes
+        segment_count = _segment_count(size, self._segment_bytes)
+        if not final and size % self._segment_bytes:
+            # the log ends in a partial segment, of which this much has been uploaded so far
+            uploaded_in_partial = max(uploaded - (segment_count - 1) * self._segment_bytes, 0)
+            growth = size - uploaded
+            if growth < min(uploaded_in_partial, self._segment_bytes // PARTIAL_SEGMENT_GROWTH):
+                return uploaded
+
+        with open(path, 'rb') as log_file:
+            for index in range(first_index, segment_count):
+                start = index * self._segment_bytes
+                log_file.seek(start)
+                self._s3_session.put_object(
+                    Bucket=self._s3_bucket,
+                    Key=self._segment_key(run_id, step_key, io_type, index),
+                    Body=log_file.read(min(self._segment_bytes, size - start)),
+                )
+
+        return size
+
+    def _compose_segments(self, run_id, step_key, io_type, size):
+        key = self._bucket_key(run_id, step_key, io_type)
+        segment_keys = [
+            self._segment_key(run_id, step_key, io_type, index)
+            for index in range(_segment_count(size, self._segment_bytes))
+        ]
+
+        if not segment_keys:
+            self._s3_session.put_object(Bucket=self._s3_bucket, Key=key, Body=b'')
+            return
+
+        if len(segment_keys) == 1:
+            self._s3_session.copy_object(
+                Bucket=self._s3_bucket,
+                Key=key,
+                CopySource={'Bucket': self._s3_bucket, 'Key': segment_keys[0]},
+            )
+        else:
+            upload_id = self._s3_session.create_multipart_upload(Bucket=self._s3_bucket, Key=key)[
+                'UploadId'
+            ]
+            parts = []
+            for part_number, segment_key in enumerate(segment_keys, 1):
+                result = self._s3_session.upload_part_copy(
+                    Bucket=self._s3_bucket,
+                    Key=key,
+                    CopySource={'Bucket': self._s3_bucket, 'Key': segment_key},
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                )
+                parts.append({'ETag': result['CopyPartResult']['ETag'], 'PartNumber': part_number})
+            self._s3_session.complete_multipart_upload(
+                Bucket=self._s3_bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts},
+            )
+
+        # delete_objects accepts at most 1000 keys per request
+        for start in range(0, len(segment_keys), 1000):
+            self._s3_session.delete_objects(
+                Bucket=self._s3_bucket,
+                Delete={'Objects': [{'Key': key} for key in segment_keys[start : start + 1000]]},
+            )
+
+    def _read_segments(self, run_id, step_key, io_type, cursor, max_bytes):
+        chunks = []
+        position = cursor
+        while position - cursor < max_bytes:
+            index, offset = divmod(position, self._segment_bytes)
+            segment_key = self._segment_key(run_id, step_key, io_type, index)
+            try:
+                length = self._s3_session.head_object(Bucket=self._s3_bucket, Key=segment_key)[
+                    'ContentLength'
+                ]
+            except ClientError:
+                break
+
+            if offset >= length:
+                break
+
+            end = min(length, offset + max_bytes - (position - cursor))
+            chunk = self._s3_session.get_object(
+                Bucket=self._s3_bucket,
+                Key=segment_key,
+                Range='bytes={}-{}'.format(offset, end - 1),
+            )['Body'].read()
+            chunks.append(chunk)
+            position += len(chunk)
+
+            if length < self._segment_bytes:
+                # the last segment uploaded so far
+                break
+
+        return ComputeLogFileData(
+            path='s3://{}/{}'.format(self._s3_bucket, self._bucket_key(run_id, step_key, io_type)),
+            data=b''.join(chunks).decode('utf-8'),
+            cursor=position,
+            size=position,
+            download_url=self.local_manager.download_url(run_id, step_key, io_type),
+        )
+
     def _download_to_local(self, run_id, step_key, io_type):
         path = self.get_local_path(run_id, step_key, io_type)
         ensure_dir(os.path.dirname(path))
@@ -154,3 +349,61 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             '{}.{}'.format(step_key, extension),
         ]
         return '/'.join(paths)  # s3 path delimiter
+
+    def _segment_key(self, run_id, step_key, io_type, index):
+        # not under the log's own key, which is listed as a prefix to check that the log exists
+        check.inst_param(io_type, 'io_type', ComputeIOType)
+        extension = IO_TYPE_EXTENSION[io_type]
+        paths = [
+            self._s3_prefix,
+            'storage',
+            run_id,
+            'compute_logs',
+            'segments',
+            '{}.{}'.format(step_key, extension),
+            '{:08d}'.format(index),
+        ]
+        return '/'.join(paths)  # s3 path delimiter
+
+
+def _segment_count(size, segment_bytes):
+    return (size + segment_bytes - 1) // segment_bytes
+
+
+class S3ComputeLogSegmentUploader(object):
+    '''Periodically uploads the logs of a running step as segments, from a daemon thread.'''
+
+    def __init__(self, upload_segments, run_id, step_key, interval):
+        self._upload_segments = check.callable_param(upload_segments, 'upload_segments')
+        self._run_id = check.str_param(run_id, 'run_id')
+        self._step_key = check.str_param(step_key, 'step_key')
+        self._interval = check.int_param(interval, 'interval')
+        self._uploaded = {io_type: 0 for io_type in ComputeIOType}
+        self._shutdown = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        '''Stop the uploads, upload what remains of the logs and return the number of bytes
+        uploaded per io type.'''
+        self._shutdown.set()
+        self._thread.join()
+        self._upload(final=True)
+        return dict(self._uploaded)
+
+    def _run(self):
+        while not self._shutdown.wait(self._interval):
+            try:
+                self._upload()
+            except ClientError:
+                # try again on the next interval, and when the step completes
+                pass
+
+    def _upload(self, final=False):
+        for io_type in ComputeIOType:
+            self._uploaded[io_type] = self._upload_segments(
+                self._run_id, self._step_key, io_type, self._uploaded[io_type], final=final
+            )
@@ -1,12 +1,13 @@
+import hashlib
 import logging
-import sys
-from io import BytesIO, StringIO
+import tempfile
 
 import boto3
+from botocore.exceptions import ClientError
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.storage.object_store import ObjectStore
+from dagster.core.storage.object_store import ObjectStore, file_obj_for_mode
 from dagster.core.types.marshal import SerializationStrategy
 
 
@@ -31,17 +32,14 @@ class S3ObjectStore(ObjectStore):
             logging.warning('Removing existing S3 key: {key}'.format(key=key))
             self.rm_object(key)
 
-        with BytesIO() as bytes_io:
-            if serialization_strategy.write_mode == 'w' and sys.version_info >= (3, 0):
-                with StringIO() as string_io:
-                    string_io = StringIO()
-                    serialization_strategy.serialize(obj, string_io)
-                    string_io.seek(0)
-                    bytes_io.write(string_io.read().encode('utf-8'))
-            else:
-                serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        # serialize to a temporary file rather than to memory, and stream it to S3 in parts
+        with tempfile.TemporaryFile() as file_obj:
+            with file_obj_for_mode(
+                file_obj, serialization_strategy.write_mode, serialization_strategy.encoding
+            ) as write_obj:
+                serialization_strategy.serialize(obj, write_obj)
+            file_obj.seek(0)
+            self.s3.upload_fileobj(file_obj, self.bucket, key)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -50,6 +48,7 @@ class S3ObjectStore(ObjectStore):
             obj=obj,
             serialization_strategy_name=serialization_strategy.name,
             object_store_name=self.name,
+            digest=self.get_digest(key),
         )
 
     def get_object(self, key, serialization_strategy=None):
@@ -57,15 +56,14 @@ class S3ObjectStore(ObjectStore):
         check.param_invariant(len(key) > 0, 'key')
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-            if serialization_strategy.read_mode == 'rb'
-            else StringIO(
-                self.s3.get_object(Bucket=self.bucket, Key=key)['Body']
-                .read()
-                .decode(serialization_strategy.encoding)
-            )
-        )
+        with tempfile.TemporaryFile() as file_obj:
+            self.s3.download_fileobj(self.bucket, key, file_obj)
+            file_obj.seek(0)
+            with file_obj_for_mode(
+                file_obj, serialization_strategy.read_mode, serialization_strategy.encoding
+            ) as read_obj:
+                obj = serialization_strategy.deserialize(read_obj)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -114,11 +112,63 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def get_size(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        try:
+            return self.s3.head_object(Bucket=self.bucket, Key=key)['ContentLength']
+        except ClientError:
+            pass
+
+        # otherwise the key names a directory, whose objects are all under key + '/', and not
+        # under the keys that merely start with key
+        prefix = key if key.endswith(self.sep) else key + self.sep
+        size = 0
+        for page in self.s3.get_paginator('list_objects_v2').paginate(
+            Bucket=self.bucket, Prefix=prefix
+        ):
+            size += sum(result['Size'] for result in page.get('Contents', []))
+        return size
+
+    def get_digest(self, key):
+        '''The ETag of the object at key, or for a directory, the SHA-1 of the relative key and
+        ETag of each object under it.
+
+        The ETag of an object uploaded in one part is the MD5 of its bytes. That of an object
+        uploaded in several parts is derived from the MD5 of each part, and so also changes
+        whenever the bytes do.'''
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        try:
+            return 'etag:' + self.s3.head_object(Bucket=self.bucket, Key=key)['ETag'].strip('"')
+        except ClientError:
+            pass
+
+        prefix = key if key.endswith(self.sep) else key + self.sep
+        digest = hashlib.sha1()
+        count = 0
+        for page in self.s3.get_paginator('list_objects_v2').paginate(
+            Bucket=self.bucket, Prefix=prefix
+        ):
+            for result in page.get('Contents', []):
+                digest.update(
+                    '{key}\0{etag}\n'.format(
+                        key=result['Key'][len(prefix) :], etag=result['ETag'].strip('"')
+                    ).encode('utf-8')
+                )
+                count += 1
+
+        if not count:
+            return None
+        return 'etag-tree:' + digest.hexdigest()
+
     def cp_object(self, src, dst):
         check.str_param(src, 'src')
         check.str_param(dst, 'dst')
 
-        self.s3.copy_object(
+        result = self.s3.copy_object(
             Bucket=self.bucket, Key=dst, CopySource={'Bucket': self.bucket, 'Key': src}
         )
 
@@ -127,6 +177,7 @@ class S3ObjectStore(ObjectStore):
             key=self.uri_for_key(src),
             dest_key=self.uri_for_key(dst),
             object_store_name=self.name,
+            digest='etag:' + result['CopyObjectResult']['ETag'].strip('"'),
         )
 
     def uri_for_key(self, key, protocol=None):
@@ -1,3 +1,4 @@
+import hashlib
 import io
 from collections import defaultdict
 
@@ -5,6 +6,10 @@ from botocore.exceptions import ClientError
 from dagster_aws.s3.resources import S3Resource
 
 
+def _etag(body):
+    return '"{}"'.format(hashlib.md5(body).hexdigest())
+
+
 def create_s3_fake_resource(buckets=None):
     '''Create a mock :py:class:`S3Resource` for test.'''
     return S3Resource(S3FakeSession(buckets=buckets))
@@ -20,14 +25,21 @@ class S3FakeSession(object):
         from dagster.seven import mock
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
+        self.multipart_uploads = {}
         self.mock_extras = mock.MagicMock()
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
 
     def head_object(self, Bucket, Key, *args, **kwargs):
+        if not self.has_object(Bucket, Key):
+            raise ClientError({}, None)
+
         self.mock_extras.head_object(*args, **kwargs)
-        return {'ContentLength': len(self.buckets.get(Bucket, {}).get(Key, b''))}
+        return {
+            'ContentLength': len(self.buckets[Bucket][Key]),
+            'ETag': _etag(self.buckets[Bucket][Key]),
+        }
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
@@ -37,21 +49,69 @@ class S3FakeSession(object):
         else:
             return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
 
+    def get_paginator(self, operation_name):
+        self.mock_extras.get_paginator(operation_name)
+        return S3FakePaginator(self, operation_name)
+
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
-        self.buckets[Bucket][Key] = Body.read()
+        self.buckets[Bucket][Key] = Body if isinstance(Body, bytes) else Body.read()
 
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self.has_object(Bucket, Key):
             raise ClientError({}, None)
 
+        byte_range = kwargs.pop('Range', None)
         self.mock_extras.get_object(*args, **kwargs)
+        if byte_range:
+            # e.g. 'bytes=0-99', both ends inclusive
+            start, end = byte_range[len('bytes=') :].split('-')
+            return {'Body': io.BytesIO(self.buckets[Bucket][Key][int(start) : int(end) + 1])}
         return {'Body': self._get_byte_stream(Bucket, Key)}
 
+    def copy_object(self, Bucket, Key, CopySource, *args, **kwargs):
+        self.mock_extras.copy_object(*args, **kwargs)
+        self.buckets[Bucket][Key] = self.buckets[CopySource['Bucket']][CopySource['Key']]
+        return {'CopyObjectResult': {'ETag': _etag(self.buckets[Bucket][Key])}}
+
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete['Objects']:
+            self.buckets[Bucket].pop(obj['Key'], None)
+
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = {}
+        return {'Bucket': Bucket, 'Key': Key, 'UploadId': upload_id}
+
+    def upload_part_copy(
+        self, Bucket, Key, CopySource, PartNumber, UploadId, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.upload_part_copy(*args, **kwargs)
+        self.multipart_uploads[UploadId][PartNumber] = self.buckets[CopySource['Bucket']][
+            CopySource['Key']
+        ]
+        return {'CopyPartResult': {'ETag': str(PartNumber)}}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
 
+    def download_fileobj(self, bucket, key, fileobj, *args, **kwargs):
+        if not self.has_object(bucket, key):
+            raise ClientError({}, None)
+
+        self.mock_extras.download_fileobj(*args, **kwargs)
+        fileobj.write(self.buckets[bucket][key])
+
     def has_object(self, bucket, key):
         return bucket in self.buckets and key in self.buckets[bucket]
 
@@ -62,3 +122,21 @@ class S3FakeSession(object):
         self.mock_extras.download_file(*args, **kwargs)
         with open(Filename, 'wb') as ff:
             ff.write(self._get_byte_stream(Bucket, Key).read())
+
+
+class S3FakePaginator(object):
+    '''Paginator for a :py:class:`S3FakeSession`, which returns every result in one page.'''
+
+    def __init__(self, session, operation_name):
+        if operation_name != 'list_objects_v2':
+            raise NotImplementedError(operation_name)
+        self.session = session
+
+    def paginate(self, Bucket, Prefix='', **kwargs):
+        self.session.mock_extras.paginate(**kwargs)
+        contents = [
+            {'Key': key, 'Size': len(body), 'ETag': _etag(body)}
+            for key, body in sorted(self.session.buckets.get(Bucket, {}).items())
+            if key.startswith(Prefix)
+        ]
+        yield {'KeyCount': len(contents), 'Contents': contents, 'IsTruncated': False}
@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+
+import pytest
+from dagster_aws.s3 import compute_log_manager
+from dagster_aws.s3.compute_log_manager import S3ComputeLogManager
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster import check, execute_pipeline, pipeline, seven, solid
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
+from dagster.utils import ensure_dir
+
+HELLO_WORLD = 'Hello World, from a step that is still running'
+
+
+def _wait_for(condition, timeout=10):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout
+        time.sleep(0.1)
+
+
+def test_compute_logs_uploaded_while_step_runs(s3_bucket, monkeypatch):
+    # small segments, so that the logs span several of them
+    monkeypatch.setattr(compute_log_manager, 'MIN_SEGMENT_BYTES', 16)
+    s3_session = S3FakeSession()
+    with seven.TemporaryDirectory() as local_dir, seven.TemporaryDirectory() as remote_dir:
+        manager = S3ComputeLogManager(
+            bucket=s3_bucket,
+            local_dir=local_dir,
+            upload_interval=1,
+            segment_bytes=16,
+            s3_session=s3_session,
+        )
+        # e.g. dagit on another machine, which only sees the logs uploaded to S3
+        remote_manager = S3ComputeLogManager(
+            bucket=s3_bucket, local_dir=remote_dir, segment_bytes=16, s3_session=s3_session
+        )
+        remote_reads = []
+
+        @solid
+        def spew(context):
+            print(HELLO_WORLD)
+            sys.stdout.flush()
+
+            def read_remotely():
+                return remote_manager.read_logs_file(
+                    context.run_id, 'spew.compute', ComputeIOType.STDOUT
+                )
+
+            _wait_for(lambda: read_remotely().data == HELLO_WORLD + '\n')
+            remote_reads.append(read_remotely())
+            # a byte range that spans several segments
+            remote_reads.append(
+                remote_manager.read_logs_file(
+                    context.run_id, 'spew.compute', ComputeIOType.STDOUT, cursor=10, max_bytes=20
+                )
+            )
+
+        @pipeline
+        def spew_pipeline():
+            spew()
+
+        instance = DagsterInstance(
+            instance_type=InstanceType.EPHEMERAL,
+            local_artifact_storage=LocalArtifactStorage(local_dir),
+            run_storage=InMemoryRunStorage(),
+            event_storage=InMemoryEventLogStorage(),
+            compute_log_manager=manager,
+        )
+        result = execute_pipeline(spew_pipeline, instance=instance)
+        assert result.success
+
+        assert len(remote_reads) == 2
+        full_read, range_read = remote_reads[0], remote_reads[1]
+        assert full_read.cursor == len(HELLO_WORLD) + 1
+        assert range_read.data == (HELLO_WORLD + '\n')[10:30]
+        assert range_read.cursor == 30
+
+        # once the step completes, the segments are composed into a single object
+        log_keys = [key for key in s3_session.buckets[s3_bucket] if 'spew.compute' in key]
+        assert sorted(log_keys) == [
+            'dagster/storage/{}/compute_logs/spew.compute.err'.format(result.run_id),
+            'dagster/storage/{}/compute_logs/spew.compute.out'.format(result.run_id),
+        ]
+        stdout = remote_manager.read_logs_file(result.run_id, 'spew.compute', ComputeIOType.STDOUT)
+        assert stdout.data == HELLO_WORLD + '\n'
+
+
+class CountingS3FakeSession(S3FakeSession):
+    def __init__(self, *args, **kwargs):
+        super(CountingS3FakeSession, self).__init__(*args, **kwargs)
+        self.put_bytes = 0
+
+    def put_object(self, Bucket, Key, Body, *args, **kwargs):
+        self.put_bytes += len(Body)
+        return super(CountingS3FakeSession, self).put_object(Bucket, Key, Body, *args, **kwargs)
+
+
+def test_partial_segment_reuploads_are_bounded(s3_bucket, monkeypatch):
+    monkeypatch.setattr(compute_log_manager, 'MIN_SEGMENT_BYTES', 64)
+    s3_session = CountingS3FakeSession()
+    with seven.TemporaryDirectory() as local_dir:
+        manager = S3ComputeLogManager(
+            bucket=s3_bucket, local_dir=local_dir, segment_bytes=64, s3_session=s3_session
+        )
+        path = manager.get_local_path('run_id', 'step.compute', ComputeIOType.STDOUT)
+        ensure_dir(os.path.dirname(path))
+
+        # a log growing a byte at a time, uploaded after every byte
+        uploaded = 0
+        for _ in range(640):
+            with open(path, 'ab') as log_file:
+                log_file.write(b'x')
+            uploaded = manager._upload_segments(  # pylint: disable=protected-access
+                'run_id', 'step.compute', ComputeIOType.STDOUT, uploaded
+            )
+
+        # re-uploading the partial segment every time would put 64 * 65 / 2 bytes per segment
+        assert s3_session.put_bytes < 640 * 5
+
+        uploaded = manager._upload_segments(  # pylint: disable=protected-access
+            'run_id', 'step.compute', ComputeIOType.STDOUT, uploaded, final=True
+        )
+        assert uploaded == 640
+
+
+def test_segment_bytes_must_be_a_valid_part_size(s3_bucket):
+    with pytest.raises(check.ParameterCheckError, match='at least 5242880 bytes'):
+        S3ComputeLogManager(bucket=s3_bucket, segment_bytes=1024, s3_session=S3FakeSession())
@@ -0,0 +1,69 @@
+import hashlib
+import pickle
+
+from dagster_aws.s3.object_store import S3ObjectStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.utils import PICKLE_PROTOCOL
+
+
+def test_s3_object_store_get_size():
+    s3_session = S3FakeSession(
+        buckets={
+            'bucket': {
+                'intermediates/foo': b'a' * 10,
+                'intermediates/foo.compute': b'a' * 100,
+                'intermediates/foo.compute/part-0': b'a' * 3,
+                'intermediates/foo.compute/part-1': b'a' * 4,
+                'intermediates/foo.compute_bar/part-0': b'a' * 1000,
+            }
+        }
+    )
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    # a key that names an object is not a prefix of the keys that start with it
+    assert object_store.get_size('intermediates/foo') == 10
+
+    # a key that only names a directory covers the objects under it, and not its siblings
+    assert object_store.get_size('intermediates/foo.compute') == 100
+    del s3_session.buckets['bucket']['intermediates/foo.compute']
+    assert object_store.get_size('intermediates/foo.compute') == 7
+    assert object_store.get_size('intermediates/foo.compute/') == 7
+
+    assert object_store.get_size('intermediates/bar') == 0
+
+
+def test_s3_object_store_get_digest():
+    s3_session = S3FakeSession(
+        buckets={
+            'bucket': {
+                'intermediates/foo.compute/part-0': b'a' * 3,
+                'intermediates/foo.compute/part-1': b'a' * 4,
+                'intermediates/foo.compute_bar/part-0': b'a' * 1000,
+            }
+        }
+    )
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    set_operation = object_store.set_object(
+        'intermediates/foo', 'foo', serialization_strategy=PickleSerializationStrategy()
+    )
+    assert (
+        set_operation.digest
+        == 'etag:' + hashlib.md5(pickle.dumps('foo', PICKLE_PROTOCOL)).hexdigest()
+    )
+    assert object_store.get_digest('intermediates/foo') == set_operation.digest
+    assert object_store.cp_object('intermediates/foo', 'intermediates/bar').digest == (
+        set_operation.digest
+    )
+
+    # a directory's digest covers the objects under it, and not its siblings
+    digest = object_store.get_digest('intermediates/foo.compute')
+    assert digest.startswith('etag-tree:')
+    del s3_session.buckets['bucket']['intermediates/foo.compute_bar/part-0']
+    assert object_store.get_digest('intermediates/foo.compute') == digest
+    s3_session.buckets['bucket']['intermediates/foo.compute/part-1'] = b'b' * 4
+    assert object_store.get_digest('intermediates/foo.compute') != digest
+
+    assert object_store.get_digest('intermediates/baz') is None
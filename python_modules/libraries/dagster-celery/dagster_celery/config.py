@@ -29,7 +29,10 @@ class dict_wrapper(object):
 
 
 class CeleryConfig(
-    namedtuple('CeleryConfig', 'broker backend include config_source retries'), ExecutorConfig,
+    namedtuple(
+        'CeleryConfig', 'broker backend include config_source retries prioritize_critical_path'
+    ),
+    ExecutorConfig,
 ):
     '''Configuration class for the Celery execution engine.
 
@@ -39,10 +42,18 @@ class CeleryConfig(
         include (Optional[List[str]]): List of modules every worker should import.
         config_source (Optional[Dict]): Config settings for the Celery app.
         retries (Retries): Controls retry behavior
+        prioritize_critical_path (Optional[bool]): Whether to submit the steps with the longest
+            chain of downstream steps first. Default: False.
     '''
 
     def __new__(
-        cls, retries, broker=None, backend=None, include=None, config_source=None,
+        cls,
+        retries,
+        broker=None,
+        backend=None,
+        include=None,
+        config_source=None,
+        prioritize_critical_path=None,
     ):
 
         return super(CeleryConfig, cls).__new__(
@@ -54,6 +65,9 @@ class CeleryConfig(
                 dict(DEFAULT_CONFIG, **check.opt_dict_param(config_source, 'config_source'))
             ),
             retries=check.inst_param(retries, 'retries', Retries),
+            prioritize_critical_path=check.opt_bool_param(
+                prioritize_critical_path, 'prioritize_critical_path', default=False
+            ),
         )
 
     @staticmethod
@@ -1,13 +1,16 @@
 import sys
-import time
+import threading
+from collections import Counter, defaultdict
 
 from dagster import check
 from dagster.core.engine.engine_base import Engine, override_env_for_inner_executor
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.critical_path import critical_path_sort_key_fn_for_context
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.instance import DagsterInstance
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.net import is_local_uri
 
@@ -15,10 +18,90 @@ from .config import CeleryConfig
 from .defaults import task_default_priority, task_default_queue
 from .tasks import create_task, make_app
 
+# Upper bound on how long the engine sleeps between checks on its tasks; it is woken early as soon
+# as a worker writes to the run's event log
 TICK_SECONDS = 1
 DELEGATE_MARKER = 'celery_queue_wait'
 
 
+class StepEventStream(object):
+    '''The step events celery workers write to a run's event log, read as they arrive.
+
+    A task's result, the list of events it produced, is the authoritative record of a step. When
+    the workers share the engine's event log, the stream lets the engine handle step events before
+    the task returns, so dependent steps can be submitted as soon as a step succeeds. The records
+    are pushed by the event log storage's watcher, which keeps track of the last event it
+    dispatched, and the events read early are set aside so they are not handled again when the
+    task's result arrives. Likewise, the events handled from a task's result before the watcher
+    delivered them are set aside, so they are not read again when they arrive late, e.g. while
+    the step is being retried. When the workers write to another event log, nothing is read early
+    and every event is handled from the task's result.
+    '''
+
+    def __init__(self, instance, run_id):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_id = check.str_param(run_id, 'run_id')
+        self._lock = threading.Lock()
+        self._has_new_events = threading.Event()
+        self._records = []
+        # step_key -> Counter of the serialized events read for the step and not yet matched by
+        # the events of its task's result
+        self._read_events = defaultdict(Counter)
+        # step_key -> Counter of the serialized events handled from the step's task results and
+        # not yet delivered by the watcher
+        self._handled_events = defaultdict(Counter)
+        instance.watch_event_logs(run_id, -1, self._on_new_event)
+
+    def _on_new_event(self, record):
+        with self._lock:
+            self._records.append(record)
+        self._has_new_events.set()
+
+    def wait(self, timeout):
+        '''Block until new events have been written to the run's event log, or for at most
+        timeout seconds.'''
+        self._has_new_events.wait(timeout)
+
+    def read_step_events(self, step_keys):
+        '''The step events for step_keys written since the last read. Events for other steps are
+        discarded.'''
+        with self._lock:
+            self._has_new_events.clear()
+            records, self._records = self._records, []
+
+        events = []
+        for record in records:
+            if not (record.is_dagster_event and record.dagster_event.is_step_event):
+                continue
+
+            event = record.dagster_event
+            serialized_event = serialize_dagster_namedtuple(event)
+            handled_events = self._handled_events[event.step_key]
+            if handled_events[serialized_event] > 0:
+                handled_events[serialized_event] -= 1
+            elif event.step_key in step_keys:
+                self._read_events[event.step_key][serialized_event] += 1
+                events.append(event)
+        return events
+
+    def unread_step_events(self, step_key, step_events):
+        '''The events of a finished task that were not already read from the event log.'''
+        read_events = self._read_events[step_key]
+        events = []
+        for event in step_events:
+            serialized_event = serialize_dagster_namedtuple(event)
+            if read_events[serialized_event] > 0:
+                read_events[serialized_event] -= 1
+            else:
+                if event.is_step_event:
+                    self._handled_events[step_key][serialized_event] += 1
+                events.append(event)
+        return events
+
+    def close(self):
+        self._instance.end_watch_event_logs(self._run_id, self._on_new_event)
+
+
 class CeleryEngine(Engine):
     @staticmethod
     def execute(pipeline_context, execution_plan):
@@ -59,6 +142,10 @@ class CeleryEngine(Engine):
             -1 * int(step.tags.get('dagster-celery/priority', task_default_priority))
             + -1 * _get_run_priority(pipeline_context)
         )
+        if pipeline_context.executor_config.prioritize_critical_path:
+            priority_for_step = critical_path_sort_key_fn_for_context(
+                pipeline_context, execution_plan, sort_key_fn=priority_for_step
+            )
         priority_for_key = lambda step_key: (
             priority_for_step(execution_plan.get_step_by_key(step_key))
         )
@@ -71,73 +158,91 @@ class CeleryEngine(Engine):
             retries=pipeline_context.executor_config.retries, sort_key_fn=priority_for_step
         )
         stopping = False
+        step_event_stream = StepEventStream(
+            pipeline_context.instance, pipeline_context.pipeline_run.run_id
+        )
+
+        try:
+            while (not active_execution.is_complete and not stopping) or step_results:
 
-        while (not active_execution.is_complete and not stopping) or step_results:
+                for event in step_event_stream.read_step_events(step_results):
+                    yield event
+                    # retries are handled from the task's result, so that the step is not
+                    # resubmitted before the result of the task it is retrying has been handled
+                    if not event.is_step_up_for_retry:
+                        active_execution.handle_event(event)
+
+                for step_key, result in sorted(
+                    step_results.items(), key=lambda x: priority_for_key(x[0])
+                ):
+                    if not result.ready():
+                        continue
 
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
                     try:
-                        step_events = result.get()
-                    except Exception as e:  # pylint: disable=broad-except
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
+                        step_events = [
+                            deserialize_json_to_dagster_namedtuple(step_event)
+                            for step_event in result.get()
+                        ]
+                    except Exception:  # pylint: disable=broad-except
+                        # We will want to do more to handle the exception here.. maybe subclass
+                        # Task. Certainly yield an engine or pipeline event
                         step_events = []
                         step_errors[step_key] = serializable_error_info_from_exc_info(
                             sys.exc_info()
                         )
                         stopping = True
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
+
+                    for event in step_event_stream.unread_step_events(step_key, step_events):
                         yield event
-                        active_execution.handle_event(event)
+                        if not event.is_step_up_for_retry:
+                            active_execution.handle_event(event)
 
-                    results_to_pop.append(step_key)
-                    completed_steps.add(step_key)
+                    for event in step_events:
+                        if event.is_step_up_for_retry:
+                            active_execution.handle_event(event)
 
-            for step_key in results_to_pop:
-                if step_key in step_results:
                     del step_results[step_key]
+                    completed_steps.add(step_key)
                     active_execution.verify_complete(pipeline_context, step_key)
 
-            # process skips from failures or uncovered inputs
-            for event in active_execution.skipped_step_events_iterator(pipeline_context):
-                yield event
-
-            # don't add any new steps if we are stopping
-            if stopping:
-                continue
-
-            # This is a slight refinement. If we have n workers idle and schedule m > n steps for
-            # execution, the first n steps will be picked up by the idle workers in the order in
-            # which they are scheduled (and the following m-n steps will be executed in priority
-            # order, provided that it takes longer to execute a step than to schedule it). The test
-            # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
-                try:
-                    queue = step.tags.get('dagster-celery/queue', task_default_queue)
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        'Submitting celery task for step "{step_key}" to queue "{queue}".'.format(
-                            step_key=step.key, queue=queue
-                        ),
-                        EngineEventData(marker_start=DELEGATE_MARKER),
-                        step_key=step.key,
-                    )
-                    step_results[step.key] = _submit_task(app, pipeline_context, step, queue)
-                except Exception:
-                    yield DagsterEvent.engine_event(
-                        pipeline_context,
-                        'Encountered error during celery task submission.'.format(),
-                        event_specific_data=EngineEventData.engine_error(
-                            serializable_error_info_from_exc_info(sys.exc_info()),
-                        ),
-                    )
-                    raise
+                # process skips from failures or uncovered inputs
+                for event in active_execution.skipped_step_events_iterator(pipeline_context):
+                    yield event
+
+                # don't add any new steps if we are stopping
+                if stopping:
+                    continue
+
+                # This is a slight refinement. If we have n workers idle and schedule m > n steps
+                # for execution, the first n steps will be picked up by the idle workers in the
+                # order in which they are scheduled (and the following m-n steps will be executed
+                # in priority order, provided that it takes longer to execute a step than to
+                # schedule it). The test case has m >> n to exhibit this behavior in the absence of
+                # this sort step.
+                for step in active_execution.get_steps_to_execute():
+                    try:
+                        queue = step.tags.get('dagster-celery/queue', task_default_queue)
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            'Submitting celery task for step "{step_key}" to queue '
+                            '"{queue}".'.format(step_key=step.key, queue=queue),
+                            EngineEventData(marker_start=DELEGATE_MARKER),
+                            step_key=step.key,
+                        )
+                        step_results[step.key] = _submit_task(app, pipeline_context, step, queue)
+                    except Exception:
+                        yield DagsterEvent.engine_event(
+                            pipeline_context,
+                            'Encountered error during celery task submission.'.format(),
+                            event_specific_data=EngineEventData.engine_error(
+                                serializable_error_info_from_exc_info(sys.exc_info()),
+                            ),
+                        )
+                        raise
 
-            time.sleep(TICK_SECONDS)
+                step_event_stream.wait(TICK_SECONDS)
+        finally:
+            step_event_stream.close()
 
         if step_errors:
             raise DagsterSubprocessError(
@@ -160,28 +265,26 @@ def _submit_task(app, pipeline_context, step, queue):
 
     task = create_task(app)
 
-    handle_dict = pipeline_context.execution_target_handle.to_dict()
+    pipeline_name = pipeline_context.pipeline_def.name
+    handle_dict = pipeline_context.execution_target_handle.with_pipeline_name(
+        pipeline_name
+    ).to_dict()
     instance_ref_dict = pipeline_context.instance.get_ref().to_dict()
 
-    pipeline_name = pipeline_context.pipeline_def.name
-    mode = pipeline_context.mode_def.name
-    run_id = pipeline_context.pipeline_run.run_id
-
-    variables = {
-        'executionParams': {
-            'selector': {'name': pipeline_name},
-            'environmentConfigData': override_env_for_inner_executor(
-                pipeline_context.environment_dict,
-                pipeline_context.executor_config.retries,
-                step.key,
-                DELEGATE_MARKER,
-            ),
-            'mode': mode,
-            'executionMetadata': {'runId': run_id},
-            'stepKeys': [step.key],
-        }
-    }
-    task_signature = task.si(handle_dict, variables, instance_ref_dict)
+    environment_dict = override_env_for_inner_executor(
+        pipeline_context.environment_dict,
+        pipeline_context.executor_config.retries,
+        step.key,
+        DELEGATE_MARKER,
+    )
+    task_signature = task.si(
+        handle_dict,
+        pipeline_context.pipeline_run.run_id,
+        [step.key],
+        environment_dict,
+        pipeline_context.mode_def.name,
+        instance_ref_dict,
+    )
     return task_signature.apply_async(
         priority=priority, queue=queue, routing_key='{queue}.execute_query'.format(queue=queue),
     )
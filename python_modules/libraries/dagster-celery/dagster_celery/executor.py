@@ -1,4 +1,4 @@
-from dagster import Field, Noneable, Permissive
+from dagster import Bool, Field, Noneable, Permissive
 from dagster.core.definitions.executor import check_cross_process_constraints, executor
 from dagster.core.execution.retries import Retries, get_retries_config
 
@@ -32,6 +32,13 @@ from .config import CeleryConfig
             description='Additional settings for the Celery app.',
         ),
         'retries': get_retries_config(),
+        'prioritize_critical_path': Field(
+            Bool,
+            is_required=False,
+            default_value=False,
+            description='Submit the steps with the longest chain of downstream steps first, '
+            'weighting each step by its mean duration in recent runs of the pipeline.',
+        ),
     },
 )
 def celery_executor(init_context):
@@ -78,6 +85,8 @@ def celery_executor(init_context):
               config_source: # Dict[str, Any]: Any additional parameters to pass to the
                   #...       # Celery workers. This dict will be passed as the `config_source`
                   #...       # argument of celery.Celery().
+              prioritize_critical_path: false # Optional[bool]: Submit the steps with the
+                  #...       # longest chain of downstream steps first
 
     Note that the YAML you provide here must align with the configuration with which the Celery
     workers on which you hope to run were started. If, for example, you point the executor at a
@@ -92,4 +101,5 @@ def celery_executor(init_context):
         config_source=init_context.executor_config.get('config_source'),
         include=init_context.executor_config.get('include'),
         retries=Retries.from_config(init_context.executor_config['retries']),
+        prioritize_critical_path=init_context.executor_config['prioritize_critical_path'],
     )
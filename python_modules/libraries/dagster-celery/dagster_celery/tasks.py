@@ -1,26 +1,30 @@
 from celery import Celery
 from celery.utils.collections import force_mapping
 from dagster_celery.config import CeleryConfig
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
 from kombu import Queue
 
 from dagster import ExecutionTargetHandle, check
+from dagster.core.execution.api import execute_step_remotely
 from dagster.core.instance import InstanceRef
-from dagster.core.serdes import serialize_dagster_namedtuple
 from dagster.seven import is_module_available
 
 
 def create_task(celery_app, **task_kwargs):
     @celery_app.task(bind=True, name='execute_query', **task_kwargs)
-    def _execute_query(_self, handle_dict, variables, instance_ref_dict):
+    def _execute_query(
+        _self, handle_dict, run_id, step_keys, environment_dict, mode, instance_ref_dict
+    ):
         instance_ref = InstanceRef.from_dict(instance_ref_dict)
         handle = ExecutionTargetHandle.from_dict(handle_dict)
 
-        events = execute_execute_plan_mutation(
-            handle=handle, variables=variables, instance_ref=instance_ref,
+        return execute_step_remotely(
+            handle=handle,
+            run_id=run_id,
+            step_keys=step_keys,
+            environment_dict=environment_dict,
+            mode=mode,
+            instance_ref=instance_ref,
         )
-        serialized_events = [serialize_dagster_namedtuple(event) for event in events]
-        return serialized_events
 
     return _execute_query
 
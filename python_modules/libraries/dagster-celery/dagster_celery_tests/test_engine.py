@@ -0,0 +1,130 @@
+import time
+
+from dagster_celery.engine import StepEventStream
+
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import StepRetryData, StepSuccessData
+from dagster.core.instance import DagsterInstance
+from dagster.core.utils import make_new_run_id
+
+
+def _step_event_record(run_id, event_type, step_key, event_specific_data=None):
+    return DagsterEventRecord(
+        None,
+        event_type.value,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        step_key=step_key,
+        dagster_event=DagsterEvent(
+            event_type.value, 'foo', step_key=step_key, event_specific_data=event_specific_data,
+        ),
+    )
+
+
+def test_step_event_stream():
+    # the in memory event log storage notifies its watchers as each event is stored
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+
+    stream = StepEventStream(instance, run_id)
+    try:
+        foo_start = _step_event_record(run_id, DagsterEventType.STEP_START, 'foo.compute')
+        foo_success = _step_event_record(
+            run_id, DagsterEventType.STEP_SUCCESS, 'foo.compute', StepSuccessData(duration_ms=1.0),
+        )
+        instance.handle_new_event(foo_start)
+        instance.handle_new_event(
+            _step_event_record(run_id, DagsterEventType.STEP_START, 'bar.compute')
+        )
+        instance.handle_new_event(foo_success)
+
+        events = stream.read_step_events(['foo.compute'])
+        assert [(event.event_type, event.step_key) for event in events] == [
+            (DagsterEventType.STEP_START, 'foo.compute'),
+            (DagsterEventType.STEP_SUCCESS, 'foo.compute'),
+        ]
+
+        # each event is only read once, and events for other steps are discarded
+        assert stream.read_step_events(['foo.compute', 'bar.compute']) == []
+
+        # the events of the finished task that were read early are not returned again
+        foo_engine_event = DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'foo',
+            step_key='foo.compute',
+            event_specific_data=EngineEventData(),
+        )
+        assert stream.unread_step_events(
+            'foo.compute', [foo_start.dagster_event, foo_engine_event, foo_success.dagster_event],
+        ) == [foo_engine_event]
+    finally:
+        stream.close()
+
+
+def test_step_event_stream_retry():
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+
+    stream = StepEventStream(instance, run_id)
+    try:
+        foo_start = _step_event_record(run_id, DagsterEventType.STEP_START, 'foo.compute')
+        foo_retry = _step_event_record(
+            run_id,
+            DagsterEventType.STEP_UP_FOR_RETRY,
+            'foo.compute',
+            StepRetryData(error=None, seconds_to_wait=None),
+        )
+        foo_restarted = _step_event_record(run_id, DagsterEventType.STEP_RESTARTED, 'foo.compute')
+        foo_success = _step_event_record(
+            run_id, DagsterEventType.STEP_SUCCESS, 'foo.compute', StepSuccessData(duration_ms=1.0),
+        )
+
+        # the first attempt's task result is handled before the watcher delivers its events
+        first_attempt = [foo_start.dagster_event, foo_retry.dagster_event]
+        assert stream.unread_step_events('foo.compute', first_attempt) == first_attempt
+
+        # which are not read again when they arrive late, while the step is being retried
+        instance.handle_new_event(foo_start)
+        instance.handle_new_event(foo_retry)
+        instance.handle_new_event(foo_restarted)
+        events = stream.read_step_events(['foo.compute'])
+        assert [event.event_type for event in events] == [DagsterEventType.STEP_RESTARTED]
+
+        instance.handle_new_event(foo_success)
+        events = stream.read_step_events(['foo.compute'])
+        assert [event.event_type for event in events] == [DagsterEventType.STEP_SUCCESS]
+
+        # the second attempt's events were all read early
+        assert (
+            stream.unread_step_events(
+                'foo.compute', [foo_restarted.dagster_event, foo_success.dagster_event]
+            )
+            == []
+        )
+    finally:
+        stream.close()
+
+
+def test_step_event_stream_separate_event_log():
+    instance = DagsterInstance.ephemeral()
+    run_id = make_new_run_id()
+
+    stream = StepEventStream(instance, run_id)
+    try:
+        # a worker writing to another event log is only heard from through its task's result
+        events = [
+            DagsterEvent(DagsterEventType.STEP_START.value, 'foo', step_key='foo.compute'),
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                'foo',
+                step_key='foo.compute',
+                event_specific_data=StepSuccessData(duration_ms=1.0),
+            ),
+        ]
+        assert stream.read_step_events(['foo.compute']) == []
+        assert stream.unread_step_events('foo.compute', events) == events
+    finally:
+        stream.close()
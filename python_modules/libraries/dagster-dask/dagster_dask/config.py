@@ -2,10 +2,15 @@ from collections import namedtuple
 
 from dagster import check
 from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.retries import Retries, RetryMode
 
 
 class DaskConfig(
-    namedtuple('DaskConfig', 'address timeout scheduler_file direct_to_workers heartbeat_interval'),
+    namedtuple(
+        'DaskConfig',
+        'address timeout scheduler_file direct_to_workers heartbeat_interval retries '
+        'max_concurrent',
+    ),
     ExecutorConfig,
 ):
     '''DaskConfig - configuration for the Dask execution engine
@@ -17,6 +22,9 @@ class DaskConfig(
         direct_to_workers (Optional[bool]): Whether or not to connect directly to the workers, or
             to ask the scheduler to serve as intermediary.
         heartbeat_interval (Optional[int]): Time in milliseconds between heartbeats to scheduler.
+        retries (Optional[Retries]): Controls retry behavior. Retries are enabled by default.
+        max_concurrent (Optional[int]): The maximum number of steps submitted to the cluster at
+            once. If not set, or 0, every step is submitted as soon as it is ready to execute.
     '''
 
     def __new__(
@@ -26,6 +34,8 @@ class DaskConfig(
         scheduler_file=None,
         direct_to_workers=False,
         heartbeat_interval=None,
+        retries=None,
+        max_concurrent=None,
     ):
         return super(DaskConfig, cls).__new__(
             cls,
@@ -34,6 +44,10 @@ class DaskConfig(
             scheduler_file=check.opt_str_param(scheduler_file, 'scheduler_file'),
             direct_to_workers=check.opt_bool_param(direct_to_workers, 'direct_to_workers'),
             heartbeat_interval=check.opt_int_param(heartbeat_interval, 'heartbeat_interval'),
+            retries=check.opt_inst_param(
+                retries, 'retries', Retries, default=Retries(RetryMode.ENABLED)
+            ),
+            max_concurrent=check.opt_int_param(max_concurrent, 'max_concurrent') or 0,
         )
 
     @staticmethod
@@ -1,13 +1,23 @@
+import sys
+import threading
+import time
+
 import dask
 import dask.distributed
-from dagster_graphql.client.mutations import execute_execute_plan_mutation
+from six.moves import queue
 
 from dagster import check, seven
-from dagster.core.engine.engine_base import Engine
-from dagster.core.events import DagsterEvent
+from dagster.core.engine.engine_base import Engine, override_env_for_inner_executor
+from dagster.core.errors import DagsterSubprocessError
+from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.execution.api import execute_step_remotely_iterator
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.retries import Retries, RetryMode
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils import frozentags
+from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.net import is_local_uri
 
 from .config import DaskConfig
@@ -15,14 +25,93 @@ from .config import DaskConfig
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = 'dagster-dask/resource_requirements'
 
+# Upper bound on how long the engine waits for events before checking on its tasks; it is woken
+# early whenever a worker reports an event or finishes a task. Also how long the engine waits for a
+# task whose future failed to report that it has finished.
+TICK_SECONDS = 1
+DELEGATE_MARKER = 'dask_queue_wait'
+
 
 def query_on_dask_worker(
-    handle, variables, dependencies, instance_ref=None
-):  # pylint: disable=unused-argument
-    '''Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
+    handle,
+    run_id,
+    step_key,
+    environment_dict,
+    mode,
+    previous_attempts,
+    task_key,
+    queue_name,
+    instance_ref=None,
+):
+    '''Executes a single step on a Dask worker.
+
+    Each of the step's events is put on the named distributed Queue as it happens, followed by
+    None once the step has finished, so that the engine can stream the events and is woken as
+    soon as the task completes.
+    '''
+    # older versions of distributed do not find the worker's client for the Queue by themselves
+    events_queue = dask.distributed.Queue(queue_name, client=dask.distributed.get_client())
+    try:
+        for event in execute_step_remotely_iterator(
+            handle,
+            run_id,
+            [step_key],
+            override_env_for_inner_executor(
+                environment_dict,
+                Retries(RetryMode.DEFERRED, {step_key: previous_attempts}),
+                step_key,
+                DELEGATE_MARKER,
+            ),
+            mode,
+            instance_ref=instance_ref,
+        ):
+            events_queue.put((task_key, serialize_dagster_namedtuple(event)))
+    finally:
+        events_queue.put((task_key, None))
+        # each Queue made with a name holds a reference to the scheduler's queue of that name
+        events_queue.close()
+
+
+class DaskEventReceiver(object):
+    '''Relays what the workers put on a run's distributed Queue to a local queue.
+
+    Blocking reads on the distributed Queue are done by a background thread, so that the engine
+    can wait on the local queue with a timeout. Closing the receiver releases the distributed
+    Queue, which is otherwise kept by the scheduler for as long as it runs.
     '''
-    return execute_execute_plan_mutation(handle, variables, instance_ref=instance_ref)
+
+    def __init__(self, client, queue_name):
+        self.queue_name = check.str_param(queue_name, 'queue_name')
+        self._events_queue = dask.distributed.Queue(queue_name, client=client)
+        self._received = queue.Queue()
+        self._thread = threading.Thread(target=self._relay, name='dask-event-receiver')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _relay(self):
+        while True:
+            item = self._events_queue.get()
+            if item is None:
+                break
+            self._received.put(item)
+
+    def get(self, timeout):
+        '''Wait for at most timeout seconds for an item, returning every item received so far.'''
+        try:
+            items = [self._received.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while True:
+            try:
+                items.append(self._received.get_nowait())
+            except queue.Empty:
+                return items
+
+    def close(self):
+        self._events_queue.put(None)
+        self._thread.join()
+        self._events_queue.close()
 
 
 def get_dask_resource_requirements(tags):
@@ -74,57 +163,134 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                 'Cannot use in-memory storage with Dask, use filesystem, S3, or GCS',
             )
 
-        step_levels = execution_plan.execution_step_levels()
-
         pipeline_name = pipeline_context.pipeline_def.name
+        run_id = pipeline_context.pipeline_run.run_id
+        mode = pipeline_context.mode_def.name
+        limit = dask_config.max_concurrent
 
-        instance = pipeline_context.instance
+        instance_ref = pipeline_context.instance.get_ref()
+        handle = pipeline_context.execution_target_handle.with_pipeline_name(pipeline_name)
+
+        for event in copy_required_intermediates_for_execution(pipeline_context, execution_plan):
+            yield event
+
+        active_execution = execution_plan.start(retries=dask_config.retries)
+        futures = {}  # Dict[str, Tuple[str, dask.distributed.Future]], keyed by Dask task key
+        errors = {}
+        failed_futures = {}  # Dict[str, float], when each failed future was seen by Dask task key
+        stopping = False
 
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
-            execution_futures = []
-            execution_futures_dict = {}
-
-            for step_level in step_levels:
-                for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = []
-                    for step_input in step.step_inputs:
-                        for key in step_input.dependency_keys:
-                            dependencies.append(execution_futures_dict[key])
-
-                    environment_dict = dict(
-                        pipeline_context.environment_dict, execution={'in_process': {}}
-                    )
-                    variables = {
-                        'executionParams': {
-                            'selector': {'name': pipeline_name},
-                            'environmentConfigData': environment_dict,
-                            'mode': pipeline_context.mode_def.name,
-                            'executionMetadata': {'runId': pipeline_context.pipeline_run.run_id},
-                            'stepKeys': [step.key],
-                        }
-                    }
-
-                    dask_task_name = '%s.%s' % (pipeline_name, step.key)
-
-                    future = client.submit(
-                        query_on_dask_worker,
-                        pipeline_context.execution_target_handle,
-                        variables,
-                        dependencies,
-                        instance.get_ref(),
-                        key=dask_task_name,
-                        resources=get_dask_resource_requirements(step.tags),
+            # The environment is shipped to the cluster once, instead of with every task
+            [environment_future] = client.scatter(
+                [pipeline_context.environment_dict], broadcast=True
+            )
+            receiver = DaskEventReceiver(client, 'dagster-{run_id}'.format(run_id=run_id))
+
+            try:
+                while (not stopping and not active_execution.is_complete) or futures:
+                    # submit steps as their dependencies complete
+                    while not stopping and not (limit and len(futures) >= limit):
+                        steps = active_execution.get_steps_to_execute(
+                            limit=(limit - len(futures)) if limit else None
+                        )
+                        if not steps:
+                            break
+
+                        for step in steps:
+                            previous_attempts = dask_config.retries.get_attempt_count(step.key)
+                            task_key = '{pipeline_name}.{step_key}.{attempt}'.format(
+                                pipeline_name=pipeline_name,
+                                step_key=step.key,
+                                attempt=previous_attempts,
+                            )
+                            yield DagsterEvent.engine_event(
+                                pipeline_context,
+                                'Submitting dask task for step "{step_key}".'.format(
+                                    step_key=step.key
+                                ),
+                                EngineEventData(marker_start=DELEGATE_MARKER),
+                                step_key=step.key,
+                            )
+                            futures[task_key] = (
+                                step.key,
+                                client.submit(
+                                    query_on_dask_worker,
+                                    handle,
+                                    run_id,
+                                    step.key,
+                                    environment_future,
+                                    mode,
+                                    previous_attempts,
+                                    task_key,
+                                    receiver.queue_name,
+                                    instance_ref,
+                                    key=task_key,
+                                    priority=int(step.tags.get('dagster/priority', 0)),
+                                    resources=get_dask_resource_requirements(step.tags),
+                                ),
+                            )
+
+                    # A task is finished once the None it puts on the queue after its events has
+                    # been received, since its events may still be on their way through the
+                    # receiver after its future is done. A task whose future failed without that
+                    # None arriving within a tick, e.g. because its worker died, is finished too.
+                    now = time.time()
+                    finished_task_keys = set(
+                        task_key
+                        for task_key, failed_at in failed_futures.items()
+                        if now - failed_at >= TICK_SECONDS
                     )
+                    for task_key, (_, future) in futures.items():
+                        if (
+                            task_key not in failed_futures
+                            and future.done()
+                            and future.status != 'finished'
+                        ):
+                            failed_futures[task_key] = now
 
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
+                    for task_key, serialized_event in receiver.get(TICK_SECONDS):
+                        if serialized_event is None:
+                            finished_task_keys.add(task_key)
+                            continue
 
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            for future in dask.distributed.as_completed(execution_futures):
-                for step_event in future.result():
-                    check.inst(step_event, DagsterEvent)
+                        event = check.inst(
+                            deserialize_json_to_dagster_namedtuple(serialized_event), DagsterEvent
+                        )
+                        yield event
+                        active_execution.handle_event(event)
 
-                    yield step_event
+                    for task_key in finished_task_keys:
+                        if task_key not in futures:
+                            continue
+
+                        step_key, future = futures.pop(task_key)
+                        failed_futures.pop(task_key, None)
+                        try:
+                            future.result()
+                        except Exception:  # pylint: disable=broad-except
+                            errors[task_key] = serializable_error_info_from_exc_info(sys.exc_info())
+                            stopping = True
+
+                        # a step that asked to be retried may already have been resubmitted
+                        if not any(key == step_key for key, _ in futures.values()):
+                            active_execution.verify_complete(pipeline_context, step_key)
+
+                    # process skips from failures or uncovered inputs
+                    for event in active_execution.skipped_step_events_iterator(pipeline_context):
+                        yield event
+            finally:
+                receiver.close()
+
+        if errors:
+            raise DagsterSubprocessError(
+                'During dask execution errors occurred in workers:\n{error_list}'.format(
+                    error_list='\n'.join(
+                        [
+                            '[{task}]: {err}'.format(task=key, err=err.to_string())
+                            for key, err in errors.items()
+                        ]
+                    )
+                ),
+                subprocess_error_infos=list(errors.values()),
+            )
@@ -1,5 +1,6 @@
 from dagster import Bool, Field, Int, String
 from dagster.core.definitions.executor import check_cross_process_constraints, executor
+from dagster.core.execution.retries import Retries, get_retries_config
 
 from .config import DaskConfig
 
@@ -33,6 +34,14 @@ from .config import DaskConfig
             is_required=False,
             description='Time in milliseconds between heartbeats to scheduler.',
         ),
+        'retries': get_retries_config(),
+        'max_concurrent': Field(
+            Int,
+            is_required=False,
+            default_value=0,
+            description='The maximum number of steps submitted to the cluster at once. If 0, '
+            'every step is submitted as soon as its dependencies have completed.',
+        ),
     },
 )
 def dask_executor(init_context):
@@ -54,8 +63,13 @@ def dask_executor(init_context):
             # intermediary
             direct_to_workers?: False,
             heartbeat_interval?: 1000,  # Time in milliseconds between heartbeats to scheduler
+            retries?: {enabled: {}},  # Whether and how steps that request a retry are retried
+            max_concurrent?: 0,  # The maximum number of steps submitted to the cluster at once
         }
 
+    Steps are submitted to the cluster as their dependencies complete, in order of the
+    ``dagster/priority`` tag, and their events are streamed back to the engine as they happen.
+
     If you'd like to configure a dask executor in addition to the
     :py:class:`~dagster.default_executors`, you should add it to the ``executor_defs`` defined on a
     :py:class:`~dagster.ModeDefinition` as follows:
@@ -72,4 +86,6 @@ def dask_executor(init_context):
     '''
     check_cross_process_constraints(init_context)
 
-    return DaskConfig(**init_context.executor_config)
+    executor_config = dict(init_context.executor_config)
+    executor_config['retries'] = Retries.from_config(executor_config['retries'])
+    return DaskConfig(**executor_config)
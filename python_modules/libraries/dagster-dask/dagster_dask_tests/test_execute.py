@@ -1,17 +1,25 @@
+# pylint: disable=protected-access
+import time
+
 import dagster_pandas as dagster_pd
+import dask.distributed
 from dagster_dask import dask_executor
+from dagster_dask.engine import DaskEventReceiver
 
 from dagster import (
     ExecutionTargetHandle,
     InputDefinition,
     ModeDefinition,
+    RetryRequested,
     execute_pipeline,
     file_relative_path,
+    lambda_solid,
     pipeline,
     seven,
     solid,
 )
 from dagster.core.definitions.executor import default_executors
+from dagster.core.events import DagsterEventType
 from dagster.core.instance import DagsterInstance
 from dagster.core.test_utils import nesting_composite_pipeline
 
@@ -93,3 +101,172 @@ def test_pandas_dask():
     )
 
     assert result.success
+
+
+@lambda_solid
+def fails():
+    raise Exception('argjhgjh')
+
+
+@lambda_solid
+def should_never_execute(_):
+    assert False  # should never execute
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def dask_fails_pipeline():
+    should_never_execute(fails())
+
+
+def test_execute_fails_on_dask():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'dask_fails_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'dask': {'config': {'timeout': 30}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert not result.result_for_solid('fails').success
+    assert result.result_for_solid('fails').failure_data.error.message == 'Exception: argjhgjh\n'
+    assert result.result_for_solid('should_never_execute').skipped
+
+
+@lambda_solid
+def retry_request():
+    raise RetryRequested()
+
+
+@pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [dask_executor])])
+def dask_retries_pipeline():
+    retry_request()
+
+
+def test_execute_retries_on_dask():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'dask_retries_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'dask': {'config': {'timeout': 30}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    event_types = [event.event_type_value for event in result.event_list]
+    assert event_types.count('STEP_START') == 1
+    assert event_types.count('STEP_UP_FOR_RETRY') == 1
+    assert event_types.count('STEP_RESTARTED') == 1
+    assert event_types.count('STEP_FAILURE') == 1
+
+
+def _peak_concurrent_steps(records):
+    # steps that finish at the same time as others start are not counted as overlapping
+    changes = sorted(
+        (
+            record.timestamp,
+            1 if record.dagster_event.event_type == DagsterEventType.STEP_START else -1,
+        )
+        for record in records
+        if record.is_dagster_event
+        and record.dagster_event.event_type
+        in (
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.STEP_FAILURE,
+        )
+    )
+
+    peak = running = 0
+    for _, change in changes:
+        running += change
+        peak = max(peak, running)
+    return peak
+
+
+def test_composite_execute_max_concurrent():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'dask_composite_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'dask': {'config': {'timeout': 30, 'max_concurrent': 2}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+
+    records = instance.all_logs(result.run_id)
+    assert 1 <= _peak_concurrent_steps(records) <= 2
+
+
+def _slow_relay(self):
+    while True:
+        item = self._events_queue.get()
+        if item is None:
+            break
+        time.sleep(0.1)
+        self._received.put(item)
+
+
+def test_execute_on_dask_slow_event_relay(monkeypatch):
+    # the futures of tasks are done well before their last events are relayed to the engine
+    monkeypatch.setattr(DaskEventReceiver, '_relay', _slow_relay)
+
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            ExecutionTargetHandle.for_pipeline_python_file(
+                __file__, 'dask_engine_pipeline'
+            ).build_pipeline_definition(),
+            environment_dict={
+                'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                'execution': {'dask': {'config': {'timeout': 30}}},
+            },
+            instance=DagsterInstance.local_temp(),
+        )
+        assert result.success
+        event_types = [event.event_type for event in result.event_list]
+        assert DagsterEventType.STEP_FAILURE not in event_types
+        assert event_types.count(DagsterEventType.STEP_SUCCESS) == 1
+        assert result.result_for_solid('simple').output_value() == 1
+
+
+def _scheduler_queue_names(dask_scheduler):
+    return list(dask_scheduler.extensions['queues'].queues)
+
+
+def test_execute_on_dask_releases_events_queue():
+    # a long-lived cluster, which would keep a queue for every run that did not release its own
+    with dask.distributed.LocalCluster(
+        n_workers=1, threads_per_worker=1, dashboard_address=None
+    ) as cluster:
+        with seven.TemporaryDirectory() as tempdir:
+            result = execute_pipeline(
+                ExecutionTargetHandle.for_pipeline_python_file(
+                    __file__, 'dask_engine_pipeline'
+                ).build_pipeline_definition(),
+                environment_dict={
+                    'storage': {'filesystem': {'config': {'base_dir': tempdir}}},
+                    'execution': {
+                        'dask': {'config': {'address': cluster.scheduler_address, 'timeout': 30}}
+                    },
+                },
+                instance=DagsterInstance.local_temp(),
+            )
+            assert result.success
+
+        with dask.distributed.Client(cluster) as client:
+            # queues are released by messages that the scheduler handles asynchronously
+            attempts = 20
+            while client.run_on_scheduler(_scheduler_queue_names) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert client.run_on_scheduler(_scheduler_queue_names) == []
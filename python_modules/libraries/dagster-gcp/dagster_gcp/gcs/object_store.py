@@ -1,17 +1,25 @@
+import hashlib
 import logging
-import sys
-from io import BytesIO, StringIO
+import tempfile
 
 from google.api_core.exceptions import TooManyRequests
 from google.cloud import storage
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.storage.object_store import ObjectStore
+from dagster.core.storage.object_store import ObjectStore, file_obj_for_mode
 from dagster.core.types.marshal import SerializationStrategy
 from dagster.utils.backoff import backoff
 
 
+def _blob_digest(blob):
+    if blob.md5_hash:
+        return 'md5:' + blob.md5_hash
+    if blob.etag:
+        return 'etag:' + blob.etag
+    return None
+
+
 class GCSObjectStore(ObjectStore):
     def __init__(self, bucket, client=None):
         self.bucket = check.str_param(bucket, 'bucket')
@@ -34,18 +42,15 @@ class GCSObjectStore(ObjectStore):
             logging.warning('Removing existing GCS key: {key}'.format(key=key))
             backoff(self.rm_object, args=[key], retry_on=(TooManyRequests,))
 
-        with (
-            BytesIO()
-            if serialization_strategy.write_mode == 'wb' or sys.version_info < (3, 0)
-            else StringIO()
-        ) as file_like:
-            serialization_strategy.serialize(obj, file_like)
-            file_like.seek(0)
-            backoff(
-                self.bucket_obj.blob(key).upload_from_file,
-                args=[file_like],
-                retry_on=(TooManyRequests,),
-            )
+        # serialize to a temporary file rather than to memory, and stream it to GCS
+        with tempfile.TemporaryFile() as file_obj:
+            with file_obj_for_mode(
+                file_obj, serialization_strategy.write_mode, serialization_strategy.encoding
+            ) as write_obj:
+                serialization_strategy.serialize(obj, write_obj)
+            file_obj.seek(0)
+            blob = self.bucket_obj.blob(key)
+            backoff(blob.upload_from_file, args=[file_obj], retry_on=(TooManyRequests,))
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -54,25 +59,21 @@ class GCSObjectStore(ObjectStore):
             obj=obj,
             serialization_strategy_name=serialization_strategy.name,
             object_store_name=self.name,
+            digest=_blob_digest(blob),
         )
 
     def get_object(self, key, serialization_strategy=None):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        if serialization_strategy.read_mode == 'rb':
-            file_obj = BytesIO()
+        with tempfile.TemporaryFile() as file_obj:
             self.bucket_obj.blob(key).download_to_file(file_obj)
-        else:
-            file_obj = StringIO(
-                self.bucket_obj.blob(key)
-                .download_as_string()
-                .decode(serialization_strategy.encoding)
-            )
-
-        file_obj.seek(0)
+            file_obj.seek(0)
+            with file_obj_for_mode(
+                file_obj, serialization_strategy.read_mode, serialization_strategy.encoding
+            ) as read_obj:
+                obj = serialization_strategy.deserialize(read_obj)
 
-        obj = serialization_strategy.deserialize(file_obj)
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -104,18 +105,62 @@ class GCSObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def get_size(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        blob = self.bucket_obj.get_blob(key)
+        if blob is not None:
+            return blob.size or 0
+
+        # otherwise the key names a directory, whose blobs are all under key + '/', and not under
+        # the keys that merely start with key
+        prefix = key if key.endswith(self.sep) else key + self.sep
+        return sum(blob.size or 0 for blob in self.client.list_blobs(self.bucket, prefix=prefix))
+
+    def get_digest(self, key):
+        '''The MD5 of the blob at key, or for a directory, the SHA-1 of the relative name and MD5
+        of each blob under it.
+
+        Composite blobs have no MD5, and are identified by their ETag instead.'''
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        blob = self.bucket_obj.get_blob(key)
+        if blob is not None:
+            return _blob_digest(blob)
+
+        prefix = key if key.endswith(self.sep) else key + self.sep
+        digest = hashlib.sha1()
+        count = 0
+        for blob in self.client.list_blobs(self.bucket, prefix=prefix):
+            blob_digest = _blob_digest(blob)
+            if blob_digest is None:
+                return None
+            digest.update(
+                '{name}\0{blob_digest}\n'.format(
+                    name=blob.name[len(prefix) :], blob_digest=blob_digest
+                ).encode('utf-8')
+            )
+            count += 1
+
+        if not count:
+            return None
+        return 'md5-tree:' + digest.hexdigest()
+
     def cp_object(self, src, dst):
         check.str_param(src, 'src')
         check.str_param(dst, 'dst')
 
         source_blob = self.bucket_obj.blob(src)
-        self.bucket_obj.copy_blob(source_blob, self.bucket_obj, dst)
+        blob = self.bucket_obj.copy_blob(source_blob, self.bucket_obj, dst)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.CP_OBJECT,
             key=self.uri_for_key(src),
             dest_key=self.uri_for_key(dst),
             object_store_name=self.name,
+            digest=_blob_digest(blob),
         )
 
     def uri_for_key(self, key, protocol=None):
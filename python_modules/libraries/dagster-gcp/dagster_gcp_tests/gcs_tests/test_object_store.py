@@ -17,13 +17,15 @@ def test_gcs_object_store(gcs_bucket):
     serialization_strategy = PickleSerializationStrategy()
 
     key = 'test-file-%s' % uuid.uuid4().hex
-    object_store.set_object(key, file_obj, serialization_strategy)
+    set_operation = object_store.set_object(key, file_obj, serialization_strategy)
+    assert set_operation.digest.startswith('md5:')
+    assert object_store.get_digest(key) == set_operation.digest
 
     assert object_store.has_object(key)
     assert object_store.get_object(key, serialization_strategy).obj.read() == test_str
 
     other_key = 'test-file-%s' % uuid.uuid4().hex
-    object_store.cp_object(key, other_key)
+    assert object_store.cp_object(key, other_key).digest == set_operation.digest
     assert object_store.has_object(other_key)
 
     object_store.rm_object(key)
@@ -1,10 +1,14 @@
 from .constraints import RowCountConstraint, StrictColumnsConstraint
 from .data_frame import DataFrame, create_dagster_pandas_dataframe_type
+from .ndarray import NumpyArray
+from .serialization import DataFrameParquetSerializationStrategy
 from .validation import PandasColumn
 
 __all__ = [
     'DataFrame',
     'create_dagster_pandas_dataframe_type',
+    'DataFrameParquetSerializationStrategy',
+    'NumpyArray',
     'PandasColumn',
     'RowCountConstraint',
     'StrictColumnsConstraint',
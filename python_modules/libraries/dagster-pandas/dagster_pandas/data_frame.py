@@ -1,5 +1,6 @@
 import pandas as pd
 from dagster_pandas.constraints import ColumnTypeConstraint, ConstraintViolationException
+from dagster_pandas.serialization import default_dataframe_serialization_strategy
 from dagster_pandas.validation import PandasColumn, validate_constraints
 
 from dagster import (
@@ -97,6 +98,7 @@ DataFrame = DagsterType(
     input_hydration_config=dataframe_input_schema,
     output_materialization_config=dataframe_output_schema,
     type_check_fn=df_type_check,
+    serialization_strategy=default_dataframe_serialization_strategy(),
 )
 
 
@@ -150,6 +152,7 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     input_hydration_config=None,
     output_materialization_config=None,
+    serialization_strategy=None,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -169,6 +172,11 @@ def create_dagster_pandas_dataframe_type(
         output_materialization_config (Optional[OutputMaterializationConfig]): An instance of a class
             that inherits from :py:class:`~dagster.OutputMaterializationConfig`. If None, we will
             default to using the `dataframe_output_schema` output_materialization_config.
+        serialization_strategy (Optional[SerializationStrategy]): An instance of a class that
+            inherits from :py:class:`~dagster.SerializationStrategy`, used to store intermediates
+            of the type. If None, intermediates are stored as Parquet when pyarrow is installed,
+            see :py:class:`~dagster_pandas.DataFrameParquetSerializationStrategy`, and are
+            pickled otherwise.
     """
     # We allow for the plugging in of input_hydration_config/output_materialization_configs so that
     # Users can hydrate and persist their custom dataframes via configuration their own way if the default
@@ -213,6 +221,9 @@ def create_dagster_pandas_dataframe_type(
         if output_materialization_config
         else dataframe_output_schema,
         description=description,
+        serialization_strategy=serialization_strategy
+        if serialization_strategy
+        else default_dataframe_serialization_strategy(),
     )
 
 
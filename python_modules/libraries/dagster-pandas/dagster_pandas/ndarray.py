@@ -0,0 +1,11 @@
+import numpy as np
+
+from dagster import NumpyArraySerializationStrategy, PythonObjectDagsterType
+
+NumpyArray = PythonObjectDagsterType(
+    np.ndarray,
+    name='NumpyArray',
+    description='''An N-dimensional numpy array. Intermediates are stored in the .npy format, and
+    are memory mapped when they are read from the filesystem. See https://numpy.org/''',
+    serialization_strategy=NumpyArraySerializationStrategy(),
+)
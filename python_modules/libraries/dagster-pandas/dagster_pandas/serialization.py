@@ -0,0 +1,85 @@
+import pickle
+
+import pandas as pd
+
+from dagster import SerializationStrategy, check
+from dagster.utils import PICKLE_PROTOCOL
+
+PARQUET_MAGIC = b'PAR1'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # pylint: disable=import-error
+        import pyarrow.parquet  # pylint: disable=import-error
+
+        return pyarrow
+    except ImportError:
+        return None
+
+
+class DataFrameParquetSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Stores pandas DataFrames in the Parquet format through pyarrow.
+
+    Parquet files are columnar and compressed, and are read from the filesystem through a memory
+    map. DataFrames that pyarrow cannot convert, e.g. because a column mixes Python types, are
+    pickled instead, as are all DataFrames when pyarrow is not installed. Pickled DataFrames are
+    read back whether or not they were written by this strategy, so intermediates stored by earlier
+    versions remain readable.
+
+    Args:
+        compression (Optional[str]): The Parquet compression codec. Defaults to ``'snappy'``.
+    '''
+
+    def __init__(self, name='parquet', compression='snappy'):
+        self._compression = check.str_param(compression, 'compression')
+        super(DataFrameParquetSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        check.inst_param(value, 'value', pd.DataFrame)
+
+        pyarrow = _import_pyarrow()
+        table = None
+        if pyarrow:
+            try:
+                table = pyarrow.Table.from_pandas(value)
+            except (pyarrow.ArrowException, TypeError, ValueError):
+                table = None
+
+        if table is None:
+            pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        else:
+            pyarrow.parquet.write_table(table, write_file_obj, compression=self._compression)
+
+    def deserialize(self, read_file_obj):
+        if read_file_obj.read(len(PARQUET_MAGIC)) != PARQUET_MAGIC:
+            read_file_obj.seek(0)
+            return pickle.load(read_file_obj)
+
+        read_file_obj.seek(0)
+        return self._read_parquet(read_file_obj)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        with open(read_path, self.read_mode) as read_obj:
+            if read_obj.read(len(PARQUET_MAGIC)) != PARQUET_MAGIC:
+                read_obj.seek(0)
+                return pickle.load(read_obj)
+
+        return self._read_parquet(read_path, memory_map=True)
+
+    def _read_parquet(self, source, **kwargs):
+        pyarrow = _import_pyarrow()
+        check.invariant(
+            pyarrow is not None,
+            'Reading a DataFrame stored as Parquet requires the pyarrow package.',
+        )
+        return pyarrow.parquet.read_table(source, **kwargs).to_pandas()
+
+
+def default_dataframe_serialization_strategy():
+    '''Parquet when pyarrow is installed, and otherwise None, so that DataFrames are pickled.'''
+    if _import_pyarrow() is None:
+        return None
+    return DataFrameParquetSerializationStrategy()
@@ -1,4 +1,9 @@
+import io
+
+import dagster_pandas.serialization
 import pytest
+from dagster_pandas import DataFrame as DagsterPandasDataFrame
+from dagster_pandas import DataFrameParquetSerializationStrategy
 from dagster_pandas.constraints import (
     ColumnTypeConstraint,
     InRangeColumnConstraint,
@@ -22,9 +27,11 @@ from dagster import (
     execute_pipeline,
     execute_solid,
     pipeline,
+    seven,
     solid,
 )
 from dagster.core.types.config_schema import input_selector_schema, output_selector_schema
+from dagster.core.types.marshal import PickleSerializationStrategy
 from dagster.utils import safe_tempfile_path
 
 
@@ -246,3 +253,76 @@ def test_custom_dagster_dataframe_parametrizable_input():
     materialization_events = solid_result.materialization_events_during_compute
     assert len(materialization_events) == 1
     assert materialization_events[0].event_specific_data.materialization.label == 'did nothing'
+
+
+def test_dataframe_parquet_serialization_strategy():
+    pytest.importorskip('pyarrow')
+    serialization_strategy = DataFrameParquetSerializationStrategy()
+
+    df = DataFrame({'foo': [1, 2, 3], 'bar': ['a', 'b', 'c']}, index=[3, 4, 5])
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as read_obj:
+            assert read_obj.read(4) == b'PAR1'
+
+        assert serialization_strategy.deserialize_from_file(tempfile_path).equals(df)
+
+    # columns that pyarrow cannot convert are pickled
+    mixed_df = DataFrame({'foo': [1, 'a']})
+    file_obj = io.BytesIO()
+    serialization_strategy.serialize(mixed_df, file_obj)
+    file_obj.seek(0)
+    assert serialization_strategy.deserialize(file_obj).equals(mixed_df)
+
+
+def test_dataframe_parquet_serialization_strategy_reads_pickles():
+    df = DataFrame({'foo': [1, 2, 3]})
+    with safe_tempfile_path() as tempfile_path:
+        PickleSerializationStrategy().serialize_to_file(df, tempfile_path)
+        assert (
+            DataFrameParquetSerializationStrategy().deserialize_from_file(tempfile_path).equals(df)
+        )
+
+
+def test_dataframe_types_store_parquet_by_default():
+    pytest.importorskip('pyarrow')
+    assert isinstance(
+        DagsterPandasDataFrame.serialization_strategy, DataFrameParquetSerializationStrategy
+    )
+    assert isinstance(
+        create_dagster_pandas_dataframe_type(name='SomeDataFrame').serialization_strategy,
+        DataFrameParquetSerializationStrategy,
+    )
+
+
+def test_dataframe_types_pickle_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(dagster_pandas.serialization, '_import_pyarrow', lambda: None)
+    assert isinstance(
+        create_dagster_pandas_dataframe_type(name='SomeDataFrame').serialization_strategy,
+        PickleSerializationStrategy,
+    )
+
+
+def test_dataframe_type_parquet_intermediates():
+    pytest.importorskip('pyarrow')
+    ParquetDataFrame = create_dagster_pandas_dataframe_type(name='ParquetDataFrame')
+
+    @solid(output_defs=[OutputDefinition(ParquetDataFrame)])
+    def emit_df(_):
+        return DataFrame({'foo': [1, 2, 3], 'bar': ['a', 'b', 'c']})
+
+    @solid(input_defs=[InputDefinition('df', ParquetDataFrame)])
+    def count_rows(_, df):
+        return len(df)
+
+    @pipeline
+    def parquet_pipeline():
+        count_rows(emit_df())
+
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            parquet_pipeline,
+            environment_dict={'storage': {'filesystem': {'config': {'base_dir': tempdir}}}},
+        )
+        assert result.success
+        assert result.result_for_solid('count_rows').output_value() == 3
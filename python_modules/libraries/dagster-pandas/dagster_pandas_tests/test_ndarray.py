@@ -0,0 +1,29 @@
+import numpy as np
+from dagster_pandas import NumpyArray
+
+from dagster import InputDefinition, OutputDefinition, execute_pipeline, pipeline, seven, solid
+from dagster.core.types.marshal import NumpyArraySerializationStrategy
+
+
+def test_numpy_array_intermediates():
+    assert isinstance(NumpyArray.serialization_strategy, NumpyArraySerializationStrategy)
+
+    @solid(output_defs=[OutputDefinition(NumpyArray)])
+    def emit_array(_):
+        return np.arange(12).reshape(3, 4)
+
+    @solid(input_defs=[InputDefinition('array', NumpyArray)])
+    def sum_array(_, array):
+        return int(array.sum())
+
+    @pipeline
+    def array_pipeline():
+        sum_array(emit_array())
+
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            array_pipeline,
+            environment_dict={'storage': {'filesystem': {'config': {'base_dir': tempdir}}}},
+        )
+        assert result.success
+        assert result.result_for_solid('sum_array').output_value() == 66
@@ -1,10 +1,10 @@
-import datetime
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 
 import psycopg2
 import sqlalchemy as db
+from sqlalchemy.dialects import postgresql
 
 from dagster import check
 from dagster.core.events.log import EventRecord
@@ -12,9 +12,9 @@ from dagster.core.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
     deserialize_json_to_dagster_namedtuple,
-    serialize_dagster_namedtuple,
 )
 from dagster.core.storage.event_log import (
+    SqlEventLogRunStatsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
@@ -22,10 +22,14 @@ from dagster.core.storage.event_log import (
 from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
 
 from ..pynotify import await_pg_notifications
-from ..utils import pg_config, pg_url_from_config
+from ..utils import create_pg_engine, pg_storage_config, pg_url_from_config
 
 CHANNEL_NAME = 'run_events'
 
+# NOTIFY payloads must be shorter than 8000 bytes, so batches of event ids are split across
+# several notifications
+MAX_NOTIFY_INDICES = 500
+
 # Why? Because this is about as long as we expect a roundtrip to RDS to take.
 WATCHER_POLL_INTERVAL = 0.2
 
@@ -47,27 +51,18 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, pool_config=None):
         self.postgres_url = check.str_param(postgres_url, 'postgres_url')
+        self._engine = create_pg_engine(self.postgres_url, pool_config)
         self._event_watcher = PostgresEventWatcher(self.postgres_url)
-        with self.get_engine() as engine:
-            SqlEventLogStorageMetadata.create_all(engine)
+        with self.connect() as conn:
+            SqlEventLogStorageMetadata.create_all(conn)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
-    @contextmanager
-    def get_engine(self):
-        engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
-        try:
-            yield engine
-        finally:
-            engine.dispose()
-
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
-        with self.get_engine() as engine:
-            run_alembic_upgrade(alembic_config, engine)
+        with self.connect() as conn:
+            run_alembic_upgrade(alembic_config, conn)
 
     @property
     def inst_data(self):
@@ -75,12 +70,14 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return pg_storage_config()
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool_config=config_value.get('pool'),
         )
 
     @staticmethod
@@ -95,37 +92,86 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             event (EventRecord): The event to store.
         '''
         check.inst_param(event, 'event', EventRecord)
+        self.store_events([event])
 
-        dagster_event_type = None
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
+    def store_events(self, events):
+        '''Store a batch of events with a single multi-row INSERT, update the stats of each run
+        they belong to, then send one NOTIFY per run listing the ids of that run's new events. All
+        of this happens in one transaction, so notifications are delivered once it commits.
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+        if not events:
+            return
 
-        run_id = event.run_id
+        rows = [self._event_to_row(event) for event in events]
+        rows_by_run_id = OrderedDict()
+        for row in rows:
+            rows_by_run_id.setdefault(row['run_id'], []).append(row)
 
         with self.connect() as conn:
-            # https://stackoverflow.com/a/54386260/324449
-            event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-                run_id=run_id,
-                event=serialize_dagster_namedtuple(event),
-                dagster_event_type=dagster_event_type,
-                timestamp=datetime.datetime.fromtimestamp(event.timestamp),
-            )
-            result_proxy = conn.execute(
-                event_insert.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            # The storage's connections autocommit, so this one has to opt into a transaction
+            conn = conn.execution_options(isolation_level='READ COMMITTED')
+            with conn.begin():
+                # https://stackoverflow.com/a/54386260/324449
+                event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    rows
                 )
+                result_proxy = conn.execute(
+                    event_insert.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                res = result_proxy.fetchall()
+                result_proxy.close()
+
+                for run_id, run_rows in rows_by_run_id.items():
+                    self._update_run_stats(conn, run_id, run_rows)
+
+                ids_by_run_id = OrderedDict()
+                for run_id, index in res:
+                    ids_by_run_id.setdefault(run_id, []).append(index)
+
+                for run_id, indices in ids_by_run_id.items():
+                    for i in range(0, len(indices), MAX_NOTIFY_INDICES):
+                        conn.execute(
+                            '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
+                            (
+                                run_id
+                                + '_'
+                                + ','.join(
+                                    str(index) for index in indices[i : i + MAX_NOTIFY_INDICES]
+                                ),
+                            ),
+                        )
+
+    def _upsert_run_stats(self, conn, run_id, counts, times):
+        # Several processes may store events for the same run at once, so rather than update and
+        # then insert, let Postgres resolve the conflict atomically
+        stats_insert = postgresql.insert(SqlEventLogRunStatsTable).values(
+            run_id=run_id, **dict(counts, **times)
+        )
+        update_values = dict(times)
+        for column in counts:
+            update_values[column] = (
+                SqlEventLogRunStatsTable.c[column] + stats_insert.excluded[column]
             )
-            res = result_proxy.fetchone()
-            result_proxy.close()
-            conn.execute(
-                '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
-                (res[0] + '_' + str(res[1]),),
+
+        conn.execute(
+            stats_insert.on_conflict_do_update(
+                index_elements=[SqlEventLogRunStatsTable.c.run_id], set_=update_values
             )
+        )
 
     @contextmanager
     def connect(self, run_id=None):
-        with self.get_engine() as engine:
-            yield engine
+        with self._engine.connect() as conn:
+            yield conn
+
+    @property
+    def connection_acquire_stats(self):
+        return self._engine.acquire_stats
 
     def watch(self, run_id, start_cursor, callback):
         self._event_watcher.watch_run(run_id, start_cursor, callback)
@@ -143,6 +189,7 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     def dispose(self):
         self._event_watcher.close()
+        self._engine.dispose()
 
 
 EventWatcherProcessStartedEvent = namedtuple('EventWatcherProcessStartedEvent', '')
@@ -167,6 +214,8 @@ TERMINATE_EVENT_LOOP = 'TERMINATE_EVENT_LOOP'
 
 
 def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+    # events are fetched one notification at a time, so a single connection is enough
+    engine = create_engine(conn_string, isolation_level='AUTOCOMMIT', pool_size=1, max_overflow=0)
 
     try:
         for notif in await_pg_notifications(
@@ -180,32 +229,32 @@ def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_t
                 if watcher_thread_exit.is_set():
                     break
             else:
-                run_id, index_str = notif.payload.split('_')
+                run_id, indices_str = notif.payload.rsplit('_', 1)
                 if run_id not in run_id_dict:
                     continue
 
-                index = int(index_str)
+                indices = [int(index_str) for index_str in indices_str.split(',')]
                 with dict_lock:
                     handlers = handlers_dict.get(run_id, [])
 
-                engine = create_engine(
-                    conn_string, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
+                res = engine.execute(
+                    db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                    .where(SqlEventLogStorageTable.c.id.in_(indices))
+                    .order_by(SqlEventLogStorageTable.c.id.asc())
                 )
-                try:
-                    res = engine.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-                finally:
-                    engine.dispose()
+                dagster_events = [
+                    (index, deserialize_json_to_dagster_namedtuple(event))
+                    for index, event in res.fetchall()
+                ]
 
-                for (cursor, callback) in handlers:
-                    if index >= cursor:
-                        callback(dagster_event)
+                for index, dagster_event in dagster_events:
+                    for (cursor, callback) in handlers:
+                        if index >= cursor:
+                            callback(dagster_event)
     except psycopg2.OperationalError:
         pass
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher(object):
@@ -0,0 +1,74 @@
+"""add run stats
+
+Revision ID: 5c4458ab8ffb
+Revises: c201ad859919
+Create Date: 2020-03-05 10:12:41.384214
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+# revision identifiers, used by Alembic.
+revision = '5c4458ab8ffb'
+down_revision = 'c201ad859919'
+branch_labels = None
+depends_on = None
+
+# Recomputes every run's stats from its events. Rows are rebuilt rather than only added for runs
+# that lack one, since a storage that created the table before migrating may already hold partial
+# stats for runs that were in progress.
+BACKFILL_RUN_STATS = '''
+INSERT INTO run_stats (
+    run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+)
+SELECT
+    run_id,
+    SUM(CASE WHEN dagster_event_type = 'STEP_SUCCESS' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_FAILURE' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_MATERIALIZATION' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN dagster_event_type = 'STEP_EXPECTATION_RESULT' THEN 1 ELSE 0 END),
+    MAX(CASE WHEN dagster_event_type = 'PIPELINE_START' THEN timestamp END),
+    MAX(
+        CASE WHEN dagster_event_type IN ('PIPELINE_SUCCESS', 'PIPELINE_FAILURE') THEN timestamp END
+    )
+FROM event_logs
+WHERE run_id IS NOT NULL
+GROUP BY run_id
+'''
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'event_logs' not in has_tables:
+        return
+
+    if 'run_stats' not in has_tables:
+        op.create_table(
+            'run_stats',
+            sa.Column('run_id', sa.String(255), primary_key=True),
+            sa.Column('steps_succeeded', sa.Integer, nullable=False),
+            sa.Column('steps_failed', sa.Integer, nullable=False),
+            sa.Column('materializations', sa.Integer, nullable=False),
+            sa.Column('expectations', sa.Integer, nullable=False),
+            sa.Column('start_time', sa.types.TIMESTAMP),
+            sa.Column('end_time', sa.types.TIMESTAMP),
+        )
+
+    op.execute('DELETE FROM run_stats')
+    op.execute(BACKFILL_RUN_STATS)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if 'run_stats' in has_tables:
+        op.drop_table('run_stats')
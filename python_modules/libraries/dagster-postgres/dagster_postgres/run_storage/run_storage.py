@@ -7,7 +7,7 @@ from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.core.storage.runs import RunStorageSqlMetadata, SqlRunStorage
 from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
 
-from ..utils import pg_config, pg_url_from_config
+from ..utils import create_pg_engine, pg_storage_config, pg_url_from_config
 
 
 class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
@@ -26,34 +26,27 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
        :language: YAML
     '''
 
-    def __init__(self, postgres_url, inst_data=None):
-        self.postgres_url = postgres_url
-        with self.get_engine() as engine:
-            RunStorageSqlMetadata.create_all(engine)
+    def __init__(self, postgres_url, inst_data=None, pool_config=None):
+        self.postgres_url = check.str_param(postgres_url, 'postgres_url')
+        self._engine = create_pg_engine(self.postgres_url, pool_config)
+        with self.connect() as conn:
+            RunStorageSqlMetadata.create_all(conn)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
-    @contextmanager
-    def get_engine(self):
-        engine = create_engine(
-            self.postgres_url, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-        )
-        try:
-            yield engine
-        finally:
-            engine.dispose()
-
     @property
     def inst_data(self):
         return self._inst_data
 
     @classmethod
     def config_type(cls):
-        return pg_config()
+        return pg_storage_config()
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresRunStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool_config=config_value.get('pool'),
         )
 
     @staticmethod
@@ -69,10 +62,17 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
 
     @contextmanager
     def connect(self, _run_id=None):  # pylint: disable=arguments-differ
-        with self.get_engine() as engine:
-            yield engine
+        with self._engine.connect() as conn:
+            yield conn
+
+    @property
+    def connection_acquire_stats(self):
+        return self._engine.acquire_stats
+
+    def dispose(self):
+        self._engine.dispose()
 
     def upgrade(self):
         alembic_config = get_alembic_config(__file__)
-        with self.get_engine() as engine:
-            run_alembic_upgrade(alembic_config, engine)
+        with self.connect() as conn:
+            run_alembic_upgrade(alembic_config, conn)
@@ -2,9 +2,19 @@ import time
 
 import psycopg2
 
-from dagster import Field, IntSource, Selector, StringSource
+from dagster import Field, IntSource, Permissive, Selector, StringSource, check
+from dagster.config.field import resolve_to_config_type
+from dagster.config.validate import process_config
+from dagster.core.errors import DagsterInvalidConfigError
+from dagster.core.storage.sql import PooledEngine
 from dagster.seven import quote_plus as urlquote
 
+# Connection pool defaults, matching SQLAlchemy's QueuePool except for pool_recycle: connections
+# are recycled after an hour so they are not silently dropped by idle timeouts on managed databases
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = 3600
+
 
 def get_conn(conn_string):
     conn = psycopg2.connect(conn_string)
@@ -27,11 +37,82 @@ def pg_config():
     )
 
 
-def pg_url_from_config(config_value):
-    if config_value.get('postgres_url'):
-        return config_value['postgres_url']
+def pg_pool_config():
+    return Field(
+        {
+            'pool_size': Field(
+                IntSource,
+                is_required=False,
+                default_value=DEFAULT_POOL_SIZE,
+                description='Number of connections kept open in the pool.',
+            ),
+            'max_overflow': Field(
+                IntSource,
+                is_required=False,
+                default_value=DEFAULT_MAX_OVERFLOW,
+                description='Number of connections that may be opened beyond pool_size when the '
+                'pool is exhausted. These are closed when returned to the pool.',
+            ),
+            'pool_recycle': Field(
+                IntSource,
+                is_required=False,
+                default_value=DEFAULT_POOL_RECYCLE,
+                description='Seconds after which a pooled connection is replaced. -1 disables '
+                'recycling.',
+            ),
+        },
+        is_required=False,
+        description='Settings for the pool of connections each storage holds to Postgres.',
+    )
+
 
-    return get_conn_string(**config_value['postgres_db'])
+def pg_storage_config():
+    '''The config of a Postgres storage: the connection, selected as in pg_config, beside the
+    optional pool settings.
+
+    A selector admits exactly one key, so the connection keys are left unchecked here and
+    validated against pg_config by pg_url_from_config.
+    '''
+    return Permissive({'pool': pg_pool_config()})
+
+
+def pg_url_from_config(config_value):
+    connection_config = {key: value for key, value in config_value.items() if key != 'pool'}
+    result = process_config(resolve_to_config_type(pg_config()), connection_config)
+    if not result.success:
+        raise DagsterInvalidConfigError(
+            'Errors whilst loading Postgres connection configuration.',
+            result.errors,
+            connection_config,
+        )
+
+    if result.value.get('postgres_url'):
+        return result.value['postgres_url']
+
+    return get_conn_string(**result.value['postgres_db'])
+
+
+def create_pg_engine(postgres_url, pool_config=None):
+    '''Build the long-lived, pooled engine a Postgres storage holds for its connections.
+
+    Args:
+        postgres_url (str): The database URL.
+        pool_config (Optional[dict]): Overrides for the pool_size, max_overflow and pool_recycle
+            settings of the engine's QueuePool.
+
+    Returns:
+        PooledEngine
+    '''
+    check.str_param(postgres_url, 'postgres_url')
+    pool_config = check.opt_dict_param(pool_config, 'pool_config', key_type=str)
+
+    return PooledEngine(
+        postgres_url,
+        isolation_level='AUTOCOMMIT',
+        pool_size=pool_config.get('pool_size', DEFAULT_POOL_SIZE),
+        max_overflow=pool_config.get('max_overflow', DEFAULT_MAX_OVERFLOW),
+        pool_recycle=pool_config.get('pool_recycle', DEFAULT_POOL_RECYCLE),
+    )
 
 
 def get_conn_string(username, password, hostname, db_name, port='5432'):